@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         ablation_replay
+* Description:  Re-cluster annotation histories of finished experiments with alternative clustering configurations.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import multiprocessing as mp
+import os
+import pickle  # noqa: S403
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from cognitivefactory.interactive_clustering.constraints.abstract import (
+    AbstractConstraintsManager,
+)
+from cognitivefactory.interactive_clustering.constraints.factory import (
+    managing_factory,
+)
+from scipy.sparse import csr_matrix
+
+import replay_benchmark
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Separator between the name of the replayed clustering configuration and the name of the source clustering environment.
+REPLAY_SEPARATOR: str = "-replay_of_"
+
+# Inputs shared by replay tasks of a process, loaded once (vectors are shared by all experiments of a vectorization environment).
+_SHARED_INPUTS: Dict[str, Dict[str, Any]] = {
+    "vectors": {},
+    "data_IDs": {},
+    "experiments": {},
+}
+
+
+# ==============================================================================
+# ABLATION - CREATE ENVIRONMENTS
+# ==============================================================================
+def create_ablation_environments(
+    list_of_experiment_env_paths: List[str],
+    dict_of_configs_clustering: Dict[str, Dict[str, Any]],
+) -> List[str]:
+    """
+    A method aimed at create the environments of ablation replays: the annotation history of finished experiments re-clustered with alternative clustering configurations.
+    Usage note:
+        - An ablation clustering environment is created next to the source clustering environment (i.e. in the same sampling environment), and is named `[CONFIG_NAME]-replay_of_[SOURCE_CLUSTERING_NAME]`: listings, evaluation and overviews see it as another clustering environment.
+        - An ablation experiment environment has the name and the configuration of its source experiment (with the `"_REPLAY_OF"` key), and a copy of its annotation history.
+        - Unfinished experiments (without `.done` file) and ablation experiments are not replayed.
+
+    Args:
+        list_of_experiment_env_paths (List[str]): The experiment environment paths whose annotation histories are replayed (cf. `listing_envs.get_list_of_experiment_env_paths`).
+        dict_of_configs_clustering (Dict[str, Dict[str, Any]]): The clustering configurations to replay, by name (`"algorithm"`, `"init**kargs"` and `"nb_clusters"`, as in the notebook `1_Initialize_convergence_experiments.ipynb`).
+
+    Returns:
+        List[str]: The list of ablation experiment environment paths.
+    """
+
+    # Initialize the list of ablation environments.
+    list_of_ablation_env_paths: List[str] = []
+
+    # For each finished experiment...
+    for source_env_path in list_of_experiment_env_paths:
+        if not os.path.exists(source_env_path + ".done"):
+            continue
+
+        # Load configuration for experiment (ablations are not replayed).
+        with open(source_env_path + "config.json", "r") as file_config_experiment:
+            config_experiment: Dict[str, Any] = json.load(file_config_experiment)
+        if "_REPLAY_OF" in config_experiment.keys():
+            continue
+
+        # NB : environments paths are formatted links : `../experiments/[DATASET]/[PREPROCESSING]/[VECTORIZATION]/[SAMPLING]/[CLUSTERING]/[EXPERIMENT]/`
+        list_of_path_parts: List[str] = source_env_path.split("/")
+        sampling_env_path: str = "/".join(list_of_path_parts[:-3]) + "/"
+        source_clustering_name: str = list_of_path_parts[-3]
+        experiment_name: str = list_of_path_parts[-2]
+
+        # For each clustering configuration...
+        for config_name, config_clustering in dict_of_configs_clustering.items():
+
+            # Create the ablation clustering environment.
+            clustering_env_name: str = config_name + REPLAY_SEPARATOR + source_clustering_name
+            clustering_env_path: str = sampling_env_path + clustering_env_name + "/"
+            if not os.path.exists(clustering_env_path):
+                os.mkdir(clustering_env_path)
+                with open(clustering_env_path + "config.json", "w") as file_config_clustering:
+                    json.dump(
+                        {
+                            "_TYPE": "clustering",
+                            "_DESCRIPTION": str(config_clustering.get("_DESCRIPTION", config_name)) + " (replay of `" + source_clustering_name + "` annotations).",
+                            **config_clustering,
+                            "_ENV_NAME": clustering_env_name,
+                            "_ENV_PATH": clustering_env_path,
+                            "_REPLAY_OF": sampling_env_path + source_clustering_name + "/",
+                        },
+                        file_config_clustering,
+                    )
+
+            # Create the ablation experiment environment.
+            ablation_env_path: str = clustering_env_path + experiment_name + "/"
+            list_of_ablation_env_paths.append(ablation_env_path)
+            if os.path.exists(ablation_env_path):
+                continue
+            os.mkdir(ablation_env_path)
+
+            # Store configuration file.
+            with open(ablation_env_path + "config.json", "w") as file_config_ablation:
+                json.dump(
+                    {
+                        **config_experiment,
+                        "_ENV_PATH": ablation_env_path,
+                        "_REPLAY_OF": source_env_path,
+                    },
+                    file_config_ablation,
+                )
+
+            # Copy the annotation history.
+            with open(source_env_path + "dict_of_constraints_annotations.json", "r") as file_annotations_load:
+                dict_of_constraints_annotations: Dict[str, List[Tuple[str, str, str]]] = json.load(file_annotations_load)
+            with open(ablation_env_path + "dict_of_constraints_annotations.json", "w") as file_annotations_save:
+                json.dump(dict_of_constraints_annotations, file_annotations_save)
+
+            # Initialize other storage files.
+            for storage_filename in [
+                "dict_of_clustering_results.json",
+                "dict_of_clustering_performances.json",
+                "dict_of_computation_times.json",
+            ]:
+                with open(ablation_env_path + storage_filename, "w") as file_storage:
+                    json.dump({}, file_storage)
+
+    # Return ablation environments.
+    return list_of_ablation_env_paths
+
+
+# ==============================================================================
+# ABLATION - RUN
+# ==============================================================================
+def run_ablations(
+    list_of_ablation_env_paths: List[str],
+    nb_workers: int = 1,
+) -> Dict[str, Any]:
+    """
+    A method aimed at replay annotation histories of ablation experiments and store their clustering results in the standard experiment format.
+    Replay tasks (one per ablation experiment, i.e. per annotation history and clustering configuration) are run in a process pool: in a task, the history is replayed incrementally in one constraints manager (annotations of an iteration are added, then the clustering is applied), so that constraints are added only once.
+    Usage note:
+        - The ablation environments have to be created by `create_ablation_environments`. Finished ablations (with a `.done` file) are skipped.
+        - Vectors are loaded once per vectorization environment before the process pool is created, so that they are shared by all tasks (with the `fork` start method).
+        - Sampling times are the ones of the source experiment (the annotations come from its sampling), and clustering times are the ones of the replay. Clustering times of parallel tasks may be slowed down by other tasks.
+        - Then, `workerB_evaluate.experiment_evaluate` and overviews can be run on ablation environments as on other experiments.
+
+    Args:
+        list_of_ablation_env_paths (List[str]): The ablation experiment environment paths.
+        nb_workers (int, optional): The number of processes. Defaults to `1` (no process pool).
+
+    Returns:
+        Dict[str, Any]: The report: number of ablations done (`"NB_DONE"`), number of iterations replayed (`"NB_ITERATIONS"`), and the error of each bad environment (`"BAD_ENVIRONMENTS"`).
+    """
+
+    # Select ablations to run.
+    list_of_env_paths: List[str] = [
+        env_path for env_path in list_of_ablation_env_paths if not os.path.exists(env_path + ".done")
+    ]
+
+    # Load shared inputs (before the process pool, to share them).
+    for env_path in list_of_env_paths:
+        _load_shared_inputs(env_path=env_path)
+
+    # Initialize results.
+    dict_of_bad_environments: Dict[str, str] = {}
+    nb_iterations: int = 0
+
+    # Run replay tasks (one per ablation).
+    pool: Optional[Any] = mp.Pool(nb_workers) if (nb_workers > 1) else None
+    try:
+        iterator_of_results = (
+            pool.imap_unordered(_replay_task, list_of_env_paths) if (pool is not None) else map(_replay_task, list_of_env_paths)
+        )
+        for env_path, dict_of_results, error in iterator_of_results:
+
+            # Case of error: the ablation is reported and not stored.
+            if (error is not None) or (dict_of_results is None):
+                dict_of_bad_environments[env_path] = str(error)
+                continue
+
+            # Store the replayed ablation.
+            _store_ablation(env_path=env_path, dict_of_results=dict_of_results)
+            nb_iterations += len(dict_of_results)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    # Return report.
+    return {
+        "NB_DONE": len(list_of_env_paths) - len(dict_of_bad_environments),
+        "NB_ITERATIONS": nb_iterations,
+        "BAD_ENVIRONMENTS": dict_of_bad_environments,
+    }
+
+
+# ==============================================================================
+# PRIVATE - LOAD SHARED INPUTS
+# ==============================================================================
+def _load_shared_inputs(
+    env_path: str,
+) -> Dict[str, Any]:
+    """
+    A method aimed at load the inputs of an ablation experiment in the shared inputs of the process (if not already loaded).
+
+    Args:
+        env_path (str): The ablation experiment environment path.
+
+    Returns:
+        Dict[str, Any]: The inputs of the ablation: the configurations of clustering (`"config_clustering"`) and of experiment (`"config_experiment"`), the annotation history sorted by iteration (`"history"`), and the keys of its vectors (`"vectors_key"`) and data IDs (`"data_IDs_key"`) in shared inputs.
+    """
+
+    # Case of inputs already loaded.
+    if env_path in _SHARED_INPUTS["experiments"].keys():
+        return _SHARED_INPUTS["experiments"][env_path]
+
+    # Load dict of vectors (once per vectorization environment).
+    vectors_key: str = os.path.normpath(env_path + "../../../dict_of_vectors.pkl")
+    if vectors_key not in _SHARED_INPUTS["vectors"].keys():
+        with open(vectors_key, "rb") as file_vectors:
+            _SHARED_INPUTS["vectors"][vectors_key] = {
+                vector_id: csr_matrix(vector_value)
+                for vector_id, vector_value in pickle.load(file_vectors).items()  # noqa: S301
+            }
+
+    # Load list of data IDs (once per dataset environment).
+    data_IDs_key: str = os.path.normpath(env_path + "../../../../../dict_of_true_intents.json")
+    if data_IDs_key not in _SHARED_INPUTS["data_IDs"].keys():
+        with open(data_IDs_key, "r") as file_true_intents:
+            _SHARED_INPUTS["data_IDs"][data_IDs_key] = sorted(json.load(file_true_intents).keys())
+
+    # Load configurations and annotation history.
+    with open(env_path + "../config.json", "r") as file_config_clustering:
+        config_clustering: Dict[str, Any] = json.load(file_config_clustering)
+    with open(env_path + "config.json", "r") as file_config_experiment:
+        config_experiment: Dict[str, Any] = json.load(file_config_experiment)
+    with open(env_path + "dict_of_constraints_annotations.json", "r") as file_annotations:
+        dict_of_constraints_annotations: Dict[str, List[Tuple[str, str, str]]] = json.load(file_annotations)
+
+    # Store inputs.
+    _SHARED_INPUTS["experiments"][env_path] = {
+        "config_clustering": config_clustering,
+        "config_experiment": config_experiment,
+        "history": sorted(dict_of_constraints_annotations.items()),
+        "vectors_key": vectors_key,
+        "data_IDs_key": data_IDs_key,
+    }
+    return _SHARED_INPUTS["experiments"][env_path]
+
+
+# ==============================================================================
+# PRIVATE - REPLAY TASK
+# ==============================================================================
+def _replay_task(
+    env_path: str,
+) -> Tuple[str, Optional[Dict[str, Tuple[Dict[str, int], Dict[str, float]]]], Optional[str]]:
+    """
+    A method aimed at replay all iterations of an ablation experiment, incrementally in one constraints manager.
+
+    Args:
+        env_path (str): The ablation experiment environment path.
+
+    Returns:
+        Tuple[str, Optional[Dict[str, Tuple[Dict[str, int], Dict[str, float]]]], Optional[str]]: The environment path, the clustering result and the clustering times (in the format of `dict_of_computation_times.json`) of each iteration (`None` if the replay failed), and the error (`None` if the replay succeeded).
+    """
+
+    # Initialize results.
+    dict_of_results: Dict[str, Tuple[Dict[str, int], Dict[str, float]]] = {}
+    try:
+        dict_of_inputs: Dict[str, Any] = _load_shared_inputs(env_path=env_path)
+
+        # Initialize constraints manager.
+        constraints_manager: AbstractConstraintsManager = managing_factory(
+            list_of_data_IDs=_SHARED_INPUTS["data_IDs"][dict_of_inputs["data_IDs_key"]],
+            manager=dict_of_inputs["config_experiment"]["manager_type"],
+        )
+
+        # Replay iterations in order (the constraints manager is updated with annotations of each iteration).
+        for iteration_id, list_of_triplet_annotated in dict_of_inputs["history"]:
+            dict_of_replay_times, clustering_result = replay_benchmark.replay_iteration(
+                constraints_manager=constraints_manager,
+                list_of_triplet_annotated=list_of_triplet_annotated,
+                config_clustering=dict_of_inputs["config_clustering"],
+                random_seed=dict_of_inputs["config_experiment"]["random_seed"],
+                dict_of_vectors=_SHARED_INPUTS["vectors"][dict_of_inputs["vectors_key"]],
+            )
+
+            # Format clustering times as in experiment runs.
+            time_clustering_stop: float = datetime.timestamp(datetime.now())
+            time_clustering_init: float = time_clustering_stop - dict_of_replay_times["clustering"]
+            time_clustering_start: float = time_clustering_init - dict_of_replay_times["clustering_init"]
+            dict_of_results[iteration_id] = (
+                clustering_result,
+                {
+                    "clustering_start": time_clustering_start,
+                    "clustering_init": time_clustering_init,
+                    "clustering_stop": time_clustering_stop,
+                    "clustering_TOTAL_RUN": (time_clustering_stop - time_clustering_init),
+                },
+            )
+    except Exception as error:  # noqa: B902
+        return (env_path, None, type(error).__name__ + ": " + str(error))
+
+    # Return results.
+    return (env_path, dict_of_results, None)
+
+
+# ==============================================================================
+# PRIVATE - STORE ABLATION
+# ==============================================================================
+def _store_ablation(
+    env_path: str,
+    dict_of_results: Dict[str, Tuple[Dict[str, int], Dict[str, float]]],
+) -> None:
+    """
+    A method aimed at store the replayed iterations of an ablation experiment in the standard experiment files, then write its `.done` file.
+
+    Args:
+        env_path (str): The ablation experiment environment path.
+        dict_of_results (Dict[str, Tuple[Dict[str, int], Dict[str, float]]]): The clustering result and clustering times of each iteration.
+    """
+
+    # Load computation times of the source experiment (for sampling times).
+    with open(_SHARED_INPUTS["experiments"][env_path]["config_experiment"]["_REPLAY_OF"] + "dict_of_computation_times.json", "r") as file_source_times:
+        dict_of_source_computation_times: Dict[str, Dict[str, float]] = json.load(file_source_times)
+
+    # Store dictionary of clustering results.
+    with open(env_path + "dict_of_clustering_results.json", "w") as file_clustering_results:
+        json.dump(
+            {iteration_id: dict_of_results[iteration_id][0] for iteration_id in sorted(dict_of_results.keys())},
+            file_clustering_results,
+        )
+
+    # Store dictionary of computation time.
+    dict_of_computation_times: Dict[str, Dict[str, float]] = {}
+    for iteration_id in sorted(dict_of_results.keys()):
+        dict_of_source_times: Dict[str, float] = dict_of_source_computation_times.get(iteration_id, {})
+        dict_of_computation_times[iteration_id] = {
+            **{
+                time_key: dict_of_source_times[time_key]
+                for time_key in ["sampling_start", "sampling_init", "sampling_stop", "sampling_TOTAL_RUN"]
+                if time_key in dict_of_source_times.keys()
+            },
+            **dict_of_results[iteration_id][1],
+        }
+        dict_of_computation_times[iteration_id]["TOTAL_RUN"] = (
+            dict_of_source_times.get("sampling_TOTAL_RUN", 0.0) + dict_of_results[iteration_id][1]["clustering_TOTAL_RUN"]
+        )
+    with open(env_path + "dict_of_computation_times.json", "w") as file_times:
+        json.dump(dict_of_computation_times, file_times)
+
+    # Write a ".done" file.
+    with open(env_path + ".done", "a"):
+        pass
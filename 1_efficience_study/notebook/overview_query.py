@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         overview_query
+* Description:  Query overviews (mean, standard error of the mean, confidence interval) of finished experiments from an in-memory results cube.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy
+import pandas as pd
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+
+import overview_rendering
+import overview_stats
+import results_store
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Loaded results cubes, by results store path.
+_DICT_OF_CUBES: Dict[str, Dict[str, Any]] = {}
+
+
+# ==============================================================================
+# QUERY - LOAD RESULTS CUBE
+# ==============================================================================
+def load_results_cube(
+    store_path: str = results_store.DEFAULT_STORE_PATH,
+    reload: bool = False,
+) -> Dict[str, Any]:
+    """
+    A method aimed at load the results cube of a results store, once per session.
+    The cube contains the factors of each experiment. Values of a metric (array of shape `(experiments, iterations)`) are read from the store the first time the metric is queried.
+    Use `reload=True` after new experiments are added to the store.
+
+    Args:
+        store_path (str, optional): The path to the results store. Defaults to `results_store.DEFAULT_STORE_PATH`.
+        reload (bool, optional): The option to read the store again. Defaults to `False`.
+
+    Returns:
+        Dict[str, Any]: The results cube, with the factors of each experiment (`"EXPERIMENTS"`, indexed by environment path), the iterations (`"ITERATIONS"`), the values of loaded metrics (`"VALUES"`) and the results of previous queries (`"QUERIES"`).
+    """
+
+    # Case of cube already loaded.
+    if (store_path in _DICT_OF_CUBES.keys()) and (not reload):
+        return _DICT_OF_CUBES[store_path]
+
+    # Read factors and iterations of all experiments.
+    df_results: pd.DataFrame = results_store.query_results_store(
+        columns=["env_path"] + results_store.LIST_OF_FACTORS + ["iteration"],
+        store_path=store_path,
+    )
+
+    # Store the cube.
+    _DICT_OF_CUBES[store_path] = {
+        "STORE_PATH": store_path,
+        "EXPERIMENTS": (
+            df_results.drop_duplicates(subset="env_path")
+            .set_index("env_path")
+            .sort_index()[results_store.LIST_OF_FACTORS]
+        ),
+        "ITERATIONS": numpy.arange(df_results["iteration"].max() + 1 if (len(df_results) != 0) else 0),
+        "VALUES": {},
+        "QUERIES": {},
+    }
+
+    # Return the cube.
+    return _DICT_OF_CUBES[store_path]
+
+
+# ==============================================================================
+# QUERY - OVERVIEW
+# ==============================================================================
+def overview(
+    metric: str,
+    group_by: Optional[List[str]] = None,
+    where: Optional[Dict[str, Any]] = None,
+    iterations: Optional[range] = None,
+    with_bootstrap: bool = True,
+    nb_resamples: int = 2000,
+    confidence_level: float = 0.95,
+    store_path: str = results_store.DEFAULT_STORE_PATH,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    A method aimed at compute the overview of a metric over iterations, for each group of experiments.
+    Experiments are read once from the results store (cf. `load_results_cube`), and the results of a query are kept, so that exploring factors combinations doesn't scan the filesystem again.
+    Usage example: `overview(metric="v_measure", group_by=["sampling", "clustering"], where={"vectorization": "tfidf"}, iterations=range(60))`.
+
+    Args:
+        metric (str): The metric to overview (a metric, time or constraints count of `results_store.STORE_SCHEMA`).
+        group_by (Optional[List[str]], optional): The factors that define groups of experiments. Defaults to `None` (one group, `"ALL"`).
+        where (Optional[Dict[str, Any]], optional): The value (or list of values) of factors of experiments to keep. Defaults to `None` (all experiments).
+        iterations (Optional[range], optional): The iterations to overview. Defaults to `None` (all iterations).
+        with_bootstrap (bool, optional): The option to compute the bootstrap confidence interval. Defaults to `True`.
+        nb_resamples (int, optional): The number of bootstrap resamples. Defaults to `2000`.
+        confidence_level (float, optional): The confidence level of the interval. Defaults to `0.95`.
+        store_path (str, optional): The path to the results store. Defaults to `results_store.DEFAULT_STORE_PATH`.
+
+    Raises:
+        ValueError: If parameters are badly set.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each group (labelled by its factors values), the iterations (`"ITERATIONS"`), the number of experiments (`"NB_EXPERIMENTS"`) and the statistics of each iteration (`"MEAN"`, `"SEM"`, and if requested `"CI_LOW"` and `"CI_HIGH"`).
+    """
+
+    # Set default parameters.
+    if group_by is None:
+        group_by = []
+    if where is None:
+        where = {}
+
+    # Check parameters.
+    if metric not in results_store.STORE_SCHEMA.names[2 + len(results_store.LIST_OF_FACTORS) :]:
+        raise ValueError("The `metric` '" + str(metric) + "' is not in the results store.")
+    for factor in list(group_by) + list(where.keys()):
+        if factor not in results_store.LIST_OF_FACTORS:
+            raise ValueError("The `factor` '" + str(factor) + "' is not a factor of the results store.")
+
+    # Load the cube.
+    cube: Dict[str, Any] = load_results_cube(store_path=store_path)
+
+    # Case of query already done.
+    query_key: Tuple[Hashable, ...] = (
+        metric,
+        tuple(group_by),
+        tuple(sorted((factor, tuple(_get_list_of_values(value))) for factor, value in where.items())),
+        None if (iterations is None) else tuple(iterations),
+        with_bootstrap,
+        nb_resamples,
+        confidence_level,
+    )
+    if query_key in cube["QUERIES"].keys():
+        return cube["QUERIES"][query_key]
+
+    # Get iterations to overview.
+    array_of_iterations: numpy.ndarray = (
+        cube["ITERATIONS"] if (iterations is None) else numpy.asarray(list(iterations), dtype=int)
+    )
+    if (len(array_of_iterations) != 0) and (
+        (array_of_iterations.min() < 0) or (len(cube["ITERATIONS"]) <= array_of_iterations.max())
+    ):
+        raise ValueError(
+            "The `iterations` must be between 0 and " + str(len(cube["ITERATIONS"]) - 1) + " (last iteration of the results store)."
+        )
+
+    # Get experiments to keep.
+    df_experiments: pd.DataFrame = cube["EXPERIMENTS"]
+    array_of_kept: numpy.ndarray = numpy.ones(len(df_experiments), dtype=bool)
+    for factor, value in where.items():
+        array_of_kept &= df_experiments[factor].isin(_get_list_of_values(value)).to_numpy()
+    array_of_kept_indexes: numpy.ndarray = numpy.flatnonzero(array_of_kept)
+
+    # Get experiments of each group.
+    dict_of_groups: Dict[str, numpy.ndarray] = {}
+    if len(group_by) == 0:
+        dict_of_groups["ALL"] = array_of_kept_indexes
+    else:
+        dict_of_group_indexes: Dict[Any, numpy.ndarray] = (
+            df_experiments.iloc[array_of_kept_indexes].groupby(group_by, observed=True, sort=True).indices
+        )
+        for group_values, array_of_group_indexes in dict_of_group_indexes.items():
+            group_values = group_values if isinstance(group_values, tuple) else (group_values,)
+            group_label: str = ", ".join(
+                factor + "=" + str(factor_value) for factor, factor_value in zip(group_by, group_values)
+            )
+            dict_of_groups[group_label] = array_of_kept_indexes[array_of_group_indexes]
+
+    # Compute statistics of each group.
+    array_of_values: numpy.ndarray = _get_metric_values(cube=cube, metric=metric)[:, array_of_iterations]
+    dict_of_overviews: Dict[str, Dict[str, Any]] = {}
+    for group_label, array_of_group_indexes in dict_of_groups.items():
+        dict_of_overviews[group_label] = {
+            "ITERATIONS": array_of_iterations,
+            "NB_EXPERIMENTS": len(array_of_group_indexes),
+            **overview_stats.compute_overview_statistics(
+                array_of_values=array_of_values[array_of_group_indexes],
+                with_bootstrap=with_bootstrap,
+                nb_resamples=nb_resamples,
+                confidence_level=confidence_level,
+            ),
+        }
+
+    # Keep and return the query result.
+    cube["QUERIES"][query_key] = dict_of_overviews
+    return dict_of_overviews
+
+
+# ==============================================================================
+# QUERY - PLOT OVERVIEW
+# ==============================================================================
+def plot_overview(
+    dict_of_overviews: Dict[str, Dict[str, Any]],
+    ylabel: str,
+    title: Optional[str] = None,
+    error_type: str = "sem",
+    filepath: Optional[str] = None,
+    max_nb_points: Optional[int] = overview_rendering.DEFAULT_MAX_NB_POINTS,
+    list_of_highlighted_iterations: Optional[List[int]] = None,
+    list_of_formats: Optional[List[str]] = None,
+) -> Figure:
+    """
+    A method aimed at plot the result of an `overview` query: one curve and one error band per group.
+
+    Args:
+        dict_of_overviews (Dict[str, Dict[str, Any]]): The result of an `overview` query.
+        ylabel (str): The label of the y axis.
+        title (Optional[str], optional): The title of the graph. Defaults to `None`.
+        error_type (str, optional): The error band to plot: `"sem"` (standard error of the mean) or `"ci"` (bootstrap confidence interval, the query needs `with_bootstrap=True`). Defaults to `"sem"`.
+        filepath (Optional[str], optional): The path to store the graph, without extension. Defaults to `None` (not stored).
+        max_nb_points (Optional[int], optional): The maximum number of points drawn per curve, with min/max-preserving decimation (cf. `overview_rendering`). Defaults to `overview_rendering.DEFAULT_MAX_NB_POINTS`. `None` to draw all iterations.
+        list_of_highlighted_iterations (Optional[List[int]], optional): The iterations to mark on curves. Defaults to `None` (no marker).
+        list_of_formats (Optional[List[str]], optional): The formats of the stored graph: `"png"`, `"svg"`, `"pdf"` or `"html"` (interactive). Defaults to `None` (`["png"]`).
+
+    Returns:
+        Figure: The figure.
+    """
+
+    # Create a new figure.
+    fig: Figure = plt.figure(figsize=(15, 7.5), dpi=300)
+    axis = fig.gca()
+
+    # For each group...
+    for group_label, dict_of_statistics in dict_of_overviews.items():
+
+        # Plot average evolution and its error band (decimated, with markers limited to highlighted iterations).
+        overview_rendering.plot_evolution(
+            axis=axis,
+            list_of_iterations=list(dict_of_statistics["ITERATIONS"]),
+            dict_of_statistics=dict_of_statistics,
+            error_type=error_type,
+            label=group_label + " (" + str(dict_of_statistics["NB_EXPERIMENTS"]) + ")",
+            marker=("" if list_of_highlighted_iterations is None else "o"),
+            max_nb_points=max_nb_points,
+            list_of_highlighted_iterations=list_of_highlighted_iterations,
+        )
+
+    # Set axis name.
+    axis.set_xlabel(
+        "iteration [#]",
+        fontsize=18,
+    )
+    axis.set_ylabel(
+        ylabel,
+        fontsize=18,
+    )
+
+    # Plot the title.
+    if title is not None:
+        axis.set_title(
+            title,
+            fontsize=20,
+        )
+
+    # Plot the legend and the grid.
+    axis.legend(fontsize=15)
+    axis.grid(True)
+
+    # Store the graph.
+    if filepath is not None:
+        overview_rendering.save_figure(
+            fig=fig,
+            filepath=filepath,
+            list_of_formats=list_of_formats,
+        )
+
+    # Return the figure.
+    return fig
+
+
+# ==============================================================================
+# PRIVATE - GET METRIC VALUES
+# ==============================================================================
+def _get_metric_values(
+    cube: Dict[str, Any],
+    metric: str,
+) -> numpy.ndarray:
+    """
+    A method aimed at get the values of a metric for all experiments of the cube (read from the store the first time).
+    Iterations not reached by an experiment are forward-filled with its last known value (most of the time, the experiment has reached annotation completeness).
+
+    Args:
+        cube (Dict[str, Any]): The results cube (cf. `load_results_cube`).
+        metric (str): The metric.
+
+    Returns:
+        numpy.ndarray: The array of values, of shape `(experiments, iterations)`.
+    """
+
+    # Case of metric already loaded.
+    if metric in cube["VALUES"].keys():
+        return cube["VALUES"][metric]
+
+    # Read the metric of all experiments (only needed columns are read).
+    df_results: pd.DataFrame = results_store.query_results_store(
+        columns=["env_path", "iteration", metric],
+        store_path=cube["STORE_PATH"],
+    )
+
+    # Scatter values into the dense array.
+    array_of_values: numpy.ndarray = numpy.full((len(cube["EXPERIMENTS"]), len(cube["ITERATIONS"])), numpy.nan)
+    array_of_values[
+        cube["EXPERIMENTS"].index.get_indexer(df_results["env_path"]),
+        df_results["iteration"].to_numpy(),
+    ] = df_results[metric].to_numpy(dtype=float, na_value=numpy.nan)
+
+    # Forward-fill iterations not reached with the value of the last reached iteration.
+    array_of_last_indexes: numpy.ndarray = numpy.maximum.accumulate(
+        numpy.where(~numpy.isnan(array_of_values), numpy.arange(len(cube["ITERATIONS"]))[None, :], -1),
+        axis=1,
+    )
+    array_of_values = numpy.where(
+        array_of_last_indexes >= 0,
+        numpy.take_along_axis(array_of_values, numpy.maximum(array_of_last_indexes, 0), axis=1),
+        numpy.nan,
+    )
+
+    # Keep and return values.
+    cube["VALUES"][metric] = array_of_values
+    return array_of_values
+
+
+# ==============================================================================
+# PRIVATE - GET LIST OF VALUES
+# ==============================================================================
+def _get_list_of_values(
+    value: Any,
+) -> List[Any]:
+    """
+    A method aimed at get the list of accepted values of a `where` condition.
+
+    Args:
+        value (Any): A value, or a list (tuple, set) of values.
+
+    Returns:
+        List[Any]: The list of values.
+    """
+    return sorted(value) if isinstance(value, (list, tuple, set)) else [value]
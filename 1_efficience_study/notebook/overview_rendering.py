@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         overview_rendering
+* Description:  Render overview curves with bounded cost: min/max decimation, limited markers, vector and interactive outputs.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import io
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+import overview_stats
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Default maximum number of points drawn per curve (curves with more iterations are decimated).
+DEFAULT_MAX_NB_POINTS: int = 1000
+
+# Default maximum number of markers drawn per curve (if no iteration is highlighted).
+DEFAULT_MAX_NB_MARKERS: int = 25
+
+# Formats available to store a graph.
+LIST_OF_AVAILABLE_FORMATS: List[str] = ["png", "svg", "pdf", "html"]
+
+# Template of interactive graph: the SVG graph with a mouse zoom (wheel), pan (drag) and reset (double click).
+HTML_TEMPLATE: str = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>body {{ margin: 0; }} svg {{ width: 100vw; height: 100vh; cursor: grab; }}</style>
+</head>
+<body>
+{svg}
+<script>
+const svg = document.querySelector("svg");
+const initialViewBox = svg.getAttribute("viewBox").split(" ").map(Number);
+let viewBox = initialViewBox.slice();
+let dragStart = null;
+const apply = () => svg.setAttribute("viewBox", viewBox.join(" "));
+const toSvgPoint = (event) => {{
+    const rect = svg.getBoundingClientRect();
+    return [viewBox[0] + (event.clientX - rect.left) / rect.width * viewBox[2], viewBox[1] + (event.clientY - rect.top) / rect.height * viewBox[3]];
+}};
+svg.addEventListener("wheel", (event) => {{
+    event.preventDefault();
+    const [x, y] = toSvgPoint(event);
+    const scale = event.deltaY < 0 ? 0.8 : 1.25;
+    viewBox = [x - (x - viewBox[0]) * scale, y - (y - viewBox[1]) * scale, viewBox[2] * scale, viewBox[3] * scale];
+    apply();
+}});
+svg.addEventListener("mousedown", (event) => {{ dragStart = toSvgPoint(event); }});
+svg.addEventListener("mousemove", (event) => {{
+    if (dragStart === null) return;
+    const [x, y] = toSvgPoint(event);
+    viewBox[0] -= x - dragStart[0];
+    viewBox[1] -= y - dragStart[1];
+    apply();
+}});
+window.addEventListener("mouseup", () => {{ dragStart = null; }});
+svg.addEventListener("dblclick", () => {{ viewBox = initialViewBox.slice(); apply(); }});
+</script>
+</body>
+</html>
+"""
+
+
+# ==============================================================================
+# RENDERING - PLOT EVOLUTION
+# ==============================================================================
+def plot_evolution(
+    axis: Axes,
+    list_of_iterations: List[int],
+    dict_of_statistics: Dict[str, numpy.ndarray],
+    error_type: str = "sem",
+    label: Optional[str] = None,
+    color: Optional[str] = None,
+    marker: str = "",
+    linestyle: str = "-",
+    max_nb_points: Optional[int] = DEFAULT_MAX_NB_POINTS,
+    list_of_highlighted_iterations: Optional[List[int]] = None,
+) -> Line2D:
+    """
+    A method aimed at plot the average evolution of an overview and its error band, with a bounded number of points and markers.
+
+    Args:
+        axis (Axes): The axis of the graph.
+        list_of_iterations (List[int]): The iterations of the overview.
+        dict_of_statistics (Dict[str, numpy.ndarray]): The statistics of the overview (cf. `overview_stats.compute_overview_statistics`).
+        error_type (str, optional): The error band to plot: `"sem"` (standard error of the mean) or `"ci"` (bootstrap confidence interval). Defaults to `"sem"`.
+        label (Optional[str], optional): The label of the curve. Defaults to `None`.
+        color (Optional[str], optional): The color of the curve. Defaults to `None` (next color of the axis).
+        marker (str, optional): The marker of the curve. Defaults to `""` (no marker).
+        linestyle (str, optional): The line style of the curve. Defaults to `"-"`.
+        max_nb_points (Optional[int], optional): The maximum number of points drawn (cf. `decimate_curves`). Defaults to `DEFAULT_MAX_NB_POINTS`. `None` to draw all iterations.
+        list_of_highlighted_iterations (Optional[List[int]], optional): The iterations to mark (always drawn). Defaults to `None` (at most `DEFAULT_MAX_NB_MARKERS` evenly spaced markers).
+
+    Returns:
+        Line2D: The curve of the average evolution.
+    """
+
+    # Get error band.
+    error_band: Tuple[numpy.ndarray, numpy.ndarray] = overview_stats.get_error_band(
+        dict_of_statistics=dict_of_statistics,
+        error_type=error_type,
+    )
+
+    # Decimate average and error band on the same iterations (highlighted iterations are kept).
+    array_of_iterations: numpy.ndarray = numpy.asarray(list_of_iterations)
+    array_of_indices: numpy.ndarray = decimate_curves(
+        array_of_x=array_of_iterations,
+        list_of_arrays_of_y=[numpy.asarray(dict_of_statistics["MEAN"]), error_band[0], error_band[1]],
+        max_nb_points=max_nb_points,
+        list_of_kept_x=list_of_highlighted_iterations,
+    )
+    array_of_x: numpy.ndarray = array_of_iterations[array_of_indices]
+
+    # Plot average evolution.
+    dict_of_options: Dict[str, Any] = {} if color is None else {"color": color, "markerfacecolor": color}
+    line: Line2D = axis.plot(
+        array_of_x,  # x
+        numpy.asarray(dict_of_statistics["MEAN"])[array_of_indices],  # y
+        label=label,
+        marker=marker,
+        markevery=get_marker_indices(
+            array_of_x=array_of_x,
+            list_of_highlighted_x=list_of_highlighted_iterations,
+        ),
+        markersize=5,
+        linewidth=1,
+        linestyle=linestyle,
+        **dict_of_options,
+    )[0]
+
+    # Plot error band.
+    axis.fill_between(
+        x=array_of_x,
+        y1=error_band[0][array_of_indices],  # y1
+        y2=error_band[1][array_of_indices],  # y2
+        color=line.get_color(),
+        alpha=0.2,
+    )
+
+    # Return the curve.
+    return line
+
+
+# ==============================================================================
+# RENDERING - DECIMATE CURVES
+# ==============================================================================
+def decimate_curves(
+    array_of_x: numpy.ndarray,
+    list_of_arrays_of_y: List[numpy.ndarray],
+    max_nb_points: Optional[int] = DEFAULT_MAX_NB_POINTS,
+    list_of_kept_x: Optional[List[int]] = None,
+) -> numpy.ndarray:
+    """
+    A method aimed at select the points of curves sharing the same x to draw, with min/max-preserving downsampling.
+    x is split into buckets, and the minimum and the maximum of each curve are kept in each bucket: peaks and drops stay visible, and the number of points is bounded.
+
+    Args:
+        array_of_x (numpy.ndarray): The x of curves (sorted).
+        list_of_arrays_of_y (List[numpy.ndarray]): The y of curves (`NaN` are ignored).
+        max_nb_points (Optional[int], optional): The maximum number of points to draw (not counting first, last and kept points). Defaults to `DEFAULT_MAX_NB_POINTS`. `None` to keep all points.
+        list_of_kept_x (Optional[List[int]], optional): The x to keep anyway. Defaults to `None`.
+
+    Returns:
+        numpy.ndarray: The sorted indices of points to draw.
+    """
+
+    # Case of few points: keep all points.
+    nb_points: int = len(array_of_x)
+    if (max_nb_points is None) or (nb_points <= max_nb_points):
+        return numpy.arange(nb_points)
+
+    # Split points into buckets of same size (each bucket keeps up to two points per curve).
+    nb_buckets: int = max(1, max_nb_points // (2 * len(list_of_arrays_of_y)))
+    bucket_size: int = -(-nb_points // nb_buckets)
+    nb_buckets = -(-nb_points // bucket_size)
+    array_of_offsets: numpy.ndarray = numpy.arange(nb_buckets) * bucket_size
+
+    # Get indices of first, last and kept points.
+    list_of_indices: List[numpy.ndarray] = [numpy.array([0, nb_points - 1])]
+    if list_of_kept_x is not None:
+        list_of_indices.append(numpy.flatnonzero(numpy.isin(array_of_x, list_of_kept_x)))
+
+    # For each curve, get indices of minimum and maximum of each bucket (padding and `NaN` are never selected unless a bucket has no value).
+    for array_of_y in list_of_arrays_of_y:
+        array_of_padded_y: numpy.ndarray = numpy.full(nb_buckets * bucket_size, numpy.nan)
+        array_of_padded_y[:nb_points] = array_of_y
+        array_of_padded_y = array_of_padded_y.reshape(nb_buckets, bucket_size)
+        list_of_indices.append(array_of_offsets + numpy.argmin(numpy.where(numpy.isnan(array_of_padded_y), numpy.inf, array_of_padded_y), axis=1))
+        list_of_indices.append(array_of_offsets + numpy.argmax(numpy.where(numpy.isnan(array_of_padded_y), -numpy.inf, array_of_padded_y), axis=1))
+
+    # Return sorted indices (without padding).
+    array_of_indices: numpy.ndarray = numpy.unique(numpy.concatenate(list_of_indices))
+    return array_of_indices[array_of_indices < nb_points]
+
+
+# ==============================================================================
+# RENDERING - GET MARKER INDICES
+# ==============================================================================
+def get_marker_indices(
+    array_of_x: numpy.ndarray,
+    list_of_highlighted_x: Optional[List[int]] = None,
+    max_nb_markers: int = DEFAULT_MAX_NB_MARKERS,
+) -> List[int]:
+    """
+    A method aimed at get the indices of points to mark on a curve (cf. `markevery` of `matplotlib`).
+
+    Args:
+        array_of_x (numpy.ndarray): The x of the drawn curve.
+        list_of_highlighted_x (Optional[List[int]], optional): The x to mark. Defaults to `None` (evenly spaced markers).
+        max_nb_markers (int, optional): The maximum number of evenly spaced markers. Defaults to `DEFAULT_MAX_NB_MARKERS`.
+
+    Returns:
+        List[int]: The indices of points to mark.
+    """
+
+    # Case of highlighted x.
+    if list_of_highlighted_x is not None:
+        return numpy.flatnonzero(numpy.isin(array_of_x, list_of_highlighted_x)).tolist()
+
+    # Otherwise: evenly spaced markers.
+    if len(array_of_x) <= max_nb_markers:
+        return list(range(len(array_of_x)))
+    return numpy.unique(numpy.linspace(0, len(array_of_x) - 1, max_nb_markers).round().astype(int)).tolist()
+
+
+# ==============================================================================
+# RENDERING - SAVE FIGURE
+# ==============================================================================
+def save_figure(
+    fig: Figure,
+    filepath: str,
+    list_of_formats: Optional[List[str]] = None,
+    dpi: int = 300,
+) -> List[str]:
+    """
+    A method aimed at store a graph in several formats: `"png"` (raster), `"svg"` and `"pdf"` (vector, zoomable), `"html"` (interactive SVG with mouse zoom and pan).
+
+    Args:
+        fig (Figure): The figure to store.
+        filepath (str): The path to store the graph, without extension.
+        list_of_formats (Optional[List[str]], optional): The formats to store (cf. `LIST_OF_AVAILABLE_FORMATS`). Defaults to `None` (`["png"]`).
+        dpi (int, optional): The resolution of raster outputs. Defaults to `300`.
+
+    Raises:
+        ValueError: if a format is not available.
+
+    Returns:
+        List[str]: The paths of stored graphs.
+    """
+
+    # Check formats.
+    if list_of_formats is None:
+        list_of_formats = ["png"]
+    for graph_format in list_of_formats:
+        if graph_format not in LIST_OF_AVAILABLE_FORMATS:
+            raise ValueError("The `graph_format` '" + str(graph_format) + "' is not implemented.")
+
+    # Store the graph in each format.
+    list_of_filepaths: List[str] = []
+    for graph_format in list_of_formats:
+
+        # Case of interactive graph: embed the SVG graph in a HTML page.
+        if graph_format == "html":
+            svg_buffer: io.StringIO = io.StringIO()
+            fig.savefig(
+                svg_buffer,
+                format="svg",
+                transparent=True,
+                bbox_inches="tight",
+            )
+            svg: str = svg_buffer.getvalue()
+            with open(filepath + ".html", "w", encoding="utf-8") as file_graph:
+                file_graph.write(
+                    HTML_TEMPLATE.format(
+                        title=filepath.split("/")[-1],
+                        svg=svg[svg.index("<svg"):],
+                    )
+                )
+
+        # Case of static graph.
+        else:
+            fig.savefig(
+                filepath + "." + graph_format,
+                format=graph_format,
+                dpi=dpi,
+                transparent=True,
+                bbox_inches="tight",
+            )
+        list_of_filepaths.append(filepath + "." + graph_format)
+
+    # Return paths of stored graphs.
+    return list_of_filepaths
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         overview_stats
+* Description:  Vectorized statistics (mean, standard error of the mean, bootstrap confidence intervals) for overview curves.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Maximum number of float values handled by one bootstrap chunk (about 128 MB).
+MAX_ELEMENTS_PER_CHUNK: int = 2**24
+
+
+# ==============================================================================
+# STATS - MEAN AND SEM
+# ==============================================================================
+def compute_mean_and_sem(
+    array_of_values: numpy.ndarray,
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    A method aimed at compute the mean and the standard error of the mean of each iteration over experiments.
+    The standard error of the mean is computed as `scipy.stats.sem` (with `ddof=1`), and is `nan` when there is less than two experiments.
+
+    Args:
+        array_of_values (numpy.ndarray): The array of values, of shape `(experiments, iterations)`.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The mean and the standard error of the mean of each iteration, both of shape `(iterations,)`.
+    """
+
+    # Get the number of experiments.
+    nb_experiments: int = array_of_values.shape[0]
+
+    # Compute the mean.
+    array_of_means: numpy.ndarray = array_of_values.mean(axis=0)
+
+    # Compute the standard error of the mean.
+    array_of_sems: numpy.ndarray = (
+        array_of_values.std(axis=0, ddof=1) / numpy.sqrt(nb_experiments)
+        if nb_experiments > 1
+        else numpy.full(array_of_values.shape[1], numpy.nan)
+    )
+
+    # Return statistics.
+    return (array_of_means, array_of_sems)
+
+
+# ==============================================================================
+# STATS - BOOTSTRAP CONFIDENCE INTERVAL
+# ==============================================================================
+def compute_bootstrap_confidence_interval(
+    array_of_values: numpy.ndarray,
+    nb_resamples: int = 2000,
+    confidence_level: float = 0.95,
+    chunk_size: Optional[int] = None,
+    nb_workers: int = 1,
+    random_seed: int = 42,
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    A method aimed at compute the percentile bootstrap confidence interval of the mean of each iteration over experiments.
+    Each resample is drawn as multinomial weights over experiments, so that a chunk of resamples is computed with one matrix product `(resamples, experiments) x (experiments, iterations)`.
+    Chunks are seeded from `random_seed` independently of `nb_workers`, so results are reproducible whatever the parallelism.
+
+    Args:
+        array_of_values (numpy.ndarray): The array of values, of shape `(experiments, iterations)`.
+        nb_resamples (int, optional): The number of bootstrap resamples. Defaults to `2000`.
+        confidence_level (float, optional): The confidence level of the interval. Must be between `0.0` and `1.0`. Defaults to `0.95`.
+        chunk_size (Optional[int], optional): The number of resamples computed at once. Defaults to `None` (deduced from `MAX_ELEMENTS_PER_CHUNK`).
+        nb_workers (int, optional): The number of threads used to compute chunks. Defaults to `1`.
+        random_seed (int, optional): The random seed. Defaults to `42`.
+
+    Raises:
+        ValueError: If parameters are badly set.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The lower and upper bounds of the confidence interval of each iteration, both of shape `(iterations,)`.
+    """
+
+    # Check parameters.
+    if (confidence_level <= 0) or (1 <= confidence_level):
+        raise ValueError("The `confidence_level` '" + str(confidence_level) + "' must be between 0.0 and 1.0.")
+    if nb_resamples < 1:
+        raise ValueError("The `nb_resamples` '" + str(nb_resamples) + "' must be greater than 0.")
+
+    # Get the array shape.
+    nb_experiments: int
+    nb_iterations: int
+    nb_experiments, nb_iterations = array_of_values.shape
+
+    # Case of no experiment: no confidence interval.
+    if nb_experiments == 0:
+        return (numpy.full(nb_iterations, numpy.nan), numpy.full(nb_iterations, numpy.nan))
+
+    # Define the chunk size (bounded memory usage).
+    if chunk_size is None:
+        chunk_size = max(1, MAX_ELEMENTS_PER_CHUNK // max(nb_experiments, nb_iterations))
+    list_of_chunk_sizes: List[int] = [
+        min(chunk_size, nb_resamples - chunk_start) for chunk_start in range(0, nb_resamples, chunk_size)
+    ]
+
+    # Define one independent random generator per chunk.
+    list_of_seeds: List[numpy.random.SeedSequence] = numpy.random.SeedSequence(random_seed).spawn(
+        len(list_of_chunk_sizes)
+    )
+
+    # Define the computation of bootstrap means for one chunk.
+    def _compute_chunk_of_means(chunk_index: int) -> numpy.ndarray:
+        generator: numpy.random.Generator = numpy.random.default_rng(list_of_seeds[chunk_index])
+        weights: numpy.ndarray = generator.multinomial(
+            n=nb_experiments,
+            pvals=numpy.full(nb_experiments, 1 / nb_experiments),
+            size=list_of_chunk_sizes[chunk_index],
+        )
+        return (weights @ array_of_values) / nb_experiments
+
+    # Compute bootstrap means (matrix products release the GIL, so threads are enough).
+    list_of_chunks_of_means: List[numpy.ndarray]
+    if nb_workers > 1:
+        with ThreadPoolExecutor(max_workers=nb_workers) as executor:
+            list_of_chunks_of_means = list(executor.map(_compute_chunk_of_means, range(len(list_of_chunk_sizes))))
+    else:
+        list_of_chunks_of_means = [_compute_chunk_of_means(i) for i in range(len(list_of_chunk_sizes))]
+    array_of_bootstrap_means: numpy.ndarray = numpy.concatenate(list_of_chunks_of_means, axis=0)
+
+    # Compute percentile bounds.
+    alpha: float = (1 - confidence_level) / 2
+    array_of_bounds: numpy.ndarray = numpy.quantile(array_of_bootstrap_means, q=[alpha, 1 - alpha], axis=0)
+
+    # Return confidence interval.
+    return (array_of_bounds[0], array_of_bounds[1])
+
+
+# ==============================================================================
+# STATS - OVERVIEW STATISTICS
+# ==============================================================================
+def compute_overview_statistics(
+    array_of_values: numpy.ndarray,
+    with_bootstrap: bool = True,
+    nb_resamples: int = 2000,
+    confidence_level: float = 0.95,
+    nb_workers: int = 1,
+    random_seed: int = 42,
+) -> Dict[str, numpy.ndarray]:
+    """
+    A method aimed at compute all statistics of an overview curve.
+
+    Args:
+        array_of_values (numpy.ndarray): The array of values, of shape `(experiments, iterations)`.
+        with_bootstrap (bool, optional): The option to compute the bootstrap confidence interval. Defaults to `True`.
+        nb_resamples (int, optional): The number of bootstrap resamples. Defaults to `2000`.
+        confidence_level (float, optional): The confidence level of the interval. Defaults to `0.95`.
+        nb_workers (int, optional): The number of threads used to compute bootstrap. Defaults to `1`.
+        random_seed (int, optional): The random seed. Defaults to `42`.
+
+    Returns:
+        Dict[str, numpy.ndarray]: The statistics of each iteration: `"MEAN"`, `"SEM"`, and if requested `"CI_LOW"` and `"CI_HIGH"`.
+    """
+
+    # Compute mean and standard error of the mean.
+    dict_of_statistics: Dict[str, numpy.ndarray] = {}
+    dict_of_statistics["MEAN"], dict_of_statistics["SEM"] = compute_mean_and_sem(
+        array_of_values=array_of_values,
+    )
+
+    # Compute bootstrap confidence interval.
+    if with_bootstrap:
+        dict_of_statistics["CI_LOW"], dict_of_statistics["CI_HIGH"] = compute_bootstrap_confidence_interval(
+            array_of_values=array_of_values,
+            nb_resamples=nb_resamples,
+            confidence_level=confidence_level,
+            nb_workers=nb_workers,
+            random_seed=random_seed,
+        )
+
+    # Return statistics.
+    return dict_of_statistics
+
+
+# ==============================================================================
+# STATS - ERROR BAND
+# ==============================================================================
+def get_error_band(
+    dict_of_statistics: Dict[str, numpy.ndarray],
+    error_type: str = "sem",
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    A method aimed at get the lower and upper bounds of the error band to plot around an overview curve.
+
+    Args:
+        dict_of_statistics (Dict[str, numpy.ndarray]): The statistics computed by `compute_overview_statistics`.
+        error_type (str, optional): The error band type: `"sem"` (mean +/- standard error of the mean) or `"ci"` (bootstrap confidence interval). Defaults to `"sem"`.
+
+    Raises:
+        ValueError: If parameters are badly set.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The lower and upper bounds of the error band.
+    """
+
+    # Case of standard error of the mean.
+    if error_type == "sem":
+        return (
+            dict_of_statistics["MEAN"] - dict_of_statistics["SEM"],
+            dict_of_statistics["MEAN"] + dict_of_statistics["SEM"],
+        )
+
+    # Case of bootstrap confidence interval.
+    if error_type == "ci":
+        return (dict_of_statistics["CI_LOW"], dict_of_statistics["CI_HIGH"])
+
+    # Otherwise: error.
+    raise ValueError("The `error_type` '" + str(error_type) + "' is not implemented.")
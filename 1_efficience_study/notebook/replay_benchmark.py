@@ -0,0 +1,537 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         replay_benchmark
+* Description:  End-to-end benchmark of clustering that replays recorded annotation histories of efficience study experiments.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import pickle  # noqa: S403
+import platform
+import sys
+import time
+from datetime import datetime
+from importlib import metadata
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy
+import pandas as pd
+from cognitivefactory.interactive_clustering.clustering.abstract import (
+    AbstractConstrainedClustering,
+)
+from cognitivefactory.interactive_clustering.clustering.factory import (
+    clustering_factory,
+)
+from cognitivefactory.interactive_clustering.constraints.abstract import (
+    AbstractConstraintsManager,
+)
+from cognitivefactory.interactive_clustering.constraints.factory import (
+    managing_factory,
+)
+from scipy.sparse import csr_matrix
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Default path to stored replays.
+DEFAULT_REPLAYS_PATH: str = "../results/replays/"
+
+# Percentiles of iteration latency to compute.
+LIST_OF_PERCENTILES: List[int] = [50, 90, 95, 99]
+
+# Packages whose versions are stored with replays.
+LIST_OF_PACKAGES: List[str] = [
+    "cognitivefactory-interactive-clustering",
+    "scikit-learn",
+    "numpy",
+    "scipy",
+]
+
+
+# ==============================================================================
+# REPLAY - LOAD INPUTS
+# ==============================================================================
+def load_replay_inputs(
+    env_path: str,
+) -> Dict[str, Any]:
+    """
+    A method aimed at load the inputs needed to replay the annotation history of an experiment.
+    Vectors are converted to sparse matrices once, so that this conversion is not measured at each iteration.
+
+    Args:
+        env_path (str): The experiment environment path. It has to be formatted by the notebook `1_Initialize_convergence_experiments.ipynb`, and the experiment has to be run.
+
+    Returns:
+        Dict[str, Any]: The inputs of the replay: the list of data IDs (`"list_of_data_IDs"`), the vectors (`"dict_of_vectors"`), the annotation history sorted by iteration (`"history"`), the configurations of clustering (`"config_clustering"`) and of experiment (`"config_experiment"`), and the fingerprint of the workload (`"workload_fingerprint"`).
+    """
+
+    # Load configuration for clustering.
+    with open(env_path + "../config.json", "r") as file_config_clustering:
+        config_clustering: Dict[str, Any] = json.load(file_config_clustering)
+
+    # Load configuration for experiment.
+    with open(env_path + "config.json", "r") as file_config_experiment:
+        config_experiment: Dict[str, Any] = json.load(file_config_experiment)
+
+    # Load dict of true intents to get the list of data IDs.
+    with open(env_path + "../../../../../dict_of_true_intents.json", "r") as file_true_intents:
+        list_of_data_IDs: List[str] = sorted(json.load(file_true_intents).keys())
+
+    # Load dict of vectors (the file content is also hashed for the workload fingerprint).
+    with open(env_path + "../../../dict_of_vectors.pkl", "rb") as file_vectors:
+        vectors_content: bytes = file_vectors.read()
+    dict_of_vectors: Dict[str, csr_matrix] = {
+        vector_id: csr_matrix(vector_value)
+        for vector_id, vector_value in pickle.loads(vectors_content).items()  # noqa: S301
+    }
+
+    # Load dictionary of annotation history.
+    with open(env_path + "dict_of_constraints_annotations.json", "r") as file_annotations:
+        dict_of_constraints_annotations: Dict[str, List[Tuple[str, str, str]]] = json.load(file_annotations)
+    history: List[Tuple[str, List[Tuple[str, str, str]]]] = sorted(dict_of_constraints_annotations.items())
+
+    # Compute the workload fingerprint: replays are comparable only on the same data, vectors and history.
+    workload_hash = hashlib.sha1()  # noqa: S324
+    workload_hash.update(json.dumps(list_of_data_IDs).encode("utf-8"))
+    workload_hash.update(hashlib.sha1(vectors_content).digest())  # noqa: S324
+    workload_hash.update(json.dumps(history).encode("utf-8"))
+
+    # Return inputs.
+    return {
+        "list_of_data_IDs": list_of_data_IDs,
+        "dict_of_vectors": dict_of_vectors,
+        "history": history,
+        "config_clustering": config_clustering,
+        "config_experiment": config_experiment,
+        "workload_fingerprint": workload_hash.hexdigest(),
+    }
+
+
+# ==============================================================================
+# REPLAY - RUN
+# ==============================================================================
+def replay_history(
+    env_path: str,
+    config_clustering: Optional[Dict[str, Any]] = None,
+    random_seed: Optional[int] = None,
+    max_iter: Optional[int] = None,
+    nb_repetitions: int = 1,
+    dict_of_inputs: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    A method aimed at replay the recorded annotation history of an experiment with a clustering configuration, and measure the latency of each iteration.
+    At each iteration, the recorded batch of constraints is added to the constraints manager and the clustering is applied: there is no sampling, so the workload is the same for all clustering configurations and library versions.
+    Usage note:
+        - The latency of an iteration is the time spent to add its constraints, to initialize the clustering model and to run the clustering.
+        - With several repetitions, the whole history is replayed several times: latency percentiles are computed on all iterations of all repetitions, and the total time is the median over repetitions.
+        - Partitions are fingerprinted, in order to check if two engines (or two library versions) give the same clustering results.
+
+    Args:
+        env_path (str): The experiment environment path whose history is replayed.
+        config_clustering (Optional[Dict[str, Any]], optional): The clustering configuration (`"algorithm"`, `"init**kargs"` and `"nb_clusters"`, as in clustering environments). Defaults to `None` (the clustering configuration of the experiment).
+        random_seed (Optional[int], optional): The random seed of clustering. Defaults to `None` (the random seed of the experiment).
+        max_iter (Optional[int], optional): The last iteration to replay. Defaults to `None` (all the history).
+        nb_repetitions (int, optional): The number of replays of the history. Defaults to `1`.
+        dict_of_inputs (Optional[Dict[str, Any]], optional): The inputs already loaded by `load_replay_inputs` (ex: to replay several configurations). Defaults to `None`.
+
+    Raises:
+        ValueError: If parameters are badly set.
+
+    Returns:
+        Dict[str, Any]: The replay report: source experiment (`"env_path"`), workload fingerprint, clustering configuration and random seed, environment (`"versions"`, `"python"`, `"machine"`), measures of each iteration (`"iterations"`), latency statistics (`"latency"`) and total time (`"total_time"` and `"list_of_total_times"`).
+    """
+
+    # Check parameters.
+    if nb_repetitions < 1:
+        raise ValueError("The `nb_repetitions` '" + str(nb_repetitions) + "' must be greater than 0.")
+
+    # Load inputs.
+    if dict_of_inputs is None:
+        dict_of_inputs = load_replay_inputs(env_path=env_path)
+    if config_clustering is None:
+        config_clustering = dict_of_inputs["config_clustering"]
+    if random_seed is None:
+        random_seed = dict_of_inputs["config_experiment"]["random_seed"]
+
+    # Select iterations to replay.
+    history: List[Tuple[str, List[Tuple[str, str, str]]]] = [
+        (iteration_id, list_of_triplet_annotated)
+        for iteration_id, list_of_triplet_annotated in dict_of_inputs["history"]
+        if (max_iter is None) or (int(iteration_id) <= max_iter)
+    ]
+
+    # Initialize measures.
+    dict_of_iterations: Dict[str, Dict[str, Any]] = {
+        iteration_id: {
+            "nb_constraints": len(list_of_triplet_annotated),
+            "constraints_times": [],
+            "clustering_init_times": [],
+            "clustering_times": [],
+            "latencies": [],
+            "partition_fingerprint": None,
+        }
+        for iteration_id, list_of_triplet_annotated in history
+    }
+    list_of_total_times: List[float] = []
+
+    # For each repetition...
+    for _ in range(nb_repetitions):
+
+        # Start from a clean memory state.
+        gc.collect()
+
+        # Initialize constraints manager.
+        constraints_manager: AbstractConstraintsManager = managing_factory(
+            list_of_data_IDs=dict_of_inputs["list_of_data_IDs"],
+            manager=dict_of_inputs["config_experiment"]["manager_type"],
+        )
+
+        # Replay each iteration.
+        total_time: float = 0.0
+        for iteration_id, list_of_triplet_annotated in history:
+            dict_of_times, clustering_result = replay_iteration(
+                constraints_manager=constraints_manager,
+                list_of_triplet_annotated=list_of_triplet_annotated,
+                config_clustering=config_clustering,
+                random_seed=random_seed,
+                dict_of_vectors=dict_of_inputs["dict_of_vectors"],
+            )
+
+            # Store measures.
+            dict_of_iteration: Dict[str, Any] = dict_of_iterations[iteration_id]
+            dict_of_iteration["constraints_times"].append(dict_of_times["constraints"])
+            dict_of_iteration["clustering_init_times"].append(dict_of_times["clustering_init"])
+            dict_of_iteration["clustering_times"].append(dict_of_times["clustering"])
+            dict_of_iteration["latencies"].append(dict_of_times["latency"])
+            if dict_of_iteration["partition_fingerprint"] is None:
+                dict_of_iteration["partition_fingerprint"] = get_partition_fingerprint(clustering_result=clustering_result)
+            total_time += dict_of_times["latency"]
+        list_of_total_times.append(total_time)
+
+    # Return the replay report.
+    return {
+        "env_path": env_path,
+        "workload_fingerprint": dict_of_inputs["workload_fingerprint"],
+        "config_clustering": config_clustering,
+        "random_seed": random_seed,
+        "nb_repetitions": nb_repetitions,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "versions": get_package_versions(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "iterations": dict_of_iterations,
+        "latency": compute_latency_statistics(
+            list_of_latencies=[
+                latency
+                for dict_of_iteration in dict_of_iterations.values()
+                for latency in dict_of_iteration["latencies"]
+            ]
+        ),
+        "clustering_latency": compute_latency_statistics(
+            list_of_latencies=[
+                clustering_time
+                for dict_of_iteration in dict_of_iterations.values()
+                for clustering_time in dict_of_iteration["clustering_times"]
+            ]
+        ),
+        "total_time": float(numpy.median(list_of_total_times)),
+        "list_of_total_times": list_of_total_times,
+    }
+
+
+def replay_iteration(
+    constraints_manager: AbstractConstraintsManager,
+    list_of_triplet_annotated: List[Tuple[str, str, str]],
+    config_clustering: Dict[str, Any],
+    random_seed: int,
+    dict_of_vectors: Dict[str, csr_matrix],
+) -> Tuple[Dict[str, float], Dict[str, int]]:
+    """
+    A method aimed at replay one iteration: add the recorded constraints to the constraints manager, then apply the clustering.
+
+    Args:
+        constraints_manager (AbstractConstraintsManager): The constraints manager, that contains constraints of previous iterations (it is updated).
+        list_of_triplet_annotated (List[Tuple[str, str, str]]): The constraints annotated at this iteration.
+        config_clustering (Dict[str, Any]): The clustering configuration (`"algorithm"`, `"init**kargs"` and `"nb_clusters"`).
+        random_seed (int): The random seed of clustering.
+        dict_of_vectors (Dict[str, csr_matrix]): The vectors of data.
+
+    Returns:
+        Tuple[Dict[str, float], Dict[str, int]]: The times (in seconds) spent to add constraints (`"constraints"`), to initialize the clustering model (`"clustering_init"`) and to run the clustering (`"clustering"`), with their sum (`"latency"`), and the clustering result.
+    """
+
+    # Time evaluation : start !
+    time_start: float = time.perf_counter()
+
+    # Update constraints manager.
+    for annotation in list_of_triplet_annotated:
+        constraints_manager.add_constraint(
+            data_ID1=annotation[0],
+            data_ID2=annotation[1],
+            constraint_type=annotation[2],
+        )
+
+    # Time evaluation : constraints added !
+    time_constraints: float = time.perf_counter()
+
+    # Initialize clustering model.
+    clustering_model: AbstractConstrainedClustering = clustering_factory(
+        algorithm=config_clustering["algorithm"],
+        random_seed=random_seed,
+        **config_clustering["init**kargs"],
+    )
+
+    # Time evaluation : init !
+    time_init: float = time.perf_counter()
+
+    # Run clustering.
+    clustering_result: Dict[str, int] = clustering_model.cluster(
+        vectors=dict_of_vectors,
+        nb_clusters=config_clustering["nb_clusters"],
+        constraints_manager=constraints_manager,
+    )
+
+    # Time evaluation : stop !
+    time_stop: float = time.perf_counter()
+
+    # Return times and clustering result.
+    return (
+        {
+            "constraints": time_constraints - time_start,
+            "clustering_init": time_init - time_constraints,
+            "clustering": time_stop - time_init,
+            "latency": time_stop - time_start,
+        },
+        clustering_result,
+    )
+
+
+# ==============================================================================
+# REPLAY - STATISTICS
+# ==============================================================================
+def compute_latency_statistics(
+    list_of_latencies: List[float],
+) -> Dict[str, Optional[float]]:
+    """
+    A method aimed at compute percentiles, mean and maximum of latencies.
+
+    Args:
+        list_of_latencies (List[float]): The latencies (in seconds).
+
+    Returns:
+        Dict[str, Optional[float]]: The percentiles (`"p50"`, `"p90"`, ... cf. `LIST_OF_PERCENTILES`), the mean (`"mean"`) and the maximum (`"max"`). Values are `None` if there is no latency.
+    """
+
+    # Case of no latency.
+    if len(list_of_latencies) == 0:
+        return {
+            **{"p" + str(percentile): None for percentile in LIST_OF_PERCENTILES},
+            "mean": None,
+            "max": None,
+        }
+
+    # Compute statistics.
+    array_of_latencies: numpy.ndarray = numpy.array(list_of_latencies, dtype=numpy.float64)
+    return {
+        **{
+            "p" + str(percentile): float(numpy.percentile(array_of_latencies, percentile))
+            for percentile in LIST_OF_PERCENTILES
+        },
+        "mean": float(array_of_latencies.mean()),
+        "max": float(array_of_latencies.max()),
+    }
+
+
+def get_partition_fingerprint(
+    clustering_result: Dict[str, int],
+) -> str:
+    """
+    A method aimed at get the fingerprint of a clustering result, independently of cluster labels.
+
+    Args:
+        clustering_result (Dict[str, int]): The clustering result.
+
+    Returns:
+        str: The SHA-1 of the partition (clusters are sorted lists of data IDs).
+    """
+
+    # Group data IDs by cluster.
+    dict_of_clusters: Dict[int, List[str]] = {}
+    for data_ID, cluster_ID in sorted(clustering_result.items()):
+        dict_of_clusters.setdefault(cluster_ID, []).append(data_ID)
+
+    # Hash the sorted list of clusters.
+    return hashlib.sha1(  # noqa: S324
+        json.dumps(sorted(dict_of_clusters.values())).encode("utf-8")
+    ).hexdigest()
+
+
+def get_package_versions() -> Dict[str, Optional[str]]:
+    """
+    A method aimed at get the versions of tracked packages.
+
+    Returns:
+        Dict[str, Optional[str]]: The version of each package in `LIST_OF_PACKAGES` (`None` if not installed).
+    """
+    dict_of_versions: Dict[str, Optional[str]] = {}
+    for package in LIST_OF_PACKAGES:
+        try:
+            dict_of_versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            dict_of_versions[package] = None
+    return dict_of_versions
+
+
+# ==============================================================================
+# REPLAY - STORE AND COMPARE
+# ==============================================================================
+def store_replay(
+    dict_of_replay: Dict[str, Any],
+    replay_name: str,
+    replays_path: str = DEFAULT_REPLAYS_PATH,
+) -> str:
+    """
+    A method aimed at store a replay report.
+
+    Args:
+        dict_of_replay (Dict[str, Any]): The replay report (cf. `replay_history`).
+        replay_name (str): The name of the replay (ex: the engine or the library version).
+        replays_path (str, optional): The path to stored replays. Defaults to `DEFAULT_REPLAYS_PATH`.
+
+    Returns:
+        str: The path of the stored replay.
+    """
+    os.makedirs(replays_path, exist_ok=True)
+    filepath: str = replays_path + replay_name + ".json"
+    with open(filepath, "w") as file_replay:
+        json.dump(dict_of_replay, file_replay)
+    return filepath
+
+
+def load_replay(
+    replay_name: str,
+    replays_path: str = DEFAULT_REPLAYS_PATH,
+) -> Dict[str, Any]:
+    """
+    A method aimed at load a stored replay report.
+
+    Args:
+        replay_name (str): The name of the replay.
+        replays_path (str, optional): The path to stored replays. Defaults to `DEFAULT_REPLAYS_PATH`.
+
+    Raises:
+        ValueError: If the replay doesn't exist.
+
+    Returns:
+        Dict[str, Any]: The replay report.
+    """
+    filepath: str = replays_path + replay_name + ".json"
+    if not os.path.exists(filepath):
+        raise ValueError("The `replay_name` '" + str(replay_name) + "' doesn't exist.")
+    with open(filepath, "r") as file_replay:
+        return json.load(file_replay)
+
+
+def compare_replays(
+    list_of_replay_names: List[str],
+    replays_path: str = DEFAULT_REPLAYS_PATH,
+) -> pd.DataFrame:
+    """
+    A method aimed at compare stored replays of the same workload.
+    Usage note:
+        - The first replay is the reference: `"latency_p50_ratio"` and `"total_time_ratio"` are ratios to its values.
+        - `"nb_same_partitions"` is the number of iterations whose partition is the same as in the reference.
+
+    Args:
+        list_of_replay_names (List[str]): The names of the replays to compare.
+        replays_path (str, optional): The path to stored replays. Defaults to `DEFAULT_REPLAYS_PATH`.
+
+    Raises:
+        ValueError: If replays don't share the same workload.
+
+    Returns:
+        pd.DataFrame: One row per replay, with its clustering algorithm, library version, latency statistics and total time.
+    """
+
+    # Load replays.
+    list_of_replays: List[Dict[str, Any]] = [
+        load_replay(replay_name=replay_name, replays_path=replays_path)
+        for replay_name in list_of_replay_names
+    ]
+
+    # Check the workload.
+    if len({dict_of_replay["workload_fingerprint"] for dict_of_replay in list_of_replays}) > 1:
+        raise ValueError("The replays `" + "`, `".join(list_of_replay_names) + "` don't share the same workload.")
+
+    # Build the comparison.
+    dict_of_reference: Dict[str, Any] = list_of_replays[0]
+    list_of_rows: List[Dict[str, Any]] = []
+    for replay_name, dict_of_replay in zip(list_of_replay_names, list_of_replays):
+        list_of_rows.append(
+            {
+                "replay_name": replay_name,
+                "algorithm": dict_of_replay["config_clustering"]["algorithm"],
+                "init**kargs": json.dumps(dict_of_replay["config_clustering"]["init**kargs"], sort_keys=True),
+                "library_version": dict_of_replay["versions"]["cognitivefactory-interactive-clustering"],
+                "nb_iterations": len(dict_of_replay["iterations"]),
+                **{"latency_" + statistic: value for statistic, value in dict_of_replay["latency"].items()},
+                "total_time": dict_of_replay["total_time"],
+                "latency_p50_ratio": dict_of_replay["latency"]["p50"] / dict_of_reference["latency"]["p50"],
+                "total_time_ratio": dict_of_replay["total_time"] / dict_of_reference["total_time"],
+                "nb_same_partitions": sum(
+                    dict_of_iteration["partition_fingerprint"]
+                    == dict_of_reference["iterations"].get(iteration_id, {}).get("partition_fingerprint")
+                    for iteration_id, dict_of_iteration in dict_of_replay["iterations"].items()
+                ),
+            }
+        )
+    return pd.DataFrame(list_of_rows)
+
+
+# ==============================================================================
+# COMMAND - REPLAY AND COMPARE
+# ==============================================================================
+if __name__ == "__main__":
+    # Usage (from the `notebook` folder):
+    #   - `python replay_benchmark.py run REPLAY_NAME ENV_PATH [--config-clustering CONFIG_PATH]` to replay the history of an experiment (with the clustering configuration of a clustering environment `config.json`) and store the report;
+    #   - `python replay_benchmark.py compare REPLAY_NAME_1 REPLAY_NAME_2 ...` to compare stored replays (the first one is the reference).
+    parser = argparse.ArgumentParser(description="Replay recorded annotation histories to benchmark clustering.")
+    parser.add_argument("action", choices=["run", "compare"])
+    parser.add_argument("replay_names", nargs="+", help="the replay name and the experiment path (`run`), or the replay names (`compare`).")
+    parser.add_argument("--config-clustering", default=None, help="path to a clustering configuration (`run`).")
+    parser.add_argument("--max-iter", type=int, default=None)
+    parser.add_argument("--nb-repetitions", type=int, default=1)
+    arguments = parser.parse_args()
+
+    # Case of a replay.
+    if arguments.action == "run":
+        if len(arguments.replay_names) != 2:
+            parser.error("`run` expects a replay name and an experiment path.")
+        config_clustering_to_replay: Optional[Dict[str, Any]] = None
+        if arguments.config_clustering is not None:
+            with open(arguments.config_clustering, "r") as file_config_clustering:
+                config_clustering_to_replay = json.load(file_config_clustering)
+        dict_of_replay: Dict[str, Any] = replay_history(
+            env_path=os.path.join(arguments.replay_names[1], ""),
+            config_clustering=config_clustering_to_replay,
+            max_iter=arguments.max_iter,
+            nb_repetitions=arguments.nb_repetitions,
+        )
+        store_replay(dict_of_replay=dict_of_replay, replay_name=arguments.replay_names[0])
+        print(json.dumps({"latency": dict_of_replay["latency"], "total_time": dict_of_replay["total_time"]}, indent=2))
+        sys.exit(0)
+
+    # Case of a comparison.
+    print(compare_replays(list_of_replay_names=arguments.replay_names).to_string())
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         streaming_evaluation
+* Description:  Evaluate clustering results on a background thread while the interactive clustering experiment runs.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import os
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import metrics_registry
+
+# ==============================================================================
+# STREAMING EVALUATOR
+# ==============================================================================
+
+
+class StreamingEvaluator:
+    """
+    An evaluator that computes metrics of each new clustering result on a background thread.
+    The experiment run submits each iteration partition and goes on with the next sampling and clustering, while metrics are computed and stored in `dict_of_clustering_performances.json` next to the other iteration records.
+    Usage:
+        - `submit` a partition after each clustering;
+        - `close` at the end of the run to wait for the pending evaluations.
+    """
+
+    def __init__(
+        self,
+        env_path: str,
+        dict_of_true_intents: Dict[str, str],
+        list_of_metrics: Optional[List[str]] = None,
+        dict_of_vectors: Optional[Dict[str, Any]] = None,
+        max_queue_size: int = 0,
+    ):
+        """
+        The constructor for `StreamingEvaluator` class. It starts the background thread.
+
+        Args:
+            env_path (str): The experiment environment path, where evaluations are stored.
+            dict_of_true_intents (Dict[str, str]): The dictionary of true intents.
+            list_of_metrics (Optional[List[str]], optional): The list of registered metrics to compute. Defaults to `None` (`metrics_registry.DEFAULT_LIST_OF_METRICS`).
+            dict_of_vectors (Optional[Dict[str, Any]], optional): The dictionary of vectors, needed by metrics based on vectors. Defaults to `None`.
+            max_queue_size (int, optional): The maximum number of pending partitions (`0` for no limit). Defaults to `0`.
+        """
+
+        # Store parameters.
+        self.env_path: str = env_path
+        self.metrics_evaluator: metrics_registry.MetricsEvaluator = metrics_registry.MetricsEvaluator(
+            dict_of_true_intents=dict_of_true_intents,
+            list_of_metrics=list_of_metrics,
+            dict_of_vectors=dict_of_vectors,
+        )
+
+        # Load evaluations already done (case of a resumed experiment).
+        self.dict_of_clustering_performances: Dict[str, Dict[str, Optional[float]]] = {}
+        if os.path.exists(env_path + "dict_of_clustering_performances.json"):
+            with open(env_path + "dict_of_clustering_performances.json", "r") as file_performances:
+                self.dict_of_clustering_performances = json.load(file_performances)
+
+        # Initialize thread resources.
+        self._queue: "queue.Queue[Optional[Tuple[str, Dict[str, int], List[Tuple[str, str, str]]]]]" = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._error: Optional[BaseException] = None
+        self._thread: threading.Thread = threading.Thread(
+            target=self._evaluate_until_closed,
+            name="streaming-evaluation",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        iteration_id: str,
+        clustering_result: Dict[str, int],
+        list_of_constraints: Sequence[Tuple[str, str, str]],
+    ) -> None:
+        """
+        The method used to submit a new clustering result to evaluate.
+
+        Args:
+            iteration_id (str): The iteration ID of the clustering result.
+            clustering_result (Dict[str, int]): The clustering result.
+            list_of_constraints (Sequence[Tuple[str, str, str]]): The constraints annotated before this clustering (a copy is stored).
+
+        Raises:
+            RuntimeError: If a previous evaluation failed.
+        """
+
+        # Raise the error of a previous evaluation.
+        if self._error is not None:
+            raise RuntimeError("The streaming evaluation failed.") from self._error
+
+        # Add the partition to evaluate.
+        self._queue.put((iteration_id, clustering_result, list(list_of_constraints)))
+
+    def close(
+        self,
+    ) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        The method used to wait for pending evaluations and stop the background thread.
+
+        Raises:
+            RuntimeError: If an evaluation failed.
+
+        Returns:
+            Dict[str, Dict[str, Optional[float]]]: The evaluations of all iterations.
+        """
+
+        # Stop the thread once pending evaluations are done.
+        self._queue.put(None)
+        self._thread.join()
+
+        # Raise the error of an evaluation.
+        if self._error is not None:
+            raise RuntimeError("The streaming evaluation failed.") from self._error
+
+        # Return evaluations.
+        return self.dict_of_clustering_performances
+
+    def _evaluate_until_closed(
+        self,
+    ) -> None:
+        """
+        The method run by the background thread: evaluate submitted partitions until `close` is called.
+        """
+
+        while True:
+
+            # Get the next partition to evaluate (`None` means closed).
+            submission: Optional[Tuple[str, Dict[str, int], List[Tuple[str, str, str]]]] = self._queue.get()
+            if submission is None:
+                return
+
+            # Skip evaluations after a failure (wait for `close`).
+            if self._error is not None:
+                continue
+
+            try:
+                # Compute metrics.
+                iteration_id, clustering_result, list_of_constraints = submission
+                dict_of_metrics: Dict[str, Optional[float]] = self.metrics_evaluator.evaluate(
+                    clustering_result=clustering_result,
+                    constraints=list_of_constraints,
+                )
+
+                # Update evaluations (only read by the main thread after `close`).
+                self.dict_of_clustering_performances[iteration_id] = dict_of_metrics
+
+                # Store evaluations (atomic replacement, so that a reader never sees a partial file).
+                with open(self.env_path + ".dict_of_clustering_performances.json.tmp", "w") as file_performances:
+                    json.dump(self.dict_of_clustering_performances, file_performances)
+                os.replace(
+                    self.env_path + ".dict_of_clustering_performances.json.tmp",
+                    self.env_path + "dict_of_clustering_performances.json",
+                )
+
+            # Keep the error to raise it in the main thread.
+            except Exception as error:  # noqa: B902
+                self._error = error
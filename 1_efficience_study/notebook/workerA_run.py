@@ -38,6 +38,8 @@ from cognitivefactory.interactive_clustering.sampling.factory import (
 )
 from scipy.sparse import csr_matrix
 
+import streaming_evaluation
+
 
 # ==============================================================================
 # WORKER - EXPERIMENT RUN
@@ -57,7 +59,7 @@ def experiment_run(
         - The notebook `2_Run_until_convergence_and_evaluate_efficience.ipynb` launch this script for all defined experiment environments with the librairy `multiprocessing`.
 
     Args:
-        parameters (Dict[str, Any]): A dictionary that contains several parameters. Two keys are expected in this dictionary: the experiment environment path (`"ENV_PATH"`), the maximum iteration of interactive clustering (`"MAX_ITER"`).
+        parameters (Dict[str, Any]): A dictionary that contains several parameters. Two keys are expected in this dictionary: the experiment environment path (`"ENV_PATH"`), the maximum iteration of interactive clustering (`"MAX_ITER"`). An optional key (`"with_streaming_evaluation"`) can be added to evaluate each clustering result on a background thread during the run (cf. `streaming_evaluation`). An optional key (`"metrics_to_compute"`) can be added to define the registered metrics to compute by this streaming evaluation.
 
     Returns:
         int: Return `0` when finish.
@@ -68,6 +70,16 @@ def experiment_run(
     MAX_ITER: Optional[int] = (
         None if (parameters["MAX_ITER"] is None) else int(parameters["MAX_ITER"])
     )
+    with_streaming_evaluation: bool = (
+        bool(parameters["with_streaming_evaluation"])
+        if ("with_streaming_evaluation" in parameters.keys())
+        else False
+    )
+    metrics_to_compute: Optional[List[str]] = (
+        parameters["metrics_to_compute"]
+        if ("metrics_to_compute" in parameters.keys())
+        else None
+    )
 
     ### ### ### ### ###
     ### Load needed configurations and data.
@@ -85,6 +97,10 @@ def experiment_run(
     with open(ENV_PATH + "config.json", "r") as file_config_experiment:
         CONFIG_EXPERIMENT = json.load(file_config_experiment)
 
+    # Ablation experiments are not sampled: their annotation history is replayed by `ablation_replay`.
+    if "_REPLAY_OF" in CONFIG_EXPERIMENT.keys():
+        return 0
+
     ### ### ### ### ###
     ### Load needed data.
     ### ### ### ### ###
@@ -130,8 +146,12 @@ def experiment_run(
         manager=CONFIG_EXPERIMENT["manager_type"],
     )
 
+    # Initialize the list of constraints annotated.
+    list_of_annotated_constraints: List[Tuple[str, str, str]] = []
+
     # Update constraints manager.
-    for _, list_of_triplet_annotated in dict_of_constraints_annotations.items():
+    for _, list_of_triplet_annotated in sorted(dict_of_constraints_annotations.items()):
+        list_of_annotated_constraints.extend(list_of_triplet_annotated)
         for previous_annotation in list_of_triplet_annotated:
 
             # Add constraint to the constraints manager.
@@ -161,6 +181,22 @@ def experiment_run(
     # Define previous iteration.
     PREV_ITERATION: Optional[int] = None if (ITERATION == 0) else (ITERATION - 1)
 
+    ### ### ### ### ###
+    ### Define streaming evaluation.
+    ### ### ### ### ###
+
+    # Start the background evaluation of clustering results (if requested).
+    streaming_evaluator: Optional[streaming_evaluation.StreamingEvaluator] = (
+        streaming_evaluation.StreamingEvaluator(
+            env_path=ENV_PATH,
+            dict_of_true_intents=dict_of_true_intents,
+            list_of_metrics=metrics_to_compute,
+            dict_of_vectors=dict_of_vectors,
+        )
+        if with_streaming_evaluation
+        else None
+    )
+
     ### ### ### ### ###
     ### Start interactive clustering iterations.
     ### ### ### ### ###
@@ -345,6 +381,15 @@ def experiment_run(
             ] = list_of_triplet_with_annotation
             json.dump(dict_of_constraints_annotations, file_annotations_save)
 
+        # Evaluate the clustering result on the background thread (while the next iteration runs).
+        list_of_annotated_constraints.extend(list_of_triplet_with_annotation)
+        if streaming_evaluator is not None:
+            streaming_evaluator.submit(
+                iteration_id=ITERATION_ID,
+                clustering_result=current_clustering_result,
+                list_of_constraints=list_of_annotated_constraints,
+            )
+
         ### ### ### ### ###
         ### Update iteration.
         ### ### ### ### ###
@@ -357,6 +402,10 @@ def experiment_run(
         ITERATION_ID = str(ITERATION).zfill(4)
 
 
+    # Wait for pending evaluations.
+    if streaming_evaluator is not None:
+        streaming_evaluator.close()
+
     # Write a ".done" file when convergence.
     with open(
         ENV_PATH + ".done", "a"
@@ -13,18 +13,19 @@
 # ==============================================================================
 
 import json
+import os
+import pickle  # noqa: S403
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-from cognitivefactory.interactive_clustering.constraints.abstract import (
-    AbstractConstraintsManager,
-)
-from cognitivefactory.interactive_clustering.constraints.factory import (
-    managing_factory,
-)
+import numpy as np
 from matplotlib import pyplot as plt
 from matplotlib.figure import Figure
-from sklearn import metrics
+
+import completeness_tracker
+import iterations_summary
+import metrics_registry
+import results_store
 
 
 # ==============================================================================
@@ -45,7 +46,7 @@ def experiment_evaluate(
         - The notebook `2_Run_until_convergence_and_evaluate_efficience.ipynb` launch this script for all defined experiment environments with the librairy `multiprocessing`.
 
     Args:
-        parameters (Dict[str, Any]): A dictionary that contains several parameters. Two keys are expected in this dictionary: the experiment environment path (`"ENV_PATH"`), the convergence study progress to print (`"study_progress"`). An optional key (`"performance_goals_to_compute"`) can be added to define performance goal for iteration to highlight computation.
+        parameters (Dict[str, Any]): A dictionary that contains several parameters. Two keys are expected in this dictionary: the experiment environment path (`"ENV_PATH"`), the convergence study progress to print (`"study_progress"`). An optional key (`"performance_goals_to_compute"`) can be added to define performance goal for iteration to highlight computation. An optional key (`"metrics_to_compute"`) can be added to define the registered metrics to compute (cf. `metrics_registry`). An optional key (`"results_store_path"`) can be added to define the columnar results store to append to (`None` to skip the store update).
 
     Returns:
         int: Return `0` when finish.
@@ -59,6 +60,16 @@ def experiment_evaluate(
         if ("performance_goals_to_compute" in parameters.keys())
         else ["0.50", "0.60", "0.70", "0.80", "0.90", "0.95", "0.99", "1.00"]
     )
+    metrics_to_compute: List[str] = (
+        parameters["metrics_to_compute"]
+        if ("metrics_to_compute" in parameters.keys())
+        else metrics_registry.DEFAULT_LIST_OF_METRICS
+    )
+    results_store_path: Optional[str] = (
+        parameters["results_store_path"]
+        if ("results_store_path" in parameters.keys())
+        else results_store.DEFAULT_STORE_PATH
+    )
 
     ### ### ### ### ###
     ### Load needed configurations and data.
@@ -83,10 +94,6 @@ def experiment_evaluate(
     ### Load storage files.
     ### ### ### ### ###
 
-    # Load dictionary of clustering results.
-    with open(ENV_PATH + "dict_of_clustering_results.json", "r") as file_clustering_results:
-        dict_of_clustering_results: Dict[str, Dict[str, int]] = json.load(file_clustering_results)
-
     # Load dictionary of annotation history.
     with open(ENV_PATH + "dict_of_constraints_annotations.json", "r") as file_annotations:
         dict_of_constraints_annotations: Dict[
@@ -100,60 +107,76 @@ def experiment_evaluate(
     # Define list of iterations.
     LIST_OF_ITERATIONS = sorted(dict_of_constraints_annotations.keys())
 
+    # Store the summary of cumulative times and constraints numbers of each iteration (used by synthesis).
+    iterations_summary.store_iterations_summary(
+        env_path=ENV_PATH,
+        dict_of_computation_times=dict_of_computation_times,
+        dict_of_constraints_annotations=dict_of_constraints_annotations,
+    )
+
     ### ### ### ### ###
     ### Start clustering evaluation.
     ### ### ### ### ###
 
-    # Format true intents from dict to list.
-    list_of_true_intents: List[str] = [
-        dict_of_true_intents[data_ID] for data_ID in list_of_data_IDs
-    ]
-
-    # Initialize evaluation storage.
-    dict_of_clustering_performances: Dict[str, Dict[str, float]] = {}
-
-    # For all experiment...
-    for iteration in LIST_OF_ITERATIONS:
-
-        # Initialize evaluation for the current iteration.
-        dict_of_clustering_performances[iteration] = {}
-
-        # Format predicted intents from dict to list.
-        list_of_predicted_intents: List[int] = [
-            dict_of_clustering_results[iteration][data_ID]
-            for data_ID in list_of_data_IDs
-        ]
-
-        # Compute homogeneity.
-        dict_of_clustering_performances[iteration][
-            "homogeneity"
-        ] = metrics.homogeneity_score(list_of_true_intents, list_of_predicted_intents)
-
-        # Compute completeness.
-        dict_of_clustering_performances[iteration][
-            "completeness"
-        ] = metrics.completeness_score(list_of_true_intents, list_of_predicted_intents)
-
-        # Compute v_measure.
-        dict_of_clustering_performances[iteration][
-            "v_measure"
-        ] = metrics.v_measure_score(list_of_true_intents, list_of_predicted_intents)
-
-        # Compute adjusted_rand_index.
-        dict_of_clustering_performances[iteration][
-            "adjusted_rand_index"
-        ] = metrics.adjusted_rand_score(list_of_true_intents, list_of_predicted_intents)
-
-        # Compute adjusted_mutual_information.
-        dict_of_clustering_performances[iteration][
-            "adjusted_mutual_information"
-        ] = metrics.adjusted_mutual_info_score(
-            list_of_true_intents, list_of_predicted_intents
+    # Load evaluations already computed during the run (cf. `streaming_evaluation`).
+    dict_of_clustering_performances: Dict[str, Dict[str, Optional[float]]] = {}
+    if os.path.exists(ENV_PATH + "dict_of_clustering_performances.json"):
+        with open(ENV_PATH + "dict_of_clustering_performances.json", "r") as file_performances_load:
+            dict_of_clustering_performances = json.load(file_performances_load)
+
+    # Evaluate all clustering results only if some evaluations are missing.
+    if not all(
+        (iteration in dict_of_clustering_performances.keys())
+        and all(metric in dict_of_clustering_performances[iteration].keys() for metric in metrics_to_compute)
+        for iteration in LIST_OF_ITERATIONS
+    ):
+
+        # Load dictionary of clustering results.
+        with open(ENV_PATH + "dict_of_clustering_results.json", "r") as file_clustering_results:
+            dict_of_clustering_results: Dict[str, Dict[str, int]] = json.load(file_clustering_results)
+
+        # Load dict of vectors (only needed by metrics based on vectors).
+        dict_of_vectors: Optional[Dict[str, Any]] = None
+        if any(
+            "vectors" in metrics_registry.METRICS_REGISTRY[metric]["requires"]
+            for metric in metrics_to_compute
+            if metric in metrics_registry.METRICS_REGISTRY.keys()
+        ):
+            with open(ENV_PATH + "../../../dict_of_vectors.pkl", "rb") as file_vectors:
+                dict_of_vectors = pickle.load(file_vectors)  # noqa: S301
+
+        # Initialize the evaluator of registered metrics.
+        metrics_evaluator: metrics_registry.MetricsEvaluator = metrics_registry.MetricsEvaluator(
+            dict_of_true_intents=dict_of_true_intents,
+            list_of_metrics=metrics_to_compute,
+            dict_of_vectors=dict_of_vectors,
         )
 
-    # Store dictionary of clustering evaluation.
-    with open(ENV_PATH + "dict_of_clustering_performances.json", "w") as file_performances:
-        json.dump(dict_of_clustering_performances, file_performances)
+        # Initialize the list of constraints taken into account by the clustering.
+        list_of_annotated_constraints: List[Tuple[str, str, str]] = []
+
+        # For all experiment...
+        for iteration in LIST_OF_ITERATIONS:
+
+            # Update constraints (annotations of an iteration are used by its clustering).
+            list_of_annotated_constraints.extend(dict_of_constraints_annotations[iteration])
+
+            # Compute all metrics in one pass.
+            dict_of_clustering_performances[iteration] = metrics_evaluator.evaluate(
+                clustering_result=dict_of_clustering_results[iteration],
+                constraints=list_of_annotated_constraints,
+            )
+
+        # Store dictionary of clustering evaluation.
+        with open(ENV_PATH + "dict_of_clustering_performances.json", "w") as file_performances:
+            json.dump(dict_of_clustering_performances, file_performances)
+
+    # Append evaluation to the columnar results store.
+    if results_store_path is not None:
+        results_store.append_experiment_to_store(
+            env_path=ENV_PATH,
+            store_path=results_store_path,
+        )
 
     ### ### ### ### ###
     ### Find iterations that reach specific performance threshold.
@@ -233,7 +256,7 @@ def experiment_evaluate(
 # PRIVATE - GET ITERATION OF PERFORMANCE REACHED
 # ==============================================================================
 def _get_iteration_of_performance_reached(
-    evaluations: Dict[str, Dict[str, float]],
+    evaluations: Dict[str, Dict[str, Optional[float]]],
     goal: float,
     metric: str = "v_measure",
 ) -> Optional[str]:
@@ -241,7 +264,7 @@ def _get_iteration_of_performance_reached(
     A method aimed at find the iteration that reach a performance goal for a specific metric.
 
     Args:
-        evaluations (Dict[str, Dict[str, float]]): A dictionary that contains evaluations for each completed iteration.
+        evaluations (Dict[str, Dict[str, Optional[float]]]): A dictionary that contains evaluations for each completed iteration (an undefined metric doesn't reach the goal).
         goal (float): The performance goal to reach. Must be between `0.00` and `1.00`.
         metric (str, optional): The performance metric to look at. Defaults to `"v_measure"`.
 
@@ -253,13 +276,7 @@ def _get_iteration_of_performance_reached(
     """
 
     # Check that the requested metric is implemented.
-    if metric not in {
-        "homogeneity",
-        "completeness",
-        "v_measure",
-        "adjusted_rand_index",
-        "adjusted_mutual_information",
-    }:
+    if metric not in metrics_registry.METRICS_REGISTRY.keys():
         raise ValueError("The `metric` '" + str(metric) + "' is not implemented.")
 
     # Check that the requested goal is implemented.
@@ -278,7 +295,8 @@ def _get_iteration_of_performance_reached(
     previous_iteration: Optional[str] = None
 
     # Assert the last iteration reach the expected performance
-    if evaluations[current_iteration][metric] < goal:
+    current_performance: Optional[float] = evaluations[current_iteration][metric]
+    if (current_performance is None) or (current_performance < goal):
         return None
 
     # Look at all iteration (descending order).
@@ -288,7 +306,8 @@ def _get_iteration_of_performance_reached(
         previous_iteration = list_of_iterations.pop()
 
         # If the previous iteration doesn't reched the expected performance...
-        if evaluations[previous_iteration][metric] < goal:
+        previous_performance: Optional[float] = evaluations[previous_iteration][metric]
+        if (previous_performance is None) or (previous_performance < goal):
             # ... then return the current iteration as the best iteration.
             return current_iteration
         # Otherwise (the previous iteration reach the expected performance)...
@@ -310,11 +329,12 @@ def _get_iteration_of_annotation_completness(
 ) -> Optional[str]:
     """
     A method aimed at find the iteration that reach the annotation completness.
+    Completeness is tracked with a union-find structure (cf. `completeness_tracker`) instead of replaying the history in a constraints manager.
 
     Args:
         list_of_data_IDs (List[str]): The list of data IDs to manage.
         annotations (Dict[str, List[Tuple[str, str, str]]]): List of triplet of annotation over iterations.
-        manager_type (str, optional): The constraints manager type. Defaults to `"binary"`.
+        manager_type (str, optional): The constraints manager type. Only `"binary"` is implemented. Defaults to `"binary"`.
 
     Raises:
         ValueError: If parameters are badly set.
@@ -323,27 +343,30 @@ def _get_iteration_of_annotation_completness(
         Optional[str]: The iteration that reaches the annotation completness, else `None`.
     """
 
-    # Initialize constraints manager.
-    constraints_manager: AbstractConstraintsManager = managing_factory(
+    # Check that the requested manager is implemented.
+    if manager_type != "binary":
+        raise ValueError("The `manager_type` '" + str(manager_type) + "' is not implemented.")
+
+    # Initialize completeness tracker.
+    tracker: completeness_tracker.CompletenessTracker = completeness_tracker.CompletenessTracker(
         list_of_data_IDs=list_of_data_IDs,
-        manager=manager_type,
     )
 
     # For each iteration of annotation...
     for iteration, list_of_triplet_annotated in annotations.items():
 
-        # Update constraints manager.
+        # Update completeness tracker.
         for annotation in list_of_triplet_annotated:
 
-            # Add constraint to the constraints manager.
-            constraints_manager.add_constraint(
+            # Add constraint to the completeness tracker.
+            tracker.add_constraint(
                 data_ID1=annotation[0],
                 data_ID2=annotation[1],
                 constraint_type=annotation[2],
             )
 
         # Check the annotation completude.
-        if constraints_manager.check_completude_of_constraints():
+        if tracker.check_completude_of_constraints():
             return iteration
 
     # If completude is not reach over iteration, return `None`.
@@ -354,7 +377,7 @@ def _get_iteration_of_annotation_completness(
 # PRIVATE - PLOT CLUSTERING PERFORMANCE EVOLUTION
 # ==============================================================================
 def _plot_clustering_performance_evolution(
-    evaluation_storage: Dict[str, Dict[str, float]],
+    evaluation_storage: Dict[str, Dict[str, Optional[float]]],
     iterations_to_highlight: Dict[str, Dict[str, Any]],
     graph_title: str = "Interactive clustering performance over iterations",
     graph_folderpath: str = "",
@@ -364,7 +387,7 @@ def _plot_clustering_performance_evolution(
     A method aimed at create and store a graph that represents clustering performance evolution over iterations.
 
     Args:
-        evaluation_storage (Dict[str, Dict[str, float]]): The dictionary that store the clustering performances for all iterations.
+        evaluation_storage (Dict[str, Dict[str, Optional[float]]]): The dictionary that store the clustering performances for all iterations.
         iterations_to_highlight (Dict[str, Dict[str, Any]]): The dictionary that contains iteration that reach specif performance goal.
         graph_title (str, optional): The title of the graph to show. Defaults to `"Interactive clustering performance over iteration"`.
         graph_folderpath (str, optional): The foldername of the graph. Defaults to `""`.
@@ -389,10 +412,10 @@ def _plot_clustering_performance_evolution(
     # Plot homogeneity evolution.
     axis.plot(
         list_of_iteration,  # x
-        [
-            evaluation_storage[iteration]["homogeneity"]
-            for iteration in evaluation_storage.keys()
-        ],  # y
+        np.array(
+            [evaluation_storage[iteration]["homogeneity"] for iteration in evaluation_storage.keys()],
+            dtype=float,
+        ),  # y (undefined metrics are `NaN`)
         label="Homogeneity",
         marker="o",
         markerfacecolor="blue",
@@ -404,10 +427,10 @@ def _plot_clustering_performance_evolution(
     # Plot completness evolution.
     axis.plot(
         list_of_iteration,  # x
-        [
-            evaluation_storage[iteration]["completeness"]
-            for iteration in evaluation_storage.keys()
-        ],  # y
+        np.array(
+            [evaluation_storage[iteration]["completeness"] for iteration in evaluation_storage.keys()],
+            dtype=float,
+        ),  # y (undefined metrics are `NaN`)
         label="Completeness",
         marker="o",
         markerfacecolor="red",
@@ -419,10 +442,10 @@ def _plot_clustering_performance_evolution(
     # Plot v-measure evolution.
     axis.plot(
         list_of_iteration,  # x
-        [
-            evaluation_storage[iteration]["v_measure"]
-            for iteration in evaluation_storage.keys()
-        ],  # y
+        np.array(
+            [evaluation_storage[iteration]["v_measure"] for iteration in evaluation_storage.keys()],
+            dtype=float,
+        ),  # y (undefined metrics are `NaN`)
         label="V-measure",
         marker="o",
         markerfacecolor="green",
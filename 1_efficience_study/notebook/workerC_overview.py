@@ -13,12 +13,16 @@
 # ==============================================================================
 
 import json
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Union
 
 import numpy
 from matplotlib import pyplot as plt
 from matplotlib.figure import Figure
-from scipy import stats as scipystats
+
+import experiment_cube
+import overview_cache
+import overview_rendering
+import overview_stats
 
 
 # ==============================================================================
@@ -27,6 +31,13 @@ from scipy import stats as scipystats
 def experiments_performance_overview(
     overview_settings: Dict[str, Dict[str, Union[str, List[str]]]],
     forced_max_iter: Optional[str] = None,
+    error_type: str = "sem",
+    nb_resamples: int = 2000,
+    nb_workers: int = 1,
+    with_cache: bool = True,
+    max_nb_points: Optional[int] = overview_rendering.DEFAULT_MAX_NB_POINTS,
+    list_of_highlighted_iterations: Optional[List[str]] = None,
+    list_of_formats: Optional[List[str]] = None,
 ) -> int:
     """
     A method aimed at compute and plot average clustering performance evolution over iteration for several overviews, where an overview is a set of experiments.
@@ -34,111 +45,81 @@ def experiments_performance_overview(
     Args:
         overview_settings (Dict[str, Dict[str, Union[str, List[str]]]]): A dictionary that represents overviews. It contains the plot settings (color, title, ...) and the list of environments for all defined overview.
         forced_max_iter (Optional[str]): The maximum iteration to limit plot range. Defaults to `None`.
+        error_type (str): The error band to plot: `"sem"` (standard error of the mean) or `"ci"` (95% percentile bootstrap confidence interval). Defaults to `"sem"`.
+        nb_resamples (int): The number of bootstrap resamples if `error_type` is `"ci"`. Defaults to `2000`.
+        nb_workers (int): The number of processes used to read experiments, and of threads used to compute bootstrap resamples. Defaults to `1`.
+        with_cache (bool): The option to get statistics from the overview cache if no experiment file changed (cf. `overview_cache`). Defaults to `True`.
+        max_nb_points (Optional[int]): The maximum number of points drawn per curve, with min/max-preserving decimation (cf. `overview_rendering`). Defaults to `overview_rendering.DEFAULT_MAX_NB_POINTS`. `None` to draw all iterations.
+        list_of_highlighted_iterations (Optional[List[str]]): The iterations to mark on curves. Defaults to `None` (a few evenly spaced markers).
+        list_of_formats (Optional[List[str]]): The formats of the stored graph: `"png"`, `"svg"`, `"pdf"` or `"html"` (interactive). Defaults to `None` (`["png"]`).
 
     Returns:
         int: Return `0` when finish.
     """
 
     ### ### ### ### ###
-    ### Define the maximum iteration.
+    ### Load clustering performances of all experiments and compute their evolution (or get them from cache if no experiment changed).
     ### ### ### ### ###
 
-    # Initialize evaluation storage.
-    MAX_ITER: str = "0000"
-
-    # For each requested overview...
-    for _, settings_1 in overview_settings.items():
-
-        # For each experiment in this overview...
-        for env_1 in list(settings_1["LIST_OF_ENV_PATHS"]):
-
-            # Load annotations for the current experiment.
-            with open(
-                env_1 + "dict_of_constraints_annotations.json", "r"
-            ) as annotation_file:
-                dict_of_constraints_annotations: Dict[
-                    str, List[Tuple[str, str, Optional[str]]]
-                ] = json.load(annotation_file)
-
-            # Update current maximum iteration.
-            current_max_iteration: str = max(dict_of_constraints_annotations.keys())
-            if MAX_ITER < current_max_iteration:
-                MAX_ITER = current_max_iteration
-
-    # If set, force maximum iteration.
-    if forced_max_iter is not None:
-        MAX_ITER = min(MAX_ITER, forced_max_iter)
-
-    # Define list of iteration for computations.
-    LIST_OF_ITERATIONS: List[str] = [str(i).zfill(4) for i in range(int(MAX_ITER))]
-
-    ### ### ### ### ###
-    ### Compute evolution of clustering performance average over experiments.
-    ### ### ### ### ###
-
-    # Initialize storage of experiment performances for all iterations of all requested overviews.
-    dict_of_global_performances_evolution: Dict[str, Dict[str, List[float]]] = {
-        overview_perf: {iter_perf: [] for iter_perf in LIST_OF_ITERATIONS}
-        for overview_perf in overview_settings.keys()
-    }
-    # Initialize storage of performance mean for all iterations of all requested overviews.
-    dict_of_global_performances_evolution_MEAN: Dict[str, Dict[str, float]] = {
-        overview_mean: {iter_mean: 0 for iter_mean in LIST_OF_ITERATIONS}
-        for overview_mean in overview_settings.keys()
-    }
-    # Initialize storage of performance standard error of the mean for all iterations of all requested overviews.
-    dict_of_global_performances_evolution_SEM: Dict[str, Dict[str, float]] = {
-        overview_pstdev: {iter_pstdev: 0 for iter_pstdev in LIST_OF_ITERATIONS}
-        for overview_pstdev in overview_settings.keys()
-    }
-
-    # For each requested overview...
-    for overview_2, settings_2 in overview_settings.items():
-
-        # Print overview.
-        print(overview_2)
-
-        # For each experiment in this overview...
-        for env_2 in list(settings_2["LIST_OF_ENV_PATHS"]):
-
-            # Load clustering evaluations.
-            with open(
-                env_2 + "dict_of_clustering_performances.json", "r"
-            ) as evaluation_file:
-                dict_of_clustering_performances: Dict[
-                    str, Dict[str, float]
-                ] = json.load(evaluation_file)
-
-            # For each requested iteration...
-            for iter_2 in LIST_OF_ITERATIONS:
-
-                # Append the clustering performancre for the current experiment and for this iteration.
-                if iter_2 in dict_of_clustering_performances.keys():
-                    dict_of_global_performances_evolution[overview_2][iter_2].append(
-                        dict_of_clustering_performances[iter_2]["v_measure"]
-                    )
-                # If iteration isn't reached by this experiment, duplicate the last known results.
-                # Most of the time: the experiment has reached annotation completeness and there is no more iteration because clustering is "perfect" (v-measure==1.0).
-                else:
-                    last_iter: str = max(dict_of_clustering_performances.keys())
-                    dict_of_global_performances_evolution[overview_2][iter_2].append(
-                        dict_of_clustering_performances[last_iter]["v_measure"]
-                    )
-
-        # Compute mean and sem of performance for this iteration and for experiment in this overview.
-        for iter_3 in LIST_OF_ITERATIONS:
-
-            # Compute mean of performance for this iteration and for experiment in this overview.
-            dict_of_global_performances_evolution_MEAN[overview_2][iter_3] = numpy.mean(
-                dict_of_global_performances_evolution[overview_2][iter_3]
-            )
+    # Define the computation of statistics from experiments files.
+    def _compute_statistics() -> Dict[str, Any]:
+
+        # Load performances of all experiments in a cube (one parallel read per experiment).
+        cube: Dict[str, Any] = experiment_cube.load_experiment_cube(
+            dict_of_overviews={
+                overview_1: list(settings_1["LIST_OF_ENV_PATHS"])
+                for overview_1, settings_1 in overview_settings.items()
+            },
+            read_experiment=_read_experiment_performances,
+            list_of_metrics=["v_measure"],
+            forced_max_iter=forced_max_iter,
+            nb_workers=nb_workers,
+        )
 
-            # Compute sem of performance for this iteration and for experiment in this overview.
-            dict_of_global_performances_evolution_SEM[overview_2][
-                iter_3
-            ] = scipystats.sem(
-                dict_of_global_performances_evolution[overview_2][iter_3]
+        # Define list of iteration for computations.
+        LIST_OF_ITERATIONS: List[str] = cube["ITERATIONS"]
+
+        ### ### ### ### ###
+        ### Compute evolution of clustering performance average over experiments.
+        ### ### ### ### ###
+
+        # Compute statistics of performance (mean, sem, confidence interval) for all iterations and for experiments of each overview.
+        dict_of_global_performances_evolution_STATS: Dict[str, Dict[str, numpy.ndarray]] = {
+            overview_2: overview_stats.compute_overview_statistics(
+                array_of_values=experiment_cube.get_overview_values(
+                    cube=cube,
+                    overview=overview_2,
+                    metric="v_measure",
+                ),
+                with_bootstrap=(error_type == "ci"),
+                nb_resamples=nb_resamples,
+                nb_workers=nb_workers,
             )
+            for overview_2 in overview_settings.keys()
+        }
+
+        # Return iterations and statistics.
+        return {"ITERATIONS": LIST_OF_ITERATIONS, "STATS": dict_of_global_performances_evolution_STATS}
+
+    # Get statistics from cache, or compute them.
+    dict_of_results: Dict[str, Any] = overview_cache.get_or_compute(
+        list_of_filepaths=[
+            env_path + "dict_of_clustering_performances.json"
+            for settings_0 in overview_settings.values()
+            for env_path in settings_0["LIST_OF_ENV_PATHS"]
+        ],
+        dict_of_settings={
+            "overview": "experiments_performance_overview",
+            "overviews": {overview_0: list(settings_0["LIST_OF_ENV_PATHS"]) for overview_0, settings_0 in overview_settings.items()},
+            "forced_max_iter": forced_max_iter,
+            "error_type": error_type,
+            "nb_resamples": nb_resamples,
+        },
+        compute=_compute_statistics,
+        with_cache=with_cache,
+    )
+    LIST_OF_ITERATIONS: List[str] = dict_of_results["ITERATIONS"]
+    dict_of_global_performances_evolution_STATS: Dict[str, Dict[str, numpy.ndarray]] = dict_of_results["STATS"]
 
     ### ### ### ### ###
     ### Plot graph of performance.
@@ -159,42 +140,22 @@ def experiments_performance_overview(
     # For all experiments overview...
     for overview_3, settings_3 in overview_settings.items():
 
-        # Plot average clustering performance evolution.
-        axis.plot(
-            list_of_iterations_to_plot,  # x
-            [
-                dict_of_global_performances_evolution_MEAN[overview_3][iter_mean_plot]
-                for iter_mean_plot in LIST_OF_ITERATIONS
-            ],  # y
+        # Plot average clustering performance evolution and its error band (decimated, with markers limited to highlighted iterations).
+        overview_rendering.plot_evolution(
+            axis=axis,
+            list_of_iterations=list_of_iterations_to_plot,
+            dict_of_statistics=dict_of_global_performances_evolution_STATS[overview_3],
+            error_type=error_type,
             label=str(settings_3["title"]),
+            color=str(settings_3["color"]),
             marker=str(settings_3["marker"]),
-            markerfacecolor=str(settings_3["color"]),
-            markersize=5,
-            color=settings_3["color"],
-            linewidth=1,
             linestyle=str(settings_3["linestyle"]),
-        )
-
-        # Plot error bars for clustering performance evolution.
-        axis.fill_between(
-            x=list_of_iterations_to_plot,
-            y1=[
-                dict_of_global_performances_evolution_MEAN[overview_3][iter_errinf_plot]
-                - dict_of_global_performances_evolution_SEM[overview_3][
-                    iter_errinf_plot
-                ]
-                for iter_errinf_plot in LIST_OF_ITERATIONS
-            ],  # y1
-            y2=[
-                dict_of_global_performances_evolution_MEAN[overview_3][iter_errsup_plot]
-                + dict_of_global_performances_evolution_SEM[overview_3][
-                    iter_errsup_plot
-                ]
-                for iter_errsup_plot in LIST_OF_ITERATIONS
-            ],  # y2
-            # label="Standard error of the mean",
-            color=str(settings_3["color"]),
-            alpha=0.2,
+            max_nb_points=max_nb_points,
+            list_of_highlighted_iterations=(
+                None
+                if list_of_highlighted_iterations is None
+                else [int(iter_highlight) for iter_highlight in list_of_highlighted_iterations]
+            ),
         )
 
     # Set axis name.
@@ -227,11 +188,10 @@ def experiments_performance_overview(
     axis.grid(True)
 
     # Store the graph.
-    fig.savefig(
-        "../results/plot_global_performances_evolution.png",
-        dpi=300,
-        transparent=True,
-        bbox_inches="tight",
+    overview_rendering.save_figure(
+        fig=fig,
+        filepath="../results/plot_global_performances_evolution",
+        list_of_formats=list_of_formats,
     )
 
     # Close figure.
@@ -247,6 +207,13 @@ def experiments_performance_overview(
 def experiments_time_overview(
     overview_settings: Dict[str, Dict[str, Union[str, List[str]]]],
     forced_max_iter: Optional[str] = None,
+    error_type: str = "sem",
+    nb_resamples: int = 2000,
+    nb_workers: int = 1,
+    with_cache: bool = True,
+    max_nb_points: Optional[int] = overview_rendering.DEFAULT_MAX_NB_POINTS,
+    list_of_highlighted_iterations: Optional[List[str]] = None,
+    list_of_formats: Optional[List[str]] = None,
 ) -> int:
     """
     A method aimed at compute and plot average clustering time evolution over iteration for several overviews, where an overview is a set of experiments.
@@ -254,113 +221,81 @@ def experiments_time_overview(
     Args:
         overview_settings (Dict[str, Dict[str, Union[str, List[str]]]]): A dictionary that represents overviews. It contains the plot settings (color, title, ...) and the list of environments for all defined overview.
         forced_max_iter (Optional[str]): The maximum iteration to limit plot range. Defaults to `None`.
+        error_type (str): The error band to plot: `"sem"` (standard error of the mean) or `"ci"` (95% percentile bootstrap confidence interval). Defaults to `"sem"`.
+        nb_resamples (int): The number of bootstrap resamples if `error_type` is `"ci"`. Defaults to `2000`.
+        nb_workers (int): The number of processes used to read experiments, and of threads used to compute bootstrap resamples. Defaults to `1`.
+        with_cache (bool): The option to get statistics from the overview cache if no experiment file changed (cf. `overview_cache`). Defaults to `True`.
+        max_nb_points (Optional[int]): The maximum number of points drawn per curve, with min/max-preserving decimation (cf. `overview_rendering`). Defaults to `overview_rendering.DEFAULT_MAX_NB_POINTS`. `None` to draw all iterations.
+        list_of_highlighted_iterations (Optional[List[str]]): The iterations to mark on curves. Defaults to `None` (a few evenly spaced markers).
+        list_of_formats (Optional[List[str]]): The formats of the stored graph: `"png"`, `"svg"`, `"pdf"` or `"html"` (interactive). Defaults to `None` (`["png"]`).
 
     Returns:
         int: Return `0` when finish.
     """
 
     ### ### ### ### ###
-    ### Define the maximum iteration.
+    ### Load clustering times of all experiments and compute their evolution (or get them from cache if no experiment changed).
     ### ### ### ### ###
 
-    # Initialize evaluation storage.
-    MAX_ITER: str = "0000"
-
-    # For each requested overview...
-    for _, settings_1 in overview_settings.items():
-
-        # For each experiment in this overview...
-        for env_1 in list(settings_1["LIST_OF_ENV_PATHS"]):
-
-            # Load annotations for the current experiment.
-            with open(
-                env_1 + "dict_of_constraints_annotations.json", "r"
-            ) as annotation_file:
-                dict_of_constraints_annotations: Dict[
-                    str, List[Tuple[str, str, Optional[str]]]
-                ] = json.load(annotation_file)
-
-            # Update current maximum iteration.
-            current_max_iteration: str = max(dict_of_constraints_annotations.keys())
-            if MAX_ITER < current_max_iteration:
-                MAX_ITER = current_max_iteration
-
-    # If set, force maximum iteration.
-    if forced_max_iter is not None:
-        MAX_ITER = min(MAX_ITER, forced_max_iter)
-
-    # Define list of iteration for computations.
-    LIST_OF_ITERATIONS: List[str] = [str(i).zfill(4) for i in range(int(MAX_ITER))]
-
-    ### ### ### ### ###
-    ### Compute evolution of clustering performance average over experiments.
-    ### ### ### ### ###
-
-    # Initialize storage of experiment times for all iterations of all requested overviews.
-    dict_of_global_computation_times_evolution: Dict[str, Dict[str, List[float]]] = {
-        overview_perf: {iter_perf: [] for iter_perf in LIST_OF_ITERATIONS}
-        for overview_perf in overview_settings.keys()
-    }
-    # Initialize storage of time mean for all iterations of all requested overviews.
-    dict_of_global_computation_times_evolution_MEAN: Dict[str, Dict[str, float]] = {
-        overview_mean: {iter_mean: 0 for iter_mean in LIST_OF_ITERATIONS}
-        for overview_mean in overview_settings.keys()
-    }
-    # Initialize storage of time standard error of the mean for all iterations of all requested overviews.
-    dict_of_global_computation_times_evolution_SEM: Dict[str, Dict[str, float]] = {
-        overview_pstdev: {iter_pstdev: 0 for iter_pstdev in LIST_OF_ITERATIONS}
-        for overview_pstdev in overview_settings.keys()
-    }
-
-    # For each requested overview...
-    for overview_2, settings_2 in overview_settings.items():
-
-        # Print overview.
-        print(overview_2)
-
-        # For each experiment in this overview...
-        for env_2 in list(settings_2["LIST_OF_ENV_PATHS"]):
-
-            # Load clustering time.
-            with open(env_2 + "dict_of_computation_times.json", "r") as time_file:
-                dict_of_computation_times: Dict[str, Dict[str, float]] = json.load(
-                    time_file
-                )
-
-            # For each requested iteration...
-            for iter_2 in LIST_OF_ITERATIONS:
-
-                # Append the clustering time for the current experiment and for this iteration.
-                if iter_2 in dict_of_computation_times.keys():
-                    dict_of_global_computation_times_evolution[overview_2][
-                        iter_2
-                    ].append(dict_of_computation_times[iter_2]["clustering_TOTAL_RUN"])
-                # If iteration isn't reached by this experiment, duplicate the last known results.
-                # Most of the time: the experiment has reached annotation completeness and there is no more iteration because clustering is "perfect" (v-measure==1.0).
-                else:
-                    last_iter: str = max(dict_of_computation_times.keys())
-                    dict_of_global_computation_times_evolution[overview_2][
-                        iter_2
-                    ].append(
-                        dict_of_computation_times[last_iter]["clustering_TOTAL_RUN"]
-                    )
-
-        # Compute mean and sem of performance for this iteration and for experiment in this overview.
-        for iter_3 in LIST_OF_ITERATIONS:
-
-            # Compute mean of clustering time for this iteration and for experiment in this overview.
-            dict_of_global_computation_times_evolution_MEAN[overview_2][
-                iter_3
-            ] = numpy.mean(
-                dict_of_global_computation_times_evolution[overview_2][iter_3]
-            )
+    # Define the computation of statistics from experiments files.
+    def _compute_statistics() -> Dict[str, Any]:
+
+        # Load times of all experiments in a cube (one parallel read per experiment).
+        cube: Dict[str, Any] = experiment_cube.load_experiment_cube(
+            dict_of_overviews={
+                overview_1: list(settings_1["LIST_OF_ENV_PATHS"])
+                for overview_1, settings_1 in overview_settings.items()
+            },
+            read_experiment=_read_experiment_computation_times,
+            list_of_metrics=["clustering_TOTAL_RUN"],
+            forced_max_iter=forced_max_iter,
+            nb_workers=nb_workers,
+        )
 
-            # Compute sem of clustering time for this iteration and for experiment in this overview.
-            dict_of_global_computation_times_evolution_SEM[overview_2][
-                iter_3
-            ] = scipystats.sem(
-                dict_of_global_computation_times_evolution[overview_2][iter_3]
+        # Define list of iteration for computations.
+        LIST_OF_ITERATIONS: List[str] = cube["ITERATIONS"]
+
+        ### ### ### ### ###
+        ### Compute evolution of clustering time average over experiments.
+        ### ### ### ### ###
+
+        # Compute statistics of clustering time (mean, sem, confidence interval) for all iterations and for experiments of each overview.
+        dict_of_global_computation_times_evolution_STATS: Dict[str, Dict[str, numpy.ndarray]] = {
+            overview_2: overview_stats.compute_overview_statistics(
+                array_of_values=experiment_cube.get_overview_values(
+                    cube=cube,
+                    overview=overview_2,
+                    metric="clustering_TOTAL_RUN",
+                ),
+                with_bootstrap=(error_type == "ci"),
+                nb_resamples=nb_resamples,
+                nb_workers=nb_workers,
             )
+            for overview_2 in overview_settings.keys()
+        }
+
+        # Return iterations and statistics.
+        return {"ITERATIONS": LIST_OF_ITERATIONS, "STATS": dict_of_global_computation_times_evolution_STATS}
+
+    # Get statistics from cache, or compute them.
+    dict_of_results: Dict[str, Any] = overview_cache.get_or_compute(
+        list_of_filepaths=[
+            env_path + "dict_of_computation_times.json"
+            for settings_0 in overview_settings.values()
+            for env_path in settings_0["LIST_OF_ENV_PATHS"]
+        ],
+        dict_of_settings={
+            "overview": "experiments_time_overview",
+            "overviews": {overview_0: list(settings_0["LIST_OF_ENV_PATHS"]) for overview_0, settings_0 in overview_settings.items()},
+            "forced_max_iter": forced_max_iter,
+            "error_type": error_type,
+            "nb_resamples": nb_resamples,
+        },
+        compute=_compute_statistics,
+        with_cache=with_cache,
+    )
+    LIST_OF_ITERATIONS: List[str] = dict_of_results["ITERATIONS"]
+    dict_of_global_computation_times_evolution_STATS: Dict[str, Dict[str, numpy.ndarray]] = dict_of_results["STATS"]
 
     ### ### ### ### ###
     ### Plot graph of time.
@@ -378,48 +313,22 @@ def experiments_time_overview(
     # For all experiments overview...
     for overview_3, settings_3 in overview_settings.items():
 
-        # Plot average clustering time evolution.
-        axis.plot(
-            list_of_iterations_to_plot,  # x
-            [
-                dict_of_global_computation_times_evolution_MEAN[overview_3][
-                    iter_mean_plot
-                ]
-                for iter_mean_plot in LIST_OF_ITERATIONS
-            ],  # y
+        # Plot average clustering time evolution and its error band (decimated, with markers limited to highlighted iterations).
+        overview_rendering.plot_evolution(
+            axis=axis,
+            list_of_iterations=list_of_iterations_to_plot,
+            dict_of_statistics=dict_of_global_computation_times_evolution_STATS[overview_3],
+            error_type=error_type,
             label=str(settings_3["title"]),
+            color=str(settings_3["color"]),
             marker=str(settings_3["marker"]),
-            markerfacecolor=str(settings_3["color"]),
-            markersize=5,
-            color=settings_3["color"],
-            linewidth=1,
             linestyle=str(settings_3["linestyle"]),
-        )
-
-        # Plot error bars for clustering time evolution.
-        axis.fill_between(
-            x=list_of_iterations_to_plot,
-            y1=[
-                dict_of_global_computation_times_evolution_MEAN[overview_3][
-                    iter_errinf_plot
-                ]
-                - dict_of_global_computation_times_evolution_SEM[overview_3][
-                    iter_errinf_plot
-                ]
-                for iter_errinf_plot in LIST_OF_ITERATIONS
-            ],  # y1
-            y2=[
-                dict_of_global_computation_times_evolution_MEAN[overview_3][
-                    iter_errsup_plot
-                ]
-                + dict_of_global_computation_times_evolution_SEM[overview_3][
-                    iter_errsup_plot
-                ]
-                for iter_errsup_plot in LIST_OF_ITERATIONS
-            ],  # y2
-            # label="Standard error of the mean",
-            color=str(settings_3["color"]),
-            alpha=0.2,
+            max_nb_points=max_nb_points,
+            list_of_highlighted_iterations=(
+                None
+                if list_of_highlighted_iterations is None
+                else [int(iter_highlight) for iter_highlight in list_of_highlighted_iterations]
+            ),
         )
 
     # Set axis name.
@@ -452,11 +361,10 @@ def experiments_time_overview(
     axis.grid(True)
 
     # Store the graph.
-    fig.savefig(
-        "../results/plot_global_computation_times_evolution.png",
-        dpi=300,
-        transparent=True,
-        bbox_inches="tight",
+    overview_rendering.save_figure(
+        fig=fig,
+        filepath="../results/plot_global_computation_times_evolution",
+        list_of_formats=list_of_formats,
     )
 
     # Close figure.
@@ -464,3 +372,67 @@ def experiments_time_overview(
 
     # End of script.
     return 0
+
+
+# ==============================================================================
+# PRIVATE - READ EXPERIMENT PERFORMANCES
+# ==============================================================================
+def _read_experiment_performances(
+    env_path: str,
+) -> Dict[str, Any]:
+    """
+    A method aimed at read clustering performances of an experiment for `experiment_cube`.
+
+    Args:
+        env_path (str): The experiment environment path.
+
+    Returns:
+        Dict[str, Any]: The last iteration reached and the v-measure of each iteration.
+    """
+
+    # Load clustering evaluations.
+    with open(env_path + "dict_of_clustering_performances.json", "r") as evaluation_file:
+        dict_of_clustering_performances: Dict[str, Dict[str, float]] = json.load(evaluation_file)
+
+    # Return reading.
+    return {
+        "LAST_ITERATION": max(dict_of_clustering_performances.keys()),
+        "SERIES": {
+            "v_measure": {
+                iteration: performances["v_measure"]
+                for iteration, performances in dict_of_clustering_performances.items()
+            },
+        },
+    }
+
+
+# ==============================================================================
+# PRIVATE - READ EXPERIMENT COMPUTATION TIMES
+# ==============================================================================
+def _read_experiment_computation_times(
+    env_path: str,
+) -> Dict[str, Any]:
+    """
+    A method aimed at read clustering times of an experiment for `experiment_cube`.
+
+    Args:
+        env_path (str): The experiment environment path.
+
+    Returns:
+        Dict[str, Any]: The last iteration reached and the clustering time of each iteration.
+    """
+
+    # Load clustering time.
+    with open(env_path + "dict_of_computation_times.json", "r") as time_file:
+        dict_of_computation_times: Dict[str, Dict[str, float]] = json.load(time_file)
+
+    # Return reading.
+    return {
+        "LAST_ITERATION": max(dict_of_computation_times.keys()),
+        "SERIES": {
+            "clustering_TOTAL_RUN": {
+                iteration: times["clustering_TOTAL_RUN"]
+                for iteration, times in dict_of_computation_times.items()
+            },
+        },
+    }
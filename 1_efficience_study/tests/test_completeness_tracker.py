@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         test_completeness_tracker
+* Description:  Cross-check the completeness tracker against the binary constraints manager.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import itertools
+import os
+import random
+import sys
+from typing import List, Tuple
+
+import pytest
+from cognitivefactory.interactive_clustering.constraints.abstract import (
+    AbstractConstraintsManager,
+)
+from cognitivefactory.interactive_clustering.constraints.factory import (
+    managing_factory,
+)
+
+# Notebook modules are not a package: import them from the `notebook` folder.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "notebook"))
+
+import completeness_tracker  # noqa: E402
+
+
+# ==============================================================================
+# PRIVATE - RANDOM HISTORY
+# ==============================================================================
+def _get_random_history(
+    random_seed: int,
+    nb_data: int,
+    nb_intents: int,
+    nb_iterations: int,
+    nb_to_select: int,
+) -> Tuple[List[str], List[List[Tuple[str, str, str]]]]:
+    """
+    A method aimed at generate a random annotation history, annotated according to random true intents (so without conflict).
+
+    Args:
+        random_seed (int): The random seed.
+        nb_data (int): The number of data.
+        nb_intents (int): The number of true intents.
+        nb_iterations (int): The number of iterations.
+        nb_to_select (int): The number of constraints annotated at each iteration.
+
+    Returns:
+        Tuple[List[str], List[List[Tuple[str, str, str]]]]: The list of data IDs, and the constraints annotated at each iteration.
+    """
+    rng: random.Random = random.Random(random_seed)
+    list_of_data_IDs: List[str] = [str(data_index).zfill(4) for data_index in range(nb_data)]
+    dict_of_true_intents = {data_ID: rng.randrange(nb_intents) for data_ID in list_of_data_IDs}
+    history: List[List[Tuple[str, str, str]]] = []
+    for _ in range(nb_iterations):
+        history.append(
+            [
+                (
+                    data_ID1,
+                    data_ID2,
+                    "MUST_LINK" if (dict_of_true_intents[data_ID1] == dict_of_true_intents[data_ID2]) else "CANNOT_LINK",
+                )
+                for data_ID1, data_ID2 in (rng.sample(list_of_data_IDs, 2) for _ in range(nb_to_select))
+            ]
+        )
+    return (list_of_data_IDs, history)
+
+
+def _count_undetermined_pairs(
+    constraints_manager: AbstractConstraintsManager,
+    list_of_data_IDs: List[str],
+) -> int:
+    """
+    A method aimed at count the pairs of data without annotated or inferred constraint in a constraints manager.
+
+    Args:
+        constraints_manager (AbstractConstraintsManager): The constraints manager.
+        list_of_data_IDs (List[str]): The list of data IDs.
+
+    Returns:
+        int: The number of undetermined pairs.
+    """
+    return sum(
+        constraints_manager.get_inferred_constraint(data_ID1=data_ID1, data_ID2=data_ID2) is None
+        for data_ID1, data_ID2 in itertools.combinations(list_of_data_IDs, 2)
+    )
+
+
+# ==============================================================================
+# TESTS - CROSS-CHECK WITH THE BINARY CONSTRAINTS MANAGER
+# ==============================================================================
+@pytest.mark.parametrize(
+    ("random_seed", "nb_data", "nb_intents", "nb_to_select"),
+    [
+        (1, 12, 2, 3),
+        (2, 15, 3, 5),
+        (3, 20, 4, 4),
+        (4, 20, 8, 6),
+        (5, 25, 5, 10),
+    ],
+)
+def test_tracker_matches_binary_manager(
+    random_seed: int,
+    nb_data: int,
+    nb_intents: int,
+    nb_to_select: int,
+):
+    """
+    Test that the tracker completeness and number of undetermined pairs match the binary constraints manager at each iteration of random histories, until completeness.
+    """
+    list_of_data_IDs, history = _get_random_history(
+        random_seed=random_seed,
+        nb_data=nb_data,
+        nb_intents=nb_intents,
+        nb_iterations=200,
+        nb_to_select=nb_to_select,
+    )
+    constraints_manager: AbstractConstraintsManager = managing_factory(
+        list_of_data_IDs=list_of_data_IDs,
+        manager="binary",
+    )
+    tracker = completeness_tracker.CompletenessTracker(list_of_data_IDs=list_of_data_IDs)
+
+    # Check the initial state.
+    assert tracker.nb_undetermined_pairs == nb_data * (nb_data - 1) // 2
+    assert tracker.check_completude_of_constraints() == constraints_manager.check_completude_of_constraints()
+
+    # Replay the history and compare at each iteration.
+    for list_of_triplet_annotated in history:
+        for data_ID1, data_ID2, constraint_type in list_of_triplet_annotated:
+            constraints_manager.add_constraint(data_ID1=data_ID1, data_ID2=data_ID2, constraint_type=constraint_type)
+            tracker.add_constraint(data_ID1=data_ID1, data_ID2=data_ID2, constraint_type=constraint_type)
+        assert tracker.nb_undetermined_pairs == _count_undetermined_pairs(
+            constraints_manager=constraints_manager,
+            list_of_data_IDs=list_of_data_IDs,
+        )
+        assert tracker.check_completude_of_constraints() == constraints_manager.check_completude_of_constraints()
+        if tracker.check_completude_of_constraints():
+            break
+
+    # Check that histories are long enough to reach completeness.
+    assert tracker.check_completude_of_constraints()
+
+
+def test_tracker_raises_on_conflicts():
+    """
+    Test that the tracker refuses constraints in conflict, as the binary constraints manager.
+    """
+    list_of_data_IDs: List[str] = ["a", "b", "c"]
+    constraints_manager: AbstractConstraintsManager = managing_factory(list_of_data_IDs=list_of_data_IDs, manager="binary")
+    tracker = completeness_tracker.CompletenessTracker(list_of_data_IDs=list_of_data_IDs)
+    for checked in (constraints_manager, tracker):
+        checked.add_constraint(data_ID1="a", data_ID2="b", constraint_type="MUST_LINK")
+        checked.add_constraint(data_ID1="b", data_ID2="c", constraint_type="CANNOT_LINK")
+        with pytest.raises(ValueError):
+            checked.add_constraint(data_ID1="a", data_ID2="c", constraint_type="MUST_LINK")
+    assert tracker.nb_undetermined_pairs == _count_undetermined_pairs(
+        constraints_manager=constraints_manager,
+        list_of_data_IDs=list_of_data_IDs,
+    )
@@ -0,0 +1,662 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         benchmark
+* Description:  Repeated measurement of computation time with warm-up runs, robust statistics, environment metadata and isolation of timing workers.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import fcntl
+import json
+import os
+import platform
+import resource
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, TypedDict
+
+import numpy as np
+import threadpoolctl
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Default number of untimed runs before measurements (to load lazy modules, fill caches, ...).
+DEFAULT_NB_WARMUPS: int = 1
+
+# Default number of timed runs.
+DEFAULT_NB_REPETITIONS: int = 5
+
+# Default interval between two checks of the largest numpy buffer during the memory run (in seconds).
+DEFAULT_BUFFER_TRACKING_INTERVAL: float = 0.05
+
+# Coefficient of Tukey fences used to detect outliers (a sample is an outlier if it is farther than `k * IQR` from the quartiles).
+OUTLIER_COEFFICIENT: float = 1.5
+
+# Environment variables that limit the number of threads of numerical libraries.
+LIST_OF_THREAD_VARIABLES: List[str] = [
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+]
+
+# Default maximal number of measurements run again if they were taken under excessive interference.
+DEFAULT_MAX_RERUNS: int = 3
+
+# Default minimal ratio between CPU time and wall time of timed runs (a lower ratio means that the task was waiting for the CPU).
+DEFAULT_MIN_CPU_RATIO: float = 0.9
+
+# Default maximal load average per physical core around timed runs.
+DEFAULT_MAX_LOAD_PER_CORE: float = 1.25
+
+# Default folder of lock files used by isolated timing workers to claim a physical core (locks are released by the system when a worker dies).
+DEFAULT_CORE_LOCKS_PATH: str = os.path.join(tempfile.gettempdir(), "interactive_clustering_timing_cores/")
+
+# Physical core claimed by the current isolated timing worker (cf. `init_isolated_worker`), and its lock file.
+_isolated_core: Optional[int] = None
+_isolated_core_lock: Optional[IO[str]] = None
+
+
+# ==============================================================================
+# BENCHMARK - RUN
+# ==============================================================================
+def run_benchmark(
+    task: Callable[..., Any],
+    setup: Optional[Callable[[], Tuple[Any, ...]]] = None,
+    nb_warmups: int = DEFAULT_NB_WARMUPS,
+    nb_repetitions: int = DEFAULT_NB_REPETITIONS,
+    with_memory: bool = True,
+) -> Dict[str, Any]:
+    """
+    A method aimed at measure the computation time of a task: `nb_warmups` untimed runs, then `nb_repetitions` timed runs with monotonic clocks.
+    The peak resident set size is read around timed runs, and allocations are traced in an additional run after timed runs, because tracing slows down the task.
+
+    Args:
+        task (Callable[..., Any]): The task to measure. It is called with the arguments returned by `setup`.
+        setup (Optional[Callable[[], Tuple[Any, ...]]], optional): The untimed preparation of each run (ex: a fresh constraints manager if the task modifies it). Defaults to `None` (no argument).
+        nb_warmups (int, optional): The number of untimed runs. Defaults to `DEFAULT_NB_WARMUPS`.
+        nb_repetitions (int, optional): The number of timed runs. Defaults to `DEFAULT_NB_REPETITIONS`.
+        with_memory (bool, optional): The option to measure memory. Defaults to `True`.
+
+    Raises:
+        ValueError: if `nb_repetitions` is not positive.
+
+    Returns:
+        Dict[str, Any]: The measurement: start and stop timestamps of timed runs (`"start"`, `"stop"`), the estimated time (`"total"`, the median), the wall and CPU time of each run (`"samples"`, `"cpu_samples"`), their statistics (`"statistics"`, cf. `compute_statistics`), the system load around timed runs (`"load"`: load averages before and after (`"before"`, `"after"`), busy fraction of all CPUs (`"cpu_busy"`, `None` if not available), ratio between CPU time and wall time (`"cpu_ratio"`) and involuntary context switches of the process (`"involuntary_switches"`)), the memory usage in bytes (`"memory"`: resident set size before the run with the highest peak (`"rss_before"`), this peak (`"peak_rss"`) and its increase (`"peak_rss_increase"`, `None` if the peak can't be reset), `1` if the peak was reset before runs (`"peak_rss_reset"`), and traced allocations, cf. `measure_allocations`; `None` if not measured) and the environment metadata (`"environment"`, cf. `get_environment_metadata`).
+    """
+
+    # Check parameters.
+    if nb_repetitions < 1:
+        raise ValueError("The `nb_repetitions` '" + str(nb_repetitions) + "' must be positive.")
+
+    # Warm-up runs.
+    for _ in range(nb_warmups):
+        task(*(setup() if setup is not None else ()))
+
+    # Get environment metadata just before measurements.
+    dict_of_environment: Dict[str, Any] = get_environment_metadata()
+
+    # Timed runs (setup is not timed). If memory is measured, the peak resident set size is reset before each run (Linux only) and read after it, out of the timed section.
+    list_of_samples: List[float] = []
+    list_of_cpu_samples: List[float] = []
+    list_of_rss: List[Tuple[Optional[int], Optional[int], bool]] = []
+    load_before: Optional[List[float]] = _get_load_average()
+    cpu_times_before: Optional[Tuple[int, int]] = _get_cpu_times()
+    involuntary_switches_before: int = resource.getrusage(resource.RUSAGE_SELF).ru_nivcsw
+    time_start: float = datetime.timestamp(datetime.now())
+    for _ in range(nb_repetitions):
+        arguments: Tuple[Any, ...] = setup() if setup is not None else ()
+        if with_memory:
+            rss_before: Optional[int] = _get_status_value(key="VmRSS")
+            peak_rss_reset: bool = _reset_peak_rss()
+        counter_start: int = time.perf_counter_ns()
+        cpu_counter_start: int = time.process_time_ns()
+        task(*arguments)
+        cpu_counter_stop: int = time.process_time_ns()
+        counter_stop: int = time.perf_counter_ns()
+        if with_memory:
+            list_of_rss.append((rss_before, _get_peak_rss(), peak_rss_reset))
+        list_of_samples.append((counter_stop - counter_start) / 1e9)
+        list_of_cpu_samples.append((cpu_counter_stop - cpu_counter_start) / 1e9)
+    time_stop: float = datetime.timestamp(datetime.now())
+    involuntary_switches_after: int = resource.getrusage(resource.RUSAGE_SELF).ru_nivcsw
+    cpu_times_after: Optional[Tuple[int, int]] = _get_cpu_times()
+    load_after: Optional[List[float]] = _get_load_average()
+
+    # System load around timed runs (the busy fraction of CPUs is computed from `/proc/stat` on Linux).
+    dict_of_load: Dict[str, Any] = {
+        "before": load_before,
+        "after": load_after,
+        "cpu_busy": (
+            (cpu_times_after[0] - cpu_times_before[0]) / (cpu_times_after[1] - cpu_times_before[1])
+            if (cpu_times_before is not None) and (cpu_times_after is not None) and (cpu_times_after[1] > cpu_times_before[1])
+            else None
+        ),
+        "cpu_ratio": sum(list_of_cpu_samples) / max(sum(list_of_samples), 1e-9),
+        "involuntary_switches": involuntary_switches_after - involuntary_switches_before,
+    }
+
+    # Compute statistics.
+    dict_of_statistics: BenchmarkStatistics = compute_statistics(
+        list_of_samples=list_of_samples,
+    )
+
+    # Memory: peak resident set size of timed runs, and traced allocations in an additional run (the largest numpy buffer is checked about 20 times during the run).
+    dict_of_memory: Optional[Dict[str, Optional[int]]] = None
+    if with_memory:
+        rss_before, peak_rss, peak_rss_reset = max(list_of_rss, key=lambda rss: rss[1] or 0)
+        dict_of_memory = {
+            "rss_before": rss_before,
+            "peak_rss": peak_rss,
+            "peak_rss_increase": (
+                max(0, peak_rss - rss_before)
+                if (rss_before is not None) and (peak_rss is not None) and peak_rss_reset
+                else None
+            ),
+            "peak_rss_reset": int(peak_rss_reset),
+            **measure_allocations(
+                task=task,
+                setup=setup,
+                buffer_tracking_interval=max(0.001, min(DEFAULT_BUFFER_TRACKING_INTERVAL, dict_of_statistics["median"] / 20)),
+            ),
+        }
+
+    # Return measurement.
+    return {
+        "start": time_start,
+        "stop": time_stop,
+        "total": dict_of_statistics["median"],
+        "clock": "time.perf_counter_ns",
+        "nb_warmups": nb_warmups,
+        "nb_repetitions": nb_repetitions,
+        "samples": list_of_samples,
+        "cpu_samples": list_of_cpu_samples,
+        "statistics": dict_of_statistics,
+        "load": dict_of_load,
+        "memory": dict_of_memory,
+        "environment": dict_of_environment,
+    }
+
+
+# ==============================================================================
+# BENCHMARK - RUN WITH INTERFERENCE GUARD
+# ==============================================================================
+def run_guarded_benchmark(
+    task: Callable[..., Any],
+    setup: Optional[Callable[[], Tuple[Any, ...]]] = None,
+    nb_warmups: int = DEFAULT_NB_WARMUPS,
+    nb_repetitions: int = DEFAULT_NB_REPETITIONS,
+    with_memory: bool = True,
+    max_reruns: int = DEFAULT_MAX_RERUNS,
+    min_cpu_ratio: float = DEFAULT_MIN_CPU_RATIO,
+    max_load_per_core: float = DEFAULT_MAX_LOAD_PER_CORE,
+) -> Dict[str, Any]:
+    """
+    A method aimed at measure the computation time of a task (cf. `run_benchmark`), and run the measurement again if it was taken under excessive interference (cf. `get_interferences`).
+
+    Args:
+        task (Callable[..., Any]): The task to measure. It is called with the arguments returned by `setup`.
+        setup (Optional[Callable[[], Tuple[Any, ...]]], optional): The untimed preparation of each run. Defaults to `None` (no argument).
+        nb_warmups (int, optional): The number of untimed runs. Defaults to `DEFAULT_NB_WARMUPS`.
+        nb_repetitions (int, optional): The number of timed runs. Defaults to `DEFAULT_NB_REPETITIONS`.
+        with_memory (bool, optional): The option to measure memory. Defaults to `True`.
+        max_reruns (int, optional): The maximal number of measurements run again. Defaults to `DEFAULT_MAX_RERUNS`.
+        min_cpu_ratio (float, optional): The minimal ratio between CPU time and wall time of timed runs. Defaults to `DEFAULT_MIN_CPU_RATIO`.
+        max_load_per_core (float, optional): The maximal load average per physical core around timed runs. Defaults to `DEFAULT_MAX_LOAD_PER_CORE`.
+
+    Returns:
+        Dict[str, Any]: The measurement (cf. `run_benchmark`), with its interferences (`"interference"`: detected interferences (`"reasons"`, empty if the measurement is clean), number of measurements run again (`"nb_reruns"`) and loads of discarded measurements (`"discarded_loads"`)). If all measurements are interfered, the one with the highest CPU ratio is kept.
+    """
+
+    # Run measurements until one is taken without excessive interference.
+    list_of_measurements: List[Dict[str, Any]] = []
+    for _ in range(max(0, max_reruns) + 1):
+        dict_of_measurement: Dict[str, Any] = run_benchmark(
+            task=task,
+            setup=setup,
+            nb_warmups=nb_warmups,
+            nb_repetitions=nb_repetitions,
+            with_memory=with_memory,
+        )
+        dict_of_measurement["interference"] = {
+            "reasons": get_interferences(
+                dict_of_measurement=dict_of_measurement,
+                min_cpu_ratio=min_cpu_ratio,
+                max_load_per_core=max_load_per_core,
+            ),
+        }
+        list_of_measurements.append(dict_of_measurement)
+        if not dict_of_measurement["interference"]["reasons"]:
+            break
+
+    # Keep the last measurement if it is clean, otherwise the least interfered one.
+    dict_of_kept_measurement: Dict[str, Any] = (
+        list_of_measurements[-1]
+        if not list_of_measurements[-1]["interference"]["reasons"]
+        else max(list_of_measurements, key=lambda measurement: measurement["load"]["cpu_ratio"])
+    )
+    dict_of_kept_measurement["interference"]["nb_reruns"] = len(list_of_measurements) - 1
+    dict_of_kept_measurement["interference"]["discarded_loads"] = [
+        measurement["load"]
+        for measurement in list_of_measurements
+        if measurement is not dict_of_kept_measurement
+    ]
+
+    # Return measurement.
+    return dict_of_kept_measurement
+
+
+# ==============================================================================
+# BENCHMARK - GET INTERFERENCES
+# ==============================================================================
+def get_interferences(
+    dict_of_measurement: Dict[str, Any],
+    min_cpu_ratio: float = DEFAULT_MIN_CPU_RATIO,
+    max_load_per_core: float = DEFAULT_MAX_LOAD_PER_CORE,
+) -> List[str]:
+    """
+    A method aimed at detect excessive interference during a measurement: the task was waiting for the CPU (low ratio between CPU time and wall time), or the system was overloaded (high load average per physical core).
+
+    Args:
+        dict_of_measurement (Dict[str, Any]): The measurement (cf. `run_benchmark`).
+        min_cpu_ratio (float, optional): The minimal ratio between CPU time and wall time of timed runs. Defaults to `DEFAULT_MIN_CPU_RATIO`.
+        max_load_per_core (float, optional): The maximal load average per physical core around timed runs. Defaults to `DEFAULT_MAX_LOAD_PER_CORE`.
+
+    Returns:
+        List[str]: The detected interferences (`"cpu_ratio"`, `"load"`). Empty if the measurement is clean.
+    """
+
+    # Initialize detected interferences.
+    list_of_reasons: List[str] = []
+    dict_of_load: Dict[str, Any] = dict_of_measurement["load"]
+
+    # Case of a task waiting for the CPU.
+    if dict_of_load["cpu_ratio"] < min_cpu_ratio:
+        list_of_reasons.append("cpu_ratio")
+
+    # Case of an overloaded system (1-minute load average).
+    list_of_load_averages: List[float] = [
+        load_average[0]
+        for load_average in (dict_of_load["before"], dict_of_load["after"])
+        if load_average is not None
+    ]
+    if list_of_load_averages and (max(list_of_load_averages) / len(get_physical_cores(with_affinity=False)) > max_load_per_core):
+        list_of_reasons.append("load")
+
+    # Return detected interferences.
+    return list_of_reasons
+
+
+# ==============================================================================
+# BENCHMARK - MEASURE ALLOCATIONS
+# ==============================================================================
+def measure_allocations(
+    task: Callable[..., Any],
+    setup: Optional[Callable[[], Tuple[Any, ...]]] = None,
+    buffer_tracking_interval: Optional[float] = DEFAULT_BUFFER_TRACKING_INTERVAL,
+) -> Dict[str, int]:
+    """
+    A method aimed at trace the memory allocated by one run of a task with `tracemalloc` (setup is not traced).
+
+    Args:
+        task (Callable[..., Any]): The task to measure. It is called with the arguments returned by `setup`.
+        setup (Optional[Callable[[], Tuple[Any, ...]]], optional): The preparation of the run. Defaults to `None` (no argument).
+        buffer_tracking_interval (Optional[float], optional): The interval between two checks of the largest numpy buffer (in seconds). Defaults to `DEFAULT_BUFFER_TRACKING_INTERVAL`. `None` to check only at the end of the run.
+
+    Returns:
+        Dict[str, int]: The peak of memory allocated through Python and numpy (`"tracemalloc_peak"`), and the largest numpy buffer (numpy arrays and scipy sparse matrices data) observed during the run (`"largest_numpy_buffer"`), in bytes.
+    """
+
+    # Prepare the run and start tracing allocations.
+    arguments: Tuple[Any, ...] = setup() if setup is not None else ()
+    tracemalloc.start()
+
+    # Check the largest numpy buffer periodically in a thread.
+    list_of_largest_buffers: List[int] = [0]
+    event_stop: threading.Event = threading.Event()
+    def _track_largest_buffer() -> None:
+        while not event_stop.wait(buffer_tracking_interval):
+            list_of_largest_buffers.append(_get_largest_numpy_buffer())
+    thread_tracking: Optional[threading.Thread] = None
+    if buffer_tracking_interval is not None:
+        thread_tracking = threading.Thread(target=_track_largest_buffer, daemon=True)
+        thread_tracking.start()
+
+    # Run the task (its result is checked before being released).
+    try:
+        result: Any = task(*arguments)
+        list_of_largest_buffers.append(_get_largest_numpy_buffer())
+        del result
+    finally:
+        event_stop.set()
+        if thread_tracking is not None:
+            thread_tracking.join()
+        tracemalloc_peak: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    # Return traced allocations.
+    return {
+        "tracemalloc_peak": tracemalloc_peak,
+        "largest_numpy_buffer": max(list_of_largest_buffers),
+    }
+
+
+# ==============================================================================
+# BENCHMARK - COMPUTE STATISTICS
+# ==============================================================================
+class BenchmarkStatistics(TypedDict):
+    """
+    The statistics of time samples (cf. `compute_statistics`).
+    """
+
+    median: float
+    q1: float
+    q3: float
+    iqr: float
+    min: float
+    max: float
+    mean: float
+    nb_samples: int
+    outliers: List[int]
+
+
+def compute_statistics(
+    list_of_samples: List[float],
+) -> BenchmarkStatistics:
+    """
+    A method aimed at compute robust statistics of time samples, and detect outliers with Tukey fences.
+
+    Args:
+        list_of_samples (List[float]): The time samples.
+
+    Returns:
+        BenchmarkStatistics: The median, quartiles (`"q1"`, `"q3"`), interquartile range (`"iqr"`), minimum, maximum, mean, number of samples, and the indices of outliers (`"outliers"`).
+    """
+
+    # Compute quartiles.
+    array_of_samples: np.ndarray = np.asarray(list_of_samples, dtype=float)
+    q1, median, q3 = np.percentile(array_of_samples, [25, 50, 75])
+    iqr: float = q3 - q1
+
+    # Return statistics.
+    return {
+        "median": float(median),
+        "q1": float(q1),
+        "q3": float(q3),
+        "iqr": float(iqr),
+        "min": float(array_of_samples.min()),
+        "max": float(array_of_samples.max()),
+        "mean": float(array_of_samples.mean()),
+        "nb_samples": len(array_of_samples),
+        "outliers": np.flatnonzero(
+            (array_of_samples < q1 - OUTLIER_COEFFICIENT * iqr)
+            | (array_of_samples > q3 + OUTLIER_COEFFICIENT * iqr)
+        ).tolist(),
+    }
+
+
+# ==============================================================================
+# BENCHMARK - ENVIRONMENT METADATA
+# ==============================================================================
+def get_environment_metadata() -> Dict[str, Any]:
+    """
+    A method aimed at describe the environment of a measurement: CPU model, available CPUs, thread limits of numerical libraries, core of isolated timing worker, load average.
+
+    Returns:
+        Dict[str, Any]: The environment metadata.
+    """
+
+    # Get the CPU model (from `/proc/cpuinfo` on Linux).
+    cpu_model: str = platform.processor()
+    if os.path.exists("/proc/cpuinfo"):
+        with open("/proc/cpuinfo", "r") as file_cpuinfo:
+            for line in file_cpuinfo:
+                if line.startswith("model name"):
+                    cpu_model = line.split(":", 1)[1].strip()
+                    break
+
+    # Return metadata.
+    return {
+        "hostname": platform.node(),
+        "platform": platform.platform(),
+        "python_version": platform.python_version(),
+        "cpu_model": cpu_model,
+        "cpu_count": os.cpu_count(),
+        "cpu_affinity": (
+            sorted(os.sched_getaffinity(0))
+            if hasattr(os, "sched_getaffinity")
+            else None
+        ),
+        "thread_limits": {
+            variable: os.environ.get(variable)
+            for variable in LIST_OF_THREAD_VARIABLES
+        },
+        "threadpools": [
+            {"internal_api": threadpool["internal_api"], "num_threads": threadpool["num_threads"]}
+            for threadpool in threadpoolctl.threadpool_info()
+        ],
+        "isolated_core": _isolated_core,
+        "load_average": (
+            list(os.getloadavg())
+            if hasattr(os, "getloadavg")
+            else None
+        ),
+    }
+
+
+# ==============================================================================
+# BENCHMARK - ISOLATION
+# ==============================================================================
+def get_physical_cores(
+    with_affinity: bool = True,
+) -> List[int]:
+    """
+    A method aimed at list the physical cores, represented by their first logical CPU (hyperthreading siblings are ignored, Linux only).
+
+    Args:
+        with_affinity (bool, optional): The option to keep only cores available for the current process. Defaults to `True`.
+
+    Returns:
+        List[int]: The logical CPU of each physical core. If the topology is unknown, all logical CPUs.
+    """
+
+    # Get logical CPUs.
+    list_of_cpus: List[int] = (
+        sorted(os.sched_getaffinity(0))
+        if with_affinity and hasattr(os, "sched_getaffinity")
+        else list(range(os.cpu_count() or 1))
+    )
+
+    # Group logical CPUs by physical core (from `/sys/devices/system/cpu/` on Linux).
+    dict_of_physical_cores: Dict[Tuple[str, str], int] = {}
+    for cpu in list_of_cpus:
+        topology_path: str = "/sys/devices/system/cpu/cpu" + str(cpu) + "/topology/"
+        if not os.path.exists(topology_path + "core_id"):
+            return list_of_cpus
+        with open(topology_path + "physical_package_id", "r") as file_package_id:
+            package_id: str = file_package_id.read().strip()
+        with open(topology_path + "core_id", "r") as file_core_id:
+            core_id: str = file_core_id.read().strip()
+        dict_of_physical_cores.setdefault((package_id, core_id), cpu)
+
+    # Return the first logical CPU of each physical core.
+    return sorted(dict_of_physical_cores.values())
+
+
+def init_isolated_worker(
+    locks_path: str = DEFAULT_CORE_LOCKS_PATH,
+) -> None:
+    """
+    A method aimed at isolate a timing worker: numerical libraries are limited to one thread, and the worker is pinned to a physical core not claimed by another timing worker.
+    Usage note:
+        - Use it as initializer of the pool of timing workers (ex: `mp.Pool(len(benchmark.get_physical_cores()), initializer=benchmark.init_isolated_worker)`).
+        - Cores are claimed with lock files, so that a worker that replaces a dead one gets its core back, and concurrent pools don't share cores.
+        - If all physical cores are already claimed, the worker is not pinned (`get_environment_metadata()["isolated_core"]` is `None`).
+
+    Args:
+        locks_path (str, optional): The folder of lock files. Defaults to `DEFAULT_CORE_LOCKS_PATH`.
+    """
+    global _isolated_core, _isolated_core_lock  # noqa: WPS420
+
+    # Limit numerical libraries to one thread (environment variables for libraries loaded later, `threadpoolctl` for libraries already loaded).
+    for variable in LIST_OF_THREAD_VARIABLES:
+        os.environ[variable] = "1"
+    threadpoolctl.threadpool_limits(limits=1)
+
+    # Claim a free physical core.
+    os.makedirs(locks_path, exist_ok=True)
+    for core in get_physical_cores():
+        file_lock: IO[str] = open(locks_path + "core_" + str(core) + ".lock", "w")  # noqa: SIM115
+        try:
+            fcntl.flock(file_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            file_lock.close()
+            continue
+
+        # Pin the worker to the claimed core (the lock is kept open until the worker ends).
+        os.sched_setaffinity(0, {core})
+        _isolated_core, _isolated_core_lock = core, file_lock
+        break
+
+
+def get_isolated_core() -> Optional[int]:
+    """
+    A method aimed at get the physical core of the current isolated timing worker.
+
+    Returns:
+        Optional[int]: The core. `None` if the current process is not an isolated timing worker (cf. `init_isolated_worker`).
+    """
+    return _isolated_core
+
+
+# ==============================================================================
+# BENCHMARK - STORE
+# ==============================================================================
+def store_benchmark(
+    filepath: str,
+    dict_of_measurement: Dict[str, Any],
+) -> None:
+    """
+    A method aimed at store a measurement in a timing file (a hidden temporary file is used to avoid partial files if the run is killed).
+
+    Args:
+        filepath (str): The path of the timing file (ex: `ENV_PATH + "computation_time.json"`).
+        dict_of_measurement (Dict[str, Any]): The measurement (cf. `run_benchmark`).
+    """
+
+    # Store the measurement.
+    with open(filepath + ".tmp", "w") as file_time:
+        json.dump(dict_of_measurement, file_time)
+    os.replace(filepath + ".tmp", filepath)
+
+
+# ==============================================================================
+# PRIVATE - MEMORY
+# ==============================================================================
+def _get_status_value(
+    key: str,
+) -> Optional[int]:
+    """
+    A method aimed at get a memory value of the current process from `/proc/self/status` (Linux only).
+
+    Args:
+        key (str): The key of the value (ex: `"VmRSS"` for the resident set size, `"VmHWM"` for its peak).
+
+    Returns:
+        Optional[int]: The value in bytes. `None` if not available.
+    """
+    if not os.path.exists("/proc/self/status"):
+        return None
+    with open("/proc/self/status", "r") as file_status:
+        for line in file_status:
+            if line.startswith(key + ":"):
+                return int(line.split()[1]) * 1024
+    return None
+
+
+def _reset_peak_rss() -> bool:
+    """
+    A method aimed at reset the peak resident set size of the current process (Linux only, by writing `5` in `/proc/self/clear_refs`).
+
+    Returns:
+        bool: `True` if the peak was reset.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as file_clear_refs:
+            file_clear_refs.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def _get_peak_rss() -> Optional[int]:
+    """
+    A method aimed at get the peak resident set size of the current process (`VmHWM` on Linux, otherwise the peak since the process start).
+
+    Returns:
+        Optional[int]: The peak in bytes.
+    """
+    peak_rss: Optional[int] = _get_status_value(key="VmHWM")
+    if peak_rss is None:
+        # NB: `ru_maxrss` is in kilobytes on Linux and in bytes on macOS.
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if platform.system() == "Darwin" else 1024)
+    return peak_rss
+
+
+def _get_largest_numpy_buffer() -> int:
+    """
+    A method aimed at get the size of the largest numpy buffer currently allocated (`tracemalloc` has to be started).
+
+    Returns:
+        int: The size in bytes (`0` if there is no numpy buffer).
+    """
+    return max(
+        (
+            trace.size
+            for trace in tracemalloc.take_snapshot().traces
+            if trace.domain == np.lib.tracemalloc_domain
+        ),
+        default=0,
+    )
+
+
+# ==============================================================================
+# PRIVATE - LOAD
+# ==============================================================================
+def _get_load_average() -> Optional[List[float]]:
+    """
+    A method aimed at get the load averages of the system over 1, 5 and 15 minutes.
+
+    Returns:
+        Optional[List[float]]: The load averages. `None` if not available.
+    """
+    if not hasattr(os, "getloadavg"):
+        return None
+    return list(os.getloadavg())
+
+
+def _get_cpu_times() -> Optional[Tuple[int, int]]:
+    """
+    A method aimed at get the busy and total time of all CPUs since boot, from `/proc/stat` (Linux only).
+
+    Returns:
+        Optional[Tuple[int, int]]: The busy time and the total time (in clock ticks). `None` if not available.
+    """
+    if not os.path.exists("/proc/stat"):
+        return None
+    with open("/proc/stat", "r") as file_stat:
+        # NB : the first line is `cpu user nice system idle iowait irq softirq steal guest guest_nice`, and guest times are already counted in user times.
+        list_of_times: List[int] = [int(value) for value in file_stat.readline().split()[1:9]]
+    return (sum(list_of_times) - list_of_times[3] - list_of_times[4], sum(list_of_times))
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         clustering_benchmark
+* Description:  Define the benchmark of constrained clustering algorithms against dataset size and constraints density, with the number of iterations until convergence.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import contextlib
+import io
+import re
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+import numpy as np
+from cognitivefactory.interactive_clustering.clustering import affinity_propagation
+from cognitivefactory.interactive_clustering.clustering.abstract import (
+    AbstractConstrainedClustering,
+)
+from cognitivefactory.interactive_clustering.clustering.kmeans import (
+    KMeansConstrainedClustering,
+)
+from cognitivefactory.interactive_clustering.clustering.mpckmeans import (
+    MPCKMeansConstrainedClustering,
+)
+from cognitivefactory.interactive_clustering.constraints.abstract import (
+    AbstractConstraintsManager,
+)
+from scipy.sparse import csr_matrix
+
+import scaling_benchmark
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Sizes of datasets.
+DEFAULT_LIST_OF_SIZES: List[int] = [1000, 2000, 5000, 10000]
+
+# Densities of previous constraints, as a rate of the dataset size.
+DEFAULT_LIST_OF_RATES: List[float] = [0.0, 0.5, 1.0, 2.0]
+
+# Default number of clusters (algorithms without number of clusters ignore it).
+DEFAULT_NB_CLUSTERS: int = 10
+
+# Clustering algorithms used in the studies (name used in environments names, algorithm in `clustering_factory` and its settings).
+DICT_OF_ALGORITHMS: Dict[str, Dict[str, Any]] = {
+    "kmeans_COP": {
+        "algorithm": "kmeans",
+        "init**kargs": {"model": "COP", "max_iteration": 150, "tolerance": 1e-4},
+        "with_nb_clusters": True,
+    },
+    "kmeans_MPC": {
+        "algorithm": "mpckmeans",
+        "init**kargs": {"model": "MPC", "max_iteration": 150, "w": 1.0},
+        "with_nb_clusters": True,
+    },
+    "hier_ward": {
+        "algorithm": "hierarchical",
+        "init**kargs": {"linkage": "ward"},
+        "with_nb_clusters": True,
+    },
+    "hier_average": {
+        "algorithm": "hierarchical",
+        "init**kargs": {"linkage": "average"},
+        "with_nb_clusters": True,
+    },
+    "hier_complete": {
+        "algorithm": "hierarchical",
+        "init**kargs": {"linkage": "complete"},
+        "with_nb_clusters": True,
+    },
+    "hier_single": {
+        "algorithm": "hierarchical",
+        "init**kargs": {"linkage": "single"},
+        "with_nb_clusters": True,
+    },
+    "spectral_SPEC": {
+        "algorithm": "spectral",
+        "init**kargs": {"model": "SPEC"},
+        "with_nb_clusters": True,
+    },
+    "dbscan": {
+        "algorithm": "dbscan",
+        "init**kargs": {"eps": 0.5, "min_samples": 5},
+        "with_nb_clusters": False,
+    },
+    "affinity_propagation": {
+        "algorithm": "affinity_propagation",
+        "init**kargs": {"max_iteration": 150, "convergence_iteration": 10},
+        "with_nb_clusters": False,
+    },
+}
+
+
+# ==============================================================================
+# CLUSTERING BENCHMARK - ALGORITHMS CONFIGURATIONS
+# ==============================================================================
+def get_algorithm_configs(
+    dataset_size: int,
+    list_of_algorithms: Optional[List[str]] = None,
+    list_of_rates: Optional[List[float]] = None,
+    nb_clusters: int = DEFAULT_NB_CLUSTERS,
+    list_of_random_seeds: Optional[List[int]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    A method aimed at define the `algorithm` environments of the `clustering` task for a dataset size: one environment per algorithm, density of previous constraints and random seed.
+    Usage note:
+        - The number of previous constraints depends on the dataset size, so configurations are defined for each dataset size (cf. `create_clustering_environments`).
+        - Environments names are the same as in the notebook `1_Initialize_computation_time_experiments.ipynb`, so experiments already run are reused.
+
+    Args:
+        dataset_size (int): The dataset size.
+        list_of_algorithms (Optional[List[str]], optional): The algorithms to measure (keys of `DICT_OF_ALGORITHMS`). Defaults to `None` (all algorithms).
+        list_of_rates (Optional[List[float]], optional): The densities of previous constraints, as a rate of the dataset size. Defaults to `None` (`DEFAULT_LIST_OF_RATES`).
+        nb_clusters (int, optional): The number of clusters. Defaults to `DEFAULT_NB_CLUSTERS`.
+        list_of_random_seeds (Optional[List[int]], optional): The random seeds of clustering. Defaults to `None` (`[1]`).
+
+    Raises:
+        ValueError: if an algorithm is not implemented.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The configurations of algorithms environments (same format as in the notebook `1_Initialize_computation_time_experiments.ipynb`).
+    """
+
+    # Set default parameters.
+    if list_of_algorithms is None:
+        list_of_algorithms = list(DICT_OF_ALGORITHMS.keys())
+    if list_of_rates is None:
+        list_of_rates = DEFAULT_LIST_OF_RATES
+    if list_of_random_seeds is None:
+        list_of_random_seeds = [1]
+
+    # Check parameters.
+    for algorithm_name in list_of_algorithms:
+        if algorithm_name not in DICT_OF_ALGORITHMS.keys():
+            raise ValueError("The `algorithm` '" + str(algorithm_name) + "' is not implemented.")
+
+    # Define configurations.
+    dict_of_algorithm_configs: Dict[str, Dict[str, Any]] = {}
+    for algorithm_name in list_of_algorithms:
+        algorithm_nb_clusters: Optional[int] = nb_clusters if DICT_OF_ALGORITHMS[algorithm_name]["with_nb_clusters"] else None
+        for rate in list_of_rates:
+            previous_nb_constraints: int = int(round(rate * dataset_size))
+            for random_seed in list_of_random_seeds:
+                dict_of_algorithm_configs["{algo_str}-clusters_{nb_clusters_str}-rand_{rand_str}-prev_const{const_str}".format(
+                    algo_str=algorithm_name,
+                    nb_clusters_str=algorithm_nb_clusters if (algorithm_nb_clusters is not None) else "auto",
+                    rand_str=random_seed,
+                    const_str=previous_nb_constraints,
+                )] = {
+                    "_TYPE": "algorithm",
+                    "_TASK": "clustering",
+                    "_ALGORITHM": algorithm_name,
+                    "_DESCRIPTION": "Clustering '{algo_str}', {nb_clusters_str} clusters, {const_str} previous constraints ({rate_str} per data).".format(
+                        algo_str=algorithm_name,
+                        nb_clusters_str=algorithm_nb_clusters if (algorithm_nb_clusters is not None) else "auto",
+                        const_str=previous_nb_constraints,
+                        rate_str=rate,
+                    ),
+                    "preprocessing": {
+                        "apply_preprocessing": True,
+                        "apply_lemmatization": False,
+                        "apply_parsing_filter": False,
+                        "spacy_language_model": "fr_core_news_md",
+                    },
+                    "vectorization": {
+                        "vectorizer_type": "tfidf",
+                        "spacy_language_model": None,
+                    },
+                    "clustering": {
+                        "algorithm": DICT_OF_ALGORITHMS[algorithm_name]["algorithm"],
+                        "init**kargs": DICT_OF_ALGORITHMS[algorithm_name]["init**kargs"],
+                        "nb_clusters": algorithm_nb_clusters,
+                    },
+                    "previous": {
+                        "constraints": previous_nb_constraints,
+                    },
+                    "random_seed": random_seed,
+                }
+
+    # Return configurations.
+    return dict_of_algorithm_configs
+
+
+# ==============================================================================
+# CLUSTERING BENCHMARK - CREATE ENVIRONMENTS
+# ==============================================================================
+def create_clustering_environments(
+    list_of_algorithms: Optional[List[str]] = None,
+    list_of_rates: Optional[List[float]] = None,
+    nb_clusters: int = DEFAULT_NB_CLUSTERS,
+    list_of_algorithm_random_seeds: Optional[List[int]] = None,
+    list_of_sizes: Optional[List[int]] = None,
+    list_of_random_seeds: Optional[List[int]] = None,
+    list_of_datasets: Optional[List[str]] = None,
+    datasets_path: str = "../../datasets/",
+) -> List[str]:
+    """
+    A method aimed at create the `clustering` experiments environments (`../experiments/clustering/[DATASET]/[ALGORITHM]`), with datasets generated as in the scaling benchmark (cf. `scaling_benchmark.create_scaling_environments`).
+
+    Args:
+        list_of_algorithms (Optional[List[str]], optional): The algorithms to measure (keys of `DICT_OF_ALGORITHMS`). Defaults to `None` (all algorithms).
+        list_of_rates (Optional[List[float]], optional): The densities of previous constraints, as a rate of the dataset size. Defaults to `None` (`DEFAULT_LIST_OF_RATES`).
+        nb_clusters (int, optional): The number of clusters. Defaults to `DEFAULT_NB_CLUSTERS`.
+        list_of_algorithm_random_seeds (Optional[List[int]], optional): The random seeds of clustering. Defaults to `None` (`[1]`).
+        list_of_sizes (Optional[List[int]], optional): The sizes of datasets. Defaults to `None` (`DEFAULT_LIST_OF_SIZES`).
+        list_of_random_seeds (Optional[List[int]], optional): The random seeds of datasets. Defaults to `None` (`[1]`).
+        list_of_datasets (Optional[List[str]], optional): The base datasets (keys of `scaling_benchmark.DICT_OF_BASE_DATASETS`). Defaults to `None` (`["bank_cards_v2"]`).
+        datasets_path (str, optional): The path to base datasets files. Defaults to `"../../datasets/"`.
+
+    Returns:
+        List[str]: The list of paths to the `clustering` algorithms environments, smaller datasets first.
+    """
+
+    # Create environments of each dataset size (the number of previous constraints depends on it).
+    list_of_algorithm_env_paths: List[str] = []
+    for size in sorted(list_of_sizes if (list_of_sizes is not None) else DEFAULT_LIST_OF_SIZES):
+        list_of_algorithm_env_paths += scaling_benchmark.create_scaling_environments(
+            dict_of_algorithm_configs=get_algorithm_configs(
+                dataset_size=size,
+                list_of_algorithms=list_of_algorithms,
+                list_of_rates=list_of_rates,
+                nb_clusters=nb_clusters,
+                list_of_random_seeds=list_of_algorithm_random_seeds,
+            ),
+            list_of_sizes=[size],
+            list_of_random_seeds=list_of_random_seeds,
+            list_of_datasets=list_of_datasets if (list_of_datasets is not None) else ["bank_cards_v2"],
+            datasets_path=datasets_path,
+        )
+
+    # Return environments paths.
+    return list_of_algorithm_env_paths
+
+
+# ==============================================================================
+# CLUSTERING BENCHMARK - MEASURE CONVERGENCE
+# ==============================================================================
+def measure_convergence(
+    create_clustering_model: Callable[[], AbstractConstrainedClustering],
+    constraints_manager: AbstractConstraintsManager,
+    vectors: Dict[str, csr_matrix],
+    nb_clusters: Optional[int],
+) -> Optional[Dict[str, Any]]:
+    """
+    A method aimed at get the number of iterations of an iterative clustering until its convergence, in an additional run (the clustering code is not modified).
+    Usage note:
+        - `kmeans`: iterations are read in the verbose output of the clustering.
+        - `mpckmeans`: iterations are counted with a hook on the cluster assignment (called once per iteration).
+        - `affinity_propagation`: iterations are counted with a hook on `numpy.add` in the module (called once per iteration).
+        - Other algorithms are not iterative, and no additional run is done.
+
+    Args:
+        create_clustering_model (Callable[[], AbstractConstrainedClustering]): The creation of a new clustering model (cf. `clustering_factory`).
+        constraints_manager (AbstractConstraintsManager): The constraints manager with previous constraints.
+        vectors (Dict[str, csr_matrix]): The vectors of data.
+        nb_clusters (Optional[int]): The number of clusters.
+
+    Returns:
+        Optional[Dict[str, Any]]: The number of iterations (`"nb_iterations"`), the maximal number of iterations (`"max_iteration"`) and the convergence before the maximal number of iterations (`"is_converged"`). `None` if the algorithm is not iterative.
+    """
+
+    # Create the clustering model.
+    clustering_model: AbstractConstrainedClustering = create_clustering_model()
+    nb_iterations: Optional[int] = None
+    is_converged: Optional[bool] = None
+
+    # Case of kmeans: read the last iteration in the verbose output.
+    if isinstance(clustering_model, KMeansConstrainedClustering):
+        with contextlib.redirect_stdout(io.StringIO()) as verbose_output:
+            clustering_model.cluster(
+                constraints_manager=constraints_manager,
+                vectors=vectors,
+                nb_clusters=nb_clusters,
+                verbose=True,
+            )
+        list_of_iterations: List[Any] = re.findall(r"CLUSTERING_ITERATION=(\d+)\s*,\s*converged=(\w+)", verbose_output.getvalue())
+        if list_of_iterations:
+            nb_iterations = int(list_of_iterations[-1][0])
+            is_converged = list_of_iterations[-1][1] == "True"
+
+    # Case of mpckmeans: count calls of the cluster assignment.
+    elif isinstance(clustering_model, MPCKMeansConstrainedClustering):
+        nb_calls_of_assign_clusters: int = 0
+        original_assign_clusters: Callable[..., Any] = clustering_model._assign_clusters  # noqa: WPS437
+
+        def hooked_assign_clusters(*args: Any, **kwargs: Any) -> Any:
+            nonlocal nb_calls_of_assign_clusters
+            nb_calls_of_assign_clusters += 1
+            return original_assign_clusters(*args, **kwargs)
+
+        with mock.patch.object(clustering_model, "_assign_clusters", hooked_assign_clusters):
+            clustering_model.cluster(
+                constraints_manager=constraints_manager,
+                vectors=vectors,
+                nb_clusters=nb_clusters,
+            )
+        nb_iterations = nb_calls_of_assign_clusters
+        is_converged = nb_iterations < clustering_model.max_iteration
+
+    # Case of affinity propagation: count calls of `numpy.add` in the module.
+    elif isinstance(clustering_model, affinity_propagation.AffinityPropagationConstrainedClustering):
+        hooked_numpy: _CountingNumpy = _CountingNumpy()
+        with mock.patch.object(affinity_propagation, "np", hooked_numpy):
+            clustering_model.cluster(
+                constraints_manager=constraints_manager,
+                vectors=vectors,
+                nb_clusters=nb_clusters,
+            )
+        nb_iterations = hooked_numpy.nb_calls_of_add
+        is_converged = nb_iterations < clustering_model.max_iteration
+
+    # Other algorithms are not iterative.
+    else:
+        return None
+
+    # Return convergence.
+    return {
+        "nb_iterations": nb_iterations,
+        "max_iteration": getattr(clustering_model, "max_iteration", None),
+        "is_converged": is_converged,
+    }
+
+
+# ==============================================================================
+# PRIVATE - HOOKS
+# ==============================================================================
+class _CountingNumpy:
+    """
+    A wrapper of the `numpy` module used by `affinity_propagation`, that counts calls of `numpy.add` (called once per iteration of message passing).
+    """
+
+    def __init__(self) -> None:
+        """
+        The constructor of the `numpy` wrapper.
+        """
+        self.nb_calls_of_add: int = 0
+
+    def add(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        The hook of `numpy.add`.
+        """
+        self.nb_calls_of_add += 1
+        return np.add(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Other functions of the `numpy` module are not hooked.
+        """
+        return getattr(np, name)
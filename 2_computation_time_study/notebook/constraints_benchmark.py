@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         constraints_benchmark
+* Description:  Define the benchmark of constraints manager operations (insertion, inference, components, completude) against dataset size and number of constraints.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from cognitivefactory.interactive_clustering.constraints.abstract import (
+    AbstractConstraintsManager,
+)
+from cognitivefactory.interactive_clustering.constraints.factory import (
+    managing_factory,
+)
+
+import scaling_benchmark
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Sizes of datasets.
+DEFAULT_LIST_OF_SIZES: List[int] = [1000, 2000, 5000, 10000, 25000, 50000]
+
+# Numbers of constraints, as a rate of the dataset size (up to `8`, as `MAX_RATE_CONSTRAINTS` in the annotation subjectivity study).
+DEFAULT_LIST_OF_RATES: List[float] = [0.5, 1.0, 2.0, 4.0, 8.0]
+
+# Operations of the constraints manager to measure (the initialization doesn't depend on constraints).
+LIST_OF_OPERATIONS: List[str] = [
+    "initialization",
+    "add_constraint",
+    "get_inferred_constraint",
+    "get_connected_components",
+    "check_completude_of_constraints",
+]
+
+# Insertion patterns of constraints: annotations consistent with the groundtruth, or with annotation errors that create conflicts.
+LIST_OF_PATTERNS: List[str] = ["consistent", "conflicting"]
+
+# Default rate of annotation errors in the conflicting pattern.
+DEFAULT_CONFLICT_RATE: float = 0.1
+
+# Default number of inferred constraints queried in one run of `get_inferred_constraint`.
+DEFAULT_NB_QUERIES: int = 10000
+
+
+# ==============================================================================
+# CONSTRAINTS BENCHMARK - ALGORITHMS CONFIGURATIONS
+# ==============================================================================
+def get_algorithm_configs(
+    list_of_rates: Optional[List[float]] = None,
+    list_of_patterns: Optional[List[str]] = None,
+    list_of_operations: Optional[List[str]] = None,
+    list_of_random_seeds: Optional[List[int]] = None,
+    conflict_rate: float = DEFAULT_CONFLICT_RATE,
+    nb_queries: int = DEFAULT_NB_QUERIES,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    A method aimed at define the `algorithm` environments of the `constraints` task: one environment per operation, insertion pattern, rate of constraints and random seed.
+
+    Args:
+        list_of_rates (Optional[List[float]], optional): The numbers of constraints, as a rate of the dataset size. Defaults to `None` (`DEFAULT_LIST_OF_RATES`).
+        list_of_patterns (Optional[List[str]], optional): The insertion patterns. Defaults to `None` (`LIST_OF_PATTERNS`).
+        list_of_operations (Optional[List[str]], optional): The operations to measure. Defaults to `None` (`LIST_OF_OPERATIONS`).
+        list_of_random_seeds (Optional[List[int]], optional): The random seeds of constraints. Defaults to `None` (`[1]`).
+        conflict_rate (float, optional): The rate of annotation errors in the conflicting pattern. Defaults to `DEFAULT_CONFLICT_RATE`.
+        nb_queries (int, optional): The number of inferred constraints queried in one run of `get_inferred_constraint`. Defaults to `DEFAULT_NB_QUERIES`.
+
+    Raises:
+        ValueError: if an operation or a pattern is not implemented.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The configurations of algorithms environments (same format as in the notebook `1_Initialize_computation_time_experiments.ipynb`).
+    """
+
+    # Set default parameters.
+    if list_of_rates is None:
+        list_of_rates = DEFAULT_LIST_OF_RATES
+    if list_of_patterns is None:
+        list_of_patterns = LIST_OF_PATTERNS
+    if list_of_operations is None:
+        list_of_operations = LIST_OF_OPERATIONS
+    if list_of_random_seeds is None:
+        list_of_random_seeds = [1]
+
+    # Check parameters.
+    for operation in list_of_operations:
+        if operation not in LIST_OF_OPERATIONS:
+            raise ValueError("The `operation` '" + str(operation) + "' is not implemented.")
+    for pattern in list_of_patterns:
+        if pattern not in LIST_OF_PATTERNS:
+            raise ValueError("The `pattern` '" + str(pattern) + "' is not implemented.")
+
+    # Define configurations.
+    dict_of_algorithm_configs: Dict[str, Dict[str, Any]] = {}
+    for operation in list_of_operations:
+        for pattern in list_of_patterns if (operation != "initialization") else ["consistent"]:
+            for rate in list_of_rates if (operation != "initialization") else [0.0]:
+                for random_seed in list_of_random_seeds:
+                    algorithm_name: str = operation if (operation == "initialization") else operation + "-" + pattern
+                    dict_of_algorithm_configs["{algo_str}-rate_{rate_str}-rand_{rand_str}".format(
+                        algo_str=algorithm_name,
+                        rate_str=rate,
+                        rand_str=random_seed,
+                    )] = {
+                        "_TYPE": "algorithm",
+                        "_TASK": "constraints",
+                        "_ALGORITHM": algorithm_name,
+                        "_DESCRIPTION": "Binary constraints manager `" + operation + "`, " + pattern + " constraints (" + str(rate) + " per data).",
+                        "constraints": {
+                            "manager": "binary",
+                            "operation": operation,
+                            "pattern": pattern,
+                            "rate": rate,
+                            "conflict_rate": conflict_rate,
+                            "nb_queries": nb_queries,
+                        },
+                        "random_seed": random_seed,
+                    }
+
+    # Return configurations.
+    return dict_of_algorithm_configs
+
+
+# ==============================================================================
+# CONSTRAINTS BENCHMARK - CREATE ENVIRONMENTS
+# ==============================================================================
+def create_constraints_environments(
+    dict_of_algorithm_configs: Dict[str, Dict[str, Any]],
+    list_of_sizes: Optional[List[int]] = None,
+    list_of_random_seeds: Optional[List[int]] = None,
+    list_of_datasets: Optional[List[str]] = None,
+    datasets_path: str = "../../datasets/",
+) -> List[str]:
+    """
+    A method aimed at create the `constraints` experiments environments (`../experiments/constraints/[DATASET]/[ALGORITHM]`), with datasets generated as in the scaling benchmark (cf. `scaling_benchmark.create_scaling_environments`).
+
+    Args:
+        dict_of_algorithm_configs (Dict[str, Dict[str, Any]]): The configurations of algorithms environments (cf. `get_algorithm_configs`).
+        list_of_sizes (Optional[List[int]], optional): The sizes of datasets. Defaults to `None` (`DEFAULT_LIST_OF_SIZES`).
+        list_of_random_seeds (Optional[List[int]], optional): The random seeds of datasets. Defaults to `None` (`[1]`).
+        list_of_datasets (Optional[List[str]], optional): The base datasets (keys of `scaling_benchmark.DICT_OF_BASE_DATASETS`). Defaults to `None` (`["bank_cards_v2"]`).
+        datasets_path (str, optional): The path to base datasets files. Defaults to `"../../datasets/"`.
+
+    Returns:
+        List[str]: The list of paths to the `constraints` algorithms environments, smaller datasets first.
+    """
+    return scaling_benchmark.create_scaling_environments(
+        dict_of_algorithm_configs=dict_of_algorithm_configs,
+        list_of_sizes=list_of_sizes if (list_of_sizes is not None) else DEFAULT_LIST_OF_SIZES,
+        list_of_random_seeds=list_of_random_seeds,
+        list_of_datasets=list_of_datasets if (list_of_datasets is not None) else ["bank_cards_v2"],
+        datasets_path=datasets_path,
+    )
+
+
+# ==============================================================================
+# CONSTRAINTS BENCHMARK - GET OPERATION
+# ==============================================================================
+def get_operation(
+    config_algorithm: Dict[str, Any],
+    dict_of_true_intents: Dict[str, str],
+) -> Tuple[Callable[..., Any], Optional[Callable[[], Tuple[Any, ...]]]]:
+    """
+    A method aimed at get the operation of the constraints manager to measure, and its untimed preparation (cf. `benchmark.run_benchmark`).
+    Usage note:
+        - `initialization` creates a constraints manager for all data.
+        - `add_constraint` adds all constraints in a new constraints manager (conflicts are fixed with the inferred constraint, as annotators do in the annotation subjectivity study).
+        - `get_inferred_constraint` queries `nb_queries` random pairs of data in a constraints manager with all constraints.
+        - `get_connected_components` and `check_completude_of_constraints` are called once on a constraints manager with all constraints.
+
+    Args:
+        config_algorithm (Dict[str, Any]): The configuration of the algorithm environment (`"constraints"` and `"random_seed"` settings are used).
+        dict_of_true_intents (Dict[str, str]): The groundtruth of the dataset.
+
+    Raises:
+        ValueError: if the operation is not implemented.
+
+    Returns:
+        Tuple[Callable[..., Any], Optional[Callable[[], Tuple[Any, ...]]]]: The operation to measure, and its preparation (`None` if not needed).
+    """
+
+    # Get settings.
+    operation: str = config_algorithm["constraints"]["operation"]
+    list_of_data_IDs: List[str] = sorted(dict_of_true_intents.keys())
+    list_of_constraints: List[Tuple[str, str, str]] = get_constraints_stream(
+        dict_of_true_intents=dict_of_true_intents,
+        nb_constraints=get_nb_constraints(config_algorithm=config_algorithm, dataset_size=len(list_of_data_IDs)),
+        pattern=config_algorithm["constraints"]["pattern"],
+        conflict_rate=config_algorithm["constraints"]["conflict_rate"],
+        random_seed=config_algorithm["random_seed"],
+    )
+
+    # Case of initialization.
+    if operation == "initialization":
+        return (
+            lambda: managing_factory(manager=config_algorithm["constraints"]["manager"], list_of_data_IDs=list_of_data_IDs),
+            None,
+        )
+
+    # Case of insertion: a new constraints manager is created before each run.
+    if operation == "add_constraint":
+        return (
+            lambda constraints_manager: add_constraints(constraints_manager=constraints_manager, list_of_constraints=list_of_constraints),
+            lambda: (managing_factory(manager=config_algorithm["constraints"]["manager"], list_of_data_IDs=list_of_data_IDs),),
+        )
+
+    # Other cases: queries on a constraints manager with all constraints (built once, queries don't modify it).
+    constraints_manager: AbstractConstraintsManager = managing_factory(
+        manager=config_algorithm["constraints"]["manager"],
+        list_of_data_IDs=list_of_data_IDs,
+    )
+    add_constraints(constraints_manager=constraints_manager, list_of_constraints=list_of_constraints)
+
+    # Case of inferred constraints.
+    if operation == "get_inferred_constraint":
+        array_of_queries: np.ndarray = np.random.default_rng([config_algorithm["random_seed"], 1]).integers(
+            0,
+            len(list_of_data_IDs),
+            size=(config_algorithm["constraints"]["nb_queries"], 2),
+        )
+        list_of_queries: List[Tuple[str, str]] = [
+            (list_of_data_IDs[i1], list_of_data_IDs[i2])
+            for i1, i2 in array_of_queries
+        ]
+        return (
+            lambda: [
+                constraints_manager.get_inferred_constraint(data_ID1=data_ID1, data_ID2=data_ID2)
+                for data_ID1, data_ID2 in list_of_queries
+            ],
+            None,
+        )
+
+    # Case of connected components.
+    if operation == "get_connected_components":
+        return (constraints_manager.get_connected_components, None)
+
+    # Case of completude.
+    if operation == "check_completude_of_constraints":
+        return (constraints_manager.check_completude_of_constraints, None)
+
+    # Case of unknown operation.
+    raise ValueError("The `operation` '" + str(operation) + "' is not implemented.")
+
+
+# ==============================================================================
+# CONSTRAINTS BENCHMARK - CONSTRAINTS
+# ==============================================================================
+def get_nb_constraints(
+    config_algorithm: Dict[str, Any],
+    dataset_size: int,
+) -> int:
+    """
+    A method aimed at get the number of constraints of an experiment.
+
+    Args:
+        config_algorithm (Dict[str, Any]): The configuration of the algorithm environment (the `"constraints"` `"rate"` setting is used).
+        dataset_size (int): The dataset size.
+
+    Returns:
+        int: The number of constraints.
+    """
+    return int(round(config_algorithm["constraints"]["rate"] * dataset_size))
+
+
+def get_constraints_stream(
+    dict_of_true_intents: Dict[str, str],
+    nb_constraints: int,
+    pattern: str = "consistent",
+    conflict_rate: float = DEFAULT_CONFLICT_RATE,
+    random_seed: int = 1,
+) -> List[Tuple[str, str, str]]:
+    """
+    A method aimed at generate the constraints to add: random pairs of different data, annotated according to the groundtruth (with annotation errors in the conflicting pattern).
+
+    Args:
+        dict_of_true_intents (Dict[str, str]): The groundtruth of the dataset.
+        nb_constraints (int): The number of constraints.
+        pattern (str, optional): The insertion pattern (cf. `LIST_OF_PATTERNS`). Defaults to `"consistent"`.
+        conflict_rate (float, optional): The rate of annotation errors in the conflicting pattern. Defaults to `DEFAULT_CONFLICT_RATE`.
+        random_seed (int, optional): The random seed. Defaults to `1`.
+
+    Raises:
+        ValueError: if the pattern is not implemented.
+
+    Returns:
+        List[Tuple[str, str, str]]: The constraints (data IDs and constraint type), in order of insertion.
+    """
+
+    # Check parameters.
+    if pattern not in LIST_OF_PATTERNS:
+        raise ValueError("The `pattern` '" + str(pattern) + "' is not implemented.")
+
+    # Draw pairs of different data.
+    list_of_data_IDs: List[str] = sorted(dict_of_true_intents.keys())
+    random_generator: np.random.Generator = np.random.default_rng(random_seed)
+    array_of_first: np.ndarray = random_generator.integers(0, len(list_of_data_IDs), size=nb_constraints)
+    # NB : the second data is drawn among other data, by shifting indices.
+    array_of_second: np.ndarray = (array_of_first + random_generator.integers(1, max(2, len(list_of_data_IDs)), size=nb_constraints)) % len(list_of_data_IDs)
+
+    # Annotate pairs according to the groundtruth, and add annotation errors if needed.
+    array_of_intents: np.ndarray = np.array([dict_of_true_intents[data_ID] for data_ID in list_of_data_IDs])
+    array_of_must_links: np.ndarray = array_of_intents[array_of_first] == array_of_intents[array_of_second]
+    if pattern == "conflicting":
+        array_of_must_links ^= random_generator.random(nb_constraints) < conflict_rate
+
+    # Return constraints.
+    return [
+        (list_of_data_IDs[i1], list_of_data_IDs[i2], "MUST_LINK" if must_link else "CANNOT_LINK")
+        for i1, i2, must_link in zip(array_of_first, array_of_second, array_of_must_links)
+    ]
+
+
+def add_constraints(
+    constraints_manager: AbstractConstraintsManager,
+    list_of_constraints: List[Tuple[str, str, str]],
+) -> int:
+    """
+    A method aimed at add constraints in a constraints manager. A constraint in conflict with the inferred constraints is replaced by the inferred constraint.
+
+    Args:
+        constraints_manager (AbstractConstraintsManager): The constraints manager.
+        list_of_constraints (List[Tuple[str, str, str]]): The constraints (cf. `get_constraints_stream`).
+
+    Raises:
+        ValueError: if a constraint can't be added and no constraint is inferred between its data (not a conflict).
+
+    Returns:
+        int: The number of conflicts.
+    """
+
+    # Add constraints, and fix conflicts.
+    nb_conflicts: int = 0
+    for data_ID1, data_ID2, constraint_type in list_of_constraints:
+        try:
+            constraints_manager.add_constraint(data_ID1=data_ID1, data_ID2=data_ID2, constraint_type=constraint_type)
+        except ValueError as conflict_error:
+            nb_conflicts += 1
+            # NB : a conflict means that the constraint is inferred, otherwise the error is not a conflict.
+            inferred_constraint_type: Optional[str] = constraints_manager.get_inferred_constraint(data_ID1=data_ID1, data_ID2=data_ID2)
+            if inferred_constraint_type is None:
+                raise ValueError(
+                    "The constraint '" + str((data_ID1, data_ID2, constraint_type)) + "' can't be added, and no constraint is inferred between its data."
+                ) from conflict_error
+            constraints_manager.add_constraint(
+                data_ID1=data_ID1,
+                data_ID2=data_ID2,
+                constraint_type=inferred_constraint_type,
+            )
+
+    # Return the number of conflicts.
+    return nb_conflicts
@@ -0,0 +1,594 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         cost_model
+* Description:  Fit, store and use GLM models of computation time and memory of interactive clustering tasks.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import statsmodels.formula.api
+
+import synthesis_writer
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Default path to stored cost models (one file per version).
+DEFAULT_MODELS_PATH: str = "../results/cost_models/"
+
+# Default synthesis files used to fit cost models (cf. `workerC_synthesis`).
+DEFAULT_SYNTHESIS_PATH_PATTERN: str = "../results/experiments_synthesis_for_{task}"
+
+# Factors of each task: model terms `X[i]POW[p]` are powers of the i-th factor, and `_` is their product (ex: `X1POW2_X3POW1` is `dataset_size**2 * algorithm_nb_clusters`).
+DICT_OF_FACTORS: Dict[str, List[str]] = {
+    "preprocessing": ["dataset_size"],
+    "vectorization": ["dataset_size"],
+    "clustering": ["dataset_size", "previous_nb_constraints", "algorithm_nb_clusters"],
+    "sampling": ["dataset_size", "previous_nb_constraints", "previous_nb_clusters", "algorithm_nb_to_select"],
+}
+
+# Candidate formulas of each value and task (the one with the lowest AIC is kept for each algorithm).
+DICT_OF_FORMULAS: Dict[str, Dict[str, List[str]]] = {
+    "time_total": {
+        "preprocessing": [
+            "time_total ~ 0 + X1POW1",
+            "time_total ~ 1 + X1POW1",
+            "time_total ~ 1 + X1POW1 + X1POW2",
+        ],
+        "vectorization": [
+            "time_total ~ 0 + X1POW1",
+            "time_total ~ 1 + X1POW1",
+            "time_total ~ 1 + X1POW1 + X1POW2",
+        ],
+        "clustering": [
+            "time_total ~ 0 + X1POW1",
+            "time_total ~ 1 + X1POW1",
+            "time_total ~ 0 + X1POW2",
+            "time_total ~ 1 + X1POW2",
+            "time_total ~ 1 + X1POW1 + X1POW2",
+            "time_total ~ 1 + X1POW2 + X1POW2_X3POW1",
+        ],
+        "sampling": [
+            "time_total ~ 0 + X1POW2",
+            "time_total ~ 1 + X1POW2",
+            "time_total ~ 1 + X1POW1 + X1POW2",
+            "time_total ~ 1 + X1POW2 + X1POW2_X3POW1",
+            "time_total ~ 1 + X1POW2 + X1POW1_X4POW1",
+        ],
+    },
+    "memory_MiB": {
+        task: [
+            "memory_MiB ~ 1",
+            "memory_MiB ~ 1 + X1POW1",
+            "memory_MiB ~ 1 + X1POW2",
+            "memory_MiB ~ 1 + X1POW1 + X1POW2",
+        ]
+        for task in ["preprocessing", "vectorization", "clustering", "sampling"]
+    },
+}
+
+# Quantile of the standard normal distribution used for the confidence interval of predictions (95%).
+INTERVAL_Z_SCORE: float = 1.959963984540054
+
+# A measured time is anomalous if it is higher than the high prediction multiplied by this tolerance.
+DEFAULT_ANOMALY_TOLERANCE: float = 2.0
+
+
+# ==============================================================================
+# COST MODELS - FIT
+# ==============================================================================
+def fit_cost_models(
+    synthesis_path_pattern: str = DEFAULT_SYNTHESIS_PATH_PATTERN,
+    models_path: Optional[str] = DEFAULT_MODELS_PATH,
+) -> Dict[str, Any]:
+    """
+    A method aimed at fit GLM models of computation time and memory for each task and algorithm, and store them as a new version.
+    For each algorithm, candidate formulas of `DICT_OF_FORMULAS` are fitted and the one with the lowest AIC is kept.
+
+    Args:
+        synthesis_path_pattern (str, optional): The path of synthesis files, without extension (Parquet files are used if available, otherwise CSV files). Defaults to `DEFAULT_SYNTHESIS_PATH_PATTERN`.
+        models_path (Optional[str], optional): The path to stored cost models. Defaults to `DEFAULT_MODELS_PATH` (`None` to not store them).
+
+    Returns:
+        Dict[str, Any]: The cost models: their version (`"VERSION"`), fit date (`"FITTED_AT"`), the fingerprint of synthesis files (`"FINGERPRINT"`), and the parameters of each model (`"MODELS"`, by value, task and algorithm: formula, parameters, standard errors, covariance matrix of parameters, AIC and number of observations).
+    """
+
+    # Initialize cost models.
+    dict_of_models: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {value: {} for value in DICT_OF_FORMULAS.keys()}
+
+    # Fit models of each task.
+    for task, list_of_factors in DICT_OF_FACTORS.items():
+
+        # Load synthesis of the task.
+        df_synthesis: Optional[pd.DataFrame] = _load_task_synthesis(
+            synthesis_path_pattern=synthesis_path_pattern,
+            task=task,
+        )
+        if df_synthesis is None:
+            continue
+
+        # Compute values and terms of models (typed synthesis can have nullable integers).
+        for factor in list_of_factors:
+            df_synthesis[factor] = df_synthesis[factor].astype(float)
+        df_synthesis["time_total"] = df_synthesis["time_total"].astype(float)
+        df_synthesis["memory_MiB"] = (
+            df_synthesis["memory_peak_rss_increase"].astype(float) / 1024 / 1024
+            if "memory_peak_rss_increase" in df_synthesis.columns
+            else np.nan
+        )
+        for term in {
+            term
+            for dict_of_formulas in DICT_OF_FORMULAS.values()
+            for formula in dict_of_formulas[task]
+            for term in _get_terms(formula=formula)
+        }:
+            df_synthesis[term] = _compute_term(dict_of_factors=df_synthesis, term=term, list_of_factors=list_of_factors)
+
+        # Fit models of each value and algorithm.
+        for value, dict_of_formulas in DICT_OF_FORMULAS.items():
+            dict_of_models[value][task] = {}
+            for algorithm_name, df_algorithm in df_synthesis.groupby("algorithm_name", observed=True):
+                df_algorithm = df_algorithm[df_algorithm[value].notna()]
+                if len(df_algorithm) < 2:
+                    continue
+                # NB : some algorithms don't have all factors (ex: `dbscan` has no number of clusters).
+                list_of_formulas: List[str] = [
+                    formula
+                    for formula in dict_of_formulas[task]
+                    if df_algorithm[_get_terms(formula=formula)].notna().all().all()
+                ]
+                if not list_of_formulas:
+                    continue
+                list_of_results = [
+                    statsmodels.formula.api.glm(formula=formula, data=df_algorithm).fit()
+                    for formula in list_of_formulas
+                ]
+                index_of_best: int = int(np.argmin([results.aic for results in list_of_results]))
+                dict_of_models[value][task][str(algorithm_name)] = {
+                    "formula": list_of_formulas[index_of_best],
+                    "params": {term: float(param) for term, param in list_of_results[index_of_best].params.items()},
+                    "bse": {term: float(bse) for term, bse in list_of_results[index_of_best].bse.items()},
+                    "cov_params": {
+                        term: {other_term: float(cov) for other_term, cov in row_of_cov.items()}
+                        for term, row_of_cov in list_of_results[index_of_best].cov_params().iterrows()
+                    },
+                    "aic": float(list_of_results[index_of_best].aic),
+                    "nb_observations": int(list_of_results[index_of_best].nobs),
+                }
+
+    # Define the new version.
+    dict_of_cost_models: Dict[str, Any] = {
+        "VERSION": (_get_latest_version(models_path=models_path) or 0) + 1 if models_path is not None else 1,
+        "FITTED_AT": datetime.timestamp(datetime.now()),
+        "FINGERPRINT": get_synthesis_fingerprint(synthesis_path_pattern=synthesis_path_pattern),
+        "MODELS": dict_of_models,
+    }
+
+    # Store the new version.
+    if models_path is not None:
+        os.makedirs(models_path, exist_ok=True)
+        filepath: str = models_path + "cost_models_v{version:04d}.json".format(version=dict_of_cost_models["VERSION"])
+        with open(filepath + ".tmp", "w") as file_models:
+            json.dump(dict_of_cost_models, file_models, indent=4)
+        os.replace(filepath + ".tmp", filepath)
+
+    # Return cost models.
+    return dict_of_cost_models
+
+
+# ==============================================================================
+# COST MODELS - LOAD
+# ==============================================================================
+def load_cost_models(
+    models_path: str = DEFAULT_MODELS_PATH,
+    synthesis_path_pattern: str = DEFAULT_SYNTHESIS_PATH_PATTERN,
+    version: Optional[int] = None,
+    with_refit: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    A method aimed at load stored cost models. If synthesis files changed since the latest version (new timing results), models are fitted again and stored as a new version.
+
+    Args:
+        models_path (str, optional): The path to stored cost models. Defaults to `DEFAULT_MODELS_PATH`.
+        synthesis_path_pattern (str, optional): The path of synthesis files, without extension. Defaults to `DEFAULT_SYNTHESIS_PATH_PATTERN`.
+        version (Optional[int], optional): The version to load. Defaults to `None` (the latest version).
+        with_refit (bool, optional): The option to fit models again if synthesis files changed (only for the latest version). Defaults to `True`.
+
+    Raises:
+        ValueError: if the requested version doesn't exist.
+
+    Returns:
+        Optional[Dict[str, Any]]: The cost models (cf. `fit_cost_models`), or `None` if no model is stored and `with_refit` is `False`.
+    """
+
+    # Case of a requested version.
+    if version is not None:
+        filepath: str = models_path + "cost_models_v{version:04d}.json".format(version=version)
+        if not os.path.exists(filepath):
+            raise ValueError("The `version` '" + str(version) + "' doesn't exist.")
+        with open(filepath, "r") as file_models:
+            return json.load(file_models)
+
+    # Load the latest version.
+    latest_version: Optional[int] = _get_latest_version(models_path=models_path)
+    dict_of_cost_models: Optional[Dict[str, Any]] = None
+    if latest_version is not None:
+        with open(models_path + "cost_models_v{version:04d}.json".format(version=latest_version), "r") as file_models:
+            dict_of_cost_models = json.load(file_models)
+
+    # Fit models again if there are new timing results.
+    if with_refit and (
+        (dict_of_cost_models is None)
+        or (dict_of_cost_models["FINGERPRINT"] != get_synthesis_fingerprint(synthesis_path_pattern=synthesis_path_pattern))
+    ):
+        dict_of_cost_models = fit_cost_models(
+            synthesis_path_pattern=synthesis_path_pattern,
+            models_path=models_path,
+        )
+
+    # Return cost models.
+    return dict_of_cost_models
+
+
+# ==============================================================================
+# COST MODELS - PREDICT
+# ==============================================================================
+def predict_cost(
+    config: Dict[str, Any],
+    cost_models: Optional[Dict[str, Any]] = None,
+    value: str = "time_total",
+) -> Tuple[float, float, float]:
+    """
+    A method aimed at predict the computation time (in seconds) or the memory (in MiB) of a task.
+    The low and high predictions are the bounds of the 95% confidence interval of the prediction, computed with the covariance matrix of model parameters (as `get_prediction(...).conf_int()` of `statsmodels`).
+
+    Args:
+        config (Dict[str, Any]): The factors of the task, with the names of synthesis columns: `"task"`, `"algorithm_name"`, `"dataset_size"`, and `"previous_nb_constraints"`, `"previous_nb_clusters"`, `"algorithm_nb_clusters"`, `"algorithm_nb_to_select"` depending on the task (cf. `get_factors`).
+        cost_models (Optional[Dict[str, Any]], optional): The cost models. Defaults to `None` (loaded with `load_cost_models`; load them once for several predictions).
+        value (str, optional): The value to predict: `"time_total"` or `"memory_MiB"`. Defaults to `"time_total"`.
+
+    Raises:
+        ValueError: if the value is not implemented, if no cost model is available, or if the task or the algorithm has no cost model.
+
+    Returns:
+        Tuple[float, float, float]: The prediction, its low and its high values.
+    """
+
+    # Check parameters.
+    if value not in DICT_OF_FORMULAS.keys():
+        raise ValueError("The `value` '" + str(value) + "' is not implemented.")
+
+    # Load cost models if needed.
+    if cost_models is None:
+        cost_models = load_cost_models()
+    if cost_models is None:
+        raise ValueError("No cost model is available.")
+
+    # Get the model of the task and algorithm.
+    task: str = str(config["task"])
+    algorithm_name: str = str(config["algorithm_name"])
+    if task not in cost_models["MODELS"][value].keys():
+        raise ValueError("The `task` '" + task + "' has no cost model.")
+    if algorithm_name not in cost_models["MODELS"][value][task].keys():
+        raise ValueError("The `algorithm_name` '" + algorithm_name + "' has no cost model for the task '" + task + "'.")
+    dict_of_model: Dict[str, Any] = cost_models["MODELS"][value][task][algorithm_name]
+
+    # Compute the prediction.
+    dict_of_term_values: Dict[str, float] = {
+        term: (
+            1.0
+            if term == "Intercept"
+            else float(_compute_term(dict_of_factors=config, term=term, list_of_factors=DICT_OF_FACTORS[task]))
+        )
+        for term in dict_of_model["params"].keys()
+    }
+    res: float = sum(param * dict_of_term_values[term] for term, param in dict_of_model["params"].items())
+
+    # Compute the standard error of the prediction: `sqrt(x' * cov_params * x)`.
+    # NB : models fitted before the storage of the covariance matrix only have standard errors (parameters are then considered independent).
+    dict_of_cov_params: Dict[str, Dict[str, float]] = dict_of_model.get(
+        "cov_params",
+        {
+            term: {other_term: (bse**2 if other_term == term else 0.0) for other_term in dict_of_model["bse"].keys()}
+            for term, bse in dict_of_model["bse"].items()
+        },
+    )
+    res_variance: float = sum(
+        dict_of_term_values[term] * dict_of_cov_params[term][other_term] * dict_of_term_values[other_term]
+        for term in dict_of_term_values.keys()
+        for other_term in dict_of_term_values.keys()
+    )
+    res_margin: float = INTERVAL_Z_SCORE * float(np.sqrt(max(res_variance, 0.0)))
+
+    # Return the prediction.
+    return (res, res - res_margin, res + res_margin)
+
+
+# ==============================================================================
+# COST MODELS - ESTIMATE CAMPAIGN
+# ==============================================================================
+def estimate_campaign(
+    list_of_configs: List[Dict[str, Any]],
+    cost_models: Optional[Dict[str, Any]] = None,
+    value: str = "time_total",
+) -> pd.DataFrame:
+    """
+    A method aimed at predict the cost of several tasks (ex: a campaign before creating its environments, or experiments to schedule).
+
+    Args:
+        list_of_configs (List[Dict[str, Any]]): The factors of each task (cf. `predict_cost`).
+        cost_models (Optional[Dict[str, Any]], optional): The cost models. Defaults to `None` (loaded once with `load_cost_models`).
+        value (str, optional): The value to predict: `"time_total"` or `"memory_MiB"`. Defaults to `"time_total"`.
+
+    Returns:
+        pd.DataFrame: The prediction (`"prediction"`), its low (`"low"`) and its high (`"high"`) values of each task, in the order of configurations (`NaN` if the task or the algorithm has no cost model).
+    """
+
+    # Load cost models once.
+    if cost_models is None:
+        cost_models = load_cost_models()
+
+    # Predict the cost of each task.
+    list_of_predictions: List[Tuple[float, float, float]] = []
+    for config in list_of_configs:
+        try:
+            list_of_predictions.append(predict_cost(config=config, cost_models=cost_models, value=value))
+        except ValueError:
+            list_of_predictions.append((np.nan, np.nan, np.nan))
+
+    # Return predictions.
+    return pd.DataFrame(list_of_predictions, columns=["prediction", "low", "high"])
+
+
+# ==============================================================================
+# COST MODELS - CHECK ANOMALY
+# ==============================================================================
+def check_anomaly(
+    config: Dict[str, Any],
+    measured_time: float,
+    cost_models: Optional[Dict[str, Any]] = None,
+    tolerance: float = DEFAULT_ANOMALY_TOLERANCE,
+) -> Optional[Dict[str, Any]]:
+    """
+    A method aimed at compare a measured computation time with its prediction, in order to flag anomalously slow tasks.
+
+    Args:
+        config (Dict[str, Any]): The factors of the task (cf. `predict_cost`).
+        measured_time (float): The measured computation time (in seconds).
+        cost_models (Optional[Dict[str, Any]], optional): The cost models. Defaults to `None` (loaded with `load_cost_models`).
+        tolerance (float, optional): The measured time is anomalous if it is higher than the high prediction multiplied by this tolerance. Defaults to `DEFAULT_ANOMALY_TOLERANCE`.
+
+    Returns:
+        Optional[Dict[str, Any]]: The prediction (`"time"`, `"low"`, `"high"`), the version of cost models (`"version"`) and the anomaly flag (`"is_anomalous"`), or `None` if no cost model is available or if the task has no cost model.
+    """
+
+    # Load cost models once.
+    if cost_models is None:
+        cost_models = load_cost_models()
+    if cost_models is None:
+        return None
+
+    # Predict the computation time.
+    try:
+        prediction: Tuple[float, float, float] = predict_cost(config=config, cost_models=cost_models)
+    except ValueError:
+        return None
+
+    # Return the comparison.
+    return {
+        "time": prediction[0],
+        "low": prediction[1],
+        "high": prediction[2],
+        "version": cost_models["VERSION"],
+        "is_anomalous": bool(measured_time > prediction[2] * tolerance),
+    }
+
+
+# ==============================================================================
+# COST MODELS - GET FACTORS
+# ==============================================================================
+def get_factors(
+    config_algorithm: Dict[str, Any],
+    config_dataset: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    A method aimed at get the factors of a task from its configurations (same as `workerC_synthesis` columns).
+
+    Args:
+        config_algorithm (Dict[str, Any]): The configuration of the algorithm environment.
+        config_dataset (Dict[str, Any]): The configuration of the dataset environment.
+
+    Returns:
+        Dict[str, Any]: The factors of the task (cf. `predict_cost`).
+    """
+
+    # Get the task.
+    task: str = config_algorithm["_TASK"]
+
+    # Return factors.
+    return {
+        "task": task,
+        "algorithm_name": config_algorithm["_ALGORITHM"],
+        "dataset_size": config_dataset["size"],
+        "previous_nb_constraints": config_algorithm["previous"]["constraints"] if task in {"sampling", "clustering"} else None,
+        "previous_nb_clusters": config_algorithm["previous"]["clustering"] if task == "sampling" else None,
+        "algorithm_nb_to_select": config_algorithm["sampling"]["nb_to_select"] if task == "sampling" else None,
+        "algorithm_nb_clusters": config_algorithm["clustering"]["nb_clusters"] if task == "clustering" else None,
+    }
+
+
+def get_factors_of_environment(
+    env_path: str,
+) -> Dict[str, Any]:
+    """
+    A method aimed at get the factors of the task of an experiment environment.
+
+    Args:
+        env_path (str): The experiment environment path.
+
+    Returns:
+        Dict[str, Any]: The factors of the task (cf. `predict_cost`).
+    """
+
+    # Load configurations.
+    with open(env_path + "config.json", "r") as file_config_algorithm:
+        config_algorithm: Dict[str, Any] = json.load(file_config_algorithm)
+    with open(env_path + "../config.json", "r") as file_config_dataset:
+        config_dataset: Dict[str, Any] = json.load(file_config_dataset)
+
+    # Return factors.
+    return get_factors(config_algorithm=config_algorithm, config_dataset=config_dataset)
+
+
+# ==============================================================================
+# COST MODELS - SYNTHESIS FINGERPRINT
+# ==============================================================================
+def get_synthesis_fingerprint(
+    synthesis_path_pattern: str = DEFAULT_SYNTHESIS_PATH_PATTERN,
+) -> Dict[str, Optional[str]]:
+    """
+    A method aimed at get the fingerprint of synthesis files, in order to detect new timing results.
+
+    Args:
+        synthesis_path_pattern (str, optional): The path of synthesis files, without extension. Defaults to `DEFAULT_SYNTHESIS_PATH_PATTERN`.
+
+    Returns:
+        Dict[str, Optional[str]]: The SHA-1 of the synthesis file of each task (`None` if missing).
+    """
+
+    # Get the hash of each synthesis file.
+    dict_of_fingerprint: Dict[str, Optional[str]] = {}
+    for task in DICT_OF_FACTORS.keys():
+        filepath: Optional[str] = _get_synthesis_filepath(synthesis_path_pattern=synthesis_path_pattern, task=task)
+        dict_of_fingerprint[task] = None
+        if filepath is not None:
+            with open(filepath, "rb") as file_synthesis:
+                dict_of_fingerprint[task] = hashlib.sha1(file_synthesis.read()).hexdigest()
+
+    # Return the fingerprint.
+    return dict_of_fingerprint
+
+
+# ==============================================================================
+# PRIVATE - SYNTHESIS
+# ==============================================================================
+def _get_synthesis_filepath(
+    synthesis_path_pattern: str,
+    task: str,
+) -> Optional[str]:
+    """
+    A method aimed at get the synthesis file of a task (Parquet file if available, otherwise CSV file).
+
+    Args:
+        synthesis_path_pattern (str): The path of synthesis files, without extension.
+        task (str): The task.
+
+    Returns:
+        Optional[str]: The path of the synthesis file, or `None` if missing.
+    """
+    for extension in [".parquet", ".csv"]:
+        if os.path.exists(synthesis_path_pattern.format(task=task) + extension):
+            return synthesis_path_pattern.format(task=task) + extension
+    return None
+
+
+def _load_task_synthesis(
+    synthesis_path_pattern: str,
+    task: str,
+) -> Optional[pd.DataFrame]:
+    """
+    A method aimed at load the synthesis of a task.
+
+    Args:
+        synthesis_path_pattern (str): The path of synthesis files, without extension.
+        task (str): The task.
+
+    Returns:
+        Optional[pd.DataFrame]: The synthesis of the task, or `None` if missing.
+    """
+    filepath: Optional[str] = _get_synthesis_filepath(synthesis_path_pattern=synthesis_path_pattern, task=task)
+    if filepath is None:
+        return None
+    return synthesis_writer.load_synthesis(filepath=filepath, csv_decimal=",")
+
+
+def _get_latest_version(
+    models_path: Optional[str],
+) -> Optional[int]:
+    """
+    A method aimed at get the latest version of stored cost models.
+
+    Args:
+        models_path (Optional[str]): The path to stored cost models.
+
+    Returns:
+        Optional[int]: The latest version, or `None` if no model is stored.
+    """
+    if (models_path is None) or (not os.path.exists(models_path)):
+        return None
+    list_of_versions: List[int] = [
+        int(filename[len("cost_models_v"):-len(".json")])
+        for filename in os.listdir(models_path)
+        if filename.startswith("cost_models_v") and filename.endswith(".json")
+    ]
+    return max(list_of_versions) if len(list_of_versions) != 0 else None
+
+
+# ==============================================================================
+# PRIVATE - TERMS
+# ==============================================================================
+def _get_terms(
+    formula: str,
+) -> List[str]:
+    """
+    A method aimed at get the terms of a formula (ex: `["X1POW2", "X1POW2_X3POW1"]` for `"time_total ~ 1 + X1POW2 + X1POW2_X3POW1"`).
+
+    Args:
+        formula (str): The formula.
+
+    Returns:
+        List[str]: The terms of the formula, without intercept.
+    """
+    return [
+        term.strip()
+        for term in formula.split("~")[1].split("+")
+        if term.strip() not in {"0", "1"}
+    ]
+
+
+def _compute_term(
+    dict_of_factors: Any,
+    term: str,
+    list_of_factors: List[str],
+) -> Any:
+    """
+    A method aimed at compute a term of a model (product of powers of factors).
+
+    Args:
+        dict_of_factors (Any): The factors (a dictionary of values, or a dataframe of columns).
+        term (str): The term (ex: `"X1POW2_X3POW1"`).
+        list_of_factors (List[str]): The factors of the task (`X1` is the first one).
+
+    Returns:
+        Any: The value of the term (a number, or a column).
+    """
+    result: Any = 1.0
+    for factor_power in term.split("_"):
+        index, power = factor_power[1:].split("POW")
+        result = result * np.power(dict_of_factors[list_of_factors[int(index) - 1]], float(power))
+    return result
@@ -0,0 +1,454 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         fixture_cache
+* Description:  Build once and reuse the data needed before a measured task (preprocessed texts, vectors, previous constraints and clustering).
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import fcntl
+import hashlib
+import json
+import os
+import pickle  # noqa: S403
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from cognitivefactory.interactive_clustering.clustering.factory import (
+    clustering_factory,
+)
+from cognitivefactory.interactive_clustering.constraints.abstract import (
+    AbstractConstraintsManager,
+)
+from cognitivefactory.interactive_clustering.constraints.factory import (
+    managing_factory,
+)
+from cognitivefactory.interactive_clustering.sampling.factory import (
+    sampling_factory,
+)
+from cognitivefactory.interactive_clustering.utils.preprocessing import (
+    preprocess,
+)
+from cognitivefactory.interactive_clustering.utils.vectorization import (
+    vectorize,
+)
+from scipy.sparse import csr_matrix
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Default path to fixtures (shared by all tasks: fixtures are keyed by the content of dataset files, not by their environment).
+DEFAULT_FIXTURES_PATH: str = "../experiments/.fixtures/"
+
+
+# ==============================================================================
+# FIXTURES - PREPROCESSED TEXTS
+# ==============================================================================
+def get_preprocessed_texts(
+    env_path: str,
+    config_algorithm: Dict[str, Any],
+    fixtures_path: str = DEFAULT_FIXTURES_PATH,
+    with_cache: bool = True,
+) -> Dict[str, str]:
+    """
+    A method aimed at get the preprocessed texts of an experiment dataset.
+
+    Args:
+        env_path (str): The experiment environment path (the dataset is in its parent environment).
+        config_algorithm (Dict[str, Any]): The experiment configuration (`"preprocessing"` settings are used).
+        fixtures_path (str, optional): The path to fixtures. Defaults to `DEFAULT_FIXTURES_PATH`.
+        with_cache (bool, optional): The option to reuse fixtures. Defaults to `True`.
+
+    Returns:
+        Dict[str, str]: The preprocessed texts.
+    """
+
+    # Define the preprocessing.
+    def _build() -> Dict[str, str]:
+        with open(env_path + "../dict_of_texts.json", "r") as file_texts:
+            dict_of_texts: Dict[str, str] = json.load(file_texts)
+        return preprocess(
+            dict_of_texts=dict_of_texts,
+            apply_lemmatization=bool(config_algorithm["preprocessing"]["apply_lemmatization"]),
+            apply_parsing_filter=bool(config_algorithm["preprocessing"]["apply_parsing_filter"]),
+            spacy_language_model=str(config_algorithm["preprocessing"]["spacy_language_model"]),
+        )
+
+    # Get or build fixture.
+    return get_or_build(
+        fixture_name="preprocessed_texts",
+        dict_of_settings=_get_preprocessing_settings(env_path=env_path, config_algorithm=config_algorithm),
+        build=_build,
+        fixtures_path=fixtures_path,
+        with_cache=with_cache,
+    )
+
+
+# ==============================================================================
+# FIXTURES - VECTORS
+# ==============================================================================
+def get_vectors(
+    env_path: str,
+    config_algorithm: Dict[str, Any],
+    fixtures_path: str = DEFAULT_FIXTURES_PATH,
+    with_cache: bool = True,
+) -> Dict[str, csr_matrix]:
+    """
+    A method aimed at get the vectors of an experiment dataset (preprocessed texts are loaded only if vectors have to be built).
+
+    Args:
+        env_path (str): The experiment environment path (the dataset is in its parent environment).
+        config_algorithm (Dict[str, Any]): The experiment configuration (`"preprocessing"` and `"vectorization"` settings are used).
+        fixtures_path (str, optional): The path to fixtures. Defaults to `DEFAULT_FIXTURES_PATH`.
+        with_cache (bool, optional): The option to reuse fixtures. Defaults to `True`.
+
+    Returns:
+        Dict[str, csr_matrix]: The vectors.
+    """
+
+    # Define the vectorization.
+    def _build() -> Dict[str, csr_matrix]:
+        return vectorize(
+            dict_of_texts=get_preprocessed_texts(
+                env_path=env_path,
+                config_algorithm=config_algorithm,
+                fixtures_path=fixtures_path,
+                with_cache=with_cache,
+            ),
+            vectorizer_type=str(config_algorithm["vectorization"]["vectorizer_type"]),
+            spacy_language_model=str(config_algorithm["vectorization"]["spacy_language_model"]),
+        )
+
+    # Get or build fixture.
+    return get_or_build(
+        fixture_name="vectors",
+        dict_of_settings=_get_vectorization_settings(env_path=env_path, config_algorithm=config_algorithm),
+        build=_build,
+        fixtures_path=fixtures_path,
+        with_cache=with_cache,
+    )
+
+
+# ==============================================================================
+# FIXTURES - PREVIOUS CONSTRAINTS
+# ==============================================================================
+def get_previous_constraints_manager(
+    env_path: str,
+    config_algorithm: Dict[str, Any],
+    fixtures_path: str = DEFAULT_FIXTURES_PATH,
+    with_cache: bool = True,
+) -> AbstractConstraintsManager:
+    """
+    A method aimed at get the constraints manager with the previous constraints of an experiment (randomly sampled and annotated according to the groundtruth).
+
+    Args:
+        env_path (str): The experiment environment path (the dataset is in its parent environment).
+        config_algorithm (Dict[str, Any]): The experiment configuration (`"random_seed"` and `"previous"` `"constraints"` settings are used).
+        fixtures_path (str, optional): The path to fixtures. Defaults to `DEFAULT_FIXTURES_PATH`.
+        with_cache (bool, optional): The option to reuse fixtures. Defaults to `True`.
+
+    Returns:
+        AbstractConstraintsManager: The constraints manager (a new object at each call, that can be modified).
+    """
+
+    # Define the generation of previous constraints.
+    def _build() -> AbstractConstraintsManager:
+
+        # Load dict of texts and dict of true intents.
+        with open(env_path + "../dict_of_texts.json", "r") as file_texts:
+            dict_of_texts: Dict[str, str] = json.load(file_texts)
+        with open(env_path + "../dict_of_true_intents.json", "r") as file_true_intents:
+            dict_of_true_intents: Dict[str, str] = json.load(file_true_intents)
+
+        # Initialize constraints manager.
+        constraints_manager: AbstractConstraintsManager = managing_factory(
+            manager="binary",
+            list_of_data_IDs=list(dict_of_texts.keys()),
+        )
+
+        # Generate previous constraints.
+        list_of_previous_constraints: List[Tuple[str, str]] = sampling_factory(
+            algorithm="random",
+            random_seed=config_algorithm["random_seed"],
+        ).sample(
+            constraints_manager=constraints_manager,
+            nb_to_select=config_algorithm["previous"]["constraints"],
+        )
+
+        # Add constraint to the constraints manager (according to the groundtruth for this experiment).
+        for constraint in list_of_previous_constraints:
+            data_ID1: str = constraint[0]
+            data_ID2: str = constraint[1]
+            constraints_manager.add_constraint(
+                data_ID1=data_ID1,
+                data_ID2=data_ID2,
+                constraint_type=(
+                    "MUST_LINK"
+                    if dict_of_true_intents[data_ID1] == dict_of_true_intents[data_ID2]
+                    else "CANNOT_LINK"
+                ),
+            )
+        return constraints_manager
+
+    # Get or build fixture.
+    return get_or_build(
+        fixture_name="previous_constraints_manager",
+        dict_of_settings=_get_constraints_settings(env_path=env_path, config_algorithm=config_algorithm),
+        build=_build,
+        fixtures_path=fixtures_path,
+        with_cache=with_cache,
+    )
+
+
+# ==============================================================================
+# FIXTURES - PREVIOUS CLUSTERING
+# ==============================================================================
+def get_previous_clustering(
+    env_path: str,
+    config_algorithm: Dict[str, Any],
+    dict_of_vectors: Optional[Dict[str, csr_matrix]] = None,
+    constraints_manager: Optional[AbstractConstraintsManager] = None,
+    fixtures_path: str = DEFAULT_FIXTURES_PATH,
+    with_cache: bool = True,
+) -> Dict[str, int]:
+    """
+    A method aimed at get the previous clustering of an experiment (a KMeans of 10 iterations with previous constraints).
+
+    Args:
+        env_path (str): The experiment environment path (the dataset is in its parent environment).
+        config_algorithm (Dict[str, Any]): The experiment configuration (`"preprocessing"`, `"vectorization"`, `"random_seed"` and `"previous"` settings are used).
+        dict_of_vectors (Optional[Dict[str, csr_matrix]], optional): The vectors, if already loaded. Defaults to `None` (cf. `get_vectors`).
+        constraints_manager (Optional[AbstractConstraintsManager], optional): The constraints manager with previous constraints, if already loaded. Defaults to `None` (cf. `get_previous_constraints_manager`).
+        fixtures_path (str, optional): The path to fixtures. Defaults to `DEFAULT_FIXTURES_PATH`.
+        with_cache (bool, optional): The option to reuse fixtures. Defaults to `True`.
+
+    Returns:
+        Dict[str, int]: The previous clustering.
+    """
+
+    # Define the previous clustering.
+    def _build() -> Dict[str, int]:
+        return clustering_factory(
+            algorithm="kmeans",
+            random_seed=config_algorithm["random_seed"],
+            max_iteration=10,
+        ).cluster(
+            vectors=(
+                dict_of_vectors
+                if dict_of_vectors is not None
+                else get_vectors(
+                    env_path=env_path,
+                    config_algorithm=config_algorithm,
+                    fixtures_path=fixtures_path,
+                    with_cache=with_cache,
+                )
+            ),
+            nb_clusters=config_algorithm["previous"]["clustering"],
+            constraints_manager=(
+                constraints_manager
+                if constraints_manager is not None
+                else get_previous_constraints_manager(
+                    env_path=env_path,
+                    config_algorithm=config_algorithm,
+                    fixtures_path=fixtures_path,
+                    with_cache=with_cache,
+                )
+            ),
+        )
+
+    # Get or build fixture.
+    return get_or_build(
+        fixture_name="previous_clustering",
+        dict_of_settings={
+            **_get_vectorization_settings(env_path=env_path, config_algorithm=config_algorithm),
+            **_get_constraints_settings(env_path=env_path, config_algorithm=config_algorithm),
+            "previous_clustering": config_algorithm["previous"]["clustering"],
+        },
+        build=_build,
+        fixtures_path=fixtures_path,
+        with_cache=with_cache,
+    )
+
+
+# ==============================================================================
+# FIXTURES - GET OR BUILD
+# ==============================================================================
+def get_or_build(
+    fixture_name: str,
+    dict_of_settings: Dict[str, Any],
+    build: Callable[[], Any],
+    fixtures_path: str = DEFAULT_FIXTURES_PATH,
+    with_cache: bool = True,
+) -> Any:
+    """
+    A method aimed at load a fixture, or build and store it if it doesn't exist yet.
+    Fixtures are built under a file lock (`[FIXTURE_FILE].lock`): concurrent workers that need the same fixture wait for the first one to build it instead of building it again.
+
+    Args:
+        fixture_name (str): The name of the fixture (ex: `"vectors"`).
+        dict_of_settings (Dict[str, Any]): The settings the fixture depends on (JSON serializable).
+        build (Callable[[], Any]): The function that builds the fixture.
+        fixtures_path (str, optional): The path to fixtures. Defaults to `DEFAULT_FIXTURES_PATH`.
+        with_cache (bool, optional): The option to reuse fixtures. Defaults to `True`.
+
+    Returns:
+        Any: The fixture.
+    """
+
+    # Case of cache not used.
+    if not with_cache:
+        return build()
+
+    # Get the fixture file of these settings.
+    fixture_filepath: str = fixtures_path + fixture_name + "___" + hashlib.sha1(
+        json.dumps(dict_of_settings, sort_keys=True).encode("utf-8")
+    ).hexdigest() + ".pkl"
+
+    # Case of fixture already built.
+    if os.path.exists(fixture_filepath):
+        with open(fixture_filepath, "rb") as file_fixture_r:
+            return pickle.load(file_fixture_r)  # noqa: S301
+
+    # Otherwise: build and store fixture, under the lock of the fixture (released when the lock file is closed).
+    os.makedirs(fixtures_path, exist_ok=True)
+    with open(fixture_filepath + ".lock", "w") as file_lock:
+        fcntl.flock(file_lock, fcntl.LOCK_EX)
+
+        # Case of fixture built by another worker while waiting for the lock.
+        if os.path.exists(fixture_filepath):
+            with open(fixture_filepath, "rb") as file_fixture_r:
+                return pickle.load(file_fixture_r)  # noqa: S301
+
+        # Build and store fixture (the temporary file is replaced atomically, so that a reader without lock never sees a partial fixture).
+        fixture: Any = build()
+        with open(fixture_filepath + ".tmp", "wb") as file_fixture_w:
+            pickle.dump(fixture, file_fixture_w, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(fixture_filepath + ".tmp", fixture_filepath)
+
+    # Return fixture.
+    return fixture
+
+
+# ==============================================================================
+# FIXTURES - INVALIDATE
+# ==============================================================================
+def invalidate_fixtures(
+    fixtures_path: str = DEFAULT_FIXTURES_PATH,
+) -> int:
+    """
+    A method aimed at remove all fixtures (ex: after an update of `cognitivefactory-interactive-clustering`).
+
+    Args:
+        fixtures_path (str, optional): The path to fixtures. Defaults to `DEFAULT_FIXTURES_PATH`.
+
+    Returns:
+        int: The number of removed fixtures.
+    """
+
+    # Case of no fixture.
+    if not os.path.exists(fixtures_path):
+        return 0
+
+    # Remove all fixtures.
+    nb_removed_fixtures: int = 0
+    for filename in os.listdir(fixtures_path):
+        if filename.endswith(".pkl") or filename.endswith(".tmp") or filename.endswith(".lock"):
+            os.remove(fixtures_path + filename)
+            nb_removed_fixtures += 1
+
+    # Return the number of removed fixtures.
+    return nb_removed_fixtures
+
+
+# ==============================================================================
+# PRIVATE - SETTINGS
+# ==============================================================================
+def _get_file_hash(
+    filepath: str,
+) -> str:
+    """
+    A method aimed at get the hash of a file content (datasets of different tasks environments share fixtures if they have the same content).
+
+    Args:
+        filepath (str): The file path.
+
+    Returns:
+        str: The SHA-1 of the file content.
+    """
+    with open(filepath, "rb") as file_r:
+        return hashlib.sha1(file_r.read()).hexdigest()
+
+
+def _get_preprocessing_settings(
+    env_path: str,
+    config_algorithm: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    A method aimed at get the settings preprocessed texts depend on.
+
+    Args:
+        env_path (str): The experiment environment path.
+        config_algorithm (Dict[str, Any]): The experiment configuration.
+
+    Returns:
+        Dict[str, Any]: The dataset texts hash and the preprocessing settings.
+    """
+    return {
+        "texts": _get_file_hash(env_path + "../dict_of_texts.json"),
+        "preprocessing": {
+            "apply_lemmatization": bool(config_algorithm["preprocessing"]["apply_lemmatization"]),
+            "apply_parsing_filter": bool(config_algorithm["preprocessing"]["apply_parsing_filter"]),
+            "spacy_language_model": str(config_algorithm["preprocessing"]["spacy_language_model"]),
+        },
+    }
+
+
+def _get_vectorization_settings(
+    env_path: str,
+    config_algorithm: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    A method aimed at get the settings vectors depend on.
+
+    Args:
+        env_path (str): The experiment environment path.
+        config_algorithm (Dict[str, Any]): The experiment configuration.
+
+    Returns:
+        Dict[str, Any]: The preprocessing settings and the vectorization settings.
+    """
+    return {
+        **_get_preprocessing_settings(env_path=env_path, config_algorithm=config_algorithm),
+        "vectorization": {
+            "vectorizer_type": str(config_algorithm["vectorization"]["vectorizer_type"]),
+            "spacy_language_model": str(config_algorithm["vectorization"]["spacy_language_model"]),
+        },
+    }
+
+
+def _get_constraints_settings(
+    env_path: str,
+    config_algorithm: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    A method aimed at get the settings previous constraints depend on.
+
+    Args:
+        env_path (str): The experiment environment path.
+        config_algorithm (Dict[str, Any]): The experiment configuration.
+
+    Returns:
+        Dict[str, Any]: The dataset texts and groundtruth hashes, the random seed and the number of previous constraints.
+    """
+    return {
+        "texts": _get_file_hash(env_path + "../dict_of_texts.json"),
+        "true_intents": _get_file_hash(env_path + "../dict_of_true_intents.json"),
+        "random_seed": config_algorithm["random_seed"],
+        "previous_constraints": config_algorithm["previous"]["constraints"],
+    }
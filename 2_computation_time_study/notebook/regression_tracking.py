@@ -0,0 +1,467 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         regression_tracking
+* Description:  Store computation time results as named baselines, and detect slowdowns and speedups against a baseline.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+from importlib import metadata
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import scipy.stats
+
+import benchmark
+import synthesis_writer
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Default path to stored baselines (one folder per baseline).
+DEFAULT_BASELINES_PATH: str = "../results/baselines/"
+
+# Default path of synthesis files (without extension, cf. `workerC_synthesis`).
+DEFAULT_SYNTHESIS_PATH_PATTERN: str = "../results/experiments_synthesis_for_{task}"
+
+# Default path of regression reports.
+DEFAULT_REPORT_PATH_PATTERN: str = "../results/regression_report_vs_{baseline_name}.csv"
+
+# Tasks to track.
+LIST_OF_TASKS: List[str] = [
+    "preprocessing",
+    "vectorization",
+    "sampling",
+    "clustering",
+    "constraints",
+]
+
+# Packages whose versions are stored with baselines.
+LIST_OF_PACKAGES: List[str] = [
+    "cognitivefactory-interactive-clustering",
+    "scikit-learn",
+    "spacy",
+    "numpy",
+    "scipy",
+]
+
+# Columns of synthesis files stored in baselines.
+LIST_OF_BASELINE_COLUMNS: List[str] = [
+    "algorithm_name",
+    "time_total",
+    "time_q1",
+    "time_q3",
+]
+
+# Default significance level of statistical tests.
+DEFAULT_SIGNIFICANCE_LEVEL: float = 0.05
+
+# Default minimal relative change of time to report a slowdown or a speedup (smaller significant changes are considered as unchanged).
+DEFAULT_MIN_RELATIVE_CHANGE: float = 0.05
+
+# Default minimal number of experiments paired with the baseline to test an algorithm.
+DEFAULT_MIN_NB_EXPERIMENTS: int = 6
+
+# Statuses of algorithms in regression reports (in the order of reports).
+LIST_OF_STATUSES: List[str] = [
+    "slowdown",
+    "speedup",
+    "unchanged",
+    "insufficient",
+]
+
+
+# ==============================================================================
+# BASELINES - STORE
+# ==============================================================================
+def store_baseline(
+    baseline_name: str,
+    synthesis_path_pattern: str = DEFAULT_SYNTHESIS_PATH_PATTERN,
+    baselines_path: str = DEFAULT_BASELINES_PATH,
+    with_overwrite: bool = False,
+) -> Dict[str, Any]:
+    """
+    A method aimed at store the current computation time results as a named baseline, with library versions and hardware fingerprint.
+    Usage note:
+        - Store a baseline just after the synthesis of a campaign, in the same Python environment, so that stored versions are the ones used by the campaign.
+
+    Args:
+        baseline_name (str): The name of the baseline (ex: `"ic-1.0.0_sklearn-1.3"`).
+        synthesis_path_pattern (str, optional): The path of synthesis files, without extension. Defaults to `DEFAULT_SYNTHESIS_PATH_PATTERN`.
+        baselines_path (str, optional): The path to stored baselines. Defaults to `DEFAULT_BASELINES_PATH`.
+        with_overwrite (bool, optional): The option to replace an existing baseline. Defaults to `False`.
+
+    Raises:
+        ValueError: if the baseline already exists and `with_overwrite` is `False`, or if there is no synthesis file.
+
+    Returns:
+        Dict[str, Any]: The description of the baseline: name (`"NAME"`), creation date (`"CREATED_AT"`), library versions (`"VERSIONS"`), hardware (`"HARDWARE"`) and its fingerprint (`"HARDWARE_FINGERPRINT"`), and number of experiments per task (`"NB_EXPERIMENTS"`).
+    """
+
+    # Check the baseline.
+    baseline_path: str = baselines_path + baseline_name + "/"
+    if os.path.exists(baseline_path + "baseline.json") and not with_overwrite:
+        raise ValueError("The `baseline_name` '" + str(baseline_name) + "' already exists.")
+    os.makedirs(baseline_path, exist_ok=True)
+
+    # Store the computation time of each task.
+    dict_of_nb_experiments: Dict[str, int] = {}
+    for task in LIST_OF_TASKS:
+        df_task: Optional[pd.DataFrame] = _load_task_synthesis(synthesis_path_pattern=synthesis_path_pattern, task=task)
+        if df_task is None:
+            continue
+        df_task[LIST_OF_BASELINE_COLUMNS].to_csv(baseline_path + "timings_for_" + task + ".csv", sep=";")
+        dict_of_nb_experiments[task] = len(df_task)
+    if len(dict_of_nb_experiments) == 0:
+        raise ValueError("There is no synthesis file for the `synthesis_path_pattern` '" + str(synthesis_path_pattern) + "'.")
+
+    # Store the description of the baseline.
+    dict_of_hardware: Dict[str, Any] = get_hardware()
+    dict_of_baseline: Dict[str, Any] = {
+        "NAME": baseline_name,
+        "CREATED_AT": datetime.now().isoformat(),
+        "VERSIONS": get_package_versions(),
+        "HARDWARE": dict_of_hardware,
+        "HARDWARE_FINGERPRINT": get_hardware_fingerprint(dict_of_hardware=dict_of_hardware),
+        "NB_EXPERIMENTS": dict_of_nb_experiments,
+    }
+    with open(baseline_path + "baseline.json", "w") as file_baseline:
+        json.dump(dict_of_baseline, file_baseline, indent=4)
+
+    # Return the description of the baseline.
+    return dict_of_baseline
+
+
+# ==============================================================================
+# BASELINES - LIST
+# ==============================================================================
+def list_baselines(
+    baselines_path: str = DEFAULT_BASELINES_PATH,
+) -> List[Dict[str, Any]]:
+    """
+    A method aimed at list stored baselines.
+
+    Args:
+        baselines_path (str, optional): The path to stored baselines. Defaults to `DEFAULT_BASELINES_PATH`.
+
+    Returns:
+        List[Dict[str, Any]]: The description of each baseline (cf. `store_baseline`), from the oldest to the newest.
+    """
+
+    # Case of no baseline.
+    if not os.path.exists(baselines_path):
+        return []
+
+    # Load descriptions of baselines.
+    list_of_baselines: List[Dict[str, Any]] = []
+    for baseline_name in os.listdir(baselines_path):
+        if os.path.exists(baselines_path + baseline_name + "/baseline.json"):
+            with open(baselines_path + baseline_name + "/baseline.json", "r") as file_baseline:
+                list_of_baselines.append(json.load(file_baseline))
+
+    # Return descriptions.
+    return sorted(list_of_baselines, key=lambda baseline: baseline["CREATED_AT"])
+
+
+# ==============================================================================
+# BASELINES - COMPARE
+# ==============================================================================
+def compare_with_baseline(
+    baseline_name: str,
+    synthesis_path_pattern: str = DEFAULT_SYNTHESIS_PATH_PATTERN,
+    baselines_path: str = DEFAULT_BASELINES_PATH,
+    significance_level: float = DEFAULT_SIGNIFICANCE_LEVEL,
+    min_relative_change: float = DEFAULT_MIN_RELATIVE_CHANGE,
+    min_nb_experiments: int = DEFAULT_MIN_NB_EXPERIMENTS,
+) -> pd.DataFrame:
+    """
+    A method aimed at compare the current computation time results with a baseline, per task and algorithm.
+    Experiments are paired with the baseline by environment path, and the ratios of their median times are tested with a Wilcoxon signed-rank test.
+
+    Args:
+        baseline_name (str): The name of the baseline.
+        synthesis_path_pattern (str, optional): The path of synthesis files, without extension. Defaults to `DEFAULT_SYNTHESIS_PATH_PATTERN`.
+        baselines_path (str, optional): The path to stored baselines. Defaults to `DEFAULT_BASELINES_PATH`.
+        significance_level (float, optional): The significance level of tests. Defaults to `DEFAULT_SIGNIFICANCE_LEVEL`.
+        min_relative_change (float, optional): The minimal relative change of time to report a slowdown or a speedup. Defaults to `DEFAULT_MIN_RELATIVE_CHANGE`.
+        min_nb_experiments (int, optional): The minimal number of paired experiments to test an algorithm. Defaults to `DEFAULT_MIN_NB_EXPERIMENTS`.
+
+    Raises:
+        ValueError: if the baseline doesn't exist.
+
+    Returns:
+        pd.DataFrame: The ranked report, one row per task and algorithm: number of paired experiments (`"nb_experiments"`), geometric mean of time ratios (`"ratio"`, current time divided by baseline time), relative change (`"relative_change"`), p-value (`"p_value"`) and status (`"status"`, cf. `LIST_OF_STATUSES`). Slowdowns come first (largest first), then speedups (largest first), then other algorithms.
+    """
+
+    # Check the baseline.
+    baseline_path: str = baselines_path + baseline_name + "/"
+    if not os.path.exists(baseline_path + "baseline.json"):
+        raise ValueError("The `baseline_name` '" + str(baseline_name) + "' doesn't exist.")
+
+    # Compare each task.
+    list_of_rows: List[Dict[str, Any]] = []
+    for task in LIST_OF_TASKS:
+
+        # Load current results and baseline results.
+        df_current: Optional[pd.DataFrame] = _load_task_synthesis(synthesis_path_pattern=synthesis_path_pattern, task=task)
+        if (df_current is None) or (not os.path.exists(baseline_path + "timings_for_" + task + ".csv")):
+            continue
+        df_baseline: pd.DataFrame = pd.read_csv(baseline_path + "timings_for_" + task + ".csv", sep=";", index_col=0)
+
+        # Pair experiments by environment path.
+        df_paired: pd.DataFrame = df_current[["algorithm_name", "time_total"]].join(
+            df_baseline[["time_total"]],
+            how="inner",
+            rsuffix="_baseline",
+        )
+        df_paired = df_paired[(df_paired["time_total"] > 0) & (df_paired["time_total_baseline"] > 0)]
+        df_paired["log_ratio"] = np.log(df_paired["time_total"] / df_paired["time_total_baseline"])
+
+        # Test each algorithm.
+        for algorithm_name, df_algorithm in df_paired.groupby("algorithm_name", observed=True):
+            list_of_rows.append(
+                {
+                    "task": task,
+                    "algorithm_name": algorithm_name,
+                    **_test_log_ratios(
+                        array_of_log_ratios=df_algorithm["log_ratio"].to_numpy(),
+                        significance_level=significance_level,
+                        min_relative_change=min_relative_change,
+                        min_nb_experiments=min_nb_experiments,
+                    ),
+                }
+            )
+
+    # Rank the report: slowdowns (largest first), speedups (largest first), then other algorithms.
+    df_report: pd.DataFrame = pd.DataFrame(
+        list_of_rows,
+        columns=["task", "algorithm_name", "nb_experiments", "ratio", "relative_change", "p_value", "status"],
+    )
+    df_report["rank_of_status"] = df_report["status"].map(LIST_OF_STATUSES.index)
+    df_report["rank_of_change"] = np.where(df_report["status"] == "speedup", df_report["ratio"], -df_report["ratio"])
+    df_report = df_report.sort_values(["rank_of_status", "rank_of_change"]).drop(columns=["rank_of_status", "rank_of_change"])
+
+    # Return the report.
+    return df_report.reset_index(drop=True)
+
+
+# ==============================================================================
+# BASELINES - CHECK COMPATIBILITY
+# ==============================================================================
+def check_compatibility(
+    baseline_name: str,
+    baselines_path: str = DEFAULT_BASELINES_PATH,
+) -> Dict[str, Any]:
+    """
+    A method aimed at compare the current environment with the environment of a baseline (different hardware makes the comparison meaningless).
+
+    Args:
+        baseline_name (str): The name of the baseline.
+        baselines_path (str, optional): The path to stored baselines. Defaults to `DEFAULT_BASELINES_PATH`.
+
+    Raises:
+        ValueError: if the baseline doesn't exist.
+
+    Returns:
+        Dict[str, Any]: The option that indicates the same hardware (`"same_hardware"`), and the packages with a different version (`"changed_versions"`: package name to the baseline version and the current version).
+    """
+
+    # Load the baseline.
+    if not os.path.exists(baselines_path + baseline_name + "/baseline.json"):
+        raise ValueError("The `baseline_name` '" + str(baseline_name) + "' doesn't exist.")
+    with open(baselines_path + baseline_name + "/baseline.json", "r") as file_baseline:
+        dict_of_baseline: Dict[str, Any] = json.load(file_baseline)
+
+    # Compare hardware and versions.
+    dict_of_versions: Dict[str, Optional[str]] = get_package_versions()
+    return {
+        "same_hardware": dict_of_baseline["HARDWARE_FINGERPRINT"] == get_hardware_fingerprint(),
+        "changed_versions": {
+            package: [dict_of_baseline["VERSIONS"].get(package), version]
+            for package, version in dict_of_versions.items()
+            if dict_of_baseline["VERSIONS"].get(package) != version
+        },
+    }
+
+
+# ==============================================================================
+# BASELINES - ENVIRONMENT
+# ==============================================================================
+def get_package_versions() -> Dict[str, Optional[str]]:
+    """
+    A method aimed at get the versions of tracked packages.
+
+    Returns:
+        Dict[str, Optional[str]]: The version of each package in `LIST_OF_PACKAGES` (`None` if not installed).
+    """
+    dict_of_versions: Dict[str, Optional[str]] = {}
+    for package in LIST_OF_PACKAGES:
+        try:
+            dict_of_versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            dict_of_versions[package] = None
+    return dict_of_versions
+
+
+def get_hardware() -> Dict[str, Any]:
+    """
+    A method aimed at describe the hardware used to measure computation time.
+
+    Returns:
+        Dict[str, Any]: The architecture, CPU model, number of logical CPUs and number of physical cores.
+    """
+    dict_of_environment: Dict[str, Any] = benchmark.get_environment_metadata()
+    return {
+        "machine": platform.machine(),
+        "cpu_model": dict_of_environment["cpu_model"],
+        "cpu_count": dict_of_environment["cpu_count"],
+        "nb_physical_cores": len(benchmark.get_physical_cores(with_affinity=False)),
+    }
+
+
+def get_hardware_fingerprint(
+    dict_of_hardware: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    A method aimed at get the fingerprint of the hardware.
+
+    Args:
+        dict_of_hardware (Optional[Dict[str, Any]], optional): The hardware (cf. `get_hardware`). Defaults to `None` (the current hardware).
+
+    Returns:
+        str: The SHA-1 of the hardware description.
+    """
+    if dict_of_hardware is None:
+        dict_of_hardware = get_hardware()
+    return hashlib.sha1(json.dumps(dict_of_hardware, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+# ==============================================================================
+# PRIVATE - TESTS
+# ==============================================================================
+def _test_log_ratios(
+    array_of_log_ratios: np.ndarray,
+    significance_level: float,
+    min_relative_change: float,
+    min_nb_experiments: int,
+) -> Dict[str, Any]:
+    """
+    A method aimed at test if the logarithms of time ratios of paired experiments are centered on zero (Wilcoxon signed-rank test).
+
+    Args:
+        array_of_log_ratios (np.ndarray): The logarithms of time ratios (current time divided by baseline time).
+        significance_level (float): The significance level of the test.
+        min_relative_change (float): The minimal relative change of time to report a slowdown or a speedup.
+        min_nb_experiments (int): The minimal number of paired experiments to test.
+
+    Returns:
+        Dict[str, Any]: The number of paired experiments, geometric mean of ratios, relative change, p-value and status.
+    """
+
+    # Compute the geometric mean of ratios.
+    ratio: float = float(np.exp(array_of_log_ratios.mean())) if len(array_of_log_ratios) != 0 else np.nan
+    dict_of_test: Dict[str, Any] = {
+        "nb_experiments": len(array_of_log_ratios),
+        "ratio": ratio,
+        "relative_change": ratio - 1,
+        "p_value": np.nan,
+        "status": "insufficient",
+    }
+
+    # Case of too few experiments.
+    if len(array_of_log_ratios) < min_nb_experiments:
+        return dict_of_test
+
+    # Test ratios (identical times can't be ranked).
+    dict_of_test["p_value"] = (
+        1.0
+        if np.all(array_of_log_ratios == 0)
+        else float(scipy.stats.wilcoxon(array_of_log_ratios).pvalue)
+    )
+
+    # Set the status.
+    dict_of_test["status"] = "unchanged"
+    if (dict_of_test["p_value"] < significance_level) and (abs(ratio - 1) >= min_relative_change):
+        dict_of_test["status"] = "slowdown" if ratio > 1 else "speedup"
+
+    # Return the test.
+    return dict_of_test
+
+
+# ==============================================================================
+# PRIVATE - SYNTHESIS
+# ==============================================================================
+def _load_task_synthesis(
+    synthesis_path_pattern: str,
+    task: str,
+) -> Optional[pd.DataFrame]:
+    """
+    A method aimed at load the computation time of a task from its synthesis file (Parquet file if available, otherwise CSV file).
+
+    Args:
+        synthesis_path_pattern (str): The path of synthesis files, without extension.
+        task (str): The task.
+
+    Returns:
+        Optional[pd.DataFrame]: The computation time of the task, indexed by environment path, or `None` if missing.
+    """
+    for extension in [".parquet", ".csv"]:
+        if os.path.exists(synthesis_path_pattern.format(task=task) + extension):
+            return synthesis_writer.load_synthesis(
+                filepath=synthesis_path_pattern.format(task=task) + extension,
+                list_of_columns=LIST_OF_BASELINE_COLUMNS,
+                csv_decimal=",",
+            )
+    return None
+
+
+# ==============================================================================
+# COMMAND - STORE AND COMPARE
+# ==============================================================================
+if __name__ == "__main__":
+    # Usage (from the `notebook` folder):
+    #   - `python regression_tracking.py store [BASELINE_NAME]` to store the current results as a baseline;
+    #   - `python regression_tracking.py compare [BASELINE_NAME]` to compare the current results with a baseline. The exit code is `1` if there is a significant slowdown (for scheduled checks).
+    parser = argparse.ArgumentParser(description="Track computation time regressions against stored baselines.")
+    parser.add_argument("action", choices=["store", "compare"])
+    parser.add_argument("baseline_name")
+    parser.add_argument("--overwrite", action="store_true", help="replace an existing baseline (`store`).")
+    parser.add_argument("--significance-level", type=float, default=DEFAULT_SIGNIFICANCE_LEVEL)
+    parser.add_argument("--min-relative-change", type=float, default=DEFAULT_MIN_RELATIVE_CHANGE)
+    arguments = parser.parse_args()
+
+    # Case of a new baseline.
+    if arguments.action == "store":
+        dict_of_stored_baseline: Dict[str, Any] = store_baseline(baseline_name=arguments.baseline_name, with_overwrite=arguments.overwrite)
+        print("Baseline `" + arguments.baseline_name + "` stored:", json.dumps(dict_of_stored_baseline["NB_EXPERIMENTS"]))
+        sys.exit(0)
+
+    # Case of a comparison: warn about environment changes, then store and print the report.
+    dict_of_compatibility: Dict[str, Any] = check_compatibility(baseline_name=arguments.baseline_name)
+    if not dict_of_compatibility["same_hardware"]:
+        print("WARNING: the hardware differs from the baseline hardware, time ratios mix hardware and software changes.")
+    for package_name, (baseline_version, current_version) in dict_of_compatibility["changed_versions"].items():
+        print("Version of `" + package_name + "`:", str(baseline_version), "->", str(current_version))
+    df_regression_report: pd.DataFrame = compare_with_baseline(
+        baseline_name=arguments.baseline_name,
+        significance_level=arguments.significance_level,
+        min_relative_change=arguments.min_relative_change,
+    )
+    df_regression_report.to_csv(DEFAULT_REPORT_PATH_PATTERN.format(baseline_name=arguments.baseline_name), sep=";", index=False)
+    print(df_regression_report.to_string())
+    sys.exit(1 if (df_regression_report["status"] == "slowdown").any() else 0)
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         sampling_benchmark
+* Description:  Define the benchmark of constraints sampling algorithms, with the computation time of each phase of the sampling (candidates enumeration, constraints filtering, distances, ranking).
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+import numpy as np
+from cognitivefactory.interactive_clustering.constraints.abstract import (
+    AbstractConstraintsManager,
+)
+from cognitivefactory.interactive_clustering.sampling import clusters_based
+from cognitivefactory.interactive_clustering.sampling.abstract import (
+    AbstractConstraintsSampling,
+)
+from scipy.sparse import csr_matrix
+
+import scaling_benchmark
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Sizes of datasets.
+DEFAULT_LIST_OF_SIZES: List[int] = [1000, 2000, 5000, 10000, 20000]
+
+# Samplers to measure (short name used in environments names, and name in `sampling_factory`).
+DICT_OF_SAMPLERS: Dict[str, str] = {
+    "random": "random",
+    "in_same": "random_in_same_cluster",
+    "closest": "closest_in_different_clusters",
+    "farthest": "farthest_in_same_cluster",
+}
+
+# Reference settings of sampling (same as in the notebook `4_Run_scaling_benchmark.ipynb`).
+DEFAULT_REFERENCE_SETTINGS: Dict[str, int] = {
+    "nb_to_select": 100,
+    "constraints": 1000,
+    "clustering": 10,
+}
+
+# Values of each setting swept around the reference settings.
+DEFAULT_DICT_OF_SWEEPS: Dict[str, List[int]] = {
+    "nb_to_select": [50, 100, 250],
+    "constraints": [0, 1000, 5000],
+    "clustering": [10, 25, 50],
+}
+
+# Phases of the sampling (cf. `measure_phases`).
+LIST_OF_PHASES: List[str] = [
+    "enumeration",
+    "constraints_filtering",
+    "distance_computation",
+    "distance_formatting",
+    "ranking",
+]
+
+# Default number of instrumented runs used to measure phases.
+DEFAULT_NB_PHASE_REPETITIONS: int = 3
+
+
+# ==============================================================================
+# SAMPLING BENCHMARK - ALGORITHMS CONFIGURATIONS
+# ==============================================================================
+def get_algorithm_configs(
+    list_of_samplers: Optional[List[str]] = None,
+    dict_of_sweeps: Optional[Dict[str, List[int]]] = None,
+    reference_settings: Optional[Dict[str, int]] = None,
+    list_of_random_seeds: Optional[List[int]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    A method aimed at define the `algorithm` environments of the `sampling` task: each setting (`nb_to_select`, previous constraints, previous clusters) is swept while the other settings keep their reference value.
+    Usage note:
+        - Environments names are the same as in the notebook `1_Initialize_computation_time_experiments.ipynb`, so experiments already run are reused.
+
+    Args:
+        list_of_samplers (Optional[List[str]], optional): The samplers to measure (keys of `DICT_OF_SAMPLERS`). Defaults to `None` (all samplers).
+        dict_of_sweeps (Optional[Dict[str, List[int]]], optional): The values of each swept setting (`"nb_to_select"`, `"constraints"`, `"clustering"`). Defaults to `None` (`DEFAULT_DICT_OF_SWEEPS`).
+        reference_settings (Optional[Dict[str, int]], optional): The reference value of each setting. Defaults to `None` (`DEFAULT_REFERENCE_SETTINGS`).
+        list_of_random_seeds (Optional[List[int]], optional): The random seeds of sampling. Defaults to `None` (`[1]`).
+
+    Raises:
+        ValueError: if a sampler or a setting is not implemented.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The configurations of algorithms environments (same format as in the notebook `1_Initialize_computation_time_experiments.ipynb`).
+    """
+
+    # Set default parameters.
+    if list_of_samplers is None:
+        list_of_samplers = list(DICT_OF_SAMPLERS.keys())
+    if dict_of_sweeps is None:
+        dict_of_sweeps = DEFAULT_DICT_OF_SWEEPS
+    if reference_settings is None:
+        reference_settings = DEFAULT_REFERENCE_SETTINGS
+    if list_of_random_seeds is None:
+        list_of_random_seeds = [1]
+
+    # Check parameters.
+    for sampler in list_of_samplers:
+        if sampler not in DICT_OF_SAMPLERS.keys():
+            raise ValueError("The `sampler` '" + str(sampler) + "' is not implemented.")
+    for setting in dict_of_sweeps.keys():
+        if setting not in DEFAULT_REFERENCE_SETTINGS.keys():
+            raise ValueError("The `setting` '" + str(setting) + "' is not implemented.")
+
+    # Get the combinations of settings (one setting swept at a time).
+    list_of_settings: List[Dict[str, int]] = [{**DEFAULT_REFERENCE_SETTINGS, **reference_settings}]
+    for setting, list_of_values in dict_of_sweeps.items():
+        for value in list_of_values:
+            settings: Dict[str, int] = {**list_of_settings[0], setting: value}
+            if settings not in list_of_settings:
+                list_of_settings.append(settings)
+
+    # Define configurations.
+    dict_of_algorithm_configs: Dict[str, Dict[str, Any]] = {}
+    for sampler in list_of_samplers:
+        for settings in list_of_settings:
+            for random_seed in list_of_random_seeds:
+                dict_of_algorithm_configs["{algo_str}-select_{select_str}-rand_{rand_str}-prev_const{const_str}_clu{clu_str}".format(
+                    algo_str=sampler,
+                    select_str=settings["nb_to_select"],
+                    rand_str=random_seed,
+                    const_str=settings["constraints"],
+                    clu_str=settings["clustering"],
+                )] = {
+                    "_TYPE": "algorithm",
+                    "_TASK": "sampling",
+                    "_ALGORITHM": sampler,
+                    "_DESCRIPTION": "Sampling '{algo_str}', {select_str} combinations to select, {const_str} previous constraints, {clu_str} clusters.".format(
+                        algo_str=DICT_OF_SAMPLERS[sampler],
+                        select_str=settings["nb_to_select"],
+                        const_str=settings["constraints"],
+                        clu_str=settings["clustering"],
+                    ),
+                    "preprocessing": {
+                        "apply_preprocessing": True,
+                        "apply_lemmatization": False,
+                        "apply_parsing_filter": False,
+                        "spacy_language_model": "fr_core_news_md",
+                    },
+                    "vectorization": {
+                        "vectorizer_type": "tfidf",
+                        "spacy_language_model": None,
+                    },
+                    "sampling": {
+                        "algorithm": DICT_OF_SAMPLERS[sampler],
+                        "nb_to_select": settings["nb_to_select"],
+                    },
+                    "previous": {
+                        "clustering": settings["clustering"],
+                        "constraints": settings["constraints"],
+                    },
+                    "random_seed": random_seed,
+                }
+
+    # Return configurations.
+    return dict_of_algorithm_configs
+
+
+# ==============================================================================
+# SAMPLING BENCHMARK - CREATE ENVIRONMENTS
+# ==============================================================================
+def create_sampling_environments(
+    dict_of_algorithm_configs: Dict[str, Dict[str, Any]],
+    list_of_sizes: Optional[List[int]] = None,
+    list_of_random_seeds: Optional[List[int]] = None,
+    list_of_datasets: Optional[List[str]] = None,
+    datasets_path: str = "../../datasets/",
+) -> List[str]:
+    """
+    A method aimed at create the `sampling` experiments environments (`../experiments/sampling/[DATASET]/[ALGORITHM]`), with datasets generated as in the scaling benchmark (cf. `scaling_benchmark.create_scaling_environments`).
+
+    Args:
+        dict_of_algorithm_configs (Dict[str, Dict[str, Any]]): The configurations of algorithms environments (cf. `get_algorithm_configs`).
+        list_of_sizes (Optional[List[int]], optional): The sizes of datasets. Defaults to `None` (`DEFAULT_LIST_OF_SIZES`).
+        list_of_random_seeds (Optional[List[int]], optional): The random seeds of datasets. Defaults to `None` (`[1]`).
+        list_of_datasets (Optional[List[str]], optional): The base datasets (keys of `scaling_benchmark.DICT_OF_BASE_DATASETS`). Defaults to `None` (`["bank_cards_v2"]`).
+        datasets_path (str, optional): The path to base datasets files. Defaults to `"../../datasets/"`.
+
+    Returns:
+        List[str]: The list of paths to the `sampling` algorithms environments, smaller datasets first.
+    """
+    return scaling_benchmark.create_scaling_environments(
+        dict_of_algorithm_configs=dict_of_algorithm_configs,
+        list_of_sizes=list_of_sizes if (list_of_sizes is not None) else DEFAULT_LIST_OF_SIZES,
+        list_of_random_seeds=list_of_random_seeds,
+        list_of_datasets=list_of_datasets if (list_of_datasets is not None) else ["bank_cards_v2"],
+        datasets_path=datasets_path,
+    )
+
+
+# ==============================================================================
+# SAMPLING BENCHMARK - MEASURE PHASES
+# ==============================================================================
+def measure_phases(
+    create_sampler: Callable[[], AbstractConstraintsSampling],
+    constraints_manager: AbstractConstraintsManager,
+    nb_to_select: int,
+    clustering_result: Optional[Dict[str, int]] = None,
+    vectors: Optional[Dict[str, csr_matrix]] = None,
+    nb_repetitions: int = DEFAULT_NB_PHASE_REPETITIONS,
+) -> Dict[str, Any]:
+    """
+    A method aimed at measure the computation time of each phase of a sampling, with hooks on the functions called by `ClustersBasedConstraintsSampling.sample` between its phases (the sampling code is not modified).
+    Usage note:
+        - `enumeration`: loop over pairs of data, with the clusters restriction (measured in a run without filtering of known constraints, which is stopped at the end of the loop).
+        - `constraints_filtering`: additional time of the loop to filter pairs with an added or inferred constraint.
+        - `distance_computation`: pairwise distances between vectors (`0` for samplers without distance restriction).
+        - `distance_formatting`: copy of pairwise distances in a dictionary (`0` for samplers without distance restriction).
+        - `ranking`: sort of candidate pairs by distance, or random selection.
+        - Phases are measured in runs added after timed runs, so that hooks don't disturb the measurement of the total time.
+
+    Args:
+        create_sampler (Callable[[], AbstractConstraintsSampling]): The creation of a new sampler (a `ClustersBasedConstraintsSampling`, cf. `sampling_factory`).
+        constraints_manager (AbstractConstraintsManager): The constraints manager with previous constraints.
+        nb_to_select (int): The number of pairs of data to select.
+        clustering_result (Optional[Dict[str, int]], optional): The previous clustering. Defaults to `None`.
+        vectors (Optional[Dict[str, csr_matrix]], optional): The vectors of data. Defaults to `None`.
+        nb_repetitions (int, optional): The number of instrumented runs. Defaults to `DEFAULT_NB_PHASE_REPETITIONS`.
+
+    Raises:
+        ValueError: if the sampler is not a `ClustersBasedConstraintsSampling`.
+
+    Returns:
+        Dict[str, Any]: The measurement of phases: the median time of each phase (`"median"`, in seconds), all samples (`"samples"`), the number of candidate pairs of data (`"nb_candidates"`) and the number of instrumented runs (`"nb_repetitions"`).
+    """
+
+    # Initialize samples.
+    dict_of_samples: Dict[str, List[float]] = {phase: [] for phase in LIST_OF_PHASES}
+    nb_candidates: Optional[int] = None
+
+    for _ in range(max(1, nb_repetitions)):
+
+        # Run the whole sampling with hooks.
+        sampler: AbstractConstraintsSampling = create_sampler()
+        if not isinstance(sampler, clusters_based.ClustersBasedConstraintsSampling):
+            raise ValueError("The `sampler` '" + str(type(sampler)) + "' is not implemented.")
+        dict_of_timestamps: Dict[str, Any] = _run_hooked_sampling(
+            sampler=sampler,
+            constraints_manager=constraints_manager,
+            nb_to_select=nb_to_select,
+            clustering_result=clustering_result,
+            vectors=vectors,
+            stop_after_enumeration=False,
+        )
+
+        # Run the enumeration again without filtering of known constraints.
+        sampler_without_filter: AbstractConstraintsSampling = create_sampler()
+        if not isinstance(sampler_without_filter, clusters_based.ClustersBasedConstraintsSampling):
+            raise ValueError("The `sampler` '" + str(type(sampler_without_filter)) + "' is not implemented.")
+        sampler_without_filter.without_added_constraints = False
+        sampler_without_filter.without_inferred_constraints = False
+        dict_of_timestamps_without_filter: Dict[str, Any] = _run_hooked_sampling(
+            sampler=sampler_without_filter,
+            constraints_manager=constraints_manager,
+            nb_to_select=nb_to_select,
+            clustering_result=clustering_result,
+            vectors=vectors,
+            stop_after_enumeration=True,
+        )
+
+        # Compute durations of phases (a phase without hook lasts `0`).
+        time_of_enumeration: float = dict_of_timestamps["enumeration"] - dict_of_timestamps["start"]
+        time_of_enumeration_without_filter: float = (
+            dict_of_timestamps_without_filter["enumeration"] - dict_of_timestamps_without_filter["start"]
+        )
+        dict_of_samples["enumeration"].append(min(time_of_enumeration, time_of_enumeration_without_filter))
+        dict_of_samples["constraints_filtering"].append(max(0.0, time_of_enumeration - time_of_enumeration_without_filter))
+        dict_of_samples["distance_computation"].append(
+            dict_of_timestamps.get("distance_computation", dict_of_timestamps["enumeration"]) - dict_of_timestamps["enumeration"]
+        )
+        dict_of_samples["distance_formatting"].append(
+            dict_of_timestamps["distance_formatting"] - dict_of_timestamps.get("distance_computation", dict_of_timestamps["enumeration"])
+            if ("distance_computation" in dict_of_timestamps.keys())
+            else 0.0
+        )
+        dict_of_samples["ranking"].append(dict_of_timestamps["stop"] - dict_of_timestamps["distance_formatting"])
+        nb_candidates = dict_of_timestamps.get("nb_candidates")
+
+    # Return the measurement of phases.
+    return {
+        "median": {phase: float(np.median(list_of_samples)) for phase, list_of_samples in dict_of_samples.items()},
+        "samples": dict_of_samples,
+        "nb_candidates": nb_candidates,
+        "nb_repetitions": max(1, nb_repetitions),
+    }
+
+
+# ==============================================================================
+# PRIVATE - HOOKS
+# ==============================================================================
+class _StopAfterEnumeration(Exception):
+    """
+    An exception raised by hooks to stop a sampling at the end of the enumeration of candidate pairs.
+    """
+
+
+class _HookedRandom:
+    """
+    A wrapper of the `random` module used by `ClustersBasedConstraintsSampling.sample`, that stores when the ranking starts (`random.seed` is called just before it).
+    """
+
+    def __init__(
+        self,
+        dict_of_timestamps: Dict[str, Any],
+        stop_after_enumeration: bool,
+    ) -> None:
+        """
+        The constructor of the `random` wrapper.
+
+        Args:
+            dict_of_timestamps (Dict[str, Any]): The timestamps of phases, filled during the sampling.
+            stop_after_enumeration (bool): The option to stop the sampling at the end of the enumeration.
+        """
+        self.dict_of_timestamps: Dict[str, Any] = dict_of_timestamps
+        self.stop_after_enumeration: bool = stop_after_enumeration
+
+    def seed(self, *args: Any, **kwargs: Any) -> None:
+        """
+        The hook of `random.seed`, called at the end of distances (or at the end of the enumeration for samplers without distance restriction).
+        """
+        self.dict_of_timestamps.setdefault("enumeration", time.perf_counter())
+        if self.stop_after_enumeration:
+            raise _StopAfterEnumeration()
+        random.seed(*args, **kwargs)
+        self.dict_of_timestamps["distance_formatting"] = time.perf_counter()
+
+    def sample(self, population: Any, *args: Any, **kwargs: Any) -> Any:
+        """
+        The hook of `random.sample`, that stores the number of candidate pairs of data.
+        """
+        self.dict_of_timestamps["nb_candidates"] = len(population)
+        return random.sample(population, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Other functions of the `random` module are not hooked.
+        """
+        return getattr(random, name)
+
+
+def _run_hooked_sampling(
+    sampler: AbstractConstraintsSampling,
+    constraints_manager: AbstractConstraintsManager,
+    nb_to_select: int,
+    clustering_result: Optional[Dict[str, int]],
+    vectors: Optional[Dict[str, csr_matrix]],
+    stop_after_enumeration: bool,
+) -> Dict[str, Any]:
+    """
+    A method aimed at run a sampling with hooks on `vstack`, `pairwise_distances`, `random` and `sorted` of the `clusters_based` module, and get timestamps of phases (cf. `measure_phases`).
+
+    Args:
+        sampler (AbstractConstraintsSampling): The sampler.
+        constraints_manager (AbstractConstraintsManager): The constraints manager with previous constraints.
+        nb_to_select (int): The number of pairs of data to select.
+        clustering_result (Optional[Dict[str, int]]): The previous clustering.
+        vectors (Optional[Dict[str, csr_matrix]]): The vectors of data.
+        stop_after_enumeration (bool): The option to stop the sampling at the end of the enumeration.
+
+    Returns:
+        Dict[str, Any]: The timestamps of phases (`"start"`, `"enumeration"`, `"distance_computation"` (only with distance restriction), `"distance_formatting"` and `"stop"`), and the number of candidate pairs of data (`"nb_candidates"`).
+    """
+
+    # Initialize timestamps.
+    dict_of_timestamps: Dict[str, Any] = {}
+
+    # Define hooks.
+    original_vstack: Callable[..., Any] = clusters_based.vstack
+    original_pairwise_distances: Callable[..., Any] = clusters_based.pairwise_distances
+
+    def hooked_vstack(*args: Any, **kwargs: Any) -> Any:
+        # NB : `vstack` is called at the start of distances.
+        dict_of_timestamps["enumeration"] = time.perf_counter()
+        if stop_after_enumeration:
+            raise _StopAfterEnumeration()
+        return original_vstack(*args, **kwargs)
+
+    def hooked_pairwise_distances(*args: Any, **kwargs: Any) -> Any:
+        # NB : `vstack` is evaluated before the call of `pairwise_distances`.
+        matrix_of_pairwise_distances: Any = original_pairwise_distances(*args, **kwargs)
+        dict_of_timestamps["distance_computation"] = time.perf_counter()
+        return matrix_of_pairwise_distances
+
+    def hooked_sorted(iterable: Any, *args: Any, **kwargs: Any) -> List[Any]:
+        dict_of_timestamps["nb_candidates"] = len(iterable)
+        return sorted(iterable, *args, **kwargs)
+
+    # Run the sampling with hooks (`sorted` is a builtin, so it is shadowed by a global of the module, created for the run).
+    with mock.patch.object(clusters_based, "vstack", hooked_vstack), mock.patch.object(
+        clusters_based, "pairwise_distances", hooked_pairwise_distances
+    ), mock.patch.object(
+        clusters_based,
+        "random",
+        _HookedRandom(dict_of_timestamps=dict_of_timestamps, stop_after_enumeration=stop_after_enumeration),
+    ), mock.patch.object(
+        clusters_based, "sorted", hooked_sorted, create=True
+    ):
+        try:
+            dict_of_timestamps["start"] = time.perf_counter()
+            sampler.sample(
+                constraints_manager=constraints_manager,
+                nb_to_select=nb_to_select,
+                clustering_result=clustering_result,
+                vectors=vectors,
+            )
+            dict_of_timestamps["stop"] = time.perf_counter()
+        except _StopAfterEnumeration:
+            pass
+
+    # Return timestamps.
+    return dict_of_timestamps
@@ -0,0 +1,495 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         scaling_benchmark
+* Description:  Create large computation time study environments (10k to 100k data) and run them under time and memory caps.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import os
+import resource
+import shutil
+import subprocess  # noqa: S404
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+import faker
+import listing_envs
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Sizes of scaling datasets.
+DEFAULT_LIST_OF_SIZES: List[int] = [10000, 25000, 50000, 100000]
+
+# Base datasets streamed to generate scaling datasets.
+DICT_OF_BASE_DATASETS: Dict[str, Dict[str, Any]] = {
+    "bank_cards_v2": {
+        "_DESCRIPTION": "This dataset represents examples of common customer requests relating to bank cards management. It can be used as a training set for a small chatbot intended to process these usual requests.",
+        "file_name": "French_trainset_for_chatbots_dealing_with_usual_requests_on_bank_cards_v2.0.0.xlsx",
+        "sheet_name": "dataset",
+        "columns": ["QUESTION", "INTENT"],
+        "language": "fr",
+    },
+    "mlsum_fr": {
+        "_DESCRIPTION": "Subset of MLSUM (French newspapers titles of 14 topics).",
+        "file_name": "mlsum_fr_train_subset_v1.0.0.schild.xlsx",
+        "sheet_name": "dataset",
+        "columns": ["title", "topic"],
+        "language": "fr",
+    },
+}
+
+# Caps of an experiment run: wall time (in seconds) and memory (in bytes).
+DEFAULT_TIME_CAP: float = 3600.0
+DEFAULT_MEMORY_CAP: int = 16 * 1024**3
+
+# Statuses of an experiment run.
+LIST_OF_STATUSES: List[str] = ["ok", "timeout", "oom", "error", "skipped"]
+
+
+# ==============================================================================
+# SCALING - CREATE ENVIRONMENTS
+# ==============================================================================
+def create_scaling_environments(
+    dict_of_algorithm_configs: Dict[str, Dict[str, Any]],
+    list_of_sizes: Optional[List[int]] = None,
+    list_of_random_seeds: Optional[List[int]] = None,
+    list_of_datasets: Optional[List[str]] = None,
+    datasets_path: str = "../../datasets/",
+) -> List[str]:
+    """
+    A method aimed at create scaling experiments environments (`../experiments/[TASK]/[DATASET]/[ALGORITHM]`) that can be synthesized with the other experiments.
+    Each dataset is streamed once from its base dataset (cf. `faker.write_fake_dataset`) and copied in the other tasks environments.
+
+    Args:
+        dict_of_algorithm_configs (Dict[str, Dict[str, Any]]): The configurations of algorithms environments (same format as in the notebook `1_Initialize_computation_time_experiments.ipynb`).
+        list_of_sizes (Optional[List[int]], optional): The sizes of datasets. Defaults to `None` (`DEFAULT_LIST_OF_SIZES`).
+        list_of_random_seeds (Optional[List[int]], optional): The random seeds of datasets. Defaults to `None` (`[1]`).
+        list_of_datasets (Optional[List[str]], optional): The base datasets (keys of `DICT_OF_BASE_DATASETS`). Defaults to `None` (all base datasets).
+        datasets_path (str, optional): The path to base datasets files. Defaults to `"../../datasets/"`.
+
+    Raises:
+        ValueError: if a base dataset is not implemented.
+
+    Returns:
+        List[str]: The list of paths to the scaling algorithms environments.
+    """
+
+    # Set default parameters.
+    if list_of_sizes is None:
+        list_of_sizes = DEFAULT_LIST_OF_SIZES
+    if list_of_random_seeds is None:
+        list_of_random_seeds = [1]
+    if list_of_datasets is None:
+        list_of_datasets = list(DICT_OF_BASE_DATASETS.keys())
+
+    # Check parameters.
+    for dataset in list_of_datasets:
+        if dataset not in DICT_OF_BASE_DATASETS.keys():
+            raise ValueError("The `dataset` '" + str(dataset) + "' is not implemented.")
+
+    # Get tasks to evaluate.
+    list_of_tasks: List[str] = sorted({config["_TASK"] for config in dict_of_algorithm_configs.values()})
+
+    # Create tasks environments if needed.
+    for task in list_of_tasks:
+        task_env_path: str = "../experiments/" + task + "/"
+        if not os.path.exists(task_env_path):
+            os.mkdir(task_env_path)
+            with open(task_env_path + "config.json", "w") as file_task:
+                json.dump({"_TYPE": "task", "_TASK": task, "_ENV_NAME": task, "_ENV_PATH": task_env_path}, file_task)
+
+    # Create datasets and algorithms environments.
+    list_of_algorithm_env_paths: List[str] = []
+    for dataset in list_of_datasets:
+
+        # Load the base dataset once for all sizes (texts and true intents).
+        base_dataset: Optional[Tuple[Dict[str, str], Dict[str, str]]] = None
+
+        for size in list_of_sizes:
+            for random_seed in list_of_random_seeds:
+
+                # Name the configuration.
+                dataset_env_name: str = "{dataset_str}-size_{size_str}-rand_{rand_str}".format(
+                    dataset_str=dataset,
+                    size_str=size,
+                    rand_str=random_seed,
+                )
+                config_dataset: Dict[str, Any] = {
+                    "_TYPE": "dataset",
+                    **DICT_OF_BASE_DATASETS[dataset],
+                    "dataset": dataset,
+                    "size": size,
+                    "random_seed": random_seed,
+                    "_ENV_NAME": dataset_env_name,
+                }
+
+                # Get a dataset environment already generated (in another task environment).
+                generated_env_path: Optional[str] = None
+                for task in list_of_tasks:
+                    if os.path.exists("../experiments/" + task + "/" + dataset_env_name + "/dict_of_true_intents.json"):
+                        generated_env_path = "../experiments/" + task + "/" + dataset_env_name + "/"
+                        break
+
+                for task in list_of_tasks:
+                    dataset_env_path: str = "../experiments/" + task + "/" + dataset_env_name + "/"
+
+                    # Create the dataset environment if needed.
+                    if not os.path.exists(dataset_env_path + "dict_of_true_intents.json"):
+                        os.makedirs(dataset_env_path, exist_ok=True)
+                        with open(dataset_env_path + "config.json", "w") as file_dataset:
+                            json.dump({**config_dataset, "_ENV_PATH": dataset_env_path}, file_dataset)
+
+                        # Copy the generated dataset, or stream it from the base dataset.
+                        if generated_env_path is not None:
+                            shutil.copyfile(generated_env_path + "dict_of_texts.json", dataset_env_path + "dict_of_texts.json")
+                            shutil.copyfile(generated_env_path + "dict_of_true_intents.json", dataset_env_path + "dict_of_true_intents.json")
+                        else:
+                            if base_dataset is None:
+                                base_dataset = _load_base_dataset(
+                                    config_dataset=config_dataset,
+                                    datasets_path=datasets_path,
+                                )
+                            base_dict_of_texts, base_dict_of_true_intents = base_dataset
+                            faker.write_fake_dataset(
+                                dict_of_texts=base_dict_of_texts,
+                                dict_of_true_intents=base_dict_of_true_intents,
+                                size=size,
+                                filepath_of_texts=dataset_env_path + "dict_of_texts.json",
+                                filepath_of_true_intents=dataset_env_path + "dict_of_true_intents.json",
+                                random_seed=random_seed,
+                            )
+                            generated_env_path = dataset_env_path
+
+                    # Create algorithms environments of the task.
+                    for algorithm_env_name, config_algorithm in dict_of_algorithm_configs.items():
+                        if config_algorithm["_TASK"] != task:
+                            continue
+                        algorithm_env_path: str = dataset_env_path + algorithm_env_name + "/"
+                        if not os.path.exists(algorithm_env_path):
+                            os.mkdir(algorithm_env_path)
+                            with open(algorithm_env_path + "config.json", "w") as file_algorithm:
+                                json.dump({**config_algorithm, "_ENV_NAME": algorithm_env_name, "_ENV_PATH": algorithm_env_path}, file_algorithm)
+                        list_of_algorithm_env_paths.append(algorithm_env_path)
+
+    # Return scaling environments, smaller datasets first.
+    return sorted(list_of_algorithm_env_paths, key=lambda env_path: _get_dataset_size(env_path=env_path))
+
+
+# ==============================================================================
+# SCALING - RUN WITH CAPS
+# ==============================================================================
+def experiment_run_with_caps(
+    parameters: Dict[str, Any],
+) -> int:
+    """
+    A worker to run an experiment (cf. `workerA_run.experiment_run`) in a subprocess with a time cap and a memory cap.
+    The status of the run (`"ok"`, `"timeout"`, `"oom"`, `"error"`, or `"skipped"` if the same algorithm already failed on a smaller dataset) is stored in `run_status.json`.
+    Usage note:
+        - The memory cap limits the address space of the subprocess, which is an upper bound of its resident memory.
+        - The time cap applies to the whole run (data needed before the measured task, warm-up runs and timed runs).
+
+    Args:
+        parameters (Dict[str, Any]): The parameters of `workerA_run.experiment_run`. Optional keys set the time cap in seconds (`"TIME_CAP"`) and the memory cap in bytes (`"MEMORY_CAP"`).
+
+    Returns:
+        int: Return `0` when finish.
+    """
+
+    # Parameters.
+    ENV_PATH: str = str(parameters["ENV_PATH"])
+    TIME_CAP: float = float(parameters.get("TIME_CAP", DEFAULT_TIME_CAP))
+    MEMORY_CAP: int = int(parameters.get("MEMORY_CAP", DEFAULT_MEMORY_CAP))
+
+    # If experiment was already run: skip.
+    if ("computation_time.json" in os.listdir(ENV_PATH)) or ("run_status.json" in os.listdir(ENV_PATH)):
+        return 0
+
+    # If the algorithm already failed on a smaller dataset: skip.
+    failed_env_path: Optional[str] = _get_failed_smaller_env_path(env_path=ENV_PATH)
+    if failed_env_path is not None:
+        _store_run_status(
+            env_path=ENV_PATH,
+            dict_of_status={"status": "skipped", "failed_env_path": failed_env_path, "time_cap": TIME_CAP, "memory_cap": MEMORY_CAP},
+        )
+        return 0
+
+    # Run the experiment in a subprocess with a limited address space.
+    dict_of_worker_parameters: Dict[str, Any] = {
+        key: value
+        for key, value in parameters.items()
+        if key not in {"TIME_CAP", "MEMORY_CAP"}
+    }
+    time_start: float = time.monotonic()
+    try:
+        process: subprocess.CompletedProcess = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                "-c",
+                "import json, sys, workerA_run; workerA_run.experiment_run(json.loads(sys.argv[1]))",
+                json.dumps(dict_of_worker_parameters),
+            ],
+            cwd=os.getcwd(),
+            preexec_fn=lambda: resource.setrlimit(resource.RLIMIT_AS, (MEMORY_CAP, MEMORY_CAP)),  # noqa: PLW1509
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=TIME_CAP,
+            text=True,
+        )
+        status: str = "ok"
+        error: Optional[str] = None
+        returncode: Optional[int] = process.returncode
+        if process.returncode != 0:
+            error = (process.stderr.strip().splitlines() or [""])[-1]
+            # NB : a process killed by the system (`SIGKILL`) is considered out of memory.
+            status = "oom" if ("MemoryError" in process.stderr) or (process.returncode == -9) else "error"
+    except subprocess.TimeoutExpired:
+        status = "timeout"
+        error = None
+        returncode = None
+
+    # Store the status of the run.
+    _store_run_status(
+        env_path=ENV_PATH,
+        dict_of_status={
+            "status": status,
+            "elapsed": time.monotonic() - time_start,
+            "returncode": returncode,
+            "error": error,
+            "time_cap": TIME_CAP,
+            "memory_cap": MEMORY_CAP,
+        },
+    )
+
+    # End of script.
+    return 0
+
+
+# ==============================================================================
+# SCALING - SYNTHESIZE LIMITS
+# ==============================================================================
+def synthesize_scaling_limits(
+    list_of_experiment_environments: List[str],
+    filepath: Optional[str] = "../results/scaling_limits.csv",
+) -> pd.DataFrame:
+    """
+    A method aimed at synthesize where each algorithm times out or runs out of memory.
+    Computation times of successful runs are synthesized with the other experiments (cf. `workerC_synthesis.experiments_synthesis`).
+
+    Args:
+        list_of_experiment_environments (List[str]): The list of scaling experiments environments.
+        filepath (Optional[str], optional): The path of the CSV file of limits. Defaults to `"../results/scaling_limits.csv"`.
+
+    Returns:
+        pd.DataFrame: For each task, dataset, algorithm and random seed: the largest dataset size run successfully (`"max_size_ok"`), the smallest dataset size that failed (`"min_size_failed"`) and its status (`"failure_status"`).
+    """
+
+    # Get the status of each run.
+    list_of_runs: List[Dict[str, Any]] = []
+    for env_path in list_of_experiment_environments:
+        with open(env_path + "config.json", "r") as file_config_algorithm:
+            config_algorithm: Dict[str, Any] = json.load(file_config_algorithm)
+        with open(env_path + "../config.json", "r") as file_config_dataset:
+            config_dataset: Dict[str, Any] = json.load(file_config_dataset)
+        list_of_runs.append(
+            {
+                "task": config_algorithm["_TASK"],
+                "dataset_name": config_dataset["dataset"],
+                "dataset_random_seed": config_dataset["random_seed"],
+                "algorithm_env_name": env_path.split("/")[-2],
+                "algorithm_name": config_algorithm["_ALGORITHM"],
+                "dataset_size": config_dataset["size"],
+                "status": get_run_status(env_path=env_path),
+            }
+        )
+    df_runs: pd.DataFrame = pd.DataFrame(
+        list_of_runs,
+        columns=["task", "dataset_name", "dataset_random_seed", "algorithm_env_name", "algorithm_name", "dataset_size", "status"],
+    )
+
+    # Get limits of each algorithm (runs not done yet are ignored).
+    list_of_limits: List[Dict[str, Any]] = []
+    for keys, df_algorithm in df_runs.groupby(["task", "dataset_name", "dataset_random_seed", "algorithm_env_name", "algorithm_name"]):
+        df_ok: pd.DataFrame = df_algorithm[df_algorithm["status"] == "ok"]
+        df_failed: pd.DataFrame = df_algorithm[df_algorithm["status"].isin(["timeout", "oom", "error"])].sort_values("dataset_size")
+        list_of_limits.append(
+            {
+                **dict(zip(["task", "dataset_name", "dataset_random_seed", "algorithm_env_name", "algorithm_name"], keys)),
+                "max_size_ok": df_ok["dataset_size"].max() if len(df_ok) != 0 else None,
+                "min_size_failed": df_failed["dataset_size"].iloc[0] if len(df_failed) != 0 else None,
+                "failure_status": df_failed["status"].iloc[0] if len(df_failed) != 0 else None,
+            }
+        )
+    df_limits: pd.DataFrame = pd.DataFrame(
+        list_of_limits,
+        columns=["task", "dataset_name", "dataset_random_seed", "algorithm_env_name", "algorithm_name", "max_size_ok", "min_size_failed", "failure_status"],
+    )
+    df_limits[["max_size_ok", "min_size_failed"]] = df_limits[["max_size_ok", "min_size_failed"]].astype("Int64")
+
+    # Store the limits.
+    if filepath is not None:
+        df_limits.to_csv(filepath, sep=";", index=False)
+
+    # Return the limits.
+    return df_limits
+
+
+# ==============================================================================
+# SCALING - GET RUN STATUS
+# ==============================================================================
+def get_run_status(
+    env_path: str,
+) -> Optional[str]:
+    """
+    A method aimed at get the status of an experiment run.
+
+    Args:
+        env_path (str): The experiment environment path.
+
+    Returns:
+        Optional[str]: The status of the run (cf. `LIST_OF_STATUSES`), `"ok"` if the computation time is stored, or `None` if the experiment wasn't run.
+    """
+
+    # Case of a stored computation time.
+    if os.path.exists(env_path + "computation_time.json"):
+        return "ok"
+
+    # Case of a stored status.
+    if os.path.exists(env_path + "run_status.json"):
+        with open(env_path + "run_status.json", "r") as file_status:
+            return str(json.load(file_status)["status"])
+
+    # Case of an experiment not run.
+    return None
+
+
+# ==============================================================================
+# PRIVATE - BASE DATASETS
+# ==============================================================================
+def _load_base_dataset(
+    config_dataset: Dict[str, Any],
+    datasets_path: str,
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    A method aimed at load texts and labels of a base dataset (without duplicates).
+
+    Args:
+        config_dataset (Dict[str, Any]): The configuration of the dataset (file name, sheet name, and columns of texts and labels).
+        datasets_path (str): The path to base datasets files.
+
+    Returns:
+        Tuple[Dict[str, str], Dict[str, str]]: The texts and the labels of the base dataset.
+    """
+
+    # Load dataset.
+    df_dataset: pd.DataFrame = pd.read_excel(
+        io=datasets_path + config_dataset["file_name"],
+        sheet_name=config_dataset["sheet_name"],
+        engine="openpyxl",
+    )
+
+    # Drop duplicates.
+    df_dataset.drop_duplicates(inplace=True)
+
+    # Get `dict_of_texts` and `dict_of_true_intents`.
+    # > Force `str` type to avoid typing errors.
+    base_dict_of_texts: Dict[str, str] = {
+        str(data_id): str(value[config_dataset["columns"][0]])
+        for data_id, value in df_dataset.to_dict("index").items()
+    }
+    base_dict_of_true_intents: Dict[str, str] = {
+        str(data_id): str(value[config_dataset["columns"][1]])
+        for data_id, value in df_dataset.to_dict("index").items()
+    }
+
+    # Return the base dataset.
+    return (base_dict_of_texts, base_dict_of_true_intents)
+
+
+# ==============================================================================
+# PRIVATE - RUN STATUS
+# ==============================================================================
+def _get_dataset_size(
+    env_path: str,
+) -> int:
+    """
+    A method aimed at get the dataset size of an experiment environment.
+
+    Args:
+        env_path (str): The experiment environment path.
+
+    Returns:
+        int: The dataset size.
+    """
+
+    # Load configuration for datasets.
+    with open(env_path + "../config.json", "r") as file_config_dataset:
+        return int(json.load(file_config_dataset)["size"])
+
+
+def _get_failed_smaller_env_path(
+    env_path: str,
+) -> Optional[str]:
+    """
+    A method aimed at find the same experiment on a smaller dataset (same base dataset and random seed) that timed out or ran out of memory.
+
+    Args:
+        env_path (str): The experiment environment path.
+
+    Returns:
+        Optional[str]: The path of the failed experiment environment, or `None` if no smaller experiment failed.
+    """
+
+    # Load configuration for datasets.
+    with open(env_path + "../config.json", "r") as file_config_dataset:
+        config_dataset: Dict[str, Any] = json.load(file_config_dataset)
+
+    # Look at the same algorithm environment in other datasets of the task.
+    algorithm_env_name: str = env_path.split("/")[-2]
+    task_env_path: str = env_path + "../../"
+    for dataset_env_path in listing_envs.get_list_of_dataset_env_paths():
+        if os.path.abspath(dataset_env_path + "../") != os.path.abspath(task_env_path):
+            continue
+        if not os.path.exists(dataset_env_path + algorithm_env_name + "/run_status.json"):
+            continue
+        with open(dataset_env_path + "config.json", "r") as file_other_config_dataset:
+            other_config_dataset: Dict[str, Any] = json.load(file_other_config_dataset)
+        if (
+            other_config_dataset["dataset"] == config_dataset["dataset"]
+            and other_config_dataset["random_seed"] == config_dataset["random_seed"]
+            and other_config_dataset["size"] < config_dataset["size"]
+            and get_run_status(env_path=dataset_env_path + algorithm_env_name + "/") in {"timeout", "oom"}
+        ):
+            return dataset_env_path + algorithm_env_name + "/"
+
+    # No smaller experiment failed.
+    return None
+
+
+def _store_run_status(
+    env_path: str,
+    dict_of_status: Dict[str, Any],
+) -> None:
+    """
+    A method aimed at store the status of an experiment run.
+
+    Args:
+        env_path (str): The experiment environment path.
+        dict_of_status (Dict[str, Any]): The status of the run.
+    """
+
+    # Store the status.
+    with open(env_path + "run_status.json", "w") as file_status:
+        json.dump(dict_of_status, file_status, indent=4)
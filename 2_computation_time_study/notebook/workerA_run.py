@@ -16,8 +16,7 @@ import json
 import pickle  # noqa: S403
 import os
 import sys
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Optional
 from cognitivefactory.interactive_clustering.utils.preprocessing import (
     preprocess,
 )
@@ -30,14 +29,18 @@ from cognitivefactory.interactive_clustering.clustering.factory import (
 from cognitivefactory.interactive_clustering.constraints.abstract import (
     AbstractConstraintsManager,
 )
-from cognitivefactory.interactive_clustering.constraints.factory import (
-    managing_factory,
-)
 from cognitivefactory.interactive_clustering.sampling.factory import (
     sampling_factory,
 )
 from scipy.sparse import csr_matrix
 
+import benchmark
+import clustering_benchmark
+import constraints_benchmark
+import cost_model
+import fixture_cache
+import sampling_benchmark
+
 
 # ==============================================================================
 # WORKER - EXPERIMENT RUN
@@ -47,15 +50,21 @@ def experiment_run(
 ) -> int:
     """
     A worker to estimate the interactive clustering computation time.
-    Several task can be evaluate: preprocessing, vectorization, sampling and clustering.
+    Several task can be evaluate: preprocessing, vectorization, sampling, clustering and constraints management (cf. `constraints_benchmark`).
     During each experiment, only one task is evaluate, but several can be run in order to get the needed data (ex: performing data preprocessing, data vectorization and constraints modelization before performing constrained clustering).
     Usage note:
         - Parameters have to contain the path experiment to run. A dictionary is needed to get parameters in `multiprocessing.Pool.imap_unordered` call.
         - The path to the environment has to be formatted by the notebook `1_Initialize_computation_time_experiments.ipynb`.
         - The notebook `2_Estimate_computation_time.ipynb` launch this script for all defined experiment environments with the librairy `multiprocessing`.
+        - Data needed before the evaluated task (preprocessed texts, vectors, previous constraints, previous clustering) are built once and shared by all experiments that need them (cf. `fixture_cache`).
+        - The evaluated task is measured with warm-up runs and several timed runs (cf. `benchmark.run_benchmark`): the timing file keeps all samples, their statistics and the environment metadata, and its `"total"` is the median time.
+        - If cost models are stored (cf. `cost_model`), the timing file also keeps the predicted time and flags anomalously slow tasks (`"prediction"`).
+        - For sampling, the timing file also keeps the computation time of each phase of the sampler (`"phases"`), measured in instrumented runs added after timed runs (cf. `sampling_benchmark.measure_phases`).
+        - For iterative clustering (kmeans, mpckmeans, affinity propagation), the timing file also keeps the number of iterations until convergence (`"convergence"`), got in an additional run (cf. `clustering_benchmark.measure_convergence`).
+        - The timing file keeps the system load around timed runs. In isolated timing workers (cf. `benchmark.init_isolated_worker`), measurements taken under excessive interference are run again (cf. `benchmark.run_guarded_benchmark`).
 
     Args:
-        parameters (Dict[str, Any]): A dictionary that contains several parameters. Several keys are expected in this dictionary: the experiment environment path (`"ENV_PATH"`), the task to evaluate (`"_TASK"`) and many settings dependening on evaluated task.
+        parameters (Dict[str, Any]): A dictionary that contains several parameters. Several keys are expected in this dictionary: the experiment environment path (`"ENV_PATH"`), the task to evaluate (`"_TASK"`) and many settings dependening on evaluated task. Optional keys set the number of untimed runs (`"NB_WARMUPS"`), of timed runs (`"NB_REPETITIONS"`), of measurements run again under excessive interference (`"MAX_RERUNS"`, defaults to `benchmark.DEFAULT_MAX_RERUNS` in isolated timing workers, `0` otherwise), the option to reuse data needed before the measured task (`"WITH_FIXTURES"`, cf. `fixture_cache`), the option to get iterations of iterative clustering until convergence (`"WITH_CONVERGENCE"`, defaults to `True`), and the number of instrumented runs of sampling phases (`"NB_PHASE_REPETITIONS"`, defaults to `sampling_benchmark.DEFAULT_NB_PHASE_REPETITIONS`, `0` to skip them).
 
     Returns:
         int: Return `0` when finish.
@@ -63,6 +72,12 @@ def experiment_run(
 
     # Parameters.
     ENV_PATH: str = str(parameters["ENV_PATH"])
+    NB_WARMUPS: int = int(parameters.get("NB_WARMUPS", benchmark.DEFAULT_NB_WARMUPS))
+    NB_REPETITIONS: int = int(parameters.get("NB_REPETITIONS", benchmark.DEFAULT_NB_REPETITIONS))
+    MAX_RERUNS: int = int(parameters.get("MAX_RERUNS", benchmark.DEFAULT_MAX_RERUNS if benchmark.get_isolated_core() is not None else 0))
+    WITH_FIXTURES: bool = bool(parameters.get("WITH_FIXTURES", True))
+    WITH_CONVERGENCE: bool = bool(parameters.get("WITH_CONVERGENCE", True))
+    NB_PHASE_REPETITIONS: int = int(parameters.get("NB_PHASE_REPETITIONS", sampling_benchmark.DEFAULT_NB_PHASE_REPETITIONS))
         
     # If experiment was already run: skip.
     if "computation_time.json" in os.listdir(ENV_PATH):
@@ -80,131 +95,128 @@ def experiment_run(
     ) as file_config_algorithm:
         CONFIG_ALGORITHM = json.load(file_config_algorithm)
 
-    ### ### ### ### ###
-    ### Load needed data.
-    ### ### ### ### ###
-
-    # Load dict of true intents.
-    with open(
-        ENV_PATH + "../dict_of_texts.json", "r"
-    ) as file_texts:
-        dict_of_texts: Dict[str, str] = json.load(file_texts)
-
-    # Load dict of true intents.
-    with open(
-        ENV_PATH + "../dict_of_true_intents.json", "r"
-    ) as file_true_intents:
-        dict_of_true_intents: Dict[str, str] = json.load(file_true_intents)
-            
-    # Define list of data IDs.
-    list_of_data_IDs: List[str] = list(dict_of_texts.keys())
-
-    ### ### ### ### ###
-    ### Initialize time counter.
-    ### ### ### ### ###
-    
-    time_start: float = 0.0
-    time_stop: float = 0.0
-    time_total: float = 0.0
-            
     ### ### ### ### ###
     ### Data preprocessing
     ### ### ### ### ###
     
-    # Preprocess.
-    time_start = datetime.timestamp(datetime.now())
-    dict_of_preprocessed_texts: Dict[str, str] = preprocess(
-        dict_of_texts=dict_of_texts,
-        apply_lemmatization=bool(CONFIG_ALGORITHM["preprocessing"]["apply_lemmatization"]),
-        apply_parsing_filter=bool(CONFIG_ALGORITHM["preprocessing"]["apply_parsing_filter"]),
-        spacy_language_model=str(CONFIG_ALGORITHM["preprocessing"]["spacy_language_model"]),
-    )
-    time_stop = datetime.timestamp(datetime.now())
-    
-    # If _TASK == "preprocessing": store computation time and exit.
+    # If _TASK == "preprocessing": measure and store computation time and exit.
     if CONFIG_ALGORITHM["_TASK"] == "preprocessing":
-        with open(ENV_PATH + "computation_time.json", "w") as file_time_preprocessing:
-            json.dump(
-                {
-                    "start": time_start,
-                    "stop": time_stop,
-                    "total": (time_stop - time_start),
-                },
-                file_time_preprocessing,
-            )
+
+        # Load dict of texts.
+        with open(
+            ENV_PATH + "../dict_of_texts.json", "r"
+        ) as file_texts:
+            dict_of_texts: Dict[str, str] = json.load(file_texts)
+
+        # Measure and store computation time of preprocessing.
+        _store_measurement(
+            env_path=ENV_PATH,
+            config_algorithm=CONFIG_ALGORITHM,
+            dict_of_measurement=benchmark.run_guarded_benchmark(
+                task=lambda: preprocess(
+                    dict_of_texts=dict_of_texts,
+                    apply_lemmatization=bool(CONFIG_ALGORITHM["preprocessing"]["apply_lemmatization"]),
+                    apply_parsing_filter=bool(CONFIG_ALGORITHM["preprocessing"]["apply_parsing_filter"]),
+                    spacy_language_model=str(CONFIG_ALGORITHM["preprocessing"]["spacy_language_model"]),
+                ),
+                nb_warmups=NB_WARMUPS,
+                nb_repetitions=NB_REPETITIONS,
+                max_reruns=MAX_RERUNS,
+            ),
+        )
         return 0
             
     ### ### ### ### ###
     ### Data vectorization
     ### ### ### ### ###
     
-    # Vectorize.
-    time_start = datetime.timestamp(datetime.now())
-    dict_of_vectors: Dict[str, csr_matrix] = vectorize(
-        dict_of_texts=dict_of_preprocessed_texts,
-        vectorizer_type=str(CONFIG_ALGORITHM["vectorization"]["vectorizer_type"]),
-        spacy_language_model=str(CONFIG_ALGORITHM["vectorization"]["spacy_language_model"]),
-    )
-    time_stop = datetime.timestamp(datetime.now())
-    
-    # If _TASK == "vectorization": store computation time and exit.
+    # If _TASK == "vectorization": measure and store computation time and exit.
     if CONFIG_ALGORITHM["_TASK"] == "vectorization":
-        with open(ENV_PATH + "computation_time.json", "w") as file_time_vectorization:
-            json.dump(
-                {
-                    "start": time_start,
-                    "stop": time_stop,
-                    "total": (time_stop - time_start),
-                },
-                file_time_vectorization,
-            )
+
+        # Get preprocessed texts (built once for all tasks that need them).
+        dict_of_preprocessed_texts: Dict[str, str] = fixture_cache.get_preprocessed_texts(
+            env_path=ENV_PATH,
+            config_algorithm=CONFIG_ALGORITHM,
+            with_cache=WITH_FIXTURES,
+        )
+
+        # Measure and store computation time of vectorization.
+        _store_measurement(
+            env_path=ENV_PATH,
+            config_algorithm=CONFIG_ALGORITHM,
+            dict_of_measurement=benchmark.run_guarded_benchmark(
+                task=lambda: vectorize(
+                    dict_of_texts=dict_of_preprocessed_texts,
+                    vectorizer_type=str(CONFIG_ALGORITHM["vectorization"]["vectorizer_type"]),
+                    spacy_language_model=str(CONFIG_ALGORITHM["vectorization"]["spacy_language_model"]),
+                ),
+                nb_warmups=NB_WARMUPS,
+                nb_repetitions=NB_REPETITIONS,
+                max_reruns=MAX_RERUNS,
+            ),
+        )
         return 0
-    
 
     ### ### ### ### ###
-    ### Generate needed data.
+    ### Constraints management
+    ### ### ### ### ###
+
+    # If _TASK == "constraints": measure and store computation time of a constraints manager operation and exit.
+    if CONFIG_ALGORITHM["_TASK"] == "constraints":
+
+        # Load dict of true intents.
+        with open(
+            ENV_PATH + "../dict_of_true_intents.json", "r"
+        ) as file_true_intents:
+            dict_of_true_intents: Dict[str, str] = json.load(file_true_intents)
+
+        # Get the operation to measure and its preparation (cf. `constraints_benchmark.get_operation`).
+        operation, operation_setup = constraints_benchmark.get_operation(
+            config_algorithm=CONFIG_ALGORITHM,
+            dict_of_true_intents=dict_of_true_intents,
+        )
+
+        # Measure and store computation time of the operation.
+        _store_measurement(
+            env_path=ENV_PATH,
+            config_algorithm=CONFIG_ALGORITHM,
+            dict_of_measurement=benchmark.run_guarded_benchmark(
+                task=operation,
+                setup=operation_setup,
+                nb_warmups=NB_WARMUPS,
+                nb_repetitions=NB_REPETITIONS,
+                max_reruns=MAX_RERUNS,
+            ),
+        )
+        return 0
+
+    ### ### ### ### ###
+    ### Get needed data.
     ### ### ### ### ###
     
-    # Initialize constraints manager.
-    constraints_manager: AbstractConstraintsManager = managing_factory(
-        manager="binary",
-        list_of_data_IDs=list_of_data_IDs,
+    # Get vectors (built once for all tasks that need them).
+    dict_of_vectors: Dict[str, csr_matrix] = fixture_cache.get_vectors(
+        env_path=ENV_PATH,
+        config_algorithm=CONFIG_ALGORITHM,
+        with_cache=WITH_FIXTURES,
     )
-        
-    # Generate previous constraints.
-    list_of_previous_constraints: List[Tuple[str, str]] = sampling_factory(
-        algorithm="random",
-        random_seed=CONFIG_ALGORITHM["random_seed"],
-    ).sample(
-        constraints_manager=constraints_manager,
-        nb_to_select=CONFIG_ALGORITHM["previous"]["constraints"],
+
+    # Get constraints manager with previous constraints (built once for all tasks with the same dataset, random seed and number of previous constraints).
+    constraints_manager: AbstractConstraintsManager = fixture_cache.get_previous_constraints_manager(
+        env_path=ENV_PATH,
+        config_algorithm=CONFIG_ALGORITHM,
+        with_cache=WITH_FIXTURES,
     )
-        
-    # Add constraint to the constraints manager (according to the groundtruth for this experiment).
-    for constraint in list_of_previous_constraints:
-        data_ID1: str = constraint[0]
-        data_ID2: str = constraint[1]
-        constraints_manager.add_constraint(
-            data_ID1=data_ID1,
-            data_ID2=data_ID2,
-            constraint_type=(
-                "MUST_LINK"
-                if dict_of_true_intents[data_ID1] == dict_of_true_intents[data_ID2]
-                else "CANNOT_LINK"
-            ),
-        )
-        
-    # Generate previous clustering.
+
+    # Get previous clustering (built once for all tasks with the same vectors, previous constraints and number of previous clusters).
     dict_of_previous_clusters: Dict[str, int] = {}
     if CONFIG_ALGORITHM["_TASK"] == "sampling":
-        dict_of_previous_clusters = clustering_factory(
-            algorithm="kmeans",
-            random_seed=CONFIG_ALGORITHM["random_seed"],
-            max_iteration=10,
-        ).cluster(
-            vectors=dict_of_vectors,
-            nb_clusters=CONFIG_ALGORITHM["previous"]["clustering"],
+        dict_of_previous_clusters = fixture_cache.get_previous_clustering(
+            env_path=ENV_PATH,
+            config_algorithm=CONFIG_ALGORITHM,
+            dict_of_vectors=dict_of_vectors,
             constraints_manager=constraints_manager,
+            with_cache=WITH_FIXTURES,
         )
 
             
@@ -215,29 +227,43 @@ def experiment_run(
     # If _TASK == "sampling":
     if CONFIG_ALGORITHM["_TASK"] == "sampling":
 
-        # Sampling.
-        time_start = datetime.timestamp(datetime.now())
-        sampling_factory(
-            algorithm=CONFIG_ALGORITHM["sampling"]["algorithm"],
-            random_seed=CONFIG_ALGORITHM["random_seed"],
-        ).sample(
-            constraints_manager=constraints_manager,
-            nb_to_select=CONFIG_ALGORITHM["sampling"]["nb_to_select"],
-            clustering_result=dict_of_previous_clusters,
-            vectors=dict_of_vectors,
+        # Measure computation time of sampling.
+        dict_of_sampling_measurement: Dict[str, Any] = benchmark.run_guarded_benchmark(
+            task=lambda: sampling_factory(
+                algorithm=CONFIG_ALGORITHM["sampling"]["algorithm"],
+                random_seed=CONFIG_ALGORITHM["random_seed"],
+            ).sample(
+                constraints_manager=constraints_manager,
+                nb_to_select=CONFIG_ALGORITHM["sampling"]["nb_to_select"],
+                clustering_result=dict_of_previous_clusters,
+                vectors=dict_of_vectors,
+            ),
+            nb_warmups=NB_WARMUPS,
+            nb_repetitions=NB_REPETITIONS,
+            max_reruns=MAX_RERUNS,
         )
-        time_stop = datetime.timestamp(datetime.now())
-    
-        # Store computation time and exit.
-        with open(ENV_PATH + "computation_time.json", "w") as file_time_sampling:
-            json.dump(
-                {
-                    "start": time_start,
-                    "stop": time_stop,
-                    "total": (time_stop - time_start),
-                },
-                file_time_sampling,
+
+        # Measure computation time of each phase of sampling in additional instrumented runs (cf. `sampling_benchmark.measure_phases`).
+        dict_of_sampling_measurement["phases"] = None
+        if NB_PHASE_REPETITIONS > 0:
+            dict_of_sampling_measurement["phases"] = sampling_benchmark.measure_phases(
+                create_sampler=lambda: sampling_factory(
+                    algorithm=CONFIG_ALGORITHM["sampling"]["algorithm"],
+                    random_seed=CONFIG_ALGORITHM["random_seed"],
+                ),
+                constraints_manager=constraints_manager,
+                nb_to_select=CONFIG_ALGORITHM["sampling"]["nb_to_select"],
+                clustering_result=dict_of_previous_clusters,
+                vectors=dict_of_vectors,
+                nb_repetitions=NB_PHASE_REPETITIONS,
             )
+
+        # Store computation time of sampling, and exit.
+        _store_measurement(
+            env_path=ENV_PATH,
+            config_algorithm=CONFIG_ALGORITHM,
+            dict_of_measurement=dict_of_sampling_measurement,
+        )
         return 0
             
     ### ### ### ### ###
@@ -247,30 +273,79 @@ def experiment_run(
     # If _TASK == "clustering":
     if CONFIG_ALGORITHM["_TASK"] == "clustering":
     
-        # Clustering.
-        time_start = datetime.timestamp(datetime.now())
-        clustering_factory(
-            algorithm=CONFIG_ALGORITHM["clustering"]["algorithm"],
-            random_seed=CONFIG_ALGORITHM["random_seed"],
-            **CONFIG_ALGORITHM["clustering"]["init**kargs"],
-        ).cluster(
-            vectors=dict_of_vectors,
-            nb_clusters=CONFIG_ALGORITHM["clustering"]["nb_clusters"],
-            constraints_manager=constraints_manager,
+        # Measure computation time of clustering.
+        dict_of_clustering_measurement: Dict[str, Any] = benchmark.run_guarded_benchmark(
+            task=lambda: clustering_factory(
+                algorithm=CONFIG_ALGORITHM["clustering"]["algorithm"],
+                random_seed=CONFIG_ALGORITHM["random_seed"],
+                **CONFIG_ALGORITHM["clustering"]["init**kargs"],
+            ).cluster(
+                vectors=dict_of_vectors,
+                nb_clusters=CONFIG_ALGORITHM["clustering"]["nb_clusters"],
+                constraints_manager=constraints_manager,
+            ),
+            nb_warmups=NB_WARMUPS,
+            nb_repetitions=NB_REPETITIONS,
+            max_reruns=MAX_RERUNS,
         )
-        time_stop = datetime.timestamp(datetime.now())
-    
-        # Store computation time and exit.
-        with open(ENV_PATH + "computation_time.json", "w") as file_time_clustering:
-            json.dump(
-                {
-                    "start": time_start,
-                    "stop": time_stop,
-                    "total": (time_stop - time_start),
-                },
-                file_time_clustering,
+
+        # Get iterations of iterative clustering until convergence in an additional run (cf. `clustering_benchmark.measure_convergence`).
+        dict_of_clustering_measurement["convergence"] = None
+        if WITH_CONVERGENCE:
+            dict_of_clustering_measurement["convergence"] = clustering_benchmark.measure_convergence(
+                create_clustering_model=lambda: clustering_factory(
+                    algorithm=CONFIG_ALGORITHM["clustering"]["algorithm"],
+                    random_seed=CONFIG_ALGORITHM["random_seed"],
+                    **CONFIG_ALGORITHM["clustering"]["init**kargs"],
+                ),
+                constraints_manager=constraints_manager,
+                vectors=dict_of_vectors,
+                nb_clusters=CONFIG_ALGORITHM["clustering"]["nb_clusters"],
             )
+
+        # Store computation time of clustering, and exit.
+        _store_measurement(
+            env_path=ENV_PATH,
+            config_algorithm=CONFIG_ALGORITHM,
+            dict_of_measurement=dict_of_clustering_measurement,
+        )
         return 0
    
     # End of script.
-    return 0
\ No newline at end of file
+    return 0
+
+
+# ==============================================================================
+# PRIVATE - STORE MEASUREMENT
+# ==============================================================================
+def _store_measurement(
+    env_path: str,
+    config_algorithm: Dict[str, Any],
+    dict_of_measurement: Dict[str, Any],
+) -> None:
+    """
+    A method aimed at store the measurement of a task, with its predicted time if cost models are stored (models are not fitted again by workers).
+
+    Args:
+        env_path (str): The experiment environment path.
+        config_algorithm (Dict[str, Any]): The configuration of the algorithm environment.
+        dict_of_measurement (Dict[str, Any]): The measurement (cf. `benchmark.run_guarded_benchmark`).
+    """
+
+    # Compare the measured time with its prediction (cf. `cost_model.check_anomaly`).
+    cost_models: Optional[Dict[str, Any]] = cost_model.load_cost_models(with_refit=False)
+    dict_of_measurement["prediction"] = None
+    if cost_models is not None:
+        with open(env_path + "../config.json", "r") as file_config_dataset:
+            config_dataset: Dict[str, Any] = json.load(file_config_dataset)
+        dict_of_measurement["prediction"] = cost_model.check_anomaly(
+            config=cost_model.get_factors(config_algorithm=config_algorithm, config_dataset=config_dataset),
+            measured_time=dict_of_measurement["total"],
+            cost_models=cost_models,
+        )
+
+    # Store the measurement.
+    benchmark.store_benchmark(
+        filepath=env_path + "computation_time.json",
+        dict_of_measurement=dict_of_measurement,
+    )
\ No newline at end of file
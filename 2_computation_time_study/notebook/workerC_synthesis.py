@@ -13,9 +13,65 @@
 # ==============================================================================
 
 import json
-import pandas as pd
 
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pyarrow as pa
+
+import benchmark
+import constraints_benchmark
+import sampling_benchmark
+import synthesis_writer
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Files used to synthesize an experiment (to detect changes since the previous synthesis).
+LIST_OF_INPUT_FILES: List[str] = [
+    "config.json",
+    "../config.json",
+    "computation_time.json",
+]
+
+# Types of columns in typed synthesis files (Parquet, Feather).
+SYNTHESIS_SCHEMA: pa.Schema = pa.schema(
+    [
+        pa.field("dataset_name", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("dataset_size", pa.int32()),
+        pa.field("dataset_random_seed", pa.int32()),
+        pa.field("previous_nb_constraints", pa.int32()),
+        pa.field("previous_nb_clusters", pa.int32()),
+        pa.field("algorithm_name", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("algorithm_random_seed", pa.int32()),
+        pa.field("algorithm_nb_to_select", pa.int32()),
+        pa.field("algorithm_nb_clusters", pa.int32()),
+        pa.field("time_start", pa.float64()),
+        pa.field("time_stop", pa.float64()),
+        pa.field("time_total", pa.float64()),
+        pa.field("time_min", pa.float64()),
+        pa.field("time_q1", pa.float64()),
+        pa.field("time_q3", pa.float64()),
+        pa.field("time_iqr", pa.float64()),
+        pa.field("time_cpu_median", pa.float64()),
+        pa.field("time_nb_repetitions", pa.int32()),
+        pa.field("time_nb_outliers", pa.int32()),
+        pa.field("time_nb_reruns", pa.int32()),
+        pa.field("time_is_interfered", pa.int32()),
+        pa.field("load_before", pa.float64()),
+        pa.field("load_after", pa.float64()),
+        pa.field("load_cpu_ratio", pa.float64()),
+        pa.field("memory_peak_rss", pa.int64()),
+        pa.field("memory_peak_rss_increase", pa.int64()),
+        pa.field("memory_tracemalloc_peak", pa.int64()),
+        pa.field("memory_largest_numpy_buffer", pa.int64()),
+        *[pa.field("phase_" + phase, pa.float64()) for phase in sampling_benchmark.LIST_OF_PHASES],
+        pa.field("phase_nb_candidates", pa.int64()),
+        pa.field("clustering_nb_iterations", pa.int32()),
+        pa.field("clustering_is_converged", pa.int32()),
+    ]
+)
 
 
 # ==============================================================================
@@ -23,123 +79,211 @@ from typing import Dict, List, Optional, Tuple, Union
 # ==============================================================================
 def experiments_synthesis(
     list_of_experiment_environments: List[str],
+    nb_workers: int = 1,
+    batch_size: int = 100,
+    with_manifest: bool = True,
+    list_of_formats: Optional[List[str]] = None,
 ) -> int:
     """
     A method aimed at synthesize performance of all experiments in a csv file.
+    Experiments that can't be synthesized are reported in `../results/experiments_synthesis_report.json` instead of stopping the synthesis.
+    Results are stored in the legacy CSV format and in typed formats (cf. `synthesis_writer.load_synthesis` to load them).
 
     Args:
         list_of_experiment_environments (List[str]): The list of experiments environments used to synthesize results.
+        nb_workers (int, optional): The number of processes used to synthesize experiments. Defaults to `1`.
+        batch_size (int, optional): The number of experiments handled by a process at once. Defaults to `100`.
+        with_manifest (bool, optional): The option to synthesize again only experiments whose files changed since the previous synthesis. Defaults to `True`.
+        list_of_formats (Optional[List[str]], optional): The output formats (`"csv"`, `"parquet"`, `"feather"`). Defaults to `None` (`synthesis_writer.DEFAULT_LIST_OF_FORMATS`).
 
     Returns:
         int: Return `0` when finish.
     """
 
-    # Initialize dictionary of synthesis.
-    dict_of_experiments_synthesis: Dict[
-        str, Dict[
-            str, Dict[
-                str, Union[str, float, int, None]
-            ]
-        ]
-    ] = {}
-
-    # For each experiment environment...
-    for env_path in list_of_experiment_environments:
-
-        ### ### ### ### ###
-        ### Load files.
-        ### ### ### ### ###
-        
-        # Load configuration for tasks.
-        with open(
-            env_path + "config.json", "r"
-        ) as file_config_task:
-            CONFIG_TASK = json.load(file_config_task)
-        
-        # Load configuration for datasets.
-        with open(
-            env_path + "../config.json", "r"
-        ) as file_config_dataset:
-            CONFIG_DATASET = json.load(file_config_dataset)
-        
-        # Load configuration for algorithms.
-        with open(
-            env_path + "config.json", "r"
-        ) as file_config_algorithm:
-            CONFIG_ALGORITHM = json.load(file_config_algorithm)
-        
-        # Load computation time.
-        with open(
-            env_path + "computation_time.json", "r"
-        ) as file_computation_time:
-            COMPUTATION_TIME = json.load(file_computation_time)
-
-        ### ### ### ### ###
-        ### Initialize.
-        ### ### ### ### ###
-        
-        # Get the task.
-        task: str = CONFIG_ALGORITHM["_TASK"]
-
-        # Initialize dictionary of synthesis for this experiment.
-        if task not in dict_of_experiments_synthesis.keys():
-            dict_of_experiments_synthesis[task] = {}
-        dict_of_experiments_synthesis[task][env_path] = {}
-
-        # NB : environments paths are formatted links : `../experiments/[TASK]/[DATASET]/[ALGORITHM]`
-
-        ### ### ### ### ###
-        ### Store needeed data.
-        ### ### ### ### ###
-        
-        # dataset - name
-        dict_of_experiments_synthesis[task][env_path]["dataset_name"] = CONFIG_DATASET["dataset"]
-        # dataset - size
-        dict_of_experiments_synthesis[task][env_path]["dataset_size"] = CONFIG_DATASET["size"]
-        # dataset - random_seed
-        dict_of_experiments_synthesis[task][env_path]["dataset_random_seed"] = CONFIG_DATASET["random_seed"]
-        
-        # previous - nb_constraints
-        if task in {"sampling", "clustering"}:
-            dict_of_experiments_synthesis[task][env_path]["previous_nb_constraints"] = CONFIG_ALGORITHM["previous"]["constraints"]
-        # previous - nb_clusters
-        if task == "sampling":
-            dict_of_experiments_synthesis[task][env_path]["previous_nb_clusters"] = CONFIG_ALGORITHM["previous"]["clustering"]
-        
-        # algorithm - name
-        dict_of_experiments_synthesis[task][env_path]["algorithm_name"] = CONFIG_ALGORITHM["_ALGORITHM"]
-        # algorithm - random_seed
-        dict_of_experiments_synthesis[task][env_path]["algorithm_random_seed"] = CONFIG_ALGORITHM["random_seed"]
-        # algorithm - nb_to_select
-        if task == "sampling":
-            dict_of_experiments_synthesis[task][env_path]["algorithm_nb_to_select"] = CONFIG_ALGORITHM["sampling"]["nb_to_select"]
-        # algorithm - nb_clusters
-        if task == "clustering":
-            dict_of_experiments_synthesis[task][env_path]["algorithm_nb_clusters"] = CONFIG_ALGORITHM["clustering"]["nb_clusters"]
-        
-        # time - start
-        dict_of_experiments_synthesis[task][env_path]["time_start"] = str(COMPUTATION_TIME["start"]).replace(".", ",")
-        # time - stop
-        dict_of_experiments_synthesis[task][env_path]["time_stop"] = str(COMPUTATION_TIME["stop"]).replace(".", ",")
-        # time - total
-        dict_of_experiments_synthesis[task][env_path]["time_total"] = str(COMPUTATION_TIME["total"]).replace(".", ",")
+    # Synthesize experiments and store files.
+    synthesis_writer.write_synthesis(
+        list_of_experiment_environments=list_of_experiment_environments,
+        synthesize_experiment=_synthesize_experiment,
+        list_of_input_files=LIST_OF_INPUT_FILES,
+        output_path_pattern="../results/experiments_synthesis_for_{output}",
+        schema=SYNTHESIS_SCHEMA,
+        list_of_formats=list_of_formats,
+        csv_decimal=",",
+        nb_workers=nb_workers,
+        batch_size=batch_size,
+        manifest_path="../results/.experiments_synthesis_manifest.json" if with_manifest else None,
+        report_path="../results/experiments_synthesis_report.json",
+    )
+
+    # End of script.
+    return 0
+
+
+# ==============================================================================
+# PRIVATE - EXPERIMENT SYNTHESIS
+# ==============================================================================
+def _synthesize_experiment(
+    env_path: str,
+) -> Tuple[Optional[str], Dict[str, Union[str, float, int, None]]]:
+    """
+    A method aimed at synthesize performance of an experiment (run in a process of the pool).
+
+    Args:
+        env_path (str): The experiment environment path.
+
+    Returns:
+        Tuple[Optional[str], Dict[str, Union[str, float, int, None]]]: The output name (the task, one file per task), and the synthesis of the experiment.
+    """
 
     ### ### ### ### ###
-    ### Store file.
+    ### Load files.
     ### ### ### ### ###
 
-    # Define file path.
-    filepath: str = "../results/experiments_synthesis_for_{task}.csv"
-
-    # Define dataframe and store it to a CSV file.
-    for task_evaluated in dict_of_experiments_synthesis.keys():
-        pd.DataFrame.from_dict(
-            data=dict_of_experiments_synthesis[task_evaluated],
-            orient="index",
-        ).to_csv(
-            path_or_buf=filepath.format(task=task_evaluated),
-            sep=";",
+    # Load configuration for tasks.
+    with open(
+        env_path + "config.json", "r"
+    ) as file_config_task:
+        CONFIG_TASK = json.load(file_config_task)
+
+    # Load configuration for datasets.
+    with open(
+        env_path + "../config.json", "r"
+    ) as file_config_dataset:
+        CONFIG_DATASET = json.load(file_config_dataset)
+
+    # Load configuration for algorithms.
+    with open(
+        env_path + "config.json", "r"
+    ) as file_config_algorithm:
+        CONFIG_ALGORITHM = json.load(file_config_algorithm)
+
+    # Load computation time.
+    with open(
+        env_path + "computation_time.json", "r"
+    ) as file_computation_time:
+        COMPUTATION_TIME = json.load(file_computation_time)
+
+    ### ### ### ### ###
+    ### Initialize.
+    ### ### ### ### ###
+
+    # Get the task.
+    task: str = CONFIG_ALGORITHM["_TASK"]
+
+    # Initialize dictionary of synthesis for this experiment.
+    dict_of_experiment_synthesis: Dict[str, Union[str, float, int, None]] = {}
+
+    # NB : environments paths are formatted links : `../experiments/[TASK]/[DATASET]/[ALGORITHM]`
+
+    ### ### ### ### ###
+    ### Store needeed data.
+    ### ### ### ### ###
+
+    # dataset - name
+    dict_of_experiment_synthesis["dataset_name"] = CONFIG_DATASET["dataset"]
+    # dataset - size
+    dict_of_experiment_synthesis["dataset_size"] = CONFIG_DATASET["size"]
+    # dataset - random_seed
+    dict_of_experiment_synthesis["dataset_random_seed"] = CONFIG_DATASET["random_seed"]
+
+    # previous - nb_constraints
+    if task in {"sampling", "clustering"}:
+        dict_of_experiment_synthesis["previous_nb_constraints"] = CONFIG_ALGORITHM["previous"]["constraints"]
+    if task == "constraints":
+        dict_of_experiment_synthesis["previous_nb_constraints"] = constraints_benchmark.get_nb_constraints(
+            config_algorithm=CONFIG_ALGORITHM,
+            dataset_size=CONFIG_DATASET["size"],
         )
+    # previous - nb_clusters
+    if task == "sampling":
+        dict_of_experiment_synthesis["previous_nb_clusters"] = CONFIG_ALGORITHM["previous"]["clustering"]
 
-    # End of script.
-    return 0
+    # algorithm - name
+    dict_of_experiment_synthesis["algorithm_name"] = CONFIG_ALGORITHM["_ALGORITHM"]
+    # algorithm - random_seed
+    dict_of_experiment_synthesis["algorithm_random_seed"] = CONFIG_ALGORITHM["random_seed"]
+    # algorithm - nb_to_select
+    if task == "sampling":
+        dict_of_experiment_synthesis["algorithm_nb_to_select"] = CONFIG_ALGORITHM["sampling"]["nb_to_select"]
+    # algorithm - nb_clusters
+    if task == "clustering":
+        dict_of_experiment_synthesis["algorithm_nb_clusters"] = CONFIG_ALGORITHM["clustering"]["nb_clusters"]
+
+    # time - start
+    dict_of_experiment_synthesis["time_start"] = COMPUTATION_TIME["start"]
+    # time - stop
+    dict_of_experiment_synthesis["time_stop"] = COMPUTATION_TIME["stop"]
+    # time - total (median of timed runs)
+    dict_of_experiment_synthesis["time_total"] = COMPUTATION_TIME["total"]
+
+    # NB : timing files written before `benchmark` have only one sample.
+    statistics: benchmark.BenchmarkStatistics = COMPUTATION_TIME.get(
+        "statistics",
+        benchmark.compute_statistics(list_of_samples=[COMPUTATION_TIME["total"]]),
+    )
+    # time - min
+    dict_of_experiment_synthesis["time_min"] = statistics["min"]
+    # time - quartiles
+    dict_of_experiment_synthesis["time_q1"] = statistics["q1"]
+    dict_of_experiment_synthesis["time_q3"] = statistics["q3"]
+    dict_of_experiment_synthesis["time_iqr"] = statistics["iqr"]
+    # time - cpu median
+    dict_of_experiment_synthesis["time_cpu_median"] = (
+        float(np.median(COMPUTATION_TIME["cpu_samples"]))
+        if "cpu_samples" in COMPUTATION_TIME.keys()
+        else None
+    )
+    # time - nb_repetitions
+    dict_of_experiment_synthesis["time_nb_repetitions"] = statistics["nb_samples"]
+    # time - nb_outliers
+    dict_of_experiment_synthesis["time_nb_outliers"] = len(statistics["outliers"])
+
+    # NB : interference and load are missing in timing files written before isolation of timing workers.
+    interference: Dict[str, Any] = COMPUTATION_TIME.get("interference") or {}
+    load: Dict[str, Any] = COMPUTATION_TIME.get("load") or {}
+    # time - nb_reruns
+    dict_of_experiment_synthesis["time_nb_reruns"] = interference.get("nb_reruns")
+    # time - is_interfered
+    dict_of_experiment_synthesis["time_is_interfered"] = (
+        int(bool(interference["reasons"]))
+        if "reasons" in interference.keys()
+        else None
+    )
+    # load - before and after (1-minute load average)
+    dict_of_experiment_synthesis["load_before"] = (load.get("before") or [None])[0]
+    dict_of_experiment_synthesis["load_after"] = (load.get("after") or [None])[0]
+    # load - cpu_ratio
+    dict_of_experiment_synthesis["load_cpu_ratio"] = load.get("cpu_ratio")
+
+    # NB : memory is in bytes, and is missing in timing files written before memory measurement.
+    memory: Dict[str, Optional[int]] = COMPUTATION_TIME.get("memory") or {}
+    # memory - peak_rss
+    dict_of_experiment_synthesis["memory_peak_rss"] = memory.get("peak_rss")
+    # memory - peak_rss_increase
+    dict_of_experiment_synthesis["memory_peak_rss_increase"] = memory.get("peak_rss_increase")
+    # memory - tracemalloc_peak
+    dict_of_experiment_synthesis["memory_tracemalloc_peak"] = memory.get("tracemalloc_peak")
+    # memory - largest_numpy_buffer
+    dict_of_experiment_synthesis["memory_largest_numpy_buffer"] = memory.get("largest_numpy_buffer")
+
+    # NB : phases are only measured for sampling, and are missing in timing files written before their measurement.
+    phases: Dict[str, Any] = COMPUTATION_TIME.get("phases") or {}
+    # phase - median time of each phase
+    for phase in sampling_benchmark.LIST_OF_PHASES:
+        dict_of_experiment_synthesis["phase_" + phase] = (phases.get("median") or {}).get(phase)
+    # phase - nb_candidates
+    dict_of_experiment_synthesis["phase_nb_candidates"] = phases.get("nb_candidates")
+
+    # NB : convergence is only got for iterative clustering, and is missing in timing files written before its measurement.
+    convergence: Dict[str, Any] = COMPUTATION_TIME.get("convergence") or {}
+    # clustering - nb_iterations
+    dict_of_experiment_synthesis["clustering_nb_iterations"] = convergence.get("nb_iterations")
+    # clustering - is_converged
+    dict_of_experiment_synthesis["clustering_is_converged"] = (
+        int(convergence["is_converged"])
+        if convergence.get("is_converged") is not None
+        else None
+    )
+
+    # Return synthesis.
+    return (task, dict_of_experiment_synthesis)
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         completeness_tracker
+* Description:  Track the annotation completeness of constraints with a union-find structure.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+from typing import Dict, List, Set
+
+# ==============================================================================
+# COMPLETENESS TRACKER
+# ==============================================================================
+
+
+class CompletenessTracker:
+    """
+    A tracker of constraints annotation completeness, equivalent to `check_completude_of_constraints` of the binary constraints manager.
+    MUST_LINK components are handled by a union-find structure (union by size, path halving), and CANNOT_LINK constraints by an adjacency between components.
+    The number of pairs of data whose relation is still undetermined is updated at each constraint, so that a whole annotation history is checked in near-linear time.
+    """
+
+    def __init__(
+        self,
+        list_of_data_IDs: List[str],
+    ):
+        """
+        The constructor for `CompletenessTracker` class.
+
+        Args:
+            list_of_data_IDs (List[str]): The list of data IDs to manage.
+        """
+
+        # Union-find structure: parent and size of each MUST_LINK component.
+        self._parent: Dict[str, str] = {data_ID: data_ID for data_ID in list_of_data_IDs}
+        self._size: Dict[str, int] = {data_ID: 1 for data_ID in list_of_data_IDs}
+
+        # CANNOT_LINK adjacency between components (indexed by component roots).
+        self._cannot_link: Dict[str, Set[str]] = {data_ID: set() for data_ID in list_of_data_IDs}
+
+        # Number of pairs of data without MUST_LINK or CANNOT_LINK relation (annotated or inferred).
+        nb_data: int = len(list_of_data_IDs)
+        self.nb_undetermined_pairs: int = nb_data * (nb_data - 1) // 2
+
+    def add_constraint(
+        self,
+        data_ID1: str,
+        data_ID2: str,
+        constraint_type: str,
+    ) -> None:
+        """
+        The method used to add a constraint and update the number of undetermined pairs.
+
+        Args:
+            data_ID1 (str): The first data ID of the constraint.
+            data_ID2 (str): The second data ID of the constraint.
+            constraint_type (str): The constraint type. Can be `"MUST_LINK"` or `"CANNOT_LINK"`.
+
+        Raises:
+            ValueError: If `data_ID1` or `data_ID2` is not managed, if `constraint_type` is not implemented, or if the constraint is in conflict with previous ones.
+        """
+
+        # Check data IDs.
+        if data_ID1 not in self._parent.keys():
+            raise ValueError("The `data_ID1` '" + str(data_ID1) + "' is not managed.")
+        if data_ID2 not in self._parent.keys():
+            raise ValueError("The `data_ID2` '" + str(data_ID2) + "' is not managed.")
+
+        # Get components.
+        root1: str = self._find(data_ID1)
+        root2: str = self._find(data_ID2)
+
+        # Case of MUST_LINK.
+        if constraint_type == "MUST_LINK":
+            if root1 == root2:
+                return
+            if root2 in self._cannot_link[root1]:
+                raise ValueError(
+                    "The `MUST_LINK` constraint between '"
+                    + str(data_ID1)
+                    + "' and '"
+                    + str(data_ID2)
+                    + "' is in conflict with a `CANNOT_LINK` constraint."
+                )
+            self._merge(root1=root1, root2=root2)
+
+        # Case of CANNOT_LINK.
+        elif constraint_type == "CANNOT_LINK":
+            if root1 == root2:
+                raise ValueError(
+                    "The `CANNOT_LINK` constraint between '"
+                    + str(data_ID1)
+                    + "' and '"
+                    + str(data_ID2)
+                    + "' is in conflict with a `MUST_LINK` constraint."
+                )
+            if root2 in self._cannot_link[root1]:
+                return
+            self._cannot_link[root1].add(root2)
+            self._cannot_link[root2].add(root1)
+            self.nb_undetermined_pairs -= self._size[root1] * self._size[root2]
+
+        # Case of unknown constraint.
+        else:
+            raise ValueError("The `constraint_type` '" + str(constraint_type) + "' is not implemented.")
+
+    def check_completude_of_constraints(
+        self,
+    ) -> bool:
+        """
+        The method used to check if all pairs of data have a MUST_LINK or CANNOT_LINK relation (annotated or inferred).
+
+        Returns:
+            bool: `True` if the annotation is complete, `False` otherwise.
+        """
+        return self.nb_undetermined_pairs == 0
+
+    def _find(
+        self,
+        data_ID: str,
+    ) -> str:
+        """
+        The method used to get the root of the component of a data ID (with path halving).
+
+        Args:
+            data_ID (str): The data ID.
+
+        Returns:
+            str: The root of the component.
+        """
+        while self._parent[data_ID] != data_ID:
+            self._parent[data_ID] = self._parent[self._parent[data_ID]]
+            data_ID = self._parent[data_ID]
+        return data_ID
+
+    def _merge(
+        self,
+        root1: str,
+        root2: str,
+    ) -> None:
+        """
+        The method used to merge two components linked by a MUST_LINK constraint.
+        The CANNOT_LINK constraints of each component are inferred on the other one.
+
+        Args:
+            root1 (str): The root of the first component.
+            root2 (str): The root of the second component.
+        """
+
+        # Update the number of undetermined pairs: pairs between the two components, and pairs inferred by CANNOT_LINK.
+        size1: int = self._size[root1]
+        size2: int = self._size[root2]
+        self.nb_undetermined_pairs -= size1 * size2
+        self.nb_undetermined_pairs -= size2 * sum(
+            self._size[neighbor] for neighbor in self._cannot_link[root1] - self._cannot_link[root2]
+        )
+        self.nb_undetermined_pairs -= size1 * sum(
+            self._size[neighbor] for neighbor in self._cannot_link[root2] - self._cannot_link[root1]
+        )
+
+        # Union by size: the smallest component goes into the biggest.
+        if size1 < size2:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._size[root1] += self._size.pop(root2)
+
+        # Move CANNOT_LINK adjacency of the smallest component.
+        for neighbor in self._cannot_link.pop(root2):
+            self._cannot_link[neighbor].discard(root2)
+            self._cannot_link[neighbor].add(root1)
+            self._cannot_link[root1].add(neighbor)
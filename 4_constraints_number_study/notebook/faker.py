@@ -12,49 +12,68 @@
 # IMPORT PYTHON DEPENDENCIES
 # ==============================================================================
 
+import json
+import multiprocessing as mp
 import os  # Path management.
-import random
 import string
-from typing import Tuple, Dict, List  # Python code typing (mypy).
+from functools import partial
+from typing import Any, Tuple, Dict, Iterator, List, Optional, Set  # Python code typing (mypy).
+
+import numpy as np
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Number of generated data per shard (each shard has its own random generator).
+DEFAULT_SHARD_SIZE: int = 1000
+
+# Unicode code points of letters used in spelling errors.
+ARRAY_OF_LETTERS: np.ndarray = np.array([ord(letter) for letter in string.ascii_letters], dtype=np.uint32)
 
 
 # ==============================================================================
 # FAKER - SPELLING ERRORS
 # ==============================================================================
-def get_text_with_spelling_errors(
-    text: str,
+def get_texts_with_spelling_errors(
+    list_of_texts: List[str],
+    random_generator: np.random.Generator,
     k: int = 2,
-) -> str:
+) -> List[str]:
     """
-    Add spelling errors in a text.
-    
+    Add spelling errors in texts (`k` letters of each text are replaced by random letters, all texts at once).
+
     Args:
-        text (str): The base text.
-        k (int): The number of spelling errors to generate. Defaults to `2`.
-        
+        list_of_texts (List[str]): The base texts.
+        random_generator (np.random.Generator): The random generator.
+        k (int): The number of spelling errors to generate in each text. Defaults to `2`.
+
     Return:
-        str: The text with some spelling errors.
-        
+        List[str]: The texts with some spelling errors.
+
     """
-    
-    # Select index of letters to change.
-    letters_to_change: List[int] = random.sample(
-        range(len(text)),
-        k=k,
-    )
-    
+
+    # Get the matrix of unicode code points of texts (one row per text, padded with `0`).
+    array_of_texts: np.ndarray = np.array(list_of_texts, dtype=str)
+    max_length: int = array_of_texts.dtype.itemsize // 4
+    if (len(list_of_texts) == 0) or (max_length == 0):
+        return list(list_of_texts)
+    array_of_codes: np.ndarray = array_of_texts.view(np.uint32).reshape(len(list_of_texts), max_length).copy()
+    array_of_lengths: np.ndarray = np.char.str_len(array_of_texts)
+
+    # Select index of letters to change (`k` distinct index per text, drawn among letters of the text).
+    array_of_keys: np.ndarray = random_generator.random((len(list_of_texts), max_length))
+    array_of_keys[np.arange(max_length)[np.newaxis, :] >= array_of_lengths[:, np.newaxis]] = np.inf
+    array_of_positions: np.ndarray = np.argsort(array_of_keys, axis=1, kind="stable")[:, :min(k, max_length)]
+    array_of_rows: np.ndarray = np.broadcast_to(np.arange(len(list_of_texts))[:, np.newaxis], array_of_positions.shape)
+    array_of_is_letter: np.ndarray = array_of_positions < array_of_lengths[:, np.newaxis]
+
     # Change the selected letters.
-    new_letters: List[str] = [
-        (
-            text[i]
-            if i not in letters_to_change
-            else random.choice(string.ascii_letters)
-        )
-        for i in range(len(text))
-    ]
-        
-    # Return the new text with spelling errors.
-    return "".join(new_letters)
+    array_of_new_letters: np.ndarray = random_generator.choice(ARRAY_OF_LETTERS, size=array_of_positions.shape)
+    array_of_codes[array_of_rows[array_of_is_letter], array_of_positions[array_of_is_letter]] = array_of_new_letters[array_of_is_letter]
+
+    # Return the new texts with spelling errors.
+    return array_of_codes.view("<U" + str(max_length)).ravel().tolist()
 
 
 # ==============================================================================
@@ -66,51 +85,280 @@ def fake_dataset(
     dict_of_true_intents: Dict[str, str],
     size: int,
     random_seed: int = 42,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    nb_workers: int = 1,
+    previous_fake_dataset: Optional[Tuple[Dict[str, str], Dict[str, str]]] = None,
 ) -> Tuple[Dict[str, str], Dict[str, str]]:
     """
     Increase the size of a dataset by generating data with spelling errors.
-    
+    Generated data are deterministic for a random seed, and a smaller dataset is a prefix of a larger one: a previous fake dataset can be extended without generating its data again.
+
     Args:
         dict_of_texts (Dict[str, str]): The texts in the base dataset.
         dict_of_true_intents (Dict[str, str]): The labels in the base dataset.
         size (int): The dataset size to reach.
         random_seed (int): The random seed. Defaults to `42`.
-        
+        shard_size (int): The number of generated data per shard (the same shard size is needed to extend a previous fake dataset). Defaults to `DEFAULT_SHARD_SIZE`.
+        nb_workers (int): The number of processes used to generate shards. Defaults to `1`.
+        previous_fake_dataset (Optional[Tuple[Dict[str, str], Dict[str, str]]]): A previous fake dataset to extend, generated with the same base dataset, random seed and shard size. Defaults to `None`.
+
     Return:
         Tuple[Dict[str, str], Dict[str, str]]: The new dataset which some fake data.
     """
-    
-    # Set random seed.
-    random.seed(random_seed)
-    
-    # Prepare results variables.
-    new_dict_of_texts: Dict[str, str] = dict_of_texts.copy()
-    new_dict_of_true_intents: Dict[str, str] = dict_of_true_intents.copy()
-        
-    # Prepare temporary variables.
-    id_counter: int = 0
-    list_of_text_ids: List[str] = list(dict_of_texts.keys())
-    
-    # Loop until the dataset hasn't the requested size...
-    while len(new_dict_of_texts.keys()) < size:
-        
-        # Randomly choose a text.
-        text_id: str = random.choice(list_of_text_ids)
-                      
-        # Generated a new text with spelling errors in the text.
-        generated_text: str = get_text_with_spelling_errors(text=dict_of_texts[text_id])
-        if generated_text in dict_of_texts.values():
-            continue
-                      
-        # Add the generated text in the dataset.
-        generated_text_id: str = "g_{id_counter}".format(id_counter=id_counter)
-        new_dict_of_texts[generated_text_id] = generated_text
-        new_dict_of_true_intents[generated_text_id] = dict_of_true_intents[text_id]
-        
-        # Increase the id counter.
-        id_counter += 1
-    
+
+    # Case of a previous fake dataset large enough: keep its first data.
+    if (previous_fake_dataset is not None) and (len(previous_fake_dataset[0].keys()) >= size):
+        list_of_kept_ids: List[str] = list(previous_fake_dataset[0].keys())[:max(size, len(dict_of_texts.keys()))]
+        return (
+            {data_id: previous_fake_dataset[0][data_id] for data_id in list_of_kept_ids},
+            {data_id: previous_fake_dataset[1][data_id] for data_id in list_of_kept_ids},
+        )
+
+    # Prepare results variables (from the base dataset, or from the previous fake dataset).
+    new_dict_of_texts: Dict[str, str] = (
+        dict_of_texts.copy()
+        if previous_fake_dataset is None
+        else previous_fake_dataset[0].copy()
+    )
+    new_dict_of_true_intents: Dict[str, str] = (
+        dict_of_true_intents.copy()
+        if previous_fake_dataset is None
+        else previous_fake_dataset[1].copy()
+    )
+
+    # Generate missing data until the dataset has the requested size.
+    for data_id, text, true_intent in _stream_generated_data(
+        dict_of_texts=dict_of_texts,
+        dict_of_true_intents=dict_of_true_intents,
+        first_index=len(new_dict_of_texts.keys()) - len(dict_of_texts.keys()),
+        last_index=size - len(dict_of_texts.keys()),
+        random_seed=random_seed,
+        shard_size=shard_size,
+        nb_workers=nb_workers,
+    ):
+        new_dict_of_texts[data_id] = text
+        new_dict_of_true_intents[data_id] = true_intent
+
     # Return the new dataset.
     return (new_dict_of_texts, new_dict_of_true_intents)
-        
-        
\ No newline at end of file
+
+
+# ==============================================================================
+# FAKER - DATASET STREAM
+# ==============================================================================
+
+def stream_fake_dataset(
+    dict_of_texts: Dict[str, str],
+    dict_of_true_intents: Dict[str, str],
+    size: int,
+    random_seed: int = 42,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    nb_workers: int = 1,
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Stream data of a dataset whose size is increased by generating data with spelling errors (the base dataset first, then the generated data).
+    For a same random seed, data are the same as the ones of `fake_dataset`.
+
+    Args:
+        dict_of_texts (Dict[str, str]): The texts in the base dataset.
+        dict_of_true_intents (Dict[str, str]): The labels in the base dataset.
+        size (int): The dataset size to reach.
+        random_seed (int): The random seed. Defaults to `42`.
+        shard_size (int): The number of generated data per shard. Defaults to `DEFAULT_SHARD_SIZE`.
+        nb_workers (int): The number of processes used to generate shards. Defaults to `1`.
+
+    Return:
+        Iterator[Tuple[str, str, str]]: The data ids, texts and labels of the new dataset.
+    """
+
+    # Stream the base dataset.
+    for data_id, text in dict_of_texts.items():
+        yield (data_id, text, dict_of_true_intents[data_id])
+
+    # Stream the generated data.
+    yield from _stream_generated_data(
+        dict_of_texts=dict_of_texts,
+        dict_of_true_intents=dict_of_true_intents,
+        first_index=0,
+        last_index=size - len(dict_of_texts.keys()),
+        random_seed=random_seed,
+        shard_size=shard_size,
+        nb_workers=nb_workers,
+    )
+
+
+# ==============================================================================
+# FAKER - DATASET FILES
+# ==============================================================================
+
+def write_fake_dataset(
+    dict_of_texts: Dict[str, str],
+    dict_of_true_intents: Dict[str, str],
+    size: int,
+    filepath_of_texts: str,
+    filepath_of_true_intents: str,
+    random_seed: int = 42,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    nb_workers: int = 1,
+) -> int:
+    """
+    Write a dataset whose size is increased by generating data with spelling errors, without keeping the new dataset in memory.
+    Files are the same as the JSON dumps of `fake_dataset` results.
+
+    Args:
+        dict_of_texts (Dict[str, str]): The texts in the base dataset.
+        dict_of_true_intents (Dict[str, str]): The labels in the base dataset.
+        size (int): The dataset size to reach.
+        filepath_of_texts (str): The path of the JSON file of texts.
+        filepath_of_true_intents (str): The path of the JSON file of labels.
+        random_seed (int): The random seed. Defaults to `42`.
+        shard_size (int): The number of generated data per shard. Defaults to `DEFAULT_SHARD_SIZE`.
+        nb_workers (int): The number of processes used to generate shards. Defaults to `1`.
+
+    Return:
+        int: The number of written data.
+    """
+
+    # Write data in temporary files, one entry at a time.
+    nb_of_data: int = 0
+    with open(filepath_of_texts + ".tmp", "w") as file_texts, open(filepath_of_true_intents + ".tmp", "w") as file_true_intents:
+        file_texts.write("{")
+        file_true_intents.write("{")
+        for data_id, text, true_intent in stream_fake_dataset(
+            dict_of_texts=dict_of_texts,
+            dict_of_true_intents=dict_of_true_intents,
+            size=size,
+            random_seed=random_seed,
+            shard_size=shard_size,
+            nb_workers=nb_workers,
+        ):
+            separator: str = ", " if nb_of_data != 0 else ""
+            file_texts.write(separator + json.dumps(data_id) + ": " + json.dumps(text))
+            file_true_intents.write(separator + json.dumps(data_id) + ": " + json.dumps(true_intent))
+            nb_of_data += 1
+        file_texts.write("}")
+        file_true_intents.write("}")
+
+    # Replace files once complete.
+    os.replace(filepath_of_texts + ".tmp", filepath_of_texts)
+    os.replace(filepath_of_true_intents + ".tmp", filepath_of_true_intents)
+
+    # Return the number of written data.
+    return nb_of_data
+
+
+# ==============================================================================
+# PRIVATE - SHARDS
+# ==============================================================================
+
+def _stream_generated_data(
+    dict_of_texts: Dict[str, str],
+    dict_of_true_intents: Dict[str, str],
+    first_index: int,
+    last_index: int,
+    random_seed: int,
+    shard_size: int,
+    nb_workers: int,
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Stream generated data from index `first_index` (included) to index `last_index` (excluded), shard by shard.
+
+    Args:
+        dict_of_texts (Dict[str, str]): The texts in the base dataset.
+        dict_of_true_intents (Dict[str, str]): The labels in the base dataset.
+        first_index (int): The index of the first generated data.
+        last_index (int): The index after the last generated data.
+        random_seed (int): The random seed.
+        shard_size (int): The number of generated data per shard.
+        nb_workers (int): The number of processes used to generate shards.
+
+    Return:
+        Iterator[Tuple[str, str, str]]: The data ids (`g_[INDEX]`), texts and labels of generated data.
+    """
+
+    # Case of no data to generate.
+    if first_index >= last_index:
+        return
+
+    # Get shards to generate.
+    list_of_shard_indices: List[int] = list(range(first_index // shard_size, (last_index - 1) // shard_size + 1))
+    generate_shard = partial(
+        _generate_shard,
+        dict_of_texts=dict_of_texts,
+        dict_of_true_intents=dict_of_true_intents,
+        random_seed=random_seed,
+        shard_size=shard_size,
+    )
+
+    # Generate shards (in a process pool if needed), in order.
+    pool: Optional[Any] = mp.Pool(nb_workers) if (nb_workers > 1) else None
+    try:
+        iterator_of_shards = pool.imap(generate_shard, list_of_shard_indices) if (pool is not None) else map(generate_shard, list_of_shard_indices)
+        for shard_index, list_of_shard_data in zip(list_of_shard_indices, iterator_of_shards):
+
+            # Stream needed data of the shard.
+            for index_in_shard, (text, true_intent) in enumerate(list_of_shard_data):
+                index: int = shard_index * shard_size + index_in_shard
+                if first_index <= index < last_index:
+                    yield ("g_{id_counter}".format(id_counter=index), text, true_intent)
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+
+def _generate_shard(
+    shard_index: int,
+    dict_of_texts: Dict[str, str],
+    dict_of_true_intents: Dict[str, str],
+    random_seed: int,
+    shard_size: int,
+) -> List[Tuple[str, str]]:
+    """
+    Generate a shard of data with spelling errors (a shard only depends on the base dataset, the random seed and its index).
+
+    Args:
+        shard_index (int): The index of the shard.
+        dict_of_texts (Dict[str, str]): The texts in the base dataset.
+        dict_of_true_intents (Dict[str, str]): The labels in the base dataset.
+        random_seed (int): The random seed.
+        shard_size (int): The number of generated data per shard.
+
+    Raises:
+        ValueError: if no text of the base dataset can have spelling errors.
+
+    Return:
+        List[Tuple[str, str]]: The texts and labels of the shard.
+    """
+
+    # Set the random generator of the shard.
+    random_generator: np.random.Generator = np.random.default_rng([random_seed, shard_index])
+
+    # Prepare temporary variables (a set of base texts to check generated texts in constant time).
+    list_of_text_ids: List[str] = [data_id for data_id, text in dict_of_texts.items() if len(text) != 0]
+    set_of_base_texts: Set[str] = set(dict_of_texts.values())
+    if len(list_of_text_ids) == 0:
+        raise ValueError("The `dict_of_texts` has no text to add spelling errors.")
+
+    # Loop until the shard hasn't the requested size (candidates are generated by batch of the shard size)...
+    list_of_shard_data: List[Tuple[str, str]] = []
+    while len(list_of_shard_data) < shard_size:
+
+        # Randomly choose texts.
+        list_of_chosen_ids: List[str] = [
+            list_of_text_ids[i]
+            for i in random_generator.integers(0, len(list_of_text_ids), size=shard_size)
+        ]
+
+        # Generated new texts with spelling errors in the texts.
+        list_of_generated_texts: List[str] = get_texts_with_spelling_errors(
+            list_of_texts=[dict_of_texts[text_id] for text_id in list_of_chosen_ids],
+            random_generator=random_generator,
+        )
+
+        # Add the generated texts that are not in the base dataset.
+        for text_id, generated_text in zip(list_of_chosen_ids, list_of_generated_texts):
+            if (generated_text not in set_of_base_texts) and (len(list_of_shard_data) < shard_size):
+                list_of_shard_data.append((generated_text, dict_of_true_intents[text_id]))
+
+    # Return the shard.
+    return list_of_shard_data
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         iterations_summary
+* Description:  Materialize cumulative times and constraints numbers of each iteration of an experiment.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import bisect
+import json
+import os
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Name of the summary file stored in each experiment environment.
+SUMMARY_FILENAME: str = "dict_of_iterations_summary.json"
+
+# Summary before the first iteration.
+EMPTY_SUMMARY: Dict[str, Union[float, int]] = {
+    "sampling_time": 0,
+    "clustering_time": 0,
+    "total_time": 0,
+    "constraints_must_link": 0,
+    "constraints_cannot_link": 0,
+    "constraints_total": 0,
+}
+
+
+# ==============================================================================
+# SUMMARY - COMPUTE
+# ==============================================================================
+def compute_iterations_summary(
+    dict_of_computation_times: Dict[str, Dict[str, float]],
+    dict_of_constraints_annotations: Mapping[str, Sequence[Tuple[str, str, Optional[str]]]],
+) -> Dict[str, Dict[str, Union[float, int]]]:
+    """
+    A method aimed at compute cumulative times and constraints numbers of each iteration, in one pass over the experiment history.
+
+    Args:
+        dict_of_computation_times (Dict[str, Dict[str, float]]): The dictionary of time spent at each iteration.
+        dict_of_constraints_annotations (Mapping[str, Sequence[Tuple[str, str, Optional[str]]]]): The dictionary of constraints annotated at each iteration.
+
+    Returns:
+        Dict[str, Dict[str, Union[float, int]]]: For each iteration, the cumulative sampling, clustering and total time, and the cumulative number of `"MUST_LINK"`, `"CANNOT_LINK"` and annotated constraints.
+    """
+
+    # Initialize cumulative counters.
+    sampling_time: float = 0
+    clustering_time: float = 0
+    total_time: float = 0
+    constraints_must_link: int = 0
+    constraints_cannot_link: int = 0
+    constraints_total: int = 0
+
+    # Initialize summary.
+    dict_of_iterations_summary: Dict[str, Dict[str, Union[float, int]]] = {}
+
+    # For each iteration (in chronological order)...
+    for iteration in sorted(set(dict_of_computation_times.keys()) | set(dict_of_constraints_annotations.keys())):
+
+        # Update cumulative times.
+        if iteration in dict_of_computation_times.keys():
+            sampling_time += dict_of_computation_times[iteration]["sampling_TOTAL_RUN"]
+            clustering_time += dict_of_computation_times[iteration]["clustering_TOTAL_RUN"]
+            total_time += dict_of_computation_times[iteration]["TOTAL_RUN"]
+
+        # Update cumulative constraints numbers.
+        for annotation in dict_of_constraints_annotations.get(iteration, []):
+            if annotation[2] == "MUST_LINK":
+                constraints_must_link += 1
+            elif annotation[2] == "CANNOT_LINK":
+                constraints_cannot_link += 1
+            if annotation[2] is not None:
+                constraints_total += 1
+
+        # Store the summary of this iteration.
+        dict_of_iterations_summary[iteration] = {
+            "sampling_time": sampling_time,
+            "clustering_time": clustering_time,
+            "total_time": total_time,
+            "constraints_must_link": constraints_must_link,
+            "constraints_cannot_link": constraints_cannot_link,
+            "constraints_total": constraints_total,
+        }
+
+    # Return summary.
+    return dict_of_iterations_summary
+
+
+# ==============================================================================
+# SUMMARY - STORE AND LOAD
+# ==============================================================================
+def store_iterations_summary(
+    env_path: str,
+    dict_of_computation_times: Dict[str, Dict[str, float]],
+    dict_of_constraints_annotations: Mapping[str, Sequence[Tuple[str, str, Optional[str]]]],
+) -> Dict[str, Dict[str, Union[float, int]]]:
+    """
+    A method aimed at compute and store the summary of an experiment in its environment.
+
+    Args:
+        env_path (str): The experiment environment path.
+        dict_of_computation_times (Dict[str, Dict[str, float]]): The dictionary of time spent at each iteration.
+        dict_of_constraints_annotations (Mapping[str, Sequence[Tuple[str, str, Optional[str]]]]): The dictionary of constraints annotated at each iteration.
+
+    Returns:
+        Dict[str, Dict[str, Union[float, int]]]: The summary (cf. `compute_iterations_summary`).
+    """
+
+    # Compute summary.
+    dict_of_iterations_summary: Dict[str, Dict[str, Union[float, int]]] = compute_iterations_summary(
+        dict_of_computation_times=dict_of_computation_times,
+        dict_of_constraints_annotations=dict_of_constraints_annotations,
+    )
+
+    # Store summary.
+    with open(env_path + SUMMARY_FILENAME, "w") as file_summary:
+        json.dump(dict_of_iterations_summary, file_summary)
+
+    # Return summary.
+    return dict_of_iterations_summary
+
+
+def load_iterations_summary(
+    env_path: str,
+) -> Dict[str, Dict[str, Union[float, int]]]:
+    """
+    A method aimed at load the summary of an experiment. If the experiment was evaluated before summaries existed, the summary is computed from history and stored.
+
+    Args:
+        env_path (str): The experiment environment path.
+
+    Returns:
+        Dict[str, Dict[str, Union[float, int]]]: The summary (cf. `compute_iterations_summary`).
+    """
+
+    # Case of summary already stored.
+    if os.path.exists(env_path + SUMMARY_FILENAME):
+        with open(env_path + SUMMARY_FILENAME, "r") as file_summary:
+            return json.load(file_summary)
+
+    # Otherwise: load history, then compute and store summary.
+    with open(env_path + "dict_of_computation_times.json", "r") as time_file:
+        dict_of_computation_times: Dict[str, Dict[str, float]] = json.load(time_file)
+    with open(env_path + "dict_of_constraints_annotations.json", "r") as annotation_file:
+        dict_of_constraints_annotations: Dict[str, List[Tuple[str, str, Optional[str]]]] = json.load(annotation_file)
+    return store_iterations_summary(
+        env_path=env_path,
+        dict_of_computation_times=dict_of_computation_times,
+        dict_of_constraints_annotations=dict_of_constraints_annotations,
+    )
+
+
+# ==============================================================================
+# SUMMARY - GOAL SYNTHESIS
+# ==============================================================================
+def get_goal_synthesis(
+    dict_of_iterations_summary: Dict[str, Dict[str, Union[float, int]]],
+    iteration: Optional[str],
+) -> Dict[str, Union[str, float, int, None]]:
+    """
+    A method aimed at get times and constraints numbers needed to reach an iteration (ex: the iteration that reaches a performance goal).
+
+    Args:
+        dict_of_iterations_summary (Dict[str, Dict[str, Union[float, int]]]): The summary of the experiment (cf. `compute_iterations_summary`).
+        iteration (Optional[str]): The iteration to reach. `None` if the goal is not reached.
+
+    Returns:
+        Dict[str, Union[str, float, int, None]]: The iteration, the cumulative times, the cumulative constraints numbers, and the ratio of `"MUST_LINK"` constraints (all `None` if the goal is not reached).
+    """
+
+    # Case of `None` (i.e. goal is not reached).
+    if iteration is None:
+        return {
+            "iteration": None,
+            "sampling_time": None,
+            "clustering_time": None,
+            "total_time": None,
+            "constraints_must_link": None,
+            "constraints_cannot_link": None,
+            "constraints_total": None,
+            "constraints_ratio_must_link": None,
+        }
+
+    # Get the summary of the last iteration before the iteration to reach (included).
+    iteration = str(iteration)
+    list_of_iterations: List[str] = sorted(dict_of_iterations_summary.keys())
+    position: int = bisect.bisect_right(list_of_iterations, iteration)
+    summary: Dict[str, Union[float, int]] = (
+        dict_of_iterations_summary[list_of_iterations[position - 1]]
+        if position > 0
+        else EMPTY_SUMMARY
+    )
+
+    # Return goal synthesis.
+    return {
+        "iteration": iteration,
+        "sampling_time": summary["sampling_time"],
+        "clustering_time": summary["clustering_time"],
+        "total_time": summary["total_time"],
+        "constraints_must_link": summary["constraints_must_link"],
+        "constraints_cannot_link": summary["constraints_cannot_link"],
+        "constraints_total": summary["constraints_total"],
+        "constraints_ratio_must_link": (
+            None
+            if (summary["constraints_total"] == 0)
+            else summary["constraints_must_link"] / summary["constraints_total"]
+        ),
+    }
@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         metrics_registry
+* Description:  A registry of clustering metrics computed in one evaluation pass over each clustering result.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from cognitivefactory.features_maximization_metric.fmc import FeaturesMaximizationMetric
+from scipy.sparse import csr_matrix, vstack
+from sklearn import metrics
+
+# ==============================================================================
+# REGISTRY
+# ==============================================================================
+
+# Inputs that a metric can require.
+#   - `"labels"`: the list of true intents and the list of predicted clusters (in data IDs order).
+#   - `"contingency"`: the sparse contingency matrix between true intents (rows) and predicted clusters (columns).
+#   - `"entropies"`: the entropies of true intents and of predicted clusters, and their mutual information.
+#   - `"pair_counts"`: the pair confusion matrix (as `sklearn.metrics.cluster.pair_confusion_matrix`).
+#   - `"clustering"`: the dictionary of predicted clusters.
+#   - `"constraints"`: the list of annotated constraints taken into account by the clustering.
+#   - `"vectors"`: the matrix of data vectors (in data IDs order).
+LIST_OF_INPUTS: List[str] = [
+    "labels",
+    "contingency",
+    "entropies",
+    "pair_counts",
+    "clustering",
+    "constraints",
+    "vectors",
+]
+
+# Type of metric functions: they take the dictionary of computed inputs and return the metric value (or `None` if the metric is undefined).
+MetricFunction = Callable[..., Optional[float]]
+
+# Registry of metrics: for each metric name, the list of required inputs (`"requires"`) and the function to compute it (`"function"`, a `MetricFunction`).
+METRICS_REGISTRY: Dict[str, Dict[str, Any]] = {}
+
+
+def register_metric(
+    name: str,
+    requires: List[str],
+) -> Callable[[MetricFunction], MetricFunction]:
+    """
+    A decorator aimed at register a metric in `METRICS_REGISTRY`.
+    The decorated function takes the dictionary of computed inputs and returns the metric value (or `None` if the metric is undefined).
+
+    Args:
+        name (str): The metric name, used as key in evaluations (ex: `"v_measure"`).
+        requires (List[str]): The list of inputs needed by the metric. Must be in `LIST_OF_INPUTS`.
+
+    Raises:
+        ValueError: If parameters are badly set.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    # Check that the requested inputs are implemented.
+    for input_name in requires:
+        if input_name not in LIST_OF_INPUTS:
+            raise ValueError("The `input` '" + str(input_name) + "' is not implemented.")
+
+    # Define the decorator.
+    def decorator(
+        function: MetricFunction,
+    ) -> MetricFunction:
+        METRICS_REGISTRY[name] = {
+            "requires": requires,
+            "function": function,
+        }
+        return function
+
+    return decorator
+
+
+# ==============================================================================
+# METRICS - BASED ON CONTINGENCY
+# ==============================================================================
+@register_metric(name="homogeneity", requires=["entropies"])
+def _homogeneity(inputs: Dict[str, Any]) -> float:
+    """Homogeneity (as `sklearn.metrics.homogeneity_score`)."""
+    entropy_true, _, mutual_information = inputs["entropies"]
+    return mutual_information / entropy_true if entropy_true else 1.0
+
+
+@register_metric(name="completeness", requires=["entropies"])
+def _completeness(inputs: Dict[str, Any]) -> float:
+    """Completeness (as `sklearn.metrics.completeness_score`)."""
+    _, entropy_pred, mutual_information = inputs["entropies"]
+    return mutual_information / entropy_pred if entropy_pred else 1.0
+
+
+@register_metric(name="v_measure", requires=["entropies"])
+def _v_measure(inputs: Dict[str, Any]) -> Optional[float]:
+    """V-measure (as `sklearn.metrics.v_measure_score`)."""
+    homogeneity: Optional[float] = _homogeneity(inputs)
+    completeness: Optional[float] = _completeness(inputs)
+    if homogeneity is None or completeness is None:
+        return None
+    return (
+        0.0
+        if (homogeneity + completeness) == 0
+        else 2 * homogeneity * completeness / (homogeneity + completeness)
+    )
+
+
+@register_metric(name="adjusted_rand_index", requires=["pair_counts"])
+def _adjusted_rand_index(inputs: Dict[str, Any]) -> float:
+    """Adjusted Rand index (as `sklearn.metrics.adjusted_rand_score`)."""
+    (tn, fp), (fn, tp) = inputs["pair_counts"]
+    if fn == 0 and fp == 0:
+        return 1.0
+    return 2.0 * (tp * tn - fn * fp) / ((tp + fn) * (fn + tn) + (tp + fp) * (fp + tn))
+
+
+@register_metric(name="adjusted_mutual_information", requires=["labels"])
+def _adjusted_mutual_information(inputs: Dict[str, Any]) -> float:
+    """Adjusted mutual information (as `sklearn.metrics.adjusted_mutual_info_score`)."""
+    list_of_true_intents, list_of_predicted_intents = inputs["labels"]
+    return metrics.adjusted_mutual_info_score(list_of_true_intents, list_of_predicted_intents)
+
+
+@register_metric(name="fowlkes_mallows", requires=["pair_counts"])
+def _fowlkes_mallows(inputs: Dict[str, Any]) -> float:
+    """Fowlkes-Mallows index (as `sklearn.metrics.fowlkes_mallows_score`)."""
+    (_, fp), (fn, tp) = inputs["pair_counts"]
+    return 0.0 if tp == 0 else math.sqrt(tp / (tp + fp)) * math.sqrt(tp / (tp + fn))
+
+
+@register_metric(name="pairwise_f1", requires=["pair_counts"])
+def _pairwise_f1(inputs: Dict[str, Any]) -> float:
+    """Pairwise F1-score: harmonic mean of pairwise precision and recall (pairs of data in the same cluster)."""
+    (_, fp), (fn, tp) = inputs["pair_counts"]
+    return 0.0 if tp == 0 else 2 * tp / (2 * tp + fp + fn)
+
+
+# ==============================================================================
+# METRICS - BASED ON CONSTRAINTS
+# ==============================================================================
+@register_metric(name="constraints_violation_rate", requires=["clustering", "constraints"])
+def _constraints_violation_rate(inputs: Dict[str, Any]) -> Optional[float]:
+    """Proportion of annotated constraints not respected by the clustering (`None` if there is no annotated constraints)."""
+    dict_of_predicted_clusters: Dict[str, int] = inputs["clustering"]
+    nb_annotated: int = 0
+    nb_violated: int = 0
+    for constraint in inputs["constraints"]:
+        if constraint[2] not in {"MUST_LINK", "CANNOT_LINK"}:
+            continue
+        nb_annotated += 1
+        same_cluster: bool = dict_of_predicted_clusters[constraint[0]] == dict_of_predicted_clusters[constraint[1]]
+        if (constraint[2] == "MUST_LINK") != same_cluster:
+            nb_violated += 1
+    return None if nb_annotated == 0 else nb_violated / nb_annotated
+
+
+# ==============================================================================
+# METRICS - BASED ON VECTORS
+# ==============================================================================
+@register_metric(name="fmc_v_measure", requires=["labels", "vectors"])
+def _fmc_v_measure(inputs: Dict[str, Any]) -> float:
+    """V-measure between Features Maximization descriptions of the clustering and of the groundtruth (cf. relevance study)."""
+    _, list_of_predicted_intents = inputs["labels"]
+    vectors, fmc_reference = inputs["vectors"]
+    fmc_clustering: FeaturesMaximizationMetric = FeaturesMaximizationMetric(
+        data_vectors=vectors,
+        data_classes=[str(cluster_id) for cluster_id in list_of_predicted_intents],
+        list_of_possible_features=fmc_reference.list_of_possible_features,
+    )
+    return fmc_clustering.compare(fmc_reference=fmc_reference)[2]
+
+
+# Default metrics computed by evaluations (metrics that need vectors are opt-in).
+DEFAULT_LIST_OF_METRICS: List[str] = [
+    "homogeneity",
+    "completeness",
+    "v_measure",
+    "adjusted_rand_index",
+    "adjusted_mutual_information",
+    "fowlkes_mallows",
+    "pairwise_f1",
+    "constraints_violation_rate",
+]
+
+
+# ==============================================================================
+# EVALUATOR
+# ==============================================================================
+class MetricsEvaluator:
+    """
+    An evaluator that computes registered metrics of clustering results of one experiment.
+    Inputs shared by several metrics (contingency, entropies, pair counts) are computed once per clustering result, and inputs that depend only on the experiment (true intents, vectors) are computed once per evaluator.
+    """
+
+    def __init__(
+        self,
+        dict_of_true_intents: Dict[str, str],
+        list_of_metrics: Optional[List[str]] = None,
+        dict_of_vectors: Optional[Dict[str, csr_matrix]] = None,
+    ):
+        """
+        The constructor for `MetricsEvaluator` class.
+
+        Args:
+            dict_of_true_intents (Dict[str, str]): The dictionary of true intents.
+            list_of_metrics (Optional[List[str]], optional): The list of metrics to compute. Defaults to `None` (`DEFAULT_LIST_OF_METRICS`).
+            dict_of_vectors (Optional[Dict[str, csr_matrix]], optional): The dictionary of vectors, needed by metrics that require `"vectors"`. Defaults to `None`.
+
+        Raises:
+            ValueError: If parameters are badly set.
+        """
+
+        # Store metrics to compute.
+        self.list_of_metrics: List[str] = DEFAULT_LIST_OF_METRICS if (list_of_metrics is None) else list_of_metrics
+        for metric in self.list_of_metrics:
+            if metric not in METRICS_REGISTRY.keys():
+                raise ValueError("The `metric` '" + str(metric) + "' is not implemented.")
+
+        # Store the list of needed inputs.
+        self.set_of_inputs: set = {
+            input_name for metric in self.list_of_metrics for input_name in METRICS_REGISTRY[metric]["requires"]
+        }
+
+        # Store true intents (in data IDs order).
+        self.list_of_data_IDs: List[str] = sorted(dict_of_true_intents.keys())
+        self.list_of_true_intents: List[str] = [dict_of_true_intents[data_ID] for data_ID in self.list_of_data_IDs]
+        self._true_intents_index: np.ndarray = np.unique(self.list_of_true_intents, return_inverse=True)[1]
+
+        # Store vectors and the groundtruth Features Maximization modelization.
+        self._vectors: Optional[Tuple[csr_matrix, FeaturesMaximizationMetric]] = None
+        if "vectors" in self.set_of_inputs:
+            if dict_of_vectors is None:
+                raise ValueError("The `dict_of_vectors` is needed by the requested metrics.")
+            matrix_of_vectors: csr_matrix = csr_matrix(
+                vstack([csr_matrix(dict_of_vectors[data_ID]) for data_ID in self.list_of_data_IDs])
+            )
+            self._vectors = (
+                matrix_of_vectors,
+                FeaturesMaximizationMetric(
+                    data_vectors=matrix_of_vectors,
+                    data_classes=self.list_of_true_intents,
+                    list_of_possible_features=[str(feature) for feature in range(matrix_of_vectors.shape[1])],
+                ),
+            )
+
+    def evaluate(
+        self,
+        clustering_result: Dict[str, int],
+        constraints: Optional[Sequence[Tuple[str, str, Optional[str]]]] = None,
+    ) -> Dict[str, Optional[float]]:
+        """
+        The main method used to compute all requested metrics of a clustering result in one pass.
+
+        Args:
+            clustering_result (Dict[str, int]): The clustering result to evaluate.
+            constraints (Optional[Sequence[Tuple[str, str, Optional[str]]]], optional): The constraints annotated before this clustering, needed by metrics that require `"constraints"`. Defaults to `None` (these metrics are skipped).
+
+        Returns:
+            Dict[str, Optional[float]]: The value of each computed metric.
+        """
+
+        # Compute inputs.
+        inputs: Dict[str, Any] = self._compute_inputs(
+            clustering_result=clustering_result,
+            constraints=constraints,
+        )
+
+        # Compute metrics whose inputs are available.
+        return {
+            metric: METRICS_REGISTRY[metric]["function"](inputs)
+            for metric in self.list_of_metrics
+            if all(input_name in inputs.keys() for input_name in METRICS_REGISTRY[metric]["requires"])
+        }
+
+    def _compute_inputs(
+        self,
+        clustering_result: Dict[str, int],
+        constraints: Optional[Sequence[Tuple[str, str, Optional[str]]]],
+    ) -> Dict[str, Any]:
+        """
+        A method aimed at compute once the inputs needed by requested metrics.
+
+        Args:
+            clustering_result (Dict[str, int]): The clustering result to evaluate.
+            constraints (Optional[Sequence[Tuple[str, str, Optional[str]]]]): The constraints annotated before this clustering.
+
+        Returns:
+            Dict[str, Any]: The computed inputs.
+        """
+
+        # Initialize inputs.
+        inputs: Dict[str, Any] = {}
+
+        # Labels.
+        list_of_predicted_intents: List[int] = [clustering_result[data_ID] for data_ID in self.list_of_data_IDs]
+        inputs["labels"] = (self.list_of_true_intents, list_of_predicted_intents)
+
+        # Contingency matrix (true intents as rows, predicted clusters as columns).
+        if self.set_of_inputs & {"contingency", "entropies", "pair_counts"}:
+            predicted_index: np.ndarray = np.unique(list_of_predicted_intents, return_inverse=True)[1]
+            contingency: csr_matrix = csr_matrix(
+                (np.ones(len(predicted_index), dtype=np.int64), (self._true_intents_index, predicted_index)),
+            )
+            contingency.sum_duplicates()
+            inputs["contingency"] = contingency
+
+            # Entropies and mutual information.
+            if "entropies" in self.set_of_inputs:
+                inputs["entropies"] = (
+                    _entropy(np.ravel(contingency.sum(axis=1))),
+                    _entropy(np.ravel(contingency.sum(axis=0))),
+                    metrics.mutual_info_score(None, None, contingency=contingency),
+                )
+
+            # Pair confusion matrix.
+            if "pair_counts" in self.set_of_inputs:
+                inputs["pair_counts"] = _pair_confusion_matrix(contingency=contingency)
+
+        # Clustering and constraints.
+        inputs["clustering"] = clustering_result
+        if constraints is not None:
+            inputs["constraints"] = constraints
+
+        # Vectors.
+        if self._vectors is not None:
+            inputs["vectors"] = self._vectors
+
+        # Return inputs.
+        return inputs
+
+
+# ==============================================================================
+# PRIVATE - ENTROPY
+# ==============================================================================
+def _entropy(
+    counts: np.ndarray,
+) -> float:
+    """
+    A method aimed at compute the entropy of a labeling from its class counts (as `sklearn.metrics.cluster.entropy`).
+
+    Args:
+        counts (np.ndarray): The number of data in each class.
+
+    Returns:
+        float: The entropy.
+    """
+    counts = counts[counts > 0].astype(np.float64)
+    if len(counts) <= 1:
+        return 1.0 if len(counts) == 0 else 0.0
+    total: float = np.sum(counts)
+    return float(-np.sum((counts / total) * (np.log(counts) - math.log(total))))
+
+
+# ==============================================================================
+# PRIVATE - PAIR CONFUSION MATRIX
+# ==============================================================================
+def _pair_confusion_matrix(
+    contingency: csr_matrix,
+) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    A method aimed at compute the pair confusion matrix from a contingency matrix (as `sklearn.metrics.cluster.pair_confusion_matrix`).
+
+    Args:
+        contingency (csr_matrix): The contingency matrix (true intents as rows, predicted clusters as columns).
+
+    Returns:
+        Tuple[Tuple[int, int], Tuple[int, int]]: The pair confusion matrix `((tn, fp), (fn, tp))`.
+    """
+    n_samples: int = int(contingency.sum())
+    n_true: np.ndarray = np.ravel(contingency.sum(axis=1)).astype(np.int64)
+    n_pred: np.ndarray = np.ravel(contingency.sum(axis=0)).astype(np.int64)
+    sum_squares: int = int((contingency.data.astype(np.int64) ** 2).sum())
+    tp: int = sum_squares - n_samples
+    fp: int = int(contingency.dot(n_pred).sum()) - sum_squares
+    fn: int = int(contingency.transpose().dot(n_true).sum()) - sum_squares
+    tn: int = n_samples**2 - fp - fn - sum_squares
+    return ((tn, fp), (fn, tp))
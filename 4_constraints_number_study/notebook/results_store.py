@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         results_store
+* Description:  A columnar store (Parquet) of per-iteration results of interactive clustering constraints number study experiments.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+import metrics_registry
+
+# ==============================================================================
+# CONSTANTS - STORE SCHEMA
+# ==============================================================================
+
+# Default path to the results store.
+DEFAULT_STORE_PATH: str = "../results/campaign_store/"
+
+# Filename of the compacted part of the results store.
+COMPACTED_FILENAME: str = "compacted.parquet"
+
+# Environment factors (categorical columns).
+LIST_OF_FACTORS: List[str] = [
+    "dataset",
+    "preprocessing",
+    "vectorization",
+    "sampling",
+    "clustering",
+    "random_seed",
+]
+
+# Clustering metrics (float columns): default metrics of the metrics registry.
+LIST_OF_METRICS: List[str] = metrics_registry.DEFAULT_LIST_OF_METRICS
+
+# Schema of the results store: one row per (environment, iteration).
+STORE_SCHEMA: pa.Schema = pa.schema(
+    [pa.field("env_path", pa.string())]
+    + [pa.field(factor, pa.dictionary(pa.int32(), pa.string())) for factor in LIST_OF_FACTORS]
+    + [
+        pa.field("dataset_reference", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("dataset_size", pa.int32()),
+        pa.field("iteration", pa.int32()),
+    ]
+    + [pa.field(metric, pa.float64()) for metric in LIST_OF_METRICS]
+    + [
+        pa.field("sampling_time", pa.float64()),
+        pa.field("clustering_time", pa.float64()),
+        pa.field("total_time", pa.float64()),
+        pa.field("cumulative_sampling_time", pa.float64()),
+        pa.field("cumulative_clustering_time", pa.float64()),
+        pa.field("cumulative_total_time", pa.float64()),
+        pa.field("constraints_must_link", pa.int32()),
+        pa.field("constraints_cannot_link", pa.int32()),
+        pa.field("constraints_total", pa.int32()),
+    ]
+)
+
+
+# ==============================================================================
+# STORE - BUILD EXPERIMENT TABLE
+# ==============================================================================
+def build_experiment_table(
+    env_path: str,
+) -> pa.Table:
+    """
+    A method aimed at build the table of results of one experiment, with one row per iteration.
+    Metrics, computation times and cumulative constraints counts are read from the experiment storage files, and environment factors are deduced from the environment path.
+
+    Args:
+        env_path (str): The experiment environment path. It has to be formatted as `../experiments/[DATASET]/[PREPROCESSING]/[VECTORIZATION]/[SAMPLING]/[CLUSTERING]/[EXPERIMENT]/`.
+
+    Returns:
+        pa.Table: The table of results of the experiment, that follows `STORE_SCHEMA`.
+    """
+
+    ### ### ### ### ###
+    ### Load storage files.
+    ### ### ### ### ###
+
+    # Load dictionary of clustering performances.
+    with open(env_path + "dict_of_clustering_performances.json", "r") as file_performances:
+        dict_of_clustering_performances: Dict[str, Dict[str, float]] = json.load(file_performances)
+
+    # Load dictionary of time spent.
+    with open(env_path + "dict_of_computation_times.json", "r") as file_times:
+        dict_of_computation_times: Dict[str, Dict[str, float]] = json.load(file_times)
+
+    # Load dictionary of annotation history.
+    with open(env_path + "dict_of_constraints_annotations.json", "r") as file_annotations:
+        dict_of_constraints_annotations: Dict[str, List[Tuple[str, str, Optional[str]]]] = json.load(file_annotations)
+
+    # Load configuration for dataset.
+    with open(env_path + "../../../../../config.json", "r") as file_config_dataset:
+        CONFIG_DATASET = json.load(file_config_dataset)
+
+    ### ### ### ### ###
+    ### Build columns.
+    ### ### ### ### ###
+
+    # NB : environments paths are formatted links : `../experiments/[DATASET]/[PREPROCESSING]/[VECTORIZATION]/[SAMPLING]/[CLUSTERING]/[EXPERIMENT]/`
+    list_of_path_parts: List[str] = env_path.split("/")
+    dict_of_factors: Dict[str, str] = {
+        factor: list_of_path_parts[2 + i_factor] for i_factor, factor in enumerate(LIST_OF_FACTORS)
+    }
+
+    # Initialize columns.
+    dict_of_columns: Dict[str, List[Any]] = {field_name: [] for field_name in STORE_SCHEMA.names}
+
+    # Initialize cumulative counters.
+    cumulative_sampling_time: float = 0.0
+    cumulative_clustering_time: float = 0.0
+    cumulative_total_time: float = 0.0
+    count_ml: int = 0
+    count_cl: int = 0
+
+    # For each iteration (in ascending order)...
+    for iteration in sorted(dict_of_constraints_annotations.keys()):
+
+        # Update cumulative computation times.
+        times: Dict[str, float] = dict_of_computation_times.get(iteration, {})
+        cumulative_sampling_time += times.get("sampling_TOTAL_RUN", 0.0)
+        cumulative_clustering_time += times.get("clustering_TOTAL_RUN", 0.0)
+        cumulative_total_time += times.get("TOTAL_RUN", 0.0)
+
+        # Update cumulative constraints counts.
+        for annotation in dict_of_constraints_annotations[iteration]:
+            if annotation[2] == "MUST_LINK":
+                count_ml += 1
+            elif annotation[2] == "CANNOT_LINK":
+                count_cl += 1
+
+        # Environment and factors.
+        dict_of_columns["env_path"].append(env_path)
+        for factor, factor_value in dict_of_factors.items():
+            dict_of_columns[factor].append(factor_value)
+        dict_of_columns["dataset_reference"].append(dict_of_factors["dataset"].split("-")[0])
+        dict_of_columns["dataset_size"].append(CONFIG_DATASET["size"])
+        dict_of_columns["iteration"].append(int(iteration))
+
+        # Metrics (`None` if the iteration is not evaluated).
+        performances: Dict[str, float] = dict_of_clustering_performances.get(iteration, {})
+        for metric in LIST_OF_METRICS:
+            dict_of_columns[metric].append(performances.get(metric))
+
+        # Computation times.
+        dict_of_columns["sampling_time"].append(times.get("sampling_TOTAL_RUN"))
+        dict_of_columns["clustering_time"].append(times.get("clustering_TOTAL_RUN"))
+        dict_of_columns["total_time"].append(times.get("TOTAL_RUN"))
+        dict_of_columns["cumulative_sampling_time"].append(cumulative_sampling_time)
+        dict_of_columns["cumulative_clustering_time"].append(cumulative_clustering_time)
+        dict_of_columns["cumulative_total_time"].append(cumulative_total_time)
+
+        # Cumulative constraints counts.
+        dict_of_columns["constraints_must_link"].append(count_ml)
+        dict_of_columns["constraints_cannot_link"].append(count_cl)
+        dict_of_columns["constraints_total"].append(count_ml + count_cl)
+
+    # Return the typed table.
+    return pa.Table.from_pydict(dict_of_columns, schema=STORE_SCHEMA)
+
+
+# ==============================================================================
+# STORE - APPEND EXPERIMENT
+# ==============================================================================
+def append_experiment_to_store(
+    env_path: str,
+    store_path: str = DEFAULT_STORE_PATH,
+) -> int:
+    """
+    A method aimed at append (or replace) the results of one experiment in the results store.
+    Each experiment is stored in its own Parquet file, so that several evaluators can append to the store in parallel.
+
+    Args:
+        env_path (str): The experiment environment path.
+        store_path (str, optional): The path to the results store. Defaults to `DEFAULT_STORE_PATH`.
+
+    Returns:
+        int: Return `0` when finish.
+    """
+
+    # Create the store if needed.
+    os.makedirs(store_path, exist_ok=True)
+
+    # Write the experiment table (a hidden temporary file is used to avoid partial reads).
+    filename: str = _get_experiment_filename(env_path=env_path)
+    pq.write_table(
+        table=build_experiment_table(env_path=env_path),
+        where=store_path + "." + filename + ".tmp",
+    )
+    os.replace(store_path + "." + filename + ".tmp", store_path + filename)
+
+    # End of script.
+    return 0
+
+
+# ==============================================================================
+# STORE - BUILD STORE
+# ==============================================================================
+def build_results_store(
+    list_of_experiment_environments: List[str],
+    store_path: str = DEFAULT_STORE_PATH,
+) -> int:
+    """
+    A method aimed at build the results store of already evaluated experiments in one Parquet file.
+    The file is sorted by factors and iteration in order to have efficient row groups statistics for predicate pushdown.
+
+    Args:
+        list_of_experiment_environments (List[str]): The list of experiments environments to store.
+        store_path (str, optional): The path to the results store. Defaults to `DEFAULT_STORE_PATH`.
+
+    Returns:
+        int: Return `0` when finish.
+    """
+
+    # List experiment files already appended (they are replaced by the new store).
+    dict_of_appended_files: Dict[str, Tuple[int, int]] = _list_appended_files(store_path=store_path)
+
+    # Build tables of all experiments.
+    list_of_tables: List[pa.Table] = [
+        build_experiment_table(env_path=env_path)
+        for env_path in list_of_experiment_environments
+        if os.path.exists(env_path + "dict_of_clustering_performances.json")
+    ]
+
+    # Write the compacted store.
+    _write_compacted_store(
+        table=pa.concat_tables(list_of_tables) if list_of_tables else STORE_SCHEMA.empty_table(),
+        store_path=store_path,
+        dict_of_merged_files=dict_of_appended_files,
+    )
+
+    # End of script.
+    return 0
+
+
+# ==============================================================================
+# STORE - COMPACT STORE
+# ==============================================================================
+def compact_results_store(
+    store_path: str = DEFAULT_STORE_PATH,
+) -> int:
+    """
+    A method aimed at merge all experiment files appended in the results store into one sorted Parquet file.
+    Run it after a campaign in order to avoid opening thousands of small files on each query.
+    If an experiment has been appended again since the last compaction, its new results replace the old ones.
+    Experiment files appended during the compaction are kept for the next compaction.
+
+    Args:
+        store_path (str, optional): The path to the results store. Defaults to `DEFAULT_STORE_PATH`.
+
+    Returns:
+        int: Return `0` when finish.
+    """
+
+    # Load appended experiment files.
+    dict_of_appended_files: Dict[str, Tuple[int, int]] = _list_appended_files(store_path=store_path)
+    list_of_tables: List[pa.Table] = [
+        pq.read_table(filepath, schema=STORE_SCHEMA) for filepath in dict_of_appended_files.keys()
+    ]
+
+    # Load the previous compacted file, without experiments that have been appended again.
+    if os.path.exists(store_path + COMPACTED_FILENAME):
+        list_of_appended_envs: List[str] = sorted(
+            {env for table in list_of_tables for env in table.column("env_path").unique().to_pylist()}
+        )
+        compacted_table: pa.Table = pq.read_table(store_path + COMPACTED_FILENAME, schema=STORE_SCHEMA)
+        list_of_tables.append(
+            compacted_table.filter(
+                pc.invert(
+                    pc.is_in(
+                        compacted_table.column("env_path"),
+                        value_set=pa.array(list_of_appended_envs, type=pa.string()),
+                    )
+                )
+            )
+        )
+
+    # Write the compacted store.
+    _write_compacted_store(
+        table=pa.concat_tables(list_of_tables) if list_of_tables else STORE_SCHEMA.empty_table(),
+        store_path=store_path,
+        dict_of_merged_files=dict_of_appended_files,
+    )
+
+    # End of script.
+    return 0
+
+
+# ==============================================================================
+# STORE - QUERY
+# ==============================================================================
+def query_results_store(
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    store_path: str = DEFAULT_STORE_PATH,
+) -> pd.DataFrame:
+    """
+    A method aimed at query the results store.
+    Filters are pushed down to Parquet row groups, and only requested columns are read.
+    NB: if an experiment is evaluated again after a compaction, run `compact_results_store` before querying to avoid duplicated rows.
+    Usage example: "mean v-measure by sampling at iteration 40":
+        `query_results_store(columns=["sampling", "v_measure"], filters=[("iteration", "=", 40)]).groupby("sampling", observed=True)["v_measure"].mean()`
+
+    Args:
+        columns (Optional[List[str]], optional): The columns to read. Defaults to `None` (all columns).
+        filters (Optional[List[Tuple[str, str, Any]]], optional): The filters to apply, in `pyarrow` DNF format (ex: `[("iteration", "=", 40), ("clustering", "in", ["kmeans_cop-10c"])]`). Defaults to `None`.
+        store_path (str, optional): The path to the results store. Defaults to `DEFAULT_STORE_PATH`.
+
+    Returns:
+        pd.DataFrame: The requested results, with environment factors as categorical columns.
+    """
+
+    # Read the store with projection and predicate pushdown.
+    return pq.read_table(
+        store_path,
+        columns=columns,
+        filters=filters,
+        schema=STORE_SCHEMA,
+    ).to_pandas()
+
+
+# ==============================================================================
+# PRIVATE - GET EXPERIMENT FILENAME
+# ==============================================================================
+def _get_experiment_filename(
+    env_path: str,
+) -> str:
+    """
+    A method aimed at get the store filename of an experiment.
+
+    Args:
+        env_path (str): The experiment environment path.
+
+    Returns:
+        str: The Parquet filename of the experiment.
+    """
+
+    # NB : environments paths are formatted links : `../experiments/[DATASET]/[PREPROCESSING]/[VECTORIZATION]/[SAMPLING]/[CLUSTERING]/[EXPERIMENT]/`
+    return "__".join(env_path.strip("/").split("/")[2:]) + ".parquet"
+
+
+# ==============================================================================
+# PRIVATE - LIST APPENDED FILES
+# ==============================================================================
+def _list_appended_files(
+    store_path: str,
+) -> Dict[str, Tuple[int, int]]:
+    """
+    A method aimed at list experiment files appended in the results store, with their modification time and size.
+
+    Args:
+        store_path (str): The path to the results store.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: The modification time (in nanoseconds) and size of each appended experiment file, by path.
+    """
+
+    # Case of store not created.
+    if not os.path.exists(store_path):
+        return {}
+
+    # List experiment files (hidden temporary files and the compacted file are excluded).
+    dict_of_appended_files: Dict[str, Tuple[int, int]] = {}
+    for filename in sorted(os.listdir(store_path)):
+        if filename.endswith(".parquet") and filename != COMPACTED_FILENAME:
+            stat: os.stat_result = os.stat(store_path + filename)
+            dict_of_appended_files[store_path + filename] = (stat.st_mtime_ns, stat.st_size)
+    return dict_of_appended_files
+
+
+# ==============================================================================
+# PRIVATE - WRITE COMPACTED STORE
+# ==============================================================================
+def _write_compacted_store(
+    table: pa.Table,
+    store_path: str,
+    dict_of_merged_files: Dict[str, Tuple[int, int]],
+) -> int:
+    """
+    A method aimed at replace the compacted file of the results store, then remove the experiment files merged in it.
+    The compacted file is replaced before merged files are removed, so that readers always see all results. Only merged files that didn't change since they were read are removed.
+
+    Args:
+        table (pa.Table): The table of all results.
+        store_path (str): The path to the results store.
+        dict_of_merged_files (Dict[str, Tuple[int, int]]): The experiment files merged in the table, with their modification time and size when they were read (cf. `_list_appended_files`).
+
+    Returns:
+        int: Return `0` when finish.
+    """
+
+    # Create the store if needed.
+    os.makedirs(store_path, exist_ok=True)
+
+    # Sort the table by environment (i.e. by factors) and iteration (for row groups statistics).
+    table = table.sort_by([("env_path", "ascending"), ("iteration", "ascending")])
+
+    # Write the compacted file (a hidden temporary file is used to avoid partial reads).
+    pq.write_table(
+        table=table,
+        where=store_path + "." + COMPACTED_FILENAME + ".tmp",
+        row_group_size=65536,
+    )
+
+    os.replace(store_path + "." + COMPACTED_FILENAME + ".tmp", store_path + COMPACTED_FILENAME)
+
+    # Remove experiment files that are now in the compacted file (files appended again since they were read are kept).
+    for filepath, (mtime_ns, size) in dict_of_merged_files.items():
+        if os.path.exists(filepath):
+            stat: os.stat_result = os.stat(filepath)
+            if (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
+                os.remove(filepath)
+
+    # End of script.
+    return 0
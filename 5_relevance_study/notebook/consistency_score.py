@@ -12,10 +12,10 @@
 # IMPORT PYTHON DEPENDENCIES
 # ==============================================================================
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+import functools
 import json
 import numpy as np
-from scipy import stats as scipystats
 from cognitivefactory.features_maximization_metric.fmc import FeaturesMaximizationMetric
 from sklearn.pipeline import Pipeline
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -24,6 +24,9 @@ from sklearn.svm import LinearSVC
 from sklearn import metrics
 from matplotlib import pyplot as plt
 from matplotlib.figure import Figure
+import experiment_cube
+import overview_cache
+import overview_stats
 
 # ==============================================================================
 # 1. COMPUTE CONSISTENCY SCORE
@@ -93,6 +96,10 @@ def display_consistency_score(
     plot_label: str = "Score de cohérence du clustering.",
     plot_color: str = "black",
     graph_filename: str = "consistency_score.png",
+    error_type: str = "sem",
+    nb_resamples: int = 2000,
+    nb_workers: int = 1,
+    with_cache: bool = True,
 ) -> Figure:
     """
     Display consistency score per iteration.
@@ -104,79 +111,94 @@ def display_consistency_score(
         plot_label (str): The label of the plot. Defaults to `"Score de cohérence du clustering."`.
         plot_color (str): The color of plot. Defaults to `"black"`.
         graph_filename (str): The graph filename. Default to `"consistency_score.png"`.
+        error_type (str): The error band to plot: `"sem"` (standard error of the mean) or `"ci"` (95% percentile bootstrap confidence interval). Defaults to `"sem"`.
+        nb_resamples (int): The number of bootstrap resamples if `error_type` is `"ci"`. Defaults to `2000`.
+        nb_workers (int): The number of processes used to read experiments, and of threads used to compute bootstrap resamples. Defaults to `1`.
+        with_cache (bool): The option to get statistics from the overview cache if no experiment file changed (cf. `overview_cache`). Defaults to `True`.
         
     Returns:
         Figure: Figure of consistency score evolution.
     """
     
-    # Definition of list_of_iteration:
-    if list_of_iterations is None:
-        
-        # Initialize maximum iteration.
-        max_iteration: str = "0000"
-    
-        # For each experiment...
-        for exp1 in list_of_experiments:
+    # Define the computation of statistics from experiments files.
+    def _compute_statistics() -> Dict[str, Any]:
 
-            # Load data for the experiment.
-            with open("../experiments/" + implementation + "/previous_results___" + exp1, "r") as file_data_r:
-                dict_of_clustering_results: Dict[str, Any] = json.load(file_data_r)["dict_of_clustering_results"]
+        # Load consistency scores of all experiments (one parallel read per experiment).
+        dict_of_readings: Dict[str, Dict[str, Any]] = experiment_cube.read_experiments(
+            dict_of_overviews={"consistency": list_of_experiments},
+            read_experiment=functools.partial(
+                _read_experiment_consistency,
+                implementation=implementation,
+                with_last_iteration=(list_of_iterations is None),
+            ),
+            nb_workers=nb_workers,
+        )
 
-            # Update meximum iteration.
-            max_iteration = max(
-                max(dict_of_clustering_results.keys()),
-                max_iteration,
+        # Definition of list_of_iteration:
+        list_of_iterations_to_compute: Optional[List[str]] = list_of_iterations
+        if list_of_iterations_to_compute is None:
+            list_of_iterations_to_compute = experiment_cube.get_list_of_iterations(
+                dict_of_readings=dict_of_readings,
+                min_max_iter="0000",
             )
 
-        # Update list of iterations
-        list_of_iterations: List[str] = [
-            str(i).zfill(4)
-            for i in range(int(max_iteration))
-        ]
-
-    # Initialize storage of experiment consistency for all iterations.
-    dict_of_consistency_evolution: Dict[str, List[float]] = {
-        iter_cons: [] for iter_cons in list_of_iterations
-    }
+        # Get groundtruth consistency (same for all experiments).
+        groundtruth_consistency_score: float = dict_of_readings[list_of_experiments[-1]]["FILL"]["consistency"]
 
-    # Initialize storage of groundtruth consistency.
-    groundtruth_consistency_score: str = 0.0
+        # Store experiment consistency for all iterations (if iteration isn't reached by an experiment, use groundtruth consistency).
+        cube: Dict[str, Any] = experiment_cube.build_experiment_cube(
+            dict_of_overviews={"consistency": list_of_experiments},
+            dict_of_readings=dict_of_readings,
+            list_of_metrics=["consistency"],
+            list_of_iterations=list_of_iterations_to_compute,
+        )
 
-    # For each experiment...
-    for exp2 in list_of_experiments:
+        # Compute statistics of experiment consistency for all iterations (array of shape `(experiments, iterations)`).
+        dict_of_consistency_evolution_STATS: Dict[str, np.ndarray] = overview_stats.compute_overview_statistics(
+            array_of_values=experiment_cube.get_overview_values(
+                cube=cube,
+                overview="consistency",
+                metric="consistency",
+            ),
+            with_bootstrap=(error_type == "ci"),
+            nb_resamples=nb_resamples,
+            nb_workers=nb_workers,
+        )
 
-        # Load data for the experiment.
-        with open("../experiments/" + implementation + "/constistency_score___" + exp2, "r") as file_scores_r:
-            experiment_scores: Dict[str, Any] = json.load(file_scores_r)
+        # Return iterations and statistics.
+        return {
+            "ITERATIONS": list_of_iterations_to_compute,
+            "GROUNDTRUTH": groundtruth_consistency_score,
+            "STATS": dict_of_consistency_evolution_STATS,
+        }
 
-        # Get groundtruth consistency (same for all experiments).
-        groundtruth_consistency_score = experiment_scores["groundtruth"]
-        
-        # For each requested iteration...
-        for iter_a in list_of_iterations:
-
-            # Append the clustering consistency for the current experiment and for this iteration.
-            if iter_a in experiment_scores["evolution"].keys():
-                dict_of_consistency_evolution[iter_a].append(
-                    experiment_scores["evolution"][iter_a]
-                )
-            # If iteration isn't reached by this experiment, duplicate the last known results.
-            else:
-                dict_of_consistency_evolution[iter_a].append(
-                    experiment_scores["groundtruth"]
-                )
-        
+    # Get statistics from cache, or compute them (if no experiment file changed).
+    dict_of_results: Dict[str, Any] = overview_cache.get_or_compute(
+        list_of_filepaths=[
+            "../experiments/" + implementation + "/" + prefix + experiment
+            for experiment in list_of_experiments
+            for prefix in ["constistency_score___", "previous_results___"]
+        ],
+        dict_of_settings={
+            "overview": "display_consistency_score",
+            "implementation": implementation,
+            "list_of_experiments": list_of_experiments,
+            "list_of_iterations": list_of_iterations,
+            "error_type": error_type,
+            "nb_resamples": nb_resamples,
+        },
+        compute=_compute_statistics,
+        with_cache=with_cache,
+    )
+    list_of_iterations = dict_of_results["ITERATIONS"]
+    groundtruth_consistency_score: float = dict_of_results["GROUNDTRUTH"]
+    dict_of_consistency_evolution_STATS: Dict[str, np.ndarray] = dict_of_results["STATS"]
 
-    # Initialize storage of experiment consistency mean for all iterations.
-    dict_of_consistency_evolution_MEAN: Dict[str, float] = {
-        iter_mean: np.mean(dict_of_consistency_evolution[iter_mean])
-        for iter_mean in list_of_iterations
-    }
-    # Initialize storage of experiment consistency standard error of the mean for all iterations.
-    dict_of_consistency_evolution_SEM: Dict[str, float] = {
-        iter_sem: scipystats.sem(dict_of_consistency_evolution[iter_sem])
-        for iter_sem in list_of_iterations
-    }
+    # Get error band.
+    consistency_error_band: Tuple[np.ndarray, np.ndarray] = overview_stats.get_error_band(
+        dict_of_statistics=dict_of_consistency_evolution_STATS,
+        error_type=error_type,
+    )
     
     # Create a new figure.
     fig_plot: Figure = plt.figure(figsize=(15, 7.5), dpi=300)
@@ -189,7 +211,7 @@ def display_consistency_score(
     # Plot average clustering consistency evolution.
     axis_plot.plot(
         [int(iter_mean) for iter_mean in list_of_iterations],  # x
-        [dict_of_consistency_evolution_MEAN[iter_mean] for iter_mean in list_of_iterations],  # y
+        dict_of_consistency_evolution_STATS["MEAN"],  # y
         label=plot_label,
         marker="",
         markerfacecolor=plot_color,
@@ -200,8 +222,8 @@ def display_consistency_score(
     )
     axis_plot.fill_between(
         x=[int(iter_err) for iter_err in list_of_iterations],  # x
-        y1=[(dict_of_consistency_evolution_MEAN[iter_errinf] - dict_of_consistency_evolution_SEM[iter_errinf]) for iter_errinf in list_of_iterations],  # y1
-        y2=[(dict_of_consistency_evolution_MEAN[iter_errsup] + dict_of_consistency_evolution_SEM[iter_errsup]) for iter_errsup in list_of_iterations],  # y2
+        y1=consistency_error_band[0],  # y1
+        y2=consistency_error_band[1],  # y2
         color=plot_color,
         alpha=0.2,
     )
@@ -240,4 +262,42 @@ def display_consistency_score(
             bbox_inches="tight",
         )
 
-    return fig_plot
\ No newline at end of file
+    return fig_plot
+
+
+# ==============================================================================
+# 3. READ CONSISTENCY SCORE OF AN EXPERIMENT
+# ==============================================================================
+def _read_experiment_consistency(
+    experiment: str,
+    implementation: str,
+    with_last_iteration: bool = True,
+) -> Dict[str, Any]:
+    """
+    Read consistency scores of an experiment for `experiment_cube` (defined at module level, to be used in a process pool).
+    
+    Args:
+        experiment (str): The file that represents the experiment.
+        implementation (str): The folder that represents the folder to display.
+        with_last_iteration (bool): The option to read the last iteration reached by the experiment in its previous results. Defaults to `True`.
+        
+    Returns:
+        Dict[str, Any]: The last iteration reached, the consistency of each iteration, and the groundtruth consistency used for iterations not reached.
+    """
+    
+    # Load data for the experiment.
+    with open("../experiments/" + implementation + "/constistency_score___" + experiment, "r") as file_scores_r:
+        experiment_scores: Dict[str, Any] = json.load(file_scores_r)
+    
+    # Load last iteration reached.
+    last_iteration: str = "0000"
+    if with_last_iteration:
+        with open("../experiments/" + implementation + "/previous_results___" + experiment, "r") as file_data_r:
+            last_iteration = max(json.load(file_data_r)["dict_of_clustering_results"].keys())
+    
+    # Return reading.
+    return {
+        "LAST_ITERATION": last_iteration,
+        "SERIES": {"consistency": experiment_scores["evolution"]},
+        "FILL": {"consistency": experiment_scores["groundtruth"]},
+    }
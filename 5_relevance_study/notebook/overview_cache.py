@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         overview_cache
+* Description:  Disk cache of overview statistics, keyed by the fingerprints of experiment files.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import hashlib
+import json
+import os
+import pickle  # noqa: S403
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Default path to the overview cache.
+DEFAULT_CACHE_PATH: str = "../results/.overview_cache/"
+
+# Default maximum size of the overview cache (in bytes).
+DEFAULT_MAX_CACHE_SIZE: int = 512 * 1024 * 1024
+
+
+# ==============================================================================
+# CACHE - GET OR COMPUTE
+# ==============================================================================
+def get_or_compute(
+    list_of_filepaths: List[str],
+    dict_of_settings: Dict[str, Any],
+    compute: Callable[[], Dict[str, Any]],
+    with_cache: bool = True,
+    cache_path: str = DEFAULT_CACHE_PATH,
+    max_cache_size: int = DEFAULT_MAX_CACHE_SIZE,
+) -> Dict[str, Any]:
+    """
+    A method aimed at get overview statistics from the cache, or compute and cache them.
+    The cache key is made of the settings and of the path, modification time and size of each input file: if no input file changed, files are not loaded at all.
+    When the cache exceeds its maximum size, least recently used entries are removed.
+
+    Args:
+        list_of_filepaths (List[str]): The input files of the overview.
+        dict_of_settings (Dict[str, Any]): The settings of the overview (JSON serializable), ex: the overview name, the list of iterations, the error type.
+        compute (Callable[[], Dict[str, Any]]): The function that loads input files and computes overview statistics.
+        with_cache (bool, optional): The option to use the cache. Defaults to `True`.
+        cache_path (str, optional): The path to the overview cache. Defaults to `DEFAULT_CACHE_PATH`.
+        max_cache_size (int, optional): The maximum size of the overview cache (in bytes). Defaults to `DEFAULT_MAX_CACHE_SIZE`.
+
+    Returns:
+        Dict[str, Any]: The overview statistics.
+    """
+
+    # Case of cache not used.
+    if not with_cache:
+        return compute()
+
+    # Get the cache entry of these settings and input files.
+    cache_filepath: str = cache_path + get_cache_key(
+        list_of_filepaths=list_of_filepaths,
+        dict_of_settings=dict_of_settings,
+    ) + ".pkl"
+
+    # Case of cache hit: load the entry and mark it as recently used.
+    if os.path.exists(cache_filepath):
+        with open(cache_filepath, "rb") as file_cache_r:
+            dict_of_results: Dict[str, Any] = pickle.load(file_cache_r)  # noqa: S301
+        os.utime(cache_filepath)
+        return dict_of_results
+
+    # Otherwise: compute the overview and store it (a hidden temporary file is used to avoid partial reads).
+    dict_of_results = compute()
+    os.makedirs(cache_path, exist_ok=True)
+    with open(cache_filepath + ".tmp", "wb") as file_cache_w:
+        pickle.dump(dict_of_results, file_cache_w, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(cache_filepath + ".tmp", cache_filepath)
+
+    # Remove least recently used entries if the cache is too big.
+    _evict_entries(
+        cache_path=cache_path,
+        max_cache_size=max_cache_size,
+    )
+
+    # Return the overview statistics.
+    return dict_of_results
+
+
+# ==============================================================================
+# CACHE - GET CACHE KEY
+# ==============================================================================
+def get_cache_key(
+    list_of_filepaths: List[str],
+    dict_of_settings: Dict[str, Any],
+) -> str:
+    """
+    A method aimed at get the cache key of an overview, from its settings and the fingerprint (path, modification time, size) of its input files.
+
+    Args:
+        list_of_filepaths (List[str]): The input files of the overview.
+        dict_of_settings (Dict[str, Any]): The settings of the overview (JSON serializable).
+
+    Returns:
+        str: The cache key.
+    """
+
+    # Get fingerprints of input files (`None` for a missing file).
+    list_of_fingerprints: List[Tuple[str, Optional[int], Optional[int]]] = []
+    for filepath in list_of_filepaths:
+        if os.path.exists(filepath):
+            stat: os.stat_result = os.stat(filepath)
+            list_of_fingerprints.append((filepath, stat.st_mtime_ns, stat.st_size))
+        else:
+            list_of_fingerprints.append((filepath, None, None))
+
+    # Return the hash of settings and fingerprints.
+    return hashlib.sha1(
+        json.dumps([dict_of_settings, list_of_fingerprints], sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+# ==============================================================================
+# CACHE - INVALIDATE
+# ==============================================================================
+def invalidate_cache(
+    cache_path: str = DEFAULT_CACHE_PATH,
+) -> int:
+    """
+    A method aimed at remove all entries of the overview cache.
+
+    Args:
+        cache_path (str, optional): The path to the overview cache. Defaults to `DEFAULT_CACHE_PATH`.
+
+    Returns:
+        int: The number of removed entries.
+    """
+
+    # Case of no cache.
+    if not os.path.exists(cache_path):
+        return 0
+
+    # Remove all entries.
+    nb_removed_entries: int = 0
+    for filename in os.listdir(cache_path):
+        if filename.endswith(".pkl") or filename.endswith(".pkl.tmp"):
+            os.remove(cache_path + filename)
+            nb_removed_entries += 1
+
+    # Return the number of removed entries.
+    return nb_removed_entries
+
+
+# ==============================================================================
+# PRIVATE - EVICT ENTRIES
+# ==============================================================================
+def _evict_entries(
+    cache_path: str,
+    max_cache_size: int,
+) -> int:
+    """
+    A method aimed at remove least recently used entries until the cache size is below its maximum size.
+
+    Args:
+        cache_path (str): The path to the overview cache.
+        max_cache_size (int): The maximum size of the overview cache (in bytes).
+
+    Returns:
+        int: The number of removed entries.
+    """
+
+    # Get entries, from the least to the most recently used.
+    list_of_entries: List[Tuple[int, int, str]] = sorted(
+        (stat.st_mtime_ns, stat.st_size, cache_path + filename)
+        for filename in os.listdir(cache_path)
+        if filename.endswith(".pkl")
+        for stat in [os.stat(cache_path + filename)]
+    )
+
+    # Remove entries until the cache size is below its maximum size.
+    cache_size: int = sum(size for _, size, _ in list_of_entries)
+    nb_removed_entries: int = 0
+    for _, size, filepath in list_of_entries:
+        if cache_size <= max_cache_size:
+            break
+        os.remove(filepath)
+        cache_size -= size
+        nb_removed_entries += 1
+
+    # Return the number of removed entries.
+    return nb_removed_entries
+
+
+# ==============================================================================
+# COMMAND - INVALIDATE
+# ==============================================================================
+if __name__ == "__main__":
+    # Usage: `python overview_cache.py` (from the `notebook` folder) to remove all entries of the overview cache.
+    print(str(invalidate_cache()) + " overview cache entries removed.")
@@ -12,14 +12,17 @@
 # IMPORT PYTHON DEPENDENCIES
 # ==============================================================================
 
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple
+import functools
 import json
 import pandas as pd
 from sklearn import metrics
 import numpy as np
-from scipy import stats as scipystats
 from matplotlib import pyplot as plt
 from matplotlib.figure import Figure
+import experiment_cube
+import overview_cache
+import overview_stats
 
 # ==============================================================================
 # 1. COMPUTE CLUSTERING SIMILARITY MOVING AVERAGE
@@ -85,6 +88,10 @@ def display_clustering_similarity(
     plot_color: str = "black",
     legend_loc: str = "center right",
     graph_filename: str = "clustering_similarity.png",
+    error_type: str = "sem",
+    nb_resamples: int = 2000,
+    nb_workers: int = 1,
+    with_cache: bool = True,
 ) -> Figure:
     """
     Display clustering similarity per iteration.
@@ -98,118 +105,113 @@ def display_clustering_similarity(
         plot_color (str): The color of plot. Defaults to `"black"`.
         legend_loc (str): The legend location. Defaults to `"center right"`.
         graph_filename (str): The graph filename. Default to `"clustering_similarity.png"`.
+        error_type (str): The error band to plot: `"sem"` (standard error of the mean) or `"ci"` (95% percentile bootstrap confidence interval). Defaults to `"sem"`.
+        nb_resamples (int): The number of bootstrap resamples if `error_type` is `"ci"`. Defaults to `2000`.
+        nb_workers (int): The number of processes used to read experiments, and of threads used to compute bootstrap resamples. Defaults to `1`.
+        with_cache (bool): The option to get statistics from the overview cache if no experiment file changed (cf. `overview_cache`). Defaults to `True`.
         
     Returns:
         Figure: Figure of clustering similarity evolution.
     """
     
-    # Definition of list_of_iteration:
-    if list_of_iterations is None:
-        
-        # Initialize maximum iteration.
-        max_iteration: str = "0001"
-    
-        # For each experiment...
-        for exp1 in list_of_experiments:
+    # Define the computation of statistics from experiments files.
+    def _compute_statistics() -> Dict[str, Any]:
 
-            # Load data for the experiment.
-            with open("../experiments/" + implementation + "/previous_results___" + exp1, "r") as file_data_r:
-                dict_of_clustering_results: Dict[str, Dict[str, int]] = json.load(file_data_r)["dict_of_clustering_results"]
+        # Load clustering dissimilarities and clustering performances of all experiments (one parallel read per experiment).
+        dict_of_readings: Dict[str, Dict[str, Any]] = experiment_cube.read_experiments(
+            dict_of_overviews={"clustering_dissimilarity": list_of_experiments},
+            read_experiment=functools.partial(
+                _read_experiment_clustering_similarity,
+                implementation=implementation,
+            ),
+            nb_workers=nb_workers,
+        )
 
-            # Update meximum iteration.
-            max_iteration = max(
-                max(dict_of_clustering_results.keys()),
-                max_iteration,
+        # Definition of list_of_iteration:
+        list_of_iterations_to_compute: Optional[List[str]] = list_of_iterations
+        if list_of_iterations_to_compute is None:
+            list_of_iterations_to_compute = experiment_cube.get_list_of_iterations(
+                dict_of_readings=dict_of_readings,
+                min_max_iter="0001",
             )
 
-        # Update list of iterations
-        list_of_iterations: List[str] = [
-            str(i).zfill(4)
-            for i in range(int(max_iteration))
+        # Update iteration by removing "0000".
+        list_of_iterations_to_compute = [
+            i
+            for i in list_of_iterations_to_compute
+            if i != "0000"
         ]
-            
-    # Update iteration by removing "0000".
-    list_of_iterations = [
-        i
-        for i in list_of_iterations
-        if i != "0000"
-    ]
-
-    # Initialize storage of experiment annotation agreement score for all iterations.
-    dict_of_clustering_similarity_evolution: Dict[str, List[float]] = {
-        iter_2i: [] for iter_2i in list_of_iterations
-    }
 
-    # For each experiment...
-    for exp2 in list_of_experiments:
-
-        # Load data for the experiment.
-        with open("../experiments/" + implementation + "/clustering_similarity___" + exp2, "r") as file_scores_r:
-            clustering_similarity: Dict[str, Dict[str, float]] = json.load(file_scores_r)
-        
-        # For each requested iteration...
-        for iter_2 in list_of_iterations:
+        # Store clustering dissimilarities and performances for all iterations (if iteration isn't reached by an experiment, use 0.0).
+        cube: Dict[str, Any] = experiment_cube.build_experiment_cube(
+            dict_of_overviews={"clustering_dissimilarity": list_of_experiments},
+            dict_of_readings=dict_of_readings,
+            list_of_metrics=["clustering_dissimilarity", "v_measure"],
+            list_of_iterations=list_of_iterations_to_compute,
+        )
 
-            # Append the clustering similarity for the current experiment and for this iteration.
-            if iter_2 in clustering_similarity["similarity"].keys():
-                dict_of_clustering_similarity_evolution[iter_2].append(
-                    1-clustering_similarity["similarity"][iter_2]
-                )
-            # If iteration isn't reached by this experiment, add 1.0.
-            else:
-                dict_of_clustering_similarity_evolution[iter_2].append(0.0)
-                
+        # Compute statistics of experiment clustering dissimilarities for all iterations (array of shape `(experiments, iterations)`).
+        dict_of_clustering_similarity_evolution_STATS: Dict[str, np.ndarray] = overview_stats.compute_overview_statistics(
+            array_of_values=experiment_cube.get_overview_values(
+                cube=cube,
+                overview="clustering_dissimilarity",
+                metric="clustering_dissimilarity",
+            ),
+            with_bootstrap=(error_type == "ci"),
+            nb_resamples=nb_resamples,
+            nb_workers=nb_workers,
+        )
 
-    # Initialize storage of experiment clustering similarity mean for all iterations.
-    dict_of_clustering_similarity_evolution_MEAN: Dict[str, float] = {
-        iter_2m: np.mean(dict_of_clustering_similarity_evolution[iter_2m])
-        for iter_2m in list_of_iterations
-    }
-    # Initialize storage of experiment clustering similarity standard error of the mean for all iterations.
-    dict_of_clustering_similarity_evolution_SEM: Dict[str, float] = {
-        iter_2s: scipystats.sem(dict_of_clustering_similarity_evolution[iter_2s])
-        for iter_2s in list_of_iterations
-    }
-        
+        # Compute statistics of performance evolution (array of shape `(experiments, iterations)`).
+        dict_of_performances_evolution_per_iteration_STATS: Dict[str, np.ndarray] = overview_stats.compute_overview_statistics(
+            array_of_values=experiment_cube.get_overview_values(
+                cube=cube,
+                overview="clustering_dissimilarity",
+                metric="v_measure",
+            ),
+            with_bootstrap=(error_type == "ci"),
+            nb_resamples=nb_resamples,
+            nb_workers=nb_workers,
+        )
 
-    # Initialize storage of experiment performances for all iterations.
-    dict_of_performances_evolution_per_iteration: Dict[str, List[float]] = {
-        iter_3i: []
-        for iter_3i in list_of_iterations
-    }
-    
-    # For each experiments.
-    for exp3 in list_of_experiments:
-        
-        # Load data.
-        with open("../experiments/" + implementation + "/previous_results___" + exp3, "r") as file_experiment_data_r:
-            experiment_data: Dict[str, Any] = json.load(file_experiment_data_r)
-        dict_of_clustering_performances: Dict[str, Dict[str, float]] = experiment_data["dict_of_clustering_performances"]
+        # Return iterations and statistics.
+        return {
+            "ITERATIONS": list_of_iterations_to_compute,
+            "STATS": dict_of_clustering_similarity_evolution_STATS,
+            "PERFORMANCES_STATS": dict_of_performances_evolution_per_iteration_STATS,
+        }
 
-        # For each requested iteration...
-        for iter_3 in list_of_iterations:
+    # Get statistics from cache, or compute them (if no experiment file changed).
+    dict_of_results: Dict[str, Any] = overview_cache.get_or_compute(
+        list_of_filepaths=[
+            "../experiments/" + implementation + "/" + prefix + experiment
+            for experiment in list_of_experiments
+            for prefix in ["clustering_similarity___", "previous_results___"]
+        ],
+        dict_of_settings={
+            "overview": "display_clustering_similarity",
+            "implementation": implementation,
+            "list_of_experiments": list_of_experiments,
+            "list_of_iterations": list_of_iterations,
+            "error_type": error_type,
+            "nb_resamples": nb_resamples,
+        },
+        compute=_compute_statistics,
+        with_cache=with_cache,
+    )
+    list_of_iterations = dict_of_results["ITERATIONS"]
+    dict_of_clustering_similarity_evolution_STATS: Dict[str, np.ndarray] = dict_of_results["STATS"]
+    dict_of_performances_evolution_per_iteration_STATS: Dict[str, np.ndarray] = dict_of_results["PERFORMANCES_STATS"]
 
-            # Append the clustering performancre for the current experiment and for this iteration.
-            if iter_3 in dict_of_clustering_performances.keys():
-                dict_of_performances_evolution_per_iteration[iter_3].append(
-                    dict_of_clustering_performances[iter_3]["v_measure"]
-                )
-            # If iteration isn't reached by this experiment, duplicate the last known results.
-            # Most of the time: the experiment has reached annotation completeness and there is no more iteration because clustering is "perfect" (v-measure==1.0).
-            else:
-                dict_of_performances_evolution_per_iteration[iter_3].append(1.0)
-                
-    # Compute mean of performance evolution.
-    dict_of_performances_evolution_per_iteration_MEAN: Dict[str, Dict[str, float]] = {
-        iter_3m: np.mean(dict_of_performances_evolution_per_iteration[iter_3m])
-        for iter_3m in dict_of_performances_evolution_per_iteration.keys()
-    }
-        
-    # Compute sem of performance evolution.
-    dict_of_performances_evolution_per_iteration_SEM: Dict[str, Dict[str, float]] = {
-        iter_3s: scipystats.sem(dict_of_performances_evolution_per_iteration[iter_3s])
-        for iter_3s in dict_of_performances_evolution_per_iteration.keys()
-    }
+    # Get error bands.
+    clustering_similarity_error_band: Tuple[np.ndarray, np.ndarray] = overview_stats.get_error_band(
+        dict_of_statistics=dict_of_clustering_similarity_evolution_STATS,
+        error_type=error_type,
+    )
+    performances_error_band: Tuple[np.ndarray, np.ndarray] = overview_stats.get_error_band(
+        dict_of_statistics=dict_of_performances_evolution_per_iteration_STATS,
+        error_type=error_type,
+    )
     
     # Create a new figure.
     fig_plot: Figure = plt.figure(figsize=(15, 7.5), dpi=300)
@@ -222,7 +224,7 @@ def display_clustering_similarity(
     # Plot average clustering similarity evolution.
     axis_plot.plot(
         [int(iter_mean) for iter_mean in list_of_iterations],  # x
-        [dict_of_clustering_similarity_evolution_MEAN[iter_mean] for iter_mean in list_of_iterations],  # y
+        dict_of_clustering_similarity_evolution_STATS["MEAN"],  # y
         label=plot_label,
         marker="",
         markerfacecolor=plot_color,
@@ -233,8 +235,8 @@ def display_clustering_similarity(
     )
     axis_plot.fill_between(
         x=[int(iter_err) for iter_err in list_of_iterations],  # x
-        y1=[(dict_of_clustering_similarity_evolution_MEAN[iter_errinf] - dict_of_clustering_similarity_evolution_SEM[iter_errinf]) for iter_errinf in list_of_iterations],  # y1
-        y2=[(dict_of_clustering_similarity_evolution_MEAN[iter_errsup] + dict_of_clustering_similarity_evolution_SEM[iter_errsup]) for iter_errsup in list_of_iterations],  # y2
+        y1=clustering_similarity_error_band[0],  # y1
+        y2=clustering_similarity_error_band[1],  # y2
         color=plot_color,
         alpha=0.2,
     )
@@ -242,7 +244,7 @@ def display_clustering_similarity(
     # Plot average performance of clustering.
     axis_plot.plot(
         [int(iter_mean) for iter_mean in list_of_iterations],  # x
-        [dict_of_performances_evolution_per_iteration_MEAN[iter_mean] for iter_mean in list_of_iterations],  # y
+        dict_of_performances_evolution_per_iteration_STATS["MEAN"],  # y
         label=plot_groundtruth_label,
         marker="",
         markerfacecolor="black",
@@ -253,8 +255,8 @@ def display_clustering_similarity(
     )
     axis_plot.fill_between(
         x=[int(iter_err) for iter_err in list_of_iterations],  # x
-        y1=[(dict_of_performances_evolution_per_iteration_MEAN[iter_errinf] - dict_of_performances_evolution_per_iteration_SEM[iter_errinf]) for iter_errinf in list_of_iterations],  # y1
-        y2=[(dict_of_performances_evolution_per_iteration_MEAN[iter_errsup] + dict_of_performances_evolution_per_iteration_SEM[iter_errsup]) for iter_errsup in list_of_iterations],  # y2
+        y1=performances_error_band[0],  # y1
+        y2=performances_error_band[1],  # y2
         color="black",
         alpha=0.2,
     )
@@ -280,4 +282,47 @@ def display_clustering_similarity(
             bbox_inches="tight",
         )
 
-    return fig_plot
\ No newline at end of file
+    return fig_plot
+
+
+# ==============================================================================
+# 3. READ CLUSTERING SIMILARITY OF AN EXPERIMENT
+# ==============================================================================
+def _read_experiment_clustering_similarity(
+    experiment: str,
+    implementation: str,
+) -> Dict[str, Any]:
+    """
+    Read clustering dissimilarities and clustering performances of an experiment for `experiment_cube` (defined at module level, to be used in a process pool).
+    
+    Args:
+        experiment (str): The file that represents the experiment.
+        implementation (str): The folder that represents the folder to display.
+        
+    Returns:
+        Dict[str, Any]: The last iteration reached, the clustering dissimilarities and the v-measure of each iteration, and their values for iterations not reached.
+    """
+    
+    # Load scores for the experiment.
+    with open("../experiments/" + implementation + "/clustering_similarity___" + experiment, "r") as file_scores_r:
+        clustering_similarity: Dict[str, Dict[str, float]] = json.load(file_scores_r)
+    
+    # Load data for the experiment.
+    with open("../experiments/" + implementation + "/previous_results___" + experiment, "r") as file_experiment_data_r:
+        experiment_data: Dict[str, Any] = json.load(file_experiment_data_r)
+    
+    # Return reading.
+    return {
+        "LAST_ITERATION": max(experiment_data["dict_of_clustering_results"].keys()),
+        "SERIES": {
+            "clustering_dissimilarity": {
+                iteration: 1 - similarity
+                for iteration, similarity in clustering_similarity["similarity"].items()
+            },
+            "v_measure": {
+                iteration: performances["v_measure"]
+                for iteration, performances in experiment_data["dict_of_clustering_performances"].items()
+            },
+        },
+        "FILL": {"clustering_dissimilarity": 0.0, "v_measure": 1.0},
+    }
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         experiment_cube
+* Description:  Load experiments of several overviews into a dense (overview x experiment x iteration x metric) array.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import multiprocessing as mp
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy
+
+# ==============================================================================
+# CUBE - READ EXPERIMENTS
+# ==============================================================================
+
+
+def read_experiments(
+    dict_of_overviews: Dict[str, List[str]],
+    read_experiment: Callable[[str], Dict[str, Any]],
+    nb_workers: int = 1,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    A method aimed at read each experiment of all overviews once, in parallel.
+    Experiments are read in a process pool, because most of the reading time is JSON parsing, that holds the GIL: the reading function must be defined at module level.
+    The reading function takes an experiment path and returns a dictionary with the following keys:
+        - `"LAST_ITERATION"` (str): the last iteration reached by the experiment;
+        - `"SERIES"` (Dict[str, Dict[str, Optional[float]]]): for each metric, the value of each iteration reached;
+        - `"FILL"` (Dict[str, float], optional): for some metrics, the value of iterations not reached (other metrics are forward-filled).
+
+    Args:
+        dict_of_overviews (Dict[str, List[str]]): The list of experiment paths of each overview.
+        read_experiment (Callable[[str], Dict[str, Any]]): The function to read one experiment.
+        nb_workers (int, optional): The number of processes used to read experiments. Defaults to `1` (no process pool).
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The reading of each experiment path.
+    """
+
+    # Get the list of distinct experiments (an experiment can be in several overviews).
+    list_of_paths: List[str] = sorted(
+        {path for list_of_paths_of_overview in dict_of_overviews.values() for path in list_of_paths_of_overview}
+    )
+
+    # Read experiments (in a process pool if needed), in the same order as paths.
+    list_of_readings: List[Dict[str, Any]]
+    if nb_workers > 1:
+        with mp.Pool(nb_workers) as pool:
+            list_of_readings = list(
+                pool.imap(read_experiment, list_of_paths, chunksize=max(1, len(list_of_paths) // (4 * nb_workers)))
+            )
+    else:
+        list_of_readings = [read_experiment(path) for path in list_of_paths]
+
+    # Return readings.
+    return dict(zip(list_of_paths, list_of_readings))
+
+
+# ==============================================================================
+# CUBE - LIST OF ITERATIONS
+# ==============================================================================
+
+
+def get_list_of_iterations(
+    dict_of_readings: Dict[str, Dict[str, Any]],
+    forced_max_iter: Optional[str] = None,
+    min_max_iter: str = "0000",
+) -> List[str]:
+    """
+    A method aimed at define the list of iterations of an overview, from the last iteration reached by experiments.
+    As in previous overviews, the list goes from `"0000"` to the maximum iteration (excluded).
+
+    Args:
+        dict_of_readings (Dict[str, Dict[str, Any]]): The reading of each experiment path.
+        forced_max_iter (Optional[str], optional): The maximum iteration to limit the range. Defaults to `None`.
+        min_max_iter (str, optional): The lowest possible maximum iteration. Defaults to `"0000"`.
+
+    Returns:
+        List[str]: The list of iterations.
+    """
+
+    # Get the maximum iteration reached.
+    max_iter: str = max(
+        [reading["LAST_ITERATION"] for reading in dict_of_readings.values()] + [min_max_iter],
+    )
+
+    # If set, force maximum iteration.
+    if forced_max_iter is not None:
+        max_iter = min(max_iter, forced_max_iter)
+
+    # Return list of iterations.
+    return [str(i).zfill(4) for i in range(int(max_iter))]
+
+
+# ==============================================================================
+# CUBE - BUILD
+# ==============================================================================
+
+
+def build_experiment_cube(
+    dict_of_overviews: Dict[str, List[str]],
+    dict_of_readings: Dict[str, Dict[str, Any]],
+    list_of_metrics: List[str],
+    list_of_iterations: List[str],
+) -> Dict[str, Any]:
+    """
+    A method aimed at build the dense array of values of experiments of all overviews.
+    Iterations not reached by an experiment are forward-filled with its last known value (most of the time, the experiment has reached annotation completeness), unless a fill value is given by the reading.
+    Overviews with less experiments than others are padded with `nan`.
+
+    Args:
+        dict_of_overviews (Dict[str, List[str]]): The list of experiment paths of each overview.
+        dict_of_readings (Dict[str, Dict[str, Any]]): The reading of each experiment path (cf. `read_experiments`).
+        list_of_metrics (List[str]): The list of metrics to store.
+        list_of_iterations (List[str]): The list of iterations to store.
+
+    Returns:
+        Dict[str, Any]: The cube, with the array of values (`"VALUES"`, of shape `(overviews, experiments, iterations, metrics)`), the number of experiments of each overview (`"NB_EXPERIMENTS"`), and the axes labels (`"OVERVIEWS"`, `"ITERATIONS"`, `"METRICS"`).
+    """
+
+    # Define axes.
+    list_of_overviews: List[str] = list(dict_of_overviews.keys())
+    max_nb_experiments: int = max([len(paths) for paths in dict_of_overviews.values()], default=0)
+    dict_of_iteration_indexes: Dict[str, int] = {iteration: index for index, iteration in enumerate(list_of_iterations)}
+
+    # Initialize arrays: values, reached iterations and fill values.
+    shape = (len(list_of_overviews), max_nb_experiments, len(list_of_iterations), len(list_of_metrics))
+    array_of_values: numpy.ndarray = numpy.full(shape, numpy.nan)
+    array_of_reached: numpy.ndarray = numpy.zeros(shape, dtype=bool)
+    array_of_fills: numpy.ndarray = numpy.full(shape[:2] + (1,) + shape[3:], numpy.nan)
+    array_of_forward_fill: numpy.ndarray = numpy.zeros(shape[:2] + (1,) + shape[3:], dtype=bool)
+    array_of_last_values: numpy.ndarray = numpy.full(shape[:2] + (1,) + shape[3:], numpy.nan)
+
+    # Scatter readings into arrays.
+    for o, overview in enumerate(list_of_overviews):
+        for e, path in enumerate(dict_of_overviews[overview]):
+            reading: Dict[str, Any] = dict_of_readings[path]
+            dict_of_fills: Dict[str, float] = reading["FILL"] if ("FILL" in reading.keys()) else {}
+            for m, metric in enumerate(list_of_metrics):
+                series: Dict[str, Optional[float]] = reading["SERIES"][metric]
+                list_of_indexes: List[int] = [
+                    dict_of_iteration_indexes[iteration] for iteration in series.keys() if iteration in dict_of_iteration_indexes
+                ]
+                array_of_values[o, e, list_of_indexes, m] = [
+                    series[iteration] for iteration in series.keys() if iteration in dict_of_iteration_indexes
+                ]
+                array_of_reached[o, e, list_of_indexes, m] = True
+                if metric in dict_of_fills.keys():
+                    array_of_fills[o, e, 0, m] = dict_of_fills[metric]
+                else:
+                    array_of_forward_fill[o, e, 0, m] = True
+                    if len(series) != 0:
+                        array_of_last_values[o, e, 0, m] = series[max(series.keys())]
+
+    # Forward-fill iterations not reached: index of the last reached iteration, or the last value of the experiment if there is none.
+    array_of_last_indexes: numpy.ndarray = numpy.maximum.accumulate(
+        numpy.where(array_of_reached, numpy.arange(len(list_of_iterations))[None, None, :, None], -1),
+        axis=2,
+    )
+    array_of_forward_filled: numpy.ndarray = numpy.where(
+        array_of_last_indexes >= 0,
+        numpy.take_along_axis(array_of_values, numpy.maximum(array_of_last_indexes, 0), axis=2),
+        array_of_last_values,
+    )
+
+    # Fill iterations not reached.
+    array_of_values = numpy.where(
+        array_of_reached,
+        array_of_values,
+        numpy.where(array_of_forward_fill, array_of_forward_filled, array_of_fills),
+    )
+
+    # Return cube.
+    return {
+        "VALUES": array_of_values,
+        "NB_EXPERIMENTS": {overview: len(dict_of_overviews[overview]) for overview in list_of_overviews},
+        "OVERVIEWS": list_of_overviews,
+        "ITERATIONS": list_of_iterations,
+        "METRICS": list_of_metrics,
+    }
+
+
+# ==============================================================================
+# CUBE - LOAD
+# ==============================================================================
+
+
+def load_experiment_cube(
+    dict_of_overviews: Dict[str, List[str]],
+    read_experiment: Callable[[str], Dict[str, Any]],
+    list_of_metrics: List[str],
+    list_of_iterations: Optional[List[str]] = None,
+    forced_max_iter: Optional[str] = None,
+    nb_workers: int = 1,
+) -> Dict[str, Any]:
+    """
+    A method aimed at read experiments of all overviews once and build their dense array of values.
+
+    Args:
+        dict_of_overviews (Dict[str, List[str]]): The list of experiment paths of each overview.
+        read_experiment (Callable[[str], Dict[str, Any]]): The function to read one experiment (cf. `read_experiments`).
+        list_of_metrics (List[str]): The list of metrics to store.
+        list_of_iterations (Optional[List[str]], optional): The list of iterations to store. Defaults to `None` (cf. `get_list_of_iterations`).
+        forced_max_iter (Optional[str], optional): The maximum iteration to limit the range if `list_of_iterations` is `None`. Defaults to `None`.
+        nb_workers (int, optional): The number of processes used to read experiments. Defaults to `1` (no process pool).
+
+    Returns:
+        Dict[str, Any]: The cube (cf. `build_experiment_cube`).
+    """
+
+    # Read experiments.
+    dict_of_readings: Dict[str, Dict[str, Any]] = read_experiments(
+        dict_of_overviews=dict_of_overviews,
+        read_experiment=read_experiment,
+        nb_workers=nb_workers,
+    )
+
+    # Build cube.
+    return build_experiment_cube(
+        dict_of_overviews=dict_of_overviews,
+        dict_of_readings=dict_of_readings,
+        list_of_metrics=list_of_metrics,
+        list_of_iterations=(
+            list_of_iterations
+            if (list_of_iterations is not None)
+            else get_list_of_iterations(dict_of_readings=dict_of_readings, forced_max_iter=forced_max_iter)
+        ),
+    )
+
+
+# ==============================================================================
+# CUBE - GET VALUES
+# ==============================================================================
+
+
+def get_overview_values(
+    cube: Dict[str, Any],
+    overview: str,
+    metric: str,
+) -> numpy.ndarray:
+    """
+    A method aimed at get the values of a metric for all experiments of an overview.
+
+    Args:
+        cube (Dict[str, Any]): The cube (cf. `build_experiment_cube`).
+        overview (str): The overview.
+        metric (str): The metric.
+
+    Returns:
+        numpy.ndarray: The array of values, of shape `(experiments, iterations)`.
+    """
+    return cube["VALUES"][
+        cube["OVERVIEWS"].index(overview),
+        : cube["NB_EXPERIMENTS"][overview],
+        :,
+        cube["METRICS"].index(metric),
+    ]
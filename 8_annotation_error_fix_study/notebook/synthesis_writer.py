@@ -0,0 +1,607 @@
+# -*- coding: utf-8 -*-
+
+"""
+* Name:         synthesis_writer
+* Description:  Write experiments synthesis files (legacy CSV and typed Parquet/Feather) in parallel and incrementally, with a report of bad environments.
+* Author:       Erwan Schild
+* Created:      19/10/2026
+* Licence:      CeCILL (https://cecill.info/licences.fr.html)
+"""
+
+# ==============================================================================
+# IMPORT PYTHON DEPENDENCIES
+# ==============================================================================
+
+import functools
+import hashlib
+import inspect
+import json
+import multiprocessing as mp
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Number of rows converted at once from staging files to output files.
+CHUNK_SIZE: int = 10000
+
+# Available output formats, with their file extension.
+DICT_OF_FORMATS: Dict[str, str] = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "feather": ".feather",
+}
+
+# Default output formats: legacy CSV (for R notebooks) and typed Parquet.
+DEFAULT_LIST_OF_FORMATS: List[str] = ["csv", "parquet"]
+
+
+# ==============================================================================
+# SYNTHESIS - WRITE
+# ==============================================================================
+def write_synthesis(
+    list_of_experiment_environments: List[str],
+    synthesize_experiment: Callable[[str], Tuple[Optional[str], Dict[str, Any]]],
+    list_of_input_files: List[str],
+    output_path_pattern: str,
+    schema: Optional[pa.Schema] = None,
+    list_of_formats: Optional[List[str]] = None,
+    csv_decimal: str = ".",
+    nb_workers: int = 1,
+    batch_size: int = 100,
+    manifest_path: Optional[str] = None,
+    report_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    A method aimed at synthesize all experiments in CSV, Parquet or Feather files, one row per experiment.
+    Experiments are synthesized by batches in a process pool, and rows are streamed to a staging file per output before being written to output files.
+    An experiment that can't be synthesized is reported instead of stopping the synthesis.
+    If a manifest is used, an experiment whose input files didn't change since the previous synthesis (same modification time and size, or same content hash) is not synthesized again (unless the code of `synthesize_experiment` changed, cf. `_get_code_fingerprint`): its row is read from a row cache on disk (one file per experiment, next to the manifest), so that rows are never all kept in memory.
+    Output files of the previous synthesis that get no row (ex: all experiments failed) are removed, so that they can't be mistaken for current results.
+
+    Args:
+        list_of_experiment_environments (List[str]): The list of experiments environments used to synthesize results.
+        synthesize_experiment (Callable[[str], Tuple[Optional[str], Dict[str, Any]]]): The function that synthesizes an experiment. It returns the output name (ex: the task) and the row. It must be defined at module level to be used in a process pool.
+        list_of_input_files (List[str]): The input files of an experiment, relative to its environment path, used to detect changes.
+        output_path_pattern (str): The path of output files without extension, with an `{output}` placeholder for the output name if needed.
+        schema (Optional[pa.Schema], optional): The types of columns in Parquet and Feather files (other columns are inferred). Defaults to `None`.
+        list_of_formats (Optional[List[str]], optional): The output formats, among `DICT_OF_FORMATS`. Defaults to `None` (`DEFAULT_LIST_OF_FORMATS`).
+        csv_decimal (str, optional): The decimal separator of float values in CSV files. Defaults to `"."`.
+        nb_workers (int, optional): The number of processes. Defaults to `1` (no process pool).
+        batch_size (int, optional): The number of experiments handled by a process at once. Defaults to `100`.
+        manifest_path (Optional[str], optional): The path of the manifest of previous synthesis (rows are cached in the `[MANIFEST_PATH].rows/` folder). Defaults to `None` (all experiments are synthesized).
+        report_path (Optional[str], optional): The path of the JSON report. Defaults to `None` (no report stored).
+
+    Raises:
+        ValueError: If a format in `list_of_formats` is not implemented.
+
+    Returns:
+        Dict[str, Any]: The report: number of experiments synthesized (`"NB_SYNTHESIZED"`), reused from manifest (`"NB_REUSED"`), and the error of each bad environment (`"BAD_ENVIRONMENTS"`).
+    """
+
+    # Check formats.
+    if list_of_formats is None:
+        list_of_formats = DEFAULT_LIST_OF_FORMATS
+    for output_format in list_of_formats:
+        if output_format not in DICT_OF_FORMATS.keys():
+            raise ValueError("The `output_format` '" + str(output_format) + "' is not implemented.")
+
+    # Get the fingerprint of the synthesis code: rows of previous synthesis are reused only if it didn't change.
+    code_fingerprint: Optional[str] = _get_code_fingerprint(synthesize_experiment=synthesize_experiment)
+
+    # Load the manifest of previous synthesis (outputs of previous synthesis are kept to remove stale ones).
+    dict_of_manifest: Dict[str, Dict[str, Any]] = {}
+    set_of_previous_outputs: Set[Optional[str]] = set()
+    if (manifest_path is not None) and os.path.exists(manifest_path):
+        with open(manifest_path, "r") as file_manifest:
+            manifest: Dict[str, Any] = json.load(file_manifest)
+        set_of_previous_outputs = {dict_of_experiment["output"] for dict_of_experiment in manifest["EXPERIMENTS"].values()}
+        if (code_fingerprint is not None) and (manifest.get("CODE") == code_fingerprint):
+            dict_of_manifest = manifest["EXPERIMENTS"]
+
+    # Define the row cache of the manifest.
+    rows_cache_path: Optional[str] = None if (manifest_path is None) else (manifest_path + ".rows/")
+    if rows_cache_path is not None:
+        os.makedirs(rows_cache_path, exist_ok=True)
+
+    # Define batches of experiments, with their previous fingerprints.
+    list_of_batches: List[List[Tuple[str, Optional[Dict[str, Any]]]]] = [
+        [
+            (env_path, dict_of_manifest[env_path]["fingerprint"] if (env_path in dict_of_manifest.keys()) else None)
+            for env_path in list_of_experiment_environments[batch_start : batch_start + batch_size]
+        ]
+        for batch_start in range(0, len(list_of_experiment_environments), batch_size)
+    ]
+
+    # Define the batch process.
+    process_batch: Callable[[List[Tuple[str, Optional[Dict[str, Any]]]]], List[Dict[str, Any]]] = functools.partial(
+        _process_batch,
+        synthesize_experiment=synthesize_experiment,
+        list_of_input_files=list_of_input_files,
+        rows_cache_path=rows_cache_path,
+    )
+
+    # Initialize the new manifest, the report and staging files.
+    dict_of_new_manifest: Dict[str, Dict[str, Any]] = {}
+    dict_of_report: Dict[str, Any] = {"NB_SYNTHESIZED": 0, "NB_REUSED": 0, "BAD_ENVIRONMENTS": {}}
+    dict_of_staging_files: Dict[str, Any] = {}
+    dict_of_columns: Dict[str, Dict[str, Set[str]]] = {}
+
+    try:
+        # Process batches (in a process pool if needed), in the same order as experiments.
+        pool: Optional[Any] = mp.Pool(nb_workers) if (nb_workers > 1) else None
+        try:
+            iterator_of_results = pool.imap(process_batch, list_of_batches) if (pool is not None) else map(process_batch, list_of_batches)
+            for list_of_results in iterator_of_results:
+                for result in list_of_results:
+                    env_path: str = result["env_path"]
+
+                    # Case of bad environment: report it.
+                    if result["error"] is not None:
+                        dict_of_report["BAD_ENVIRONMENTS"][env_path] = result["error"]
+                        continue
+
+                    # Count reused (row read from the row cache) and new synthesis.
+                    dict_of_report["NB_REUSED" if result["reused"] else "NB_SYNTHESIZED"] += 1
+                    output: Optional[str] = result["output"]
+                    row: Dict[str, Any] = result["row"]
+
+                    # Stream the row to the staging file of its output.
+                    output_path: str = output_path_pattern.format(output=output)
+                    if output_path not in dict_of_staging_files.keys():
+                        dict_of_staging_files[output_path] = open(output_path + ".tmp.jsonl", "w")
+                        dict_of_columns[output_path] = {}
+                    dict_of_staging_files[output_path].write(json.dumps([env_path, row]) + "\n")
+                    for column, value in row.items():
+                        dict_of_columns[output_path].setdefault(column, set()).add(type(value).__name__)
+
+                    # Update the manifest (rows are in the row cache).
+                    dict_of_new_manifest[env_path] = {
+                        "fingerprint": result["fingerprint"],
+                        "output": output,
+                    }
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+    finally:
+        for file_staging in dict_of_staging_files.values():
+            file_staging.close()
+
+    # Convert staging files to output files, by chunks.
+    for output_path, dict_of_value_types in dict_of_columns.items():
+        _write_outputs_from_staging(
+            staging_path=output_path + ".tmp.jsonl",
+            output_path=output_path,
+            list_of_formats=list_of_formats,
+            output_schema=_get_output_schema(
+                dict_of_value_types=dict_of_value_types,
+                schema=schema,
+            ),
+            csv_decimal=csv_decimal,
+        )
+
+    # Remove stale output files: outputs of previous synthesis (or the single output) without row.
+    set_of_stale_output_paths: Set[str] = {
+        output_path_pattern.format(output=previous_output) for previous_output in set_of_previous_outputs
+    }
+    if "{output}" not in output_path_pattern:
+        set_of_stale_output_paths.add(output_path_pattern)
+    for stale_output_path in set_of_stale_output_paths - set(dict_of_columns.keys()):
+        for extension in DICT_OF_FORMATS.values():
+            if os.path.exists(stale_output_path + extension):
+                os.remove(stale_output_path + extension)
+
+    # Store the new manifest, and remove rows of experiments that are no longer synthesized from the row cache.
+    if (manifest_path is not None) and (rows_cache_path is not None):
+        with open(manifest_path + ".tmp", "w") as file_manifest_w:
+            json.dump({"CODE": code_fingerprint, "EXPERIMENTS": dict_of_new_manifest}, file_manifest_w)
+        os.replace(manifest_path + ".tmp", manifest_path)
+        set_of_cached_filenames: Set[str] = {_get_row_cache_filename(env_path=env_path) for env_path in dict_of_new_manifest.keys()}
+        for cache_filename in os.listdir(rows_cache_path):
+            if cache_filename not in set_of_cached_filenames:
+                os.remove(rows_cache_path + cache_filename)
+
+    # Store the report.
+    if report_path is not None:
+        with open(report_path, "w") as file_report:
+            json.dump(dict_of_report, file_report, indent=4)
+
+    # Print bad environments.
+    if len(dict_of_report["BAD_ENVIRONMENTS"]) != 0:
+        print(str(len(dict_of_report["BAD_ENVIRONMENTS"])) + " environment(s) can't be synthesized (see report).")
+
+    # Return report.
+    return dict_of_report
+
+
+# ==============================================================================
+# SYNTHESIS - FINGERPRINT
+# ==============================================================================
+def get_fingerprint(
+    env_path: str,
+    list_of_input_files: List[str],
+    previous_fingerprint: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    A method aimed at get the fingerprint of input files of an experiment and compare it to a previous one.
+    Files are compared on modification time and size, and content hashes are computed only if they differ.
+
+    Args:
+        env_path (str): The experiment environment path.
+        list_of_input_files (List[str]): The input files of an experiment, relative to its environment path.
+        previous_fingerprint (Optional[Dict[str, Any]], optional): The fingerprint of the previous synthesis. Defaults to `None`.
+
+    Returns:
+        Tuple[Dict[str, Any], bool]: The fingerprint, and `True` if input files didn't change since the previous fingerprint.
+    """
+
+    # Initialize fingerprint.
+    dict_of_fingerprint: Dict[str, Any] = {}
+    unchanged: bool = previous_fingerprint is not None
+
+    # For each input file...
+    for input_file in list_of_input_files:
+
+        # Case of missing file.
+        if not os.path.exists(env_path + input_file):
+            dict_of_fingerprint[input_file] = None
+            unchanged = (
+                unchanged
+                and (previous_fingerprint is not None)
+                and (input_file in previous_fingerprint.keys())
+                and (previous_fingerprint[input_file] is None)
+            )
+            continue
+
+        # Get file modification time and size.
+        stat: os.stat_result = os.stat(env_path + input_file)
+        previous: Optional[Dict[str, Any]] = previous_fingerprint.get(input_file) if (previous_fingerprint is not None) else None
+        if (previous is not None) and (previous["mtime_ns"], previous["size"]) == (stat.st_mtime_ns, stat.st_size):
+            dict_of_fingerprint[input_file] = previous
+            continue
+
+        # Otherwise: compute content hash.
+        with open(env_path + input_file, "rb") as file_input:
+            sha1: str = hashlib.sha1(file_input.read()).hexdigest()
+        dict_of_fingerprint[input_file] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha1": sha1}
+        unchanged = unchanged and (previous is not None) and (previous["sha1"] == sha1)
+
+    # Return fingerprint.
+    return (dict_of_fingerprint, unchanged)
+
+
+# ==============================================================================
+# PRIVATE - CODE FINGERPRINT
+# ==============================================================================
+def _get_code_fingerprint(
+    synthesize_experiment: Callable[[str], Tuple[Optional[str], Dict[str, Any]]],
+) -> Optional[str]:
+    """
+    A method aimed at get the fingerprint of the code of a synthesis function.
+    The code is the module of the function and the local modules it uses, recursively (modules of the same folder, ex: `iterations_summary`).
+
+    Args:
+        synthesize_experiment (Callable[[str], Tuple[Optional[str], Dict[str, Any]]]): The function that synthesizes an experiment.
+
+    Returns:
+        Optional[str]: The SHA-1 of the source files, or `None` if the source of the function isn't available (then rows are never reused).
+    """
+
+    # Get the folder of the synthesis code (built-in or partial functions have no source file).
+    try:
+        source_file: Optional[str] = inspect.getsourcefile(synthesize_experiment)
+    except TypeError:
+        source_file = None
+    if source_file is None:
+        return None
+    code_folder: str = os.path.dirname(os.path.abspath(source_file))
+
+    # Get source files of local modules used by the synthesis code.
+    set_of_source_files: Set[str] = set()
+    list_of_modules_to_visit: List[Optional[Any]] = [inspect.getmodule(synthesize_experiment)]
+    while list_of_modules_to_visit:
+        module: Optional[Any] = list_of_modules_to_visit.pop()
+        module_file: Optional[str] = getattr(module, "__file__", None)
+        if (module_file is None) or (os.path.dirname(os.path.abspath(module_file)) != code_folder):
+            continue
+        if os.path.abspath(module_file) in set_of_source_files:
+            continue
+        set_of_source_files.add(os.path.abspath(module_file))
+        # NB : modules can be imported as modules (`import x`) or through their functions and classes (`from x import y`).
+        for value in vars(module).values():
+            if inspect.ismodule(value):
+                list_of_modules_to_visit.append(value)
+            elif inspect.isfunction(value) or inspect.isclass(value):
+                list_of_modules_to_visit.append(sys.modules.get(value.__module__))
+
+    # Hash source files (in a fixed order).
+    code_hash = hashlib.sha1()  # noqa: S324
+    for code_file in sorted(set_of_source_files):
+        with open(code_file, "rb") as file_code:
+            code_hash.update(os.path.basename(code_file).encode("utf-8"))
+            code_hash.update(file_code.read())
+    return code_hash.hexdigest()
+
+
+# ==============================================================================
+# PRIVATE - PROCESS BATCH
+# ==============================================================================
+def _process_batch(
+    batch: List[Tuple[str, Optional[Dict[str, Any]]]],
+    synthesize_experiment: Callable[[str], Tuple[Optional[str], Dict[str, Any]]],
+    list_of_input_files: List[str],
+    rows_cache_path: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    A method aimed at synthesize a batch of experiments (run in a process of the pool).
+    The row of an unchanged experiment is read from the row cache, and the row of a new synthesis is written to it.
+
+    Args:
+        batch (List[Tuple[str, Optional[Dict[str, Any]]]]): The experiments environments and their previous fingerprints.
+        synthesize_experiment (Callable[[str], Tuple[Optional[str], Dict[str, Any]]]): The function that synthesizes an experiment.
+        list_of_input_files (List[str]): The input files of an experiment, relative to its environment path.
+        rows_cache_path (Optional[str], optional): The path of the row cache. Defaults to `None` (no row cache, so no reuse).
+
+    Returns:
+        List[Dict[str, Any]]: The result of each experiment: fingerprint, reuse flag, output name, row and error.
+    """
+
+    # Initialize results.
+    list_of_results: List[Dict[str, Any]] = []
+
+    # For each experiment of the batch...
+    for env_path, previous_fingerprint in batch:
+        result: Dict[str, Any] = {"env_path": env_path, "fingerprint": None, "reused": False, "output": None, "row": None, "error": None}
+        try:
+            # Check if input files changed.
+            result["fingerprint"], result["reused"] = get_fingerprint(
+                env_path=env_path,
+                list_of_input_files=list_of_input_files,
+                previous_fingerprint=previous_fingerprint,
+            )
+
+            # Read the previous synthesis from the row cache (synthesize again if it is missing).
+            cache_filepath: Optional[str] = None if (rows_cache_path is None) else (rows_cache_path + _get_row_cache_filename(env_path=env_path))
+            if result["reused"] and (cache_filepath is not None) and os.path.exists(cache_filepath):
+                with open(cache_filepath, "r") as file_cache:
+                    result["output"], result["row"] = json.load(file_cache)
+            else:
+                result["reused"] = False
+
+            # Synthesize the experiment if needed, and store its row in the row cache.
+            if not result["reused"]:
+                result["output"], result["row"] = synthesize_experiment(env_path)
+                if cache_filepath is not None:
+                    with open(cache_filepath, "w") as file_cache:
+                        json.dump([result["output"], result["row"]], file_cache)
+
+        # Case of bad environment: keep the error.
+        except Exception as error:  # noqa: B902
+            result["error"] = type(error).__name__ + ": " + str(error)
+        list_of_results.append(result)
+
+    # Return results.
+    return list_of_results
+
+
+def _get_row_cache_filename(
+    env_path: str,
+) -> str:
+    """
+    A method aimed at get the filename of the row of an experiment in the row cache.
+
+    Args:
+        env_path (str): The experiment environment path.
+
+    Returns:
+        str: The filename (SHA-1 of the experiment environment path).
+    """
+    return hashlib.sha1(env_path.encode("utf-8")).hexdigest() + ".json"  # noqa: S324
+
+
+# ==============================================================================
+# PRIVATE - WRITE OUTPUTS
+# ==============================================================================
+def _write_outputs_from_staging(
+    staging_path: str,
+    output_path: str,
+    list_of_formats: List[str],
+    output_schema: pa.Schema,
+    csv_decimal: str,
+) -> None:
+    """
+    A method aimed at convert a staging file (one JSON row per line) to output files, by chunks.
+    CSV and Parquet files are written chunk by chunk. Feather files need a single dictionary per categorical column, so typed chunks are concatenated before being written.
+
+    Args:
+        staging_path (str): The path of the staging file. It is removed at the end.
+        output_path (str): The path of output files, without extension.
+        list_of_formats (List[str]): The output formats.
+        output_schema (pa.Schema): The columns of output files and their types (cf. `_get_output_schema`).
+        csv_decimal (str): The decimal separator of float values in CSV files.
+    """
+
+    # Initialize typed outputs.
+    list_of_columns: List[str] = output_schema.names[1:]
+    list_of_tables: List[pa.Table] = []
+    parquet_writer: Optional[pq.ParquetWriter] = None
+
+    # Convert the staging file by chunks (atomic replacement of output files at the end).
+    with open(staging_path, "r") as file_staging, open(output_path + ".csv.tmp", "w") as file_csv:
+        is_first_chunk: bool = True
+        while True:
+            list_of_lines: List[str] = [line for _, line in zip(range(CHUNK_SIZE), file_staging)]
+            if (len(list_of_lines) == 0) and (not is_first_chunk):
+                break
+            list_of_rows: List[Tuple[str, Dict[str, Any]]] = [json.loads(line) for line in list_of_lines]
+
+            # Case of CSV: legacy format (`;` separator, environment path as index, float values formatted with `csv_decimal`, missing values left empty).
+            if "csv" in list_of_formats:
+                df_chunk: pd.DataFrame = pd.DataFrame.from_dict(
+                    data={env_path: row for env_path, row in list_of_rows},
+                    orient="index",
+                    dtype=object,
+                ).reindex(columns=list_of_columns)
+                if csv_decimal != ".":
+                    df_chunk = df_chunk.map(lambda value: str(value).replace(".", csv_decimal) if isinstance(value, float) and not pd.isna(value) else value)
+                df_chunk.to_csv(
+                    path_or_buf=file_csv,
+                    sep=";",
+                    header=is_first_chunk,
+                )
+
+            # Case of Parquet or Feather: typed table.
+            if ("parquet" in list_of_formats) or ("feather" in list_of_formats):
+                table_chunk: pa.Table = _build_typed_table(
+                    list_of_rows=list_of_rows,
+                    output_schema=output_schema,
+                )
+                if "parquet" in list_of_formats:
+                    if parquet_writer is None:
+                        parquet_writer = pq.ParquetWriter(output_path + ".parquet.tmp", output_schema)
+                    parquet_writer.write_table(table_chunk)
+                if "feather" in list_of_formats:
+                    list_of_tables.append(table_chunk)
+
+            is_first_chunk = False
+            if len(list_of_lines) < CHUNK_SIZE:
+                break
+
+    # Close Parquet file and write Feather file.
+    if parquet_writer is not None:
+        parquet_writer.close()
+    if "feather" in list_of_formats:
+        feather.write_feather(
+            pa.concat_tables(list_of_tables).unify_dictionaries().combine_chunks(),
+            output_path + ".feather.tmp",
+        )
+
+    # Replace output files.
+    for output_format, extension in DICT_OF_FORMATS.items():
+        if output_format in list_of_formats:
+            os.replace(output_path + extension + ".tmp", output_path + extension)
+    if "csv" not in list_of_formats:
+        os.remove(output_path + ".csv.tmp")
+    os.remove(staging_path)
+
+
+def _get_output_schema(
+    dict_of_value_types: Dict[str, Set[str]],
+    schema: Optional[pa.Schema],
+) -> pa.Schema:
+    """
+    A method aimed at define the schema of an output: the experiment environment path, then each column typed by the schema if set, or by the types of its values otherwise.
+
+    Args:
+        dict_of_value_types (Dict[str, Set[str]]): The type names of values of each column (in order of appearance).
+        schema (Optional[pa.Schema]): The types of columns.
+
+    Returns:
+        pa.Schema: The schema of the output.
+    """
+
+    # Initialize the schema with the experiment environment path.
+    list_of_fields: List[pa.Field] = [pa.field("env_path", pa.string())]
+
+    # For each column...
+    for column, set_of_value_types in dict_of_value_types.items():
+
+        # Case of column typed by the schema.
+        if (schema is not None) and (column in schema.names):
+            list_of_fields.append(schema.field(column))
+            continue
+
+        # Otherwise: infer type from values.
+        set_of_value_types = set_of_value_types - {"NoneType"}
+        if set_of_value_types == {"bool"}:
+            list_of_fields.append(pa.field(column, pa.bool_()))
+        elif set_of_value_types == {"int"}:
+            list_of_fields.append(pa.field(column, pa.int64()))
+        elif set_of_value_types in ({"float"}, {"int", "float"}):
+            list_of_fields.append(pa.field(column, pa.float64()))
+        else:
+            list_of_fields.append(pa.field(column, pa.string()))
+
+    # Return schema.
+    return pa.schema(list_of_fields)
+
+
+def _build_typed_table(
+    list_of_rows: List[Tuple[str, Dict[str, Any]]],
+    output_schema: pa.Schema,
+) -> pa.Table:
+    """
+    A method aimed at build a typed table from synthesis rows.
+
+    Args:
+        list_of_rows (List[Tuple[str, Dict[str, Any]]]): The rows, with their experiment environment path.
+        output_schema (pa.Schema): The columns of the table and their types (cf. `_get_output_schema`).
+
+    Returns:
+        pa.Table: The table, with the experiment environment path in the first column (`"env_path"`).
+    """
+
+    # Build the array of each column, then cast it to its type (ex: `"0012"` to `12`, `"kmeans"` to a categorical value).
+    list_of_arrays: List[pa.Array] = [pa.array([env_path for env_path, _ in list_of_rows], type=pa.string())]
+    for field in list(output_schema)[1:]:
+        list_of_values: List[Any] = [row.get(field.name) for _, row in list_of_rows]
+        if field.type == pa.string():
+            list_of_values = [None if (value is None) else str(value) for value in list_of_values]
+        list_of_arrays.append(pa.array(list_of_values).cast(field.type))
+
+    # Return table.
+    return pa.Table.from_arrays(list_of_arrays, schema=output_schema)
+
+
+# ==============================================================================
+# SYNTHESIS - LOAD
+# ==============================================================================
+def load_synthesis(
+    filepath: str,
+    list_of_columns: Optional[List[str]] = None,
+    csv_decimal: str = ".",
+) -> pd.DataFrame:
+    """
+    A method aimed at load a synthesis file in a dataframe indexed by experiment environment path, with typed columns (float, int and categorical).
+    Parquet and Feather files are read column by column, so only needed columns are loaded. CSV files are supported for legacy synthesis.
+
+    Args:
+        filepath (str): The path of the synthesis file (`.parquet`, `.feather` or `.csv`).
+        list_of_columns (Optional[List[str]], optional): The columns to load. Defaults to `None` (all columns).
+        csv_decimal (str, optional): The decimal separator of float values in CSV files. Defaults to `"."`.
+
+    Raises:
+        ValueError: If the file extension is not implemented.
+
+    Returns:
+        pd.DataFrame: The synthesis, one row per experiment.
+    """
+
+    # Case of typed files.
+    if filepath.endswith(".parquet") or filepath.endswith(".feather"):
+        list_of_columns_to_read: Optional[List[str]] = None if (list_of_columns is None) else ["env_path"] + list_of_columns
+        table: pa.Table = (
+            pq.read_table(filepath, columns=list_of_columns_to_read)
+            if filepath.endswith(".parquet")
+            else feather.read_table(filepath, columns=list_of_columns_to_read)
+        )
+        df_synthesis: pd.DataFrame = table.to_pandas().set_index("env_path")
+        df_synthesis.index.name = None
+        return df_synthesis
+
+    # Case of legacy CSV files.
+    if filepath.endswith(".csv"):
+        df_synthesis = pd.read_csv(filepath, sep=";", index_col=0, decimal=csv_decimal, float_precision="round_trip")
+        return df_synthesis if (list_of_columns is None) else df_synthesis[list_of_columns]
+
+    # Case of unknown extension.
+    raise ValueError("The `filepath` '" + str(filepath) + "' has an extension that is not implemented.")
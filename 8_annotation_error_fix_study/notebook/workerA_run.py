@@ -32,7 +32,8 @@ from cognitivefactory.interactive_clustering.constraints.factory import (
     managing_factory,
 )
 from scipy.sparse import csr_matrix
-from sklearn import metrics
+
+import metrics_registry
 
 
 # ==============================================================================
@@ -51,7 +52,7 @@ def experiment_run(
         - The notebook `2_Simulate_errors_and_run_clustering.ipynb` launch this script for all defined experiment environments with the librairy `multiprocessing`.
 
     Args:
-        parameters (Dict[str, Any]): A dictionary that contains several parameters. Several keys are expected in this dictionary: the experiment environment path (`"ENV_PATH"`).
+        parameters (Dict[str, Any]): A dictionary that contains several parameters. Several keys are expected in this dictionary: the experiment environment path (`"ENV_PATH"`). An optional key (`"metrics_to_compute"`) can be added to define the registered metrics to compute (cf. `metrics_registry`).
 
     Returns:
         int: Return `0` when finish.
@@ -59,6 +60,11 @@ def experiment_run(
 
     # Parameters.
     ENV_PATH: str = str(parameters["ENV_PATH"])
+    metrics_to_compute: List[str] = (
+        parameters["metrics_to_compute"]
+        if ("metrics_to_compute" in parameters.keys())
+        else metrics_registry.DEFAULT_LIST_OF_METRICS
+    )
         
     # If experiment was already run: skip.
     if "dict_of_clustering_performances.json" in os.listdir(ENV_PATH):
@@ -227,45 +233,17 @@ def experiment_run(
     ### Clustering evaluation.
     ### ### ### ### ###
 
-    # Format true intents from dict to list.
-    list_of_true_intents: List[str] = [
-        dict_of_true_intents[data_ID] for data_ID in list_of_data_IDs
-    ]
-
-    # Initialize evaluation storage.
-    dict_of_clustering_performances: Dict[str, float] = {}
-
-    # Format predicted intents from dict to list.
-    list_of_predicted_intents: List[int] = [
-        dict_of_clustering[data_ID]
-        for data_ID in list_of_data_IDs
-    ]
-
-    # Compute homogeneity.
-    dict_of_clustering_performances[
-        "homogeneity"
-    ] = metrics.homogeneity_score(list_of_true_intents, list_of_predicted_intents)
-
-    # Compute completeness.
-    dict_of_clustering_performances[
-        "completeness"
-    ] = metrics.completeness_score(list_of_true_intents, list_of_predicted_intents)
-
-    # Compute v_measure.
-    dict_of_clustering_performances[
-        "v_measure"
-    ] = metrics.v_measure_score(list_of_true_intents, list_of_predicted_intents)
-
-    # Compute adjusted_rand_index.
-    dict_of_clustering_performances[
-        "adjusted_rand_index"
-    ] = metrics.adjusted_rand_score(list_of_true_intents, list_of_predicted_intents)
-
-    # Compute adjusted_mutual_information.
-    dict_of_clustering_performances[
-        "adjusted_mutual_information"
-    ] = metrics.adjusted_mutual_info_score(
-        list_of_true_intents, list_of_predicted_intents
+    # Compute all metrics in one pass (annotated constraints are used to check violations).
+    dict_of_clustering_performances: Dict[str, Optional[float]] = metrics_registry.MetricsEvaluator(
+        dict_of_true_intents=dict_of_true_intents,
+        list_of_metrics=metrics_to_compute,
+        dict_of_vectors=dict_of_vectors,
+    ).evaluate(
+        clustering_result=dict_of_clustering,
+        constraints=[
+            (constraint[0], constraint[1], constraint[2])  # data IDs and effective constraint type
+            for constraint in list_of_constraints
+        ],
     )
 
     # Store dictionary of clustering evaluation.
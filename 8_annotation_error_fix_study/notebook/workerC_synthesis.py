@@ -13,148 +13,203 @@
 # ==============================================================================
 
 import json
-import pandas as pd
 
 from typing import Dict, List, Optional, Tuple, Union
 
+import pyarrow as pa
+
+import synthesis_writer
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Files used to synthesize an experiment (to detect changes since the previous synthesis).
+LIST_OF_INPUT_FILES: List[str] = [
+    "../../config.json",
+    "../config.json",
+    "config.json",
+    "list_of_constraints.json",
+    "dict_of_clustering_performances.json",
+]
+
+# Types of columns in typed synthesis files (Parquet, Feather).
+SYNTHESIS_SCHEMA: pa.Schema = pa.schema(
+    [
+        pa.field("dataset", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("algorithm", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("constraints_selection", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("error_simulation", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("constraints_selection__algorithm", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("constraints_selection__number", pa.int32()),
+        pa.field("constraints_selection__random_seed", pa.int32()),
+        pa.field("error_simulation__error_rate", pa.float64()),
+        pa.field("error_simulation__random_seed", pa.int32()),
+        pa.field("error_simulation__with_fix", pa.bool_()),
+        pa.field("constraints__annotated", pa.int32()),
+        pa.field("constraints__MUST_LINK", pa.int32()),
+        pa.field("constraints__CANNOT_LINK", pa.int32()),
+        pa.field("constraints__errors", pa.int32()),
+        pa.field("constraints__conflicts", pa.int32()),
+        pa.field("clustering__v_measure", pa.float64()),
+        pa.field("clustering__homogeneity", pa.float64()),
+        pa.field("clustering__completeness", pa.float64()),
+    ]
+)
+
 
 # ==============================================================================
 # WORKER - EXPERIMENT OVERVIEW
 # ==============================================================================
 def experiments_synthesis(
     list_of_experiment_environments: List[str],
+    nb_workers: int = 1,
+    batch_size: int = 100,
+    with_manifest: bool = True,
+    list_of_formats: Optional[List[str]] = None,
 ) -> int:
     """
     A method aimed at synthesize performance of all experiments in a csv file.
+    Experiments that can't be synthesized are reported in `../results/experiments_synthesis_report.json` instead of stopping the synthesis.
+    Results are stored in the legacy CSV format and in typed formats (cf. `synthesis_writer.load_synthesis` to load them).
 
     Args:
         list_of_experiment_environments (List[str]): The list of experiments environments used to synthesize results.
+        nb_workers (int, optional): The number of processes used to synthesize experiments. Defaults to `1`.
+        batch_size (int, optional): The number of experiments handled by a process at once. Defaults to `100`.
+        with_manifest (bool, optional): The option to synthesize again only experiments whose files changed since the previous synthesis. Defaults to `True`.
+        list_of_formats (Optional[List[str]], optional): The output formats (`"csv"`, `"parquet"`, `"feather"`). Defaults to `None` (`synthesis_writer.DEFAULT_LIST_OF_FORMATS`).
 
     Returns:
         int: Return `0` when finish.
     """
 
-    # Initialize dictionary of synthesis.
-    dict_of_experiments_synthesis: Dict[
-        str, Dict[str, Union[str, float, int, None]]
-    ] = {}
-
-    # For each experiment environment...
-    for env_path in list_of_experiment_environments:
-
-        # Initialize dictionary of synthesis for this experiment.
-        dict_of_experiments_synthesis[env_path] = {}
-
-        ### ### ### ### ###
-        ### Load files.
-        ### ### ### ### ###
-        
-        # Load configuration for algorithm.
-        with open(
-            env_path + "../../config.json", "r"
-        ) as file_config_algorithm:
-            CONFIG_ALGORITHM = json.load(file_config_algorithm)
-        
-        # Load configuration for constraints selection.
-        with open(
-            env_path + "../config.json", "r"
-        ) as file_config_constraints_selection:
-            CONFIG_CONSTRAINTS_SELECTION = json.load(file_config_constraints_selection)
-        
-        # Load configuration for errors simulation.
-        with open(
-            env_path + "config.json", "r"
-        ) as file_config_errors_simulation:
-            CONFIG_ERRORS_SIMULATION = json.load(file_config_errors_simulation)
-        
-        # Load constraints.
-        with open(
-            env_path + "list_of_constraints.json", "r"
-        ) as file_constraints:
-            list_of_constraints = json.load(file_constraints)
-        
-        # Load clustering performances.
-        with open(
-            env_path + "dict_of_clustering_performances.json", "r"
-        ) as file_clustering_perf:
-            dict_of_clustering_performances = json.load(file_clustering_perf)
-
-        ### ### ### ### ###
-        ### Configuration.
-        ### ### ### ### ###
-
-        # NB : environments paths are formatted links : `../experiments/[DATASET]/[CLUSTERING]/[CONSTRAINTS_SELECTION]/[ERRORS_SIMULATION]`
-
-        # Dataset information.
-        dict_of_experiments_synthesis[env_path]["dataset"] = env_path.split("/")[2]
-        # Algorithm information.
-        dict_of_experiments_synthesis[env_path]["algorithm"] = env_path.split("/")[3]
-        # Constraints selection information.
-        dict_of_experiments_synthesis[env_path]["constraints_selection"] = env_path.split("/")[4]
-        # Error simulation information.
-        dict_of_experiments_synthesis[env_path]["error_simulation"] = env_path.split("/")[5]
-
-        # constraints_selection__algorithm
-        dict_of_experiments_synthesis[env_path]["constraints_selection__algorithm"] = CONFIG_CONSTRAINTS_SELECTION["sampling"]
-        # constraints_selection__number
-        dict_of_experiments_synthesis[env_path]["constraints_selection__number"] = CONFIG_CONSTRAINTS_SELECTION["nb_constraints"]
-        # constraints_selection__random_seed
-        dict_of_experiments_synthesis[env_path]["constraints_selection__random_seed"] = CONFIG_CONSTRAINTS_SELECTION["random_seed"]
-
-        # error_simulation__error_rate
-        dict_of_experiments_synthesis[env_path]["error_simulation__error_rate"] = str(CONFIG_ERRORS_SIMULATION["error_rate"]).replace('.',',')
-        # error_simulation__random_seed
-        dict_of_experiments_synthesis[env_path]["error_simulation__random_seed"] = CONFIG_ERRORS_SIMULATION["random_seed"]
-        # error_simulation__with_fix
-        dict_of_experiments_synthesis[env_path]["error_simulation__with_fix"] = CONFIG_ERRORS_SIMULATION["with_fix"]
-
-        # constraints__annotated
-        dict_of_experiments_synthesis[env_path]["constraints__annotated"] = len(list_of_constraints)
-        # constraints__MUST LINK
-        dict_of_experiments_synthesis[env_path]["constraints__MUST_LINK"] = len([
-            constraint for constraint in list_of_constraints if constraint[2] == "MUST_LINK"
-        ])
-        # constraints__CANNOT_LINK
-        dict_of_experiments_synthesis[env_path]["constraints__CANNOT_LINK"] = len([
-            constraint for constraint in list_of_constraints if constraint[2] == "CANNOT_LINK"
-        ])
-        # constraints_-_errors
-        dict_of_experiments_synthesis[env_path]["constraints__errors"] = len([
-            constraint for constraint in list_of_constraints if constraint[3] is True
-        ])
-        # constraints__conflicts
-        dict_of_experiments_synthesis[env_path]["constraints__conflicts"] = len([
-            constraint for constraint in list_of_constraints if constraint[4] is True
-        ])
-        
-        # clustering__v_measure
-        dict_of_experiments_synthesis[env_path]["clustering__v_measure"] = str(
-            dict_of_clustering_performances["v_measure"]
-        ).replace(".", ",")
-        # clustering__homogeneity
-        dict_of_experiments_synthesis[env_path]["clustering__homogeneity"] = str(
-            dict_of_clustering_performances["homogeneity"]
-        ).replace(".", ",")
-        # clustering__completeness
-        dict_of_experiments_synthesis[env_path]["clustering__completeness"] = str(
-            dict_of_clustering_performances["completeness"]
-        ).replace(".", ",")
+    # Synthesize experiments and store files.
+    synthesis_writer.write_synthesis(
+        list_of_experiment_environments=list_of_experiment_environments,
+        synthesize_experiment=_synthesize_experiment,
+        list_of_input_files=LIST_OF_INPUT_FILES,
+        output_path_pattern="../results/experiments_synthesis",
+        schema=SYNTHESIS_SCHEMA,
+        list_of_formats=list_of_formats,
+        csv_decimal=",",
+        nb_workers=nb_workers,
+        batch_size=batch_size,
+        manifest_path="../results/.experiments_synthesis_manifest.json" if with_manifest else None,
+        report_path="../results/experiments_synthesis_report.json",
+    )
+
+    # End of script.
+    return 0
+
+
+# ==============================================================================
+# PRIVATE - EXPERIMENT SYNTHESIS
+# ==============================================================================
+def _synthesize_experiment(
+    env_path: str,
+) -> Tuple[Optional[str], Dict[str, Union[str, float, int, None]]]:
+    """
+    A method aimed at synthesize performance of an experiment (run in a process of the pool).
+
+    Args:
+        env_path (str): The experiment environment path.
+
+    Returns:
+        Tuple[Optional[str], Dict[str, Union[str, float, int, None]]]: The output name (`None`, only one file), and the synthesis of the experiment.
+    """
+
+    # Initialize dictionary of synthesis for this experiment.
+    dict_of_experiment_synthesis: Dict[str, Union[str, float, int, None]] = {}
 
     ### ### ### ### ###
-    ### Store file.
+    ### Load files.
     ### ### ### ### ###
 
-    # Define file path.
-    filepath: str = "../results/experiments_synthesis.csv"
+    # Load configuration for algorithm.
+    with open(
+        env_path + "../../config.json", "r"
+    ) as file_config_algorithm:
+        CONFIG_ALGORITHM = json.load(file_config_algorithm)
+
+    # Load configuration for constraints selection.
+    with open(
+        env_path + "../config.json", "r"
+    ) as file_config_constraints_selection:
+        CONFIG_CONSTRAINTS_SELECTION = json.load(file_config_constraints_selection)
+
+    # Load configuration for errors simulation.
+    with open(
+        env_path + "config.json", "r"
+    ) as file_config_errors_simulation:
+        CONFIG_ERRORS_SIMULATION = json.load(file_config_errors_simulation)
+
+    # Load constraints.
+    with open(
+        env_path + "list_of_constraints.json", "r"
+    ) as file_constraints:
+        list_of_constraints = json.load(file_constraints)
+
+    # Load clustering performances.
+    with open(
+        env_path + "dict_of_clustering_performances.json", "r"
+    ) as file_clustering_perf:
+        dict_of_clustering_performances = json.load(file_clustering_perf)
 
-    # Define dataframe and store it to a CSV file.
-    pd.DataFrame.from_dict(
-        data=dict_of_experiments_synthesis,
-        orient="index",
-    ).to_csv(
-        path_or_buf=filepath,
-        sep=";",
-    )
+    ### ### ### ### ###
+    ### Configuration.
+    ### ### ### ### ###
 
-    # End of script.
-    return 0
+    # NB : environments paths are formatted links : `../experiments/[DATASET]/[CLUSTERING]/[CONSTRAINTS_SELECTION]/[ERRORS_SIMULATION]`
+
+    # Dataset information.
+    dict_of_experiment_synthesis["dataset"] = env_path.split("/")[2]
+    # Algorithm information.
+    dict_of_experiment_synthesis["algorithm"] = env_path.split("/")[3]
+    # Constraints selection information.
+    dict_of_experiment_synthesis["constraints_selection"] = env_path.split("/")[4]
+    # Error simulation information.
+    dict_of_experiment_synthesis["error_simulation"] = env_path.split("/")[5]
+
+    # constraints_selection__algorithm
+    dict_of_experiment_synthesis["constraints_selection__algorithm"] = CONFIG_CONSTRAINTS_SELECTION["sampling"]
+    # constraints_selection__number
+    dict_of_experiment_synthesis["constraints_selection__number"] = CONFIG_CONSTRAINTS_SELECTION["nb_constraints"]
+    # constraints_selection__random_seed
+    dict_of_experiment_synthesis["constraints_selection__random_seed"] = CONFIG_CONSTRAINTS_SELECTION["random_seed"]
+
+    # error_simulation__error_rate
+    dict_of_experiment_synthesis["error_simulation__error_rate"] = CONFIG_ERRORS_SIMULATION["error_rate"]
+    # error_simulation__random_seed
+    dict_of_experiment_synthesis["error_simulation__random_seed"] = CONFIG_ERRORS_SIMULATION["random_seed"]
+    # error_simulation__with_fix
+    dict_of_experiment_synthesis["error_simulation__with_fix"] = CONFIG_ERRORS_SIMULATION["with_fix"]
+
+    # constraints__annotated
+    dict_of_experiment_synthesis["constraints__annotated"] = len(list_of_constraints)
+    # constraints__MUST LINK
+    dict_of_experiment_synthesis["constraints__MUST_LINK"] = len([
+        constraint for constraint in list_of_constraints if constraint[2] == "MUST_LINK"
+    ])
+    # constraints__CANNOT_LINK
+    dict_of_experiment_synthesis["constraints__CANNOT_LINK"] = len([
+        constraint for constraint in list_of_constraints if constraint[2] == "CANNOT_LINK"
+    ])
+    # constraints_-_errors
+    dict_of_experiment_synthesis["constraints__errors"] = len([
+        constraint for constraint in list_of_constraints if constraint[3] is True
+    ])
+    # constraints__conflicts
+    dict_of_experiment_synthesis["constraints__conflicts"] = len([
+        constraint for constraint in list_of_constraints if constraint[4] is True
+    ])
+
+    # clustering__v_measure
+    dict_of_experiment_synthesis["clustering__v_measure"] = dict_of_clustering_performances["v_measure"]
+    # clustering__homogeneity
+    dict_of_experiment_synthesis["clustering__homogeneity"] = dict_of_clustering_performances["homogeneity"]
+    # clustering__completeness
+    dict_of_experiment_synthesis["clustering__completeness"] = dict_of_clustering_performances["completeness"]
+
+    # Return synthesis.
+    return (None, dict_of_experiment_synthesis)
@@ -41,7 +41,8 @@ from cognitivefactory.interactive_clustering.clustering.factory import (
     clustering_factory,
 )
 from scipy.sparse import csr_matrix
-from sklearn import metrics
+
+import metrics_registry
 
 
 # ==============================================================================
@@ -61,7 +62,7 @@ def experiment_run(
         - The notebook `2_Simulate_errors_and_run_clustering.ipynb` launch this script for all defined experiment environments with the librairy `multiprocessing`.
 
     Args:
-        parameters (Dict[str, Any]): A dictionary that contains several parameters. Several keys are expected in this dictionary: the experiment environment path (`"ENV_PATH"`), the v-measure score to reach (`"MIN_VMEASURE"`), the maximum iteration of interactive clustering (`"MAX_NB_CONSTRAINTS"`).
+        parameters (Dict[str, Any]): A dictionary that contains several parameters. Several keys are expected in this dictionary: the experiment environment path (`"ENV_PATH"`), the v-measure score to reach (`"MIN_VMEASURE"`), the maximum iteration of interactive clustering (`"MAX_NB_CONSTRAINTS"`). An optional key (`"metrics_to_compute"`) can be added to define the registered metrics to compute (cf. `metrics_registry`).
 
     Returns:
         int: Return `0` when finish.
@@ -85,6 +86,11 @@ def experiment_run(
         )
         else float(parameters["MAX_RATE_CONSTRAINTS"])
     )
+    metrics_to_compute: List[str] = (
+        parameters["metrics_to_compute"]
+        if ("metrics_to_compute" in parameters.keys())
+        else metrics_registry.DEFAULT_LIST_OF_METRICS
+    )
 
     # If experiment was already run: skip.
     if ".done" in os.listdir(ENV_PATH):
@@ -142,6 +148,13 @@ def experiment_run(
     # Get list of data IDs.
     list_of_data_IDs: List[str] = sorted(dict_of_true_intents.keys())
 
+    # Initialize the evaluator of registered metrics.
+    metrics_evaluator: metrics_registry.MetricsEvaluator = metrics_registry.MetricsEvaluator(
+        dict_of_true_intents=dict_of_true_intents,
+        list_of_metrics=metrics_to_compute,
+        dict_of_vectors=dict_of_vectors,
+    )
+
     ### ### ### ### ###
     ### Load work already done.
     ### ### ### ### ###
@@ -174,7 +187,7 @@ def experiment_run(
     with open(
         ENV_PATH + "dict_of_clustering_performances.json", "r"
     ) as file_clustering_performance_r:
-        dict_of_clustering_performances: Dict[str, Dict[str, float]] = json.load(file_clustering_performance_r)
+        dict_of_clustering_performances: Dict[str, Dict[str, Optional[float]]] = json.load(file_clustering_performance_r)
 
     ### ### ### ### ###
     ### While (condition).
@@ -225,7 +238,7 @@ def experiment_run(
         # Case 3: less than MIN_VMEASURE.
         and (
             MIN_VMEASURE is None
-            or dict_of_clustering_performances[PREVIOUS_NB_CONSTRAINTS_ID]["v_measure"] < MIN_VMEASURE
+            or (dict_of_clustering_performances[PREVIOUS_NB_CONSTRAINTS_ID]["v_measure"] or 0.0) < MIN_VMEASURE
         )
     ):
         
@@ -341,25 +354,14 @@ def experiment_run(
         ### Evaluate clustering.
         ### ### ### ### ###
 
-        # Format true intents from dict to list.
-        list_of_true_intents: List[str] = [
-            dict_of_true_intents[data_ID]
-            for data_ID in list_of_data_IDs
-        ]
-
-        # Format predicted intents from dict to list.
-        list_of_predicted_intents: List[int] = [
-            clustering_result[data_ID]
-            for data_ID in list_of_data_IDs
-        ]
-
-        # Compute performances.
-        clustering_performances: Dict[str, float] = {}
-        clustering_performances["homogeneity"] = metrics.homogeneity_score(list_of_true_intents, list_of_predicted_intents)
-        clustering_performances["completeness"] = metrics.completeness_score(list_of_true_intents, list_of_predicted_intents)
-        clustering_performances["v_measure"] = metrics.v_measure_score(list_of_true_intents, list_of_predicted_intents)
-        clustering_performances["adjusted_rand_index"] = metrics.adjusted_rand_score(list_of_true_intents, list_of_predicted_intents)
-        clustering_performances["adjusted_mutual_information"] = metrics.adjusted_mutual_info_score(list_of_true_intents, list_of_predicted_intents)
+        # Compute performances in one pass (effective constraints are used to check violations).
+        clustering_performances: Dict[str, Optional[float]] = metrics_evaluator.evaluate(
+            clustering_result=clustering_result,
+            constraints=[
+                (constraint[0], constraint[1], constraint[2])  # data IDs and effective constraint type
+                for constraint in list_of_effective_constraints
+            ],
+        )
 
         # Update storage of dict of clustering performances.
         dict_of_clustering_performances[CURRENT_NB_CONSTRAINTS_ID] = clustering_performances